@@ -1,4 +1,12 @@
-from .columns import _check_duplicates, _check_high_cardinality, _check_mixed_data_types, _check_single_value_columns
+from collections.abc import Callable, Iterator
+
+from .columns import (
+    _check_duplicate_columns,
+    _check_duplicates,
+    _check_high_cardinality,
+    _check_mixed_data_types,
+    _check_single_value_columns,
+)
 from .core import Issue as Issue
 from .correlations import calculate_correlations
 from .datetime_checks import _check_datetime_future_dates, _check_datetime_gaps, _check_datetime_monotonicity
@@ -23,6 +31,8 @@ from .outliers import (
     _check_outliers,
     _check_skewness,
 )
+from .scheduler import iter_check_groups, schedule_check_groups
+from .schema import _check_schema_mismatch
 from .statistical_tests import _check_normality, _check_variance_homogeneity
 
 
@@ -48,6 +58,7 @@ CHECKS = {
     "class_imbalance": _check_class_imbalance,
     "high_cardinality": _check_high_cardinality,
     "duplicates": _check_duplicates,
+    "duplicate_columns": _check_duplicate_columns,
     "mixed_data_types": _check_mixed_data_types,
     "outliers": _check_outliers,
     "dataset_missingness": _check_dataset_missingness,
@@ -68,13 +79,140 @@ CHECKS = {
     "normality": _check_normality,
     "variance_homogeneity": _check_variance_homogeneity,
     "low_mutual_information": _check_low_mutual_information,
+    "schema_mismatch": _check_schema_mismatch,
 }
 
 CORRELATION_CHECKS = {"feature_correlation", "categorical_correlation", "mixed_correlation"}
 
+# Shared column primitives each check reads (see scheduler.RESOURCES). The scheduler
+# precomputes the union of these before running the selected checks concurrently.
+CHECK_REQUIREMENTS = {
+    "data_leakage": set(),
+    "high_missing_values": {"missing"},
+    "empty_columns": {"missing"},
+    "single_value_columns": {"distinct_counts"},
+    "target_leakage_patterns": {"missing", "target_groups"},
+    "class_imbalance": {"value_counts"},
+    "high_cardinality": {"distinct_counts"},
+    "duplicates": set(),
+    "duplicate_columns": {"distinct_counts", "content_hashes", "row_hashes"},
+    "mixed_data_types": set(),
+    "outliers": {"numeric_values"},
+    "dataset_missingness": {"missing"},
+    "high_zero_counts": {"numeric_values"},
+    "extreme_text_lengths": {"text_lengths"},
+    "datetime_skew": set(),
+    "datetime_future_dates": set(),
+    "datetime_gaps": set(),
+    "datetime_monotonicity": set(),
+    "missing_patterns": {"missing", "value_counts"},
+    "skewness": {"numeric_values"},
+    "dataset_drift": set(),
+    "uniform_distribution": {"numeric_values"},
+    "unique_values": {"missing", "distinct_counts"},
+    "infinite_values": set(),
+    "constant_length": {"text_lengths"},
+    "empty_dataset": set(),
+    "normality": {"numeric_values", "distinct_counts"},
+    "variance_homogeneity": {"missing", "target_groups"},
+    "low_mutual_information": {"missing", "distinct_counts"},
+    "schema_mismatch": set(),
+    "correlations": {"missing", "distinct_counts"},
+}
+
+# Relative cost of each task: 0 reads cached counts, 2 is pairwise, model-based or row-level
+# work. Unlisted tasks are 1. ``iter_tasks`` starts cheaper tasks first.
+CHECK_COSTS = {
+    "empty_dataset": 0,
+    "data_leakage": 0,
+    "high_missing_values": 0,
+    "empty_columns": 0,
+    "single_value_columns": 0,
+    "class_imbalance": 0,
+    "high_cardinality": 0,
+    "dataset_missingness": 0,
+    "unique_values": 0,
+    "infinite_values": 0,
+    "schema_mismatch": 0,
+    "mixed_data_types": 2,
+    "datetime_skew": 2,
+    "target_leakage_patterns": 2,
+    "missing_patterns": 2,
+    "dataset_drift": 2,
+    "normality": 2,
+    "variance_homogeneity": 2,
+    "low_mutual_information": 2,
+    "duplicate_columns": 2,
+    "correlations": 2,
+}
+
+# Cost tier of each task when the analysis runs on a sample: these cheap vectorised scans
+# (counts, hashes, value frequencies) run on every row of ``df_full``; all other tasks, the
+# "sample" tier, run on the sample (see ``DatasetAnalyzer(tiered=...)``).
+FULL_DATA_CHECKS = {
+    "empty_dataset",
+    "data_leakage",
+    "high_missing_values",
+    "empty_columns",
+    "single_value_columns",
+    "class_imbalance",
+    "high_cardinality",
+    "duplicates",
+    "dataset_missingness",
+    "high_zero_counts",
+    "unique_values",
+    "infinite_values",
+    "schema_mismatch",
+}
+
+# Checks whose issues for a column depend only on that column's values, so they can be
+# re-run on a subset of columns. Dataset-level checks depend only on whole-table figures.
+COLUMN_CHECKS = {
+    "high_missing_values",
+    "empty_columns",
+    "single_value_columns",
+    "high_cardinality",
+    "mixed_data_types",
+    "outliers",
+    "high_zero_counts",
+    "extreme_text_lengths",
+    "datetime_skew",
+    "datetime_future_dates",
+    "datetime_gaps",
+    "datetime_monotonicity",
+    "skewness",
+    "uniform_distribution",
+    "unique_values",
+    "infinite_values",
+    "constant_length",
+    "normality",
+}
+DATASET_CHECKS = {"empty_dataset", "duplicates", "dataset_missingness"}
+
+# Checks whose issue descriptions report row counts or ratios; their previous issues go stale
+# as soon as rows are appended, so incremental updates re-run them on every column.
+COUNTED_CHECKS = {
+    "high_missing_values",
+    "high_cardinality",
+    "duplicates",
+    "dataset_missingness",
+    "class_imbalance",
+    "duplicate_columns",
+    "outliers",
+    "high_zero_counts",
+    "extreme_text_lengths",
+    "datetime_skew",
+    "datetime_future_dates",
+    "datetime_monotonicity",
+    "infinite_values",
+    "constant_length",
+    "normality",
+}
+
 
-def run_checks(analyzer, checks_to_run: list[str]):
-    issues = []
+def check_tasks(checks_to_run: list[str]) -> list[tuple[str, Callable]]:
+    """Resolve check names to ``(name, check_fn)`` tasks; correlation checks collapse into one last task."""
+    tasks = []
     correlation_requested = False
 
     for check in checks_to_run:
@@ -82,9 +220,55 @@ def run_checks(analyzer, checks_to_run: list[str]):
             correlation_requested = True
             continue  # Skip individual correlation checks; handle via calculate_correlations
         if check in CHECKS:
-            issues.extend(CHECKS[check](analyzer))
+            tasks.append((check, CHECKS[check]))
 
     if correlation_requested:
-        issues.extend(calculate_correlations(analyzer))
+        tasks.append(("correlations", calculate_correlations))
+    return tasks
+
+
+def run_checks(analyzer, checks_to_run: list[str], n_jobs: int = 1, backend: str = "thread"):
+    """Run the named checks and return their issues in request order.
+
+    Correlation checks are computed together by ``calculate_correlations`` and their
+    issues come last. With ``n_jobs != 1`` independent checks run concurrently on a
+    thread or process pool (``backend``); the returned order is unchanged.
+    """
+    grouped = run_checks_by_name(analyzer, checks_to_run, n_jobs=n_jobs, backend=backend)
+    return [issue for issues in grouped.values() for issue in issues]
+
+
+def run_checks_by_name(
+    analyzer, checks_to_run: list[str], n_jobs: int = 1, backend: str = "thread"
+) -> dict[str, list[Issue]]:
+    """Like ``run_checks``, but keep each task's issues under its name (``"correlations"`` for the group)."""
+    return run_tasks(analyzer, check_tasks(checks_to_run), n_jobs=n_jobs, backend=backend)
+
+
+def run_tasks(
+    analyzer,
+    tasks: list[tuple[str, Callable]],
+    n_jobs: int = 1,
+    backend: str = "thread",
+    timings: list | None = None,
+) -> dict[str, list[Issue]]:
+    """Schedule ``check_tasks`` output and return each task's issues under its name."""
+    requirements = {name: CHECK_REQUIREMENTS.get(name, set()) for name, _ in tasks}
+    results = schedule_check_groups(analyzer, tasks, requirements, n_jobs=n_jobs, backend=backend, timings=timings)
+    return {name: issues for (name, _), issues in zip(tasks, results)}
+
 
-    return issues
+def iter_tasks(
+    analyzer,
+    tasks: list[tuple[str, Callable]],
+    n_jobs: int = 1,
+    backend: str = "thread",
+    timings: list | None = None,
+) -> Iterator[tuple[str, list[Issue]]]:
+    """Like ``run_tasks``, but yield ``(name, issues)`` as each task finishes, cheapest tasks started first."""
+    requirements = {name: CHECK_REQUIREMENTS.get(name, set()) for name, _ in tasks}
+    order = sorted(range(len(tasks)), key=lambda i: CHECK_COSTS.get(tasks[i][0], 1))
+    for index, issues in iter_check_groups(
+        analyzer, tasks, requirements, n_jobs=n_jobs, backend=backend, timings=timings, order=order
+    ):
+        yield tasks[index][0], issues
@@ -1,10 +1,21 @@
+import hashlib
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from ..summaries.sketches import get_column_sketch
+from ..utils.column_cache import get_column_cache
 from .core import Issue
 
 
 def _check_single_value_columns(analyzer):
+    cache = get_column_cache(analyzer)
     issues = []
     for col in analyzer.df.columns:
-        if analyzer.df[col].nunique(dropna=True) == 1:
+        sketch = get_column_sketch(analyzer, col)
+        unique_count = sketch.distinct_count() if sketch is not None else cache.n_unique(col)
+        if unique_count == 1:
             impact = "low" if col != analyzer.target_col else "high"
             severity = "warning" if col != analyzer.target_col else "critical"
             quick_fix = (
@@ -27,11 +38,16 @@ def _check_single_value_columns(analyzer):
 
 def _check_high_cardinality(analyzer):
     _cfg = analyzer.config.columns
+    cache = get_column_cache(analyzer)
     issues = []
-    categorical_cols = analyzer.df.select_dtypes(include="object").columns.tolist()
-    for col in categorical_cols:
-        unique_count = int(analyzer.df[col].nunique())
-        unique_ratio = float(unique_count / len(analyzer.df))
+    for col in cache.columns_of("object"):
+        sketch = get_column_sketch(analyzer, col)
+        if sketch is not None:
+            unique_count = sketch.distinct_count()
+            unique_ratio = float(unique_count / (sketch.count + sketch.missing))
+        else:
+            unique_count = cache.n_unique(col)
+            unique_ratio = float(unique_count / len(analyzer.df))
         if unique_count > _cfg.high_cardinality_count:
             severity = "critical" if unique_ratio > _cfg.high_cardinality_ratio_critical else "warning"
             impact = "high" if severity == "critical" else "medium"
@@ -56,9 +72,14 @@ def _check_high_cardinality(analyzer):
 def _check_duplicates(analyzer):
     issues = []
     _cfg = analyzer.config.columns
-    duplicate_rows = int(analyzer.df.duplicated().sum())
+    # A streamed analysis sees only a reservoir sample, but counted duplicates exactly over every row
+    stream = getattr(analyzer, "stream_profile", None)
+    if stream is not None and stream.duplicate_rows is not None:
+        duplicate_rows, rows = stream.duplicate_rows, stream.rows
+    else:
+        duplicate_rows, rows = int(analyzer.df.duplicated().sum()), len(analyzer.df)
     if duplicate_rows > 0:
-        duplicate_ratio = float(duplicate_rows / len(analyzer.df))
+        duplicate_ratio = float(duplicate_rows / rows)
         severity = "critical" if duplicate_ratio > _cfg.duplicate_ratio_critical else "warning"
         impact = "high" if severity == "critical" else "medium"
         quick_fix = (
@@ -80,9 +101,10 @@ def _check_duplicates(analyzer):
 
 
 def _check_mixed_data_types(analyzer):
+    cache = get_column_cache(analyzer)
     issues = []
     for col in analyzer.df.columns:
-        types = analyzer.df[col].dropna().map(type).nunique()
+        types = cache.non_null(col).map(type).nunique()
         if types > 1:
             issues.append(
                 Issue(
@@ -95,3 +117,179 @@ def _check_mixed_data_types(analyzer):
                 )
             )
     return issues
+
+
+_DUPLICATE_COLUMN_FIX = (
+    "Options: \n- Drop column: Removes redundant information (Pros: Smaller, less collinear data; Cons: None if truly redundant)."
+    "\n- Verify join/export: Copies often come from merges (e.g., '_x'/'_y' suffixes) (Pros: Fixes the source; Cons: Time-consuming)."
+)
+
+
+def _digest(values: np.ndarray) -> str:
+    return hashlib.blake2b(np.ascontiguousarray(values).tobytes(), digest_size=16).hexdigest()
+
+
+def _check_duplicate_columns(analyzer):
+    """Flag columns that repeat an earlier column: exact copies, re-encoded copies, monotone transforms
+    and near-duplicates. Each kind is found by hashing columns into buckets, not by comparing all pairs.
+    """
+    _cfg = analyzer.config.columns
+    cache = get_column_cache(analyzer)
+    # Constant columns are reported by single_value_columns and a copy of the target by data_leakage
+    columns = [c for c in analyzer.df.columns if c != analyzer.target_col and cache.n_unique(c) > 1]
+    duplicate_of: dict[str, tuple[str, str]] = {}
+
+    def group(key_fn, kind, cols):
+        buckets = defaultdict(list)
+        for col in cols:
+            if col not in duplicate_of:
+                buckets[key_fn(col)].append(col)
+        for cols_in_bucket in buckets.values():
+            for col in cols_in_bucket[1:]:
+                duplicate_of[col] = (cols_in_bucket[0], kind)
+
+    # Exact copies: same dtype and values (``equals`` guards against hash collisions)
+    group(cache.content_hash, "exact", columns)
+    for col, (original, _) in list(duplicate_of.items()):
+        if not analyzer.df[col].equals(analyzer.df[original]):
+            del duplicate_of[col]
+    # Same values in another representation (5 / 5.0 / "5")
+    group(lambda c: _digest(cache.row_hashes(c)), "reencoded", columns)
+    # Strictly monotone transforms of a numeric column share its dense ranks (or their reverse)
+    numeric = [c for c in cache.columns_of("number") if c in columns and cache.n_unique(c) > 2]
+    ranks = {c: analyzer.df[c].rank(method="dense").fillna(0).to_numpy() for c in numeric}
+    group(lambda c: _digest(ranks[c]), "increasing", numeric)
+    ascending = {_digest(ranks[c]): c for c in numeric if c not in duplicate_of}
+    for col in numeric:
+        if col not in duplicate_of:
+            reverse = np.where(ranks[col] > 0, ranks[col].max() + 1 - ranks[col], 0)
+            original = ascending.get(_digest(reverse))
+            if original is not None and original != col and original not in duplicate_of:
+                first, second = sorted((original, col), key=analyzer.df.columns.get_loc)
+                duplicate_of[second] = (first, "decreasing")
+    near = _near_duplicate_columns(analyzer, cache, [c for c in columns if c not in duplicate_of], _cfg)
+
+    issues = []
+    for col in analyzer.df.columns:
+        if col in duplicate_of:
+            original, kind = duplicate_of[col]
+            description = {
+                "exact": f"Column '{col}' is an exact copy of '{original}'",
+                "reencoded": f"Column '{col}' holds the same values as '{original}' "
+                f"stored as {analyzer.df[col].dtype} instead of {analyzer.df[original].dtype}",
+                "increasing": f"Column '{col}' is an increasing transform of '{original}' (same ordering of rows)",
+                "decreasing": f"Column '{col}' is a decreasing transform of '{original}' (reversed ordering of rows)",
+            }[kind]
+            impact = "medium"
+        elif col in near:
+            original, ratio, common = near[col]
+            description = f"Column '{col}' matches '{original}' on {ratio:.1%} of rows"
+            if common is not None:
+                description += f" where either is not {common!r}"
+            impact = "low"
+        else:
+            continue
+        issues.append(
+            Issue(
+                category="duplicate_columns",
+                severity="warning",
+                column=col,
+                description=description,
+                impact_score=impact,
+                quick_fix=_DUPLICATE_COLUMN_FIX,
+            )
+        )
+    return issues
+
+
+def _minhash(keys: np.ndarray, size: int) -> np.ndarray:
+    """One-permutation MinHash signature of a set of ``uint64`` keys, densified by rotation.
+
+    Keys are hashed once and split into ``size`` bins by hash; each bin keeps its smallest hash, and
+    an empty bin borrows the next non-empty bin to its right, offset by the distance between them.
+    """
+    hashed = pd.util.hash_array(keys)
+    unset = np.iinfo(np.uint64).max
+    signature = np.full(size, unset, dtype=np.uint64)
+    np.minimum.at(signature, (hashed % np.uint64(size)).astype(np.intp), hashed // np.uint64(size))
+    empty = signature == unset
+    if empty.any():
+        filled = np.flatnonzero(~empty)
+        position = np.searchsorted(filled, np.arange(size)) % len(filled)
+        distance = (filled[position] - np.arange(size)) % size
+        signature = signature[filled[position]] + distance.astype(np.uint64) * np.uint64(unset // size)
+    return signature
+
+
+def _near_duplicate_columns(analyzer, cache, columns: list, _cfg) -> dict[str, tuple[str, float, object]]:
+    """Map each column that agrees with an earlier one on ``near_duplicate_ratio`` of rows to
+    ``(earlier, ratio, common)``.
+
+    Rows where both columns hold the same most common value (``common``, else ``None``) are
+    left out of the ratio: two mostly-zero flags agree on nearly every row without being related.
+
+    Candidates come from MinHash signatures of each column's set of ``(row, value)`` pairs. A value
+    covering most of a column's rows is left out of its set, so sparse flags are compared where they
+    are set; such columns are only paired with columns leaving out the same value. Agreeing on a
+    share ``r`` of counted rows implies a Jaccard similarity of at least ``r / (2 - r)``, which the
+    signatures are filtered on. Columns with equal signatures are paired with the first of them only,
+    and LSH buckets pair each column with at most ``minhash_bucket_size`` earlier members, so
+    candidates grow with the number of columns rather than its square. Candidates are then verified
+    on all rows.
+    """
+    n_rows = len(analyzer.df)
+    if len(columns) < 2 or n_rows == 0:
+        return {}
+    size = _cfg.minhash_size
+    row_keys = pd.util.hash_array(np.arange(n_rows, dtype=np.uint64))
+    dropped, signatures = [], []
+    for col in columns:
+        hashes = cache.row_hashes(col)
+        mode, count = cache.row_hash_mode(col)
+        drop = mode if 2 * count > cache.non_missing_count(col) else 0
+        # A missing value never matches, not even another missing value
+        kept = (hashes != 0) & (hashes != drop)
+        dropped.append(drop)
+        signatures.append(_minhash(hashes[kept] ^ row_keys[kept], size) if kept.any() else None)
+    pairable = [i for i, signature in enumerate(signatures) if signature is not None]
+
+    candidates = set()
+    same = defaultdict(list)
+    for i in pairable:
+        same[(dropped[i], signatures[i].tobytes())].append(i)
+    representatives = []
+    for members in same.values():
+        representatives.append(members[0])
+        candidates.update((members[0], i) for i in members[1:])
+    band = max(1, min(_cfg.minhash_band_rows, size))
+    cap = _cfg.minhash_bucket_size
+    for start in range(0, size - band + 1, band):
+        buckets = defaultdict(list)
+        for i in sorted(representatives):
+            buckets[(dropped[i], signatures[i][start : start + band].tobytes())].append(i)
+        for members in buckets.values():
+            candidates.update((a, b) for n, b in enumerate(members) for a in members[: min(n, cap)])
+
+    # Cheap filter on the signatures (with slack for their sampling error) before the full-row check
+    jaccard = _cfg.near_duplicate_ratio / (2 - _cfg.near_duplicate_ratio)
+    slack = 3 * np.sqrt(jaccard * (1 - jaccard) / size) + 1 / size
+    near: dict[str, tuple[str, float, object]] = {}
+    for a, b in sorted(candidates):
+        first, second = columns[a], columns[b]
+        if second in near or np.mean(signatures[a] == signatures[b]) < jaccard - slack:
+            continue
+        ha, hb = cache.row_hashes(first), cache.row_hashes(second)
+        counted = (ha != 0) | (hb != 0)
+        mode = cache.row_hash_mode(first)[0]
+        common = None
+        if mode != 0 and mode == cache.row_hash_mode(second)[0]:
+            both_common = (ha == mode) & (hb == mode)
+            counted &= ~both_common
+            common = analyzer.df[first].iloc[int(np.argmax(both_common))]
+            common = common.item() if isinstance(common, np.generic) else common
+        if not counted.any():
+            continue
+        ratio = float(((ha == hb) & counted).sum() / counted.sum())
+        if ratio >= _cfg.near_duplicate_ratio:
+            near[second] = (first, ratio, common)
+    return near
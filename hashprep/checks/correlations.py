@@ -4,7 +4,8 @@ import numpy as np
 import pandas as pd
 from scipy.stats import chi2_contingency, kendalltau, pearsonr, spearmanr
 
-from ..utils.type_inference import is_usable_for_corr
+from ..utils.column_cache import get_column_cache
+from ..utils.pair_screening import is_wide, screen_numeric_pairs
 from .core import Issue
 from .discretizer import DiscretizationType, Discretizer
 
@@ -36,17 +37,18 @@ def calculate_correlations(analyzer, thresholds=None):
         thresholds = _cfg.as_nested_dict()
 
     inferred_types = analyzer.column_types  # Use analyzer.column_types for inferred types dict
+    cache = get_column_cache(analyzer)
     issues = []
 
-    numeric_cols = [
-        col for col, typ in inferred_types.items() if typ == "Numeric" and is_usable_for_corr(analyzer.df[col])
-    ]
+    def _usable(col):
+        # Same test as type_inference.is_usable_for_corr, served from the column cache
+        return cache.n_unique(col) > 1 and cache.non_missing_count(col) > 1
+
+    numeric_cols = [col for col, typ in inferred_types.items() if typ == "Numeric" and _usable(col)]
     cat_cols = [
         col
         for col, typ in inferred_types.items()
-        if typ == "Categorical"
-        and 1 < analyzer.df[col].nunique() <= _cfg.max_distinct_categories
-        and is_usable_for_corr(analyzer.df[col])
+        if typ == "Categorical" and 1 < cache.n_unique(col) <= _cfg.max_distinct_categories and _usable(col)
     ]
 
     issues.extend(_check_numeric_correlation(analyzer, numeric_cols, thresholds["numeric"]))
@@ -64,7 +66,16 @@ def _check_numeric_correlation(analyzer, numeric_cols: list, thresholds: dict):
 
     num_df = analyzer.df[numeric_cols].dropna(how="all")
 
-    for col1, col2 in combinations(numeric_cols, 2):
+    wide_cfg = analyzer.config.wide_table
+    if is_wide(len(numeric_cols), wide_cfg):
+        # Only pairs the screen estimates near or above a warning threshold get the exact tests
+        floor = min(t["warning"] for t in thresholds.values()) - wide_cfg.screen_margin
+        candidates = screen_numeric_pairs(num_df, numeric_cols, wide_cfg, min_score=floor)
+        pairs = [(col1, col2) for col1, col2, score in candidates if score >= floor]
+    else:
+        pairs = combinations(numeric_cols, 2)
+
+    for col1, col2 in pairs:
         series1, series2 = num_df[col1].dropna(), num_df[col2].dropna()
         common_idx = series1.index.intersection(series2.index)
         if len(common_idx) < 2:
@@ -1,16 +1,10 @@
 import numpy as np
-import pandas as pd
 
+from ..utils import datetimes
+from ..utils.column_cache import get_column_cache
 from .core import Issue
 
 
-def _coerce_datetime(series: pd.Series) -> pd.Series:
-    """Return a datetime Series regardless of whether the source is datetime64 or object."""
-    if pd.api.types.is_datetime64_any_dtype(series):
-        return series.dropna()
-    return pd.to_datetime(series, errors="coerce").dropna()
-
-
 def _datetime_cols(analyzer) -> list[str]:
     """Return columns inferred as DateTime."""
     return [col for col, typ in analyzer.column_types.items() if typ == "DateTime"]
@@ -19,19 +13,21 @@ def _datetime_cols(analyzer) -> list[str]:
 def _check_datetime_future_dates(analyzer) -> list[Issue]:
     """Flag datetime columns that contain values in the future (likely data errors)."""
     _cfg = analyzer.config.datetime
+    cache = get_column_cache(analyzer)
     issues = []
-    now = pd.Timestamp.now()
 
     for col in _datetime_cols(analyzer):
-        dt = _coerce_datetime(analyzer.df[col])
+        dt = cache.datetime_values(col)
         if dt.empty:
             continue
 
-        future_count = int((dt > now).sum())
+        sorted_ns = cache.datetime_sorted_ns(col)
+        future_count = len(sorted_ns) - int(np.searchsorted(sorted_ns, datetimes.now_ns(dt), side="right"))
         if future_count == 0:
             continue
 
         future_ratio = future_count / len(dt)
+        latest = datetimes.to_timestamp(sorted_ns[-1], dt)
         severity = "critical" if future_ratio > _cfg.future_date_critical_ratio else "warning"
         impact = "high" if severity == "critical" else "medium"
         issues.append(
@@ -41,7 +37,7 @@ def _check_datetime_future_dates(analyzer) -> list[Issue]:
                 column=col,
                 description=(
                     f"Column '{col}' has {future_count} future-dated values "
-                    f"({future_ratio:.1%} of non-missing) — latest: {dt.max().date()}"
+                    f"({future_ratio:.1%} of non-missing) — latest: {latest.date()}"
                 ),
                 impact_score=impact,
                 quick_fix=(
@@ -58,34 +54,30 @@ def _check_datetime_future_dates(analyzer) -> list[Issue]:
 def _check_datetime_gaps(analyzer) -> list[Issue]:
     """Detect anomalously large gaps in datetime columns (broken time series)."""
     _cfg = analyzer.config.datetime
+    cache = get_column_cache(analyzer)
     issues = []
 
     for col in _datetime_cols(analyzer):
-        dt = _coerce_datetime(analyzer.df[col]).sort_values()
+        dt = cache.datetime_values(col)
         if len(dt) < _cfg.min_rows_for_gap_check:
             continue
 
-        diffs = dt.diff().dropna()
-        if diffs.empty:
-            continue
-
-        # Work in total seconds for a unit-agnostic comparison
-        diff_seconds = diffs.dt.total_seconds()
-        median_gap = float(diff_seconds.median())
+        gaps = cache.datetime_gaps_ns(col)
+        median_gap = float(np.median(gaps))
         if median_gap <= 0:
             continue
 
-        max_gap = float(diff_seconds.max())
-        ratio = max_gap / median_gap
+        gap_idx = int(np.argmax(gaps))
+        ratio = float(gaps[gap_idx]) / median_gap
 
         if ratio >= _cfg.gap_multiplier_warning:
             severity = "critical" if ratio >= _cfg.gap_multiplier_critical else "warning"
             impact = "high" if severity == "critical" else "medium"
 
             # Locate the gap for a human-readable description
-            gap_idx = int(np.argmax(diff_seconds.values))
-            gap_start = dt.iloc[gap_idx]
-            gap_end = dt.iloc[gap_idx + 1]
+            sorted_ns = cache.datetime_sorted_ns(col)
+            gap_start = datetimes.to_timestamp(sorted_ns[gap_idx], dt)
+            gap_end = datetimes.to_timestamp(sorted_ns[gap_idx + 1], dt)
             gap_days = (gap_end - gap_start).days
 
             issues.append(
@@ -113,22 +105,22 @@ def _check_datetime_gaps(analyzer) -> list[Issue]:
 def _check_datetime_monotonicity(analyzer) -> list[Issue]:
     """Warn when a datetime column that looks like a time-series index is non-monotonic."""
     _cfg = analyzer.config.datetime
+    cache = get_column_cache(analyzer)
     issues = []
 
     for col in _datetime_cols(analyzer):
-        dt = _coerce_datetime(analyzer.df[col])
+        dt = cache.datetime_values(col)
         if len(dt) < _cfg.min_rows_for_gap_check:
             continue
 
         # Only flag if the column has mostly unique values (i.e., likely an index/timestamp)
-        unique_ratio = dt.nunique() / len(dt)
+        unique_ratio = (1 + np.count_nonzero(cache.datetime_gaps_ns(col))) / len(dt)
         if unique_ratio < 0.9:
             continue
 
         if not (dt.is_monotonic_increasing or dt.is_monotonic_decreasing):
             # Count out-of-order entries
-            sorted_dt = dt.sort_values()
-            out_of_order = int((dt.reset_index(drop=True) != sorted_dt.reset_index(drop=True)).sum())
+            out_of_order = int(np.count_nonzero(cache.datetime_ns(col) != cache.datetime_sorted_ns(col)))
             out_ratio = out_of_order / len(dt)
             severity = "warning"
             impact = "medium"
@@ -1,5 +1,7 @@
 from scipy.stats import kstest
 
+from ..summaries.sketches import get_column_sketch
+from ..utils.column_cache import get_column_cache
 from .core import Issue
 
 
@@ -9,10 +11,11 @@ def _check_uniform_distribution(analyzer) -> list[Issue]:
     Uniform distributions often indicate synthetic IDs or sequential data.
     """
     _cfg = analyzer.config.distribution
+    cache = get_column_cache(analyzer)
     issues = []
 
-    for col in analyzer.df.select_dtypes(include="number").columns:
-        series = analyzer.df[col].dropna()
+    for col in cache.columns_of("number"):
+        series = cache.non_null(col)
         if len(series) < _cfg.uniform_min_samples:
             continue
 
@@ -51,15 +54,17 @@ def _check_unique_values(analyzer) -> list[Issue]:
     High uniqueness often indicates identifiers, names, or free-text fields.
     """
     _cfg = analyzer.config.distribution
+    cache = get_column_cache(analyzer)
     issues = []
 
     for col in analyzer.df.columns:
-        series = analyzer.df[col].dropna()
-        if len(series) < _cfg.unique_min_samples:
+        sketch = get_column_sketch(analyzer, col)
+        non_missing = sketch.count if sketch is not None else cache.non_missing_count(col)
+        if non_missing < _cfg.unique_min_samples:
             continue
 
-        unique_count = series.nunique()
-        unique_ratio = unique_count / len(series)
+        unique_count = sketch.distinct_count() if sketch is not None else cache.n_unique(col)
+        unique_ratio = unique_count / non_missing
 
         if unique_ratio >= _cfg.unique_value_ratio:
             issues.append(
@@ -1,3 +1,4 @@
+from ..utils.column_cache import get_column_cache
 from .core import Issue
 
 
@@ -5,7 +6,10 @@ def _check_class_imbalance(analyzer):
     threshold = analyzer.config.imbalance.majority_class_ratio
     issues = []
     if analyzer.target_col and analyzer.target_col in analyzer.df.columns:
-        counts = analyzer.df[analyzer.target_col].value_counts(normalize=True)
+        counts = get_column_cache(analyzer).value_counts(analyzer.target_col)
+        if counts.empty:
+            return issues
+        counts = counts / counts.sum()
         if counts.max() > threshold:
             issues.append(
                 Issue(
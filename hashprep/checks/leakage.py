@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 from scipy.stats import chi2_contingency, f_oneway
 
+from ..utils.column_cache import get_column_cache, split_by_level
 from ..utils.logging import get_logger
 from .core import Issue
 
@@ -21,11 +22,14 @@ _LEAKAGE_WARNING_FIX = (
 def _check_data_leakage(analyzer):
     issues = []
     if analyzer.target_col and analyzer.target_col in analyzer.df.columns:
+        cache = get_column_cache(analyzer)
         target = analyzer.df[analyzer.target_col]
+        target_hash = cache.content_hash(analyzer.target_col)
         for col in analyzer.df.columns:
             if col == analyzer.target_col:
                 continue
-            if analyzer.df[col].equals(target):
+            # Only a column whose hash matches the target's can equal it; equals() rules out collisions
+            if cache.content_hash(col) == target_hash and analyzer.df[col].equals(target):
                 issues.append(
                     Issue(
                         category="data_leakage",
@@ -41,14 +45,14 @@ def _check_data_leakage(analyzer):
 
 def _check_target_leakage_patterns(analyzer):
     _leak = analyzer.config.leakage
+    cache = get_column_cache(analyzer)
     issues = []
     if analyzer.target_col and analyzer.target_col in analyzer.df.columns:
         target = analyzer.df[analyzer.target_col]
+        numeric_names = [c for c in cache.columns_of("number") if c != analyzer.target_col]
         # Numeric target
         if pd.api.types.is_numeric_dtype(target):
-            numeric_cols = analyzer.df.select_dtypes(include="number").drop(
-                columns=[analyzer.target_col], errors="ignore"
-            )
+            numeric_cols = analyzer.df[numeric_names]
             if not numeric_cols.empty:
                 corrs = numeric_cols.corrwith(target).abs()
                 for col, corr in corrs.items():
@@ -74,8 +78,8 @@ def _check_target_leakage_patterns(analyzer):
                         )
         # Categorical target
         else:
-            cat_cols = analyzer.df.select_dtypes(include="object").drop(columns=[analyzer.target_col], errors="ignore")
-            for col in cat_cols.columns:
+            cat_cols = [c for c in cache.columns_of("object") if c != analyzer.target_col]
+            for col in cat_cols:
                 try:
                     table = pd.crosstab(target, analyzer.df[col])
                     chi2, _, _, _ = chi2_contingency(table)
@@ -106,15 +110,12 @@ def _check_target_leakage_patterns(analyzer):
                 except (ValueError, np.linalg.LinAlgError) as e:
                     _log.debug("Chi-square leakage test failed for '%s': %s", col, e)
                     continue
-            numeric_cols = analyzer.df.select_dtypes(include="number").drop(
-                columns=[analyzer.target_col], errors="ignore"
-            )
-            for col in numeric_cols.columns:
-                groups = [
-                    analyzer.df.loc[target == level, col].dropna().to_numpy()
-                    for level in target.dropna().unique()
-                    if len(analyzer.df.loc[target == level, col].dropna()) > 1
-                ]
+            levels, codes = cache.level_codes(analyzer.target_col)
+            for col in numeric_names:
+                values = analyzer.df[col].to_numpy()
+                present = ~cache.isna(col).to_numpy()
+                groups = split_by_level(values, codes, len(levels), present)
+                groups = [g for g in groups if len(g) > 1]
                 if len(groups) < 2 or all(np.var(g, ddof=1) == 0 for g in groups):
                     continue
                 try:
@@ -6,6 +6,7 @@ from numpy.linalg import LinAlgError
 from scipy.stats import chi2_contingency, mannwhitneyu
 
 from ..config import DEFAULT_CONFIG
+from ..utils.column_cache import get_column_cache
 from ..utils.logging import get_logger
 from .core import Issue
 
@@ -16,9 +17,11 @@ _THRESHOLDS = DEFAULT_CONFIG.missing_values
 
 def _check_high_missing_values(analyzer):
     _cfg = analyzer.config.missing_values
+    cache = get_column_cache(analyzer)
+    rows = len(analyzer.df)
     issues = []
     for col in analyzer.df.columns:
-        missing_pct = float(analyzer.df[col].isna().mean())
+        missing_pct = cache.missing_count(col) / rows if rows > 0 else 0.0
         if missing_pct > _cfg.warning:
             severity = "critical" if missing_pct > _cfg.critical else "warning"
             impact = "high" if severity == "critical" else "medium"
@@ -41,9 +44,10 @@ def _check_high_missing_values(analyzer):
 
 
 def _check_empty_columns(analyzer):
+    cache = get_column_cache(analyzer)
     issues = []
     for col in analyzer.df.columns:
-        if int(analyzer.df[col].notna().sum()) == 0:
+        if cache.non_missing_count(col) == 0:
             issues.append(
                 Issue(
                     category="empty_column",
@@ -59,8 +63,13 @@ def _check_empty_columns(analyzer):
 
 def _check_dataset_missingness(analyzer):
     _cfg = analyzer.config.missing_values
+    cache = get_column_cache(analyzer)
     issues = []
-    missing_pct = float((analyzer.df.isnull().sum().sum() / (analyzer.df.shape[0] * analyzer.df.shape[1])) * 100)
+    total_cells = analyzer.df.shape[0] * analyzer.df.shape[1]
+    if total_cells == 0:
+        return issues
+    missing_cells = sum(cache.missing_count(col) for col in analyzer.df.columns)
+    missing_pct = float(missing_cells / total_cells * 100)
     if missing_pct > _cfg.dataset_warning_pct:
         severity = "critical" if missing_pct > _cfg.dataset_critical_pct else "warning"
         impact = "high" if severity == "critical" else "medium"
@@ -86,26 +95,26 @@ def _check_missing_patterns(analyzer):
     _cfg = analyzer.config.missing_values
     threshold = _cfg.pattern_p_value
     critical_p_threshold = _cfg.pattern_critical_p_value
+    cache = get_column_cache(analyzer)
     issues = []
-    missing_cols = [
-        col for col in analyzer.df.columns if int(analyzer.df[col].isna().sum()) >= _cfg.pattern_min_missing_count
-    ]
+    missing_cols = [col for col in analyzer.df.columns if cache.missing_count(col) >= _cfg.pattern_min_missing_count]
 
     # grouping logic
     cat_patterns = defaultdict(list)  # (missing_col, correlated_col, p_val, cramers_v)
     num_patterns = defaultdict(list)  # (missing_col, correlated_col, p_val, cohens_d)
 
     for col in missing_cols:
-        for other_col in analyzer.df.select_dtypes(include=["object", "category"]).columns:
+        for other_col in cache.columns_of(["object", "category"]):
             if col == other_col:
                 continue
             try:
-                value_counts = analyzer.df[other_col].value_counts()
+                value_counts = cache.value_counts(other_col)
                 rare_cats = value_counts[value_counts < _cfg.pattern_rare_category_count].index
                 temp_col = analyzer.df[other_col].copy()
                 if not rare_cats.empty:
-                    temp_col = temp_col.where(~temp_col.isin(rare_cats), "Other")
-                is_missing = analyzer.df[col].isna().astype(int)
+                    # As object, since a category column cannot take the new "Other" level
+                    temp_col = temp_col.astype(object).where(~temp_col.isin(rare_cats), "Other")
+                is_missing = cache.isna(col).astype(int)
                 table = pd.crosstab(is_missing, temp_col)
                 if table.shape[0] < 2 or table.shape[1] < 2:
                     continue
@@ -130,12 +139,15 @@ def _check_missing_patterns(analyzer):
                 _log.debug("Chi-square test failed for '%s' vs '%s': %s", col, other_col, e)
                 continue
 
-        for other_col in analyzer.df.select_dtypes(include=["int64", "float64"]).columns:
+        is_missing_mask = cache.isna(col).to_numpy()
+        for other_col in cache.columns_of(["int64", "float64"]):
             if col == other_col:
                 continue
             try:
-                missing = analyzer.df[analyzer.df[col].isna()][other_col].dropna()
-                non_missing = analyzer.df[analyzer.df[col].notna()][other_col].dropna()
+                other_values = analyzer.df[other_col].to_numpy()
+                other_present = ~cache.isna(other_col).to_numpy()
+                missing = other_values[is_missing_mask & other_present]
+                non_missing = other_values[~is_missing_mask & other_present]
                 if len(missing) < _cfg.pattern_min_group_size or len(non_missing) < _cfg.pattern_min_group_size:
                     continue
 
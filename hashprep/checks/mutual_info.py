@@ -5,6 +5,7 @@ and is likely useless (or worse — noise) for a predictive model.
 """
 
 from ..summaries.mutual_info import summarize_mutual_information
+from ..utils.column_cache import get_column_cache
 from .core import Issue
 
 
@@ -16,7 +17,12 @@ def _check_low_mutual_information(analyzer) -> list[Issue]:
     if analyzer.target_col is None:
         return []
 
-    mi_result = summarize_mutual_information(analyzer.df, analyzer.target_col, analyzer.column_types)
+    # Reuse the mutual_information summary when analyze() already computed it
+    mi_result = getattr(analyzer, "summaries", {}).get("mutual_information")
+    if mi_result is None:
+        mi_result = summarize_mutual_information(
+            analyzer.df, analyzer.target_col, analyzer.column_types, column_cache=get_column_cache(analyzer)
+        )
     if not mi_result or not mi_result.get("scores"):
         return []
 
@@ -26,7 +32,7 @@ def _check_low_mutual_information(analyzer) -> list[Issue]:
     task = mi_result["task"]
 
     for col, score in scores.items():
-        if score < _cfg.low_mi_warning:
+        if score < _cfg.low_mi_warning and col in analyzer.df.columns:
             issues.append(
                 Issue(
                     category="low_mutual_information",
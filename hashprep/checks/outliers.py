@@ -1,7 +1,7 @@
 import numpy as np
-import pandas as pd
 
 from ..config import DEFAULT_CONFIG
+from ..utils.column_cache import get_column_cache
 from .core import Issue
 
 _THRESHOLDS = DEFAULT_CONFIG.outliers
@@ -9,9 +9,10 @@ _THRESHOLDS = DEFAULT_CONFIG.outliers
 
 def _check_outliers(analyzer):
     _cfg = analyzer.config.outliers
+    cache = get_column_cache(analyzer)
     issues = []
-    for col in analyzer.df.select_dtypes(include="number").columns:
-        series = analyzer.df[col].dropna()
+    for col in cache.columns_of("number"):
+        series = cache.non_null(col)
         if len(series) == 0:
             continue
         z_scores = (series - series.mean()) / series.std(ddof=0)
@@ -40,9 +41,10 @@ def _check_outliers(analyzer):
 
 def _check_high_zero_counts(analyzer):
     _cfg = analyzer.config.outliers
+    cache = get_column_cache(analyzer)
     issues = []
-    for col in analyzer.df.select_dtypes(include="number").columns:
-        series = analyzer.df[col].dropna()
+    for col in cache.columns_of("number"):
+        series = cache.non_null(col)
         if len(series) == 0:
             continue
         zero_pct = float((series == 0).mean())
@@ -69,12 +71,12 @@ def _check_high_zero_counts(analyzer):
 
 def _check_extreme_text_lengths(analyzer):
     _cfg = analyzer.config.outliers
+    cache = get_column_cache(analyzer)
     issues = []
-    for col in analyzer.df.select_dtypes(include="object").columns:
-        series = analyzer.df[col].dropna().astype(str)
-        if series.empty:
+    for col in cache.columns_of("object"):
+        lengths = cache.str_lengths(col)
+        if lengths.empty:
             continue
-        lengths = series.str.len()
         if lengths.max() > _cfg.text_length_max or lengths.min() < _cfg.text_length_min:
             extreme_ratio = float(((lengths > _cfg.text_length_max) | (lengths < _cfg.text_length_min)).mean())
             severity = "critical" if extreme_ratio > _cfg.extreme_ratio_critical else "warning"
@@ -99,9 +101,10 @@ def _check_extreme_text_lengths(analyzer):
 
 def _check_skewness(analyzer):
     _cfg = analyzer.config.outliers
+    cache = get_column_cache(analyzer)
     issues = []
-    for col in analyzer.df.select_dtypes(include="number").columns:
-        series = analyzer.df[col].dropna()
+    for col in cache.columns_of("number"):
+        series = cache.non_null(col)
         if len(series) < _cfg.min_sample_size:
             continue
         skewness = float(series.skew())
@@ -130,9 +133,10 @@ def _check_skewness(analyzer):
 
 def _check_datetime_skew(analyzer):
     _cfg = analyzer.config.outliers
+    cache = get_column_cache(analyzer)
     issues = []
-    for col in analyzer.df.select_dtypes(include="datetime64").columns:
-        series = pd.to_datetime(analyzer.df[col], errors="coerce").dropna()
+    for col in cache.columns_of("datetime64"):
+        series = cache.datetime_values(col)
         if series.empty:
             continue
         year_counts = series.dt.year.value_counts(normalize=True)
@@ -152,8 +156,9 @@ def _check_datetime_skew(analyzer):
 
 def _check_infinite_values(analyzer):
     _cfg = analyzer.config.outliers
+    cache = get_column_cache(analyzer)
     issues = []
-    for col in analyzer.df.select_dtypes(include="number").columns:
+    for col in cache.columns_of("number"):
         series = analyzer.df[col]
         inf_count = int(np.isinf(series).sum())
         if inf_count > 0:
@@ -180,12 +185,12 @@ def _check_infinite_values(analyzer):
 
 def _check_constant_length(analyzer):
     _cfg = analyzer.config.outliers
+    cache = get_column_cache(analyzer)
     issues = []
-    for col in analyzer.df.select_dtypes(include="object").columns:
-        series = analyzer.df[col].dropna().astype(str)
-        if len(series) < _cfg.min_sample_size:
+    for col in cache.columns_of("object"):
+        lengths = cache.str_lengths(col)
+        if len(lengths) < _cfg.min_sample_size:
             continue
-        lengths = series.str.len()
         most_common_length_ratio = lengths.value_counts(normalize=True).iloc[0] if len(lengths) > 0 else 0
 
         if most_common_length_ratio >= _cfg.constant_length_ratio:
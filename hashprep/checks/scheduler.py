@@ -0,0 +1,217 @@
+"""Dependency-aware scheduling of checks.
+
+Every check declares the shared column primitives it reads (see
+``CHECK_REQUIREMENTS`` in ``hashprep.checks``). The scheduler warms those
+primitives first, in the column cache of the analyzer each check reads (a
+wrapper such as the full-data tier names it through a ``target`` method),
+then runs the checks concurrently on a thread or process pool. Issues are always returned in the
+order the checks were requested, so results do not depend on ``n_jobs``;
+``iter_check_groups`` instead yields each task's issues as soon as it finishes.
+Passing a ``timings`` list records a ``Timing`` per check (see
+``hashprep.utils.profiling``).
+"""
+
+import tracemalloc
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from ..utils.column_cache import ColumnProfileCache, get_column_cache
+from ..utils.parallel import resolve_n_jobs
+from ..utils.profiling import Timing, measure, timed_check
+from .core import Issue
+
+BACKENDS = ("thread", "process")
+
+
+def _warm_missing(analyzer, cache: ColumnProfileCache) -> None:
+    for col in analyzer.df.columns:
+        cache.missing_count(col)
+
+
+def _warm_distinct_counts(analyzer, cache: ColumnProfileCache) -> None:
+    for col in analyzer.df.columns:
+        cache.n_unique(col)
+
+
+def _warm_numeric_values(analyzer, cache: ColumnProfileCache) -> None:
+    for col in cache.columns_of("number"):
+        cache.non_null(col)
+
+
+def _warm_value_counts(analyzer, cache: ColumnProfileCache) -> None:
+    for col in cache.columns_of(["object", "category"]):
+        cache.value_counts(col)
+
+
+def _warm_text_lengths(analyzer, cache: ColumnProfileCache) -> None:
+    for col in cache.columns_of("object"):
+        cache.str_lengths(col)
+
+
+def _warm_target_groups(analyzer, cache: ColumnProfileCache) -> None:
+    if analyzer.target_col is not None and analyzer.target_col in analyzer.df.columns:
+        cache.level_codes(analyzer.target_col)
+
+
+def _warm_content_hashes(analyzer, cache: ColumnProfileCache) -> None:
+    for col in analyzer.df.columns:
+        cache.content_hash(col)
+
+
+def _warm_row_hashes(analyzer, cache: ColumnProfileCache) -> None:
+    for col in analyzer.df.columns:
+        cache.row_hashes(col)
+
+
+# Shared primitives a check can depend on, and how to precompute each of them.
+RESOURCES: dict[str, Callable] = {
+    "missing": _warm_missing,
+    "distinct_counts": _warm_distinct_counts,
+    "numeric_values": _warm_numeric_values,
+    "value_counts": _warm_value_counts,
+    "text_lengths": _warm_text_lengths,
+    "target_groups": _warm_target_groups,
+    "content_hashes": _warm_content_hashes,
+    "row_hashes": _warm_row_hashes,
+}
+
+
+# Process workers receive the analyzer once, via the pool initializer, instead of once per check.
+_WORKER_ANALYZER = None
+
+
+def _init_worker(analyzer, trace_memory: bool = False) -> None:
+    global _WORKER_ANALYZER
+    _WORKER_ANALYZER = analyzer
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def _run_in_worker(check_fn: Callable) -> list[Issue]:
+    return check_fn(_WORKER_ANALYZER)
+
+
+def _run_timed_in_worker(name: str, check_fn: Callable) -> tuple[list[Issue], Timing]:
+    # Each process worker runs one check at a time, so its tracemalloc peak is attributable
+    return timed_check(name, check_fn, _WORKER_ANALYZER)
+
+
+def _check_target(analyzer, check_fn: Callable):
+    """The analyzer ``check_fn`` reads: ``check_fn.target(analyzer)`` where defined, else ``analyzer``."""
+    target = getattr(check_fn, "target", None)
+    return target(analyzer) if target is not None else analyzer
+
+
+def schedule_checks(
+    analyzer,
+    tasks: list[tuple[str, Callable]],
+    requirements: dict[str, Iterable[str]],
+    n_jobs: int = 1,
+    backend: str = "thread",
+) -> list[Issue]:
+    """Run ``tasks`` (``(name, check_fn)`` pairs) and concatenate their issues in task order.
+
+    ``requirements`` maps task names to the RESOURCES to precompute before any check starts.
+    With ``n_jobs == 1`` the checks run serially in the calling thread and fill the
+    column cache lazily, so nothing is precomputed.
+    """
+    results = schedule_check_groups(analyzer, tasks, requirements, n_jobs=n_jobs, backend=backend)
+    return [issue for issues in results for issue in issues]
+
+
+def schedule_check_groups(
+    analyzer,
+    tasks: list[tuple[str, Callable]],
+    requirements: dict[str, Iterable[str]],
+    n_jobs: int = 1,
+    backend: str = "thread",
+    timings: list[Timing] | None = None,
+) -> list[list[Issue]]:
+    """Like ``schedule_checks``, but return one list of issues per task.
+
+    When ``timings`` is given, one ``Timing`` per task is appended to it in task order.
+    """
+    results: list[list[Issue]] = [[] for _ in tasks]
+    records: list[Timing] | None = [] if timings is not None else None
+    for index, issues in iter_check_groups(
+        analyzer, tasks, requirements, n_jobs=n_jobs, backend=backend, timings=records
+    ):
+        results[index] = issues
+    if timings is not None:
+        position = {name: i for i, (name, _) in enumerate(tasks)}
+        timings.extend(sorted(records, key=lambda timing: position.get(timing.name, -1)))
+    return results
+
+
+def iter_check_groups(
+    analyzer,
+    tasks: list[tuple[str, Callable]],
+    requirements: dict[str, Iterable[str]],
+    n_jobs: int = 1,
+    backend: str = "thread",
+    timings: list[Timing] | None = None,
+    order: Iterable[int] | None = None,
+) -> Iterator[tuple[int, list[Issue]]]:
+    """Run ``tasks`` and yield ``(task index, issues)`` as each task finishes.
+
+    ``order`` gives the task indices in the order to start them (default: task order).
+    ``timings`` receives one ``Timing`` per task in completion order. Closing the
+    generator early cancels tasks that have not started yet.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}")
+    order = list(range(len(tasks))) if order is None else list(order)
+    workers = min(resolve_n_jobs(n_jobs), max(len(tasks), 1))
+
+    if workers == 1:
+        for index in order:
+            name, check_fn = tasks[index]
+            if timings is None:
+                yield index, check_fn(analyzer)
+            else:
+                issues, timing = timed_check(name, check_fn, analyzer)
+                timings.append(timing)
+                yield index, issues
+        return
+
+    # Each check's primitives go to the cache it reads, e.g. full-data tier checks to the full-data cache
+    targets: dict[int, tuple] = {}
+    for name, check_fn in tasks:
+        target = _check_target(analyzer, check_fn)
+        cache = get_column_cache(target)
+        targets.setdefault(id(cache), (target, cache, set()))[2].update(requirements.get(name, ()))
+    warm_ups = [
+        (RESOURCES[name], target, cache) for target, cache, needed in targets.values() for name in sorted(needed)
+    ]
+
+    # Warm shared primitives in-process so both backends start from populated caches
+    with (
+        measure(timings if timings is not None else [], "warm_column_cache", "check", analyzer.df.shape, memory=False),
+        ThreadPoolExecutor(max_workers=workers) as pool,
+    ):
+        list(pool.map(lambda job: job[0](job[1], job[2]), warm_ups))
+
+    if backend == "process":
+        initargs = (analyzer, timings is not None and tracemalloc.is_tracing())
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs)
+        if timings is None:
+            futures = {pool.submit(_run_in_worker, tasks[index][1]): index for index in order}
+        else:
+            futures = {pool.submit(_run_timed_in_worker, *tasks[index]): index for index in order}
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+        if timings is None:
+            futures = {pool.submit(tasks[index][1], analyzer): index for index in order}
+        else:
+            # Concurrent threads share one tracemalloc peak, so only time them
+            futures = {pool.submit(timed_check, *tasks[index], analyzer, memory=False): index for index in order}
+
+    try:
+        for future in as_completed(futures):
+            result = future.result()
+            if timings is not None:
+                result, timing = result
+                timings.append(timing)
+            yield futures[future], result
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
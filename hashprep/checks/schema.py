@@ -0,0 +1,103 @@
+from ..utils.column_cache import get_column_cache
+from ..utils.schema import dtype_family
+from .core import Issue
+
+# New levels named in an issue description
+_SHOWN_LEVELS = 3
+
+
+def _check_schema_mismatch(analyzer) -> list[Issue]:
+    """Compare the data with the analyzer's saved schema: columns, dtypes, category levels and datetime formats."""
+    schema = getattr(analyzer, "schema", None)
+    if schema is None:
+        return []
+    cache = get_column_cache(analyzer)
+    present = {str(col): col for col in analyzer.df.columns}
+    issues = []
+
+    for name in schema.columns:
+        if name not in present:
+            issues.append(
+                Issue(
+                    category="schema_mismatch",
+                    severity="critical",
+                    column=name,
+                    description=f"Column '{name}' from the schema is missing",
+                    impact_score="high",
+                    quick_fix="Options:\n- Check the feed: The column may have been renamed or dropped upstream.\n- Re-export the schema: Run 'hashprep schema export' if the change is intended.",
+                )
+            )
+    for name, col in present.items():
+        saved = schema.columns.get(name)
+        if saved is None:
+            issues.append(
+                Issue(
+                    category="schema_mismatch",
+                    severity="warning",
+                    column=col,
+                    description=f"Column '{name}' is not in the schema",
+                    impact_score="low",
+                    quick_fix="Options:\n- Re-export the schema: Run 'hashprep schema export' to include the new column.\n- Drop column: Ignore it if the feed added it by mistake.",
+                )
+            )
+            continue
+
+        dtype = analyzer.df[col].dtype
+        if not saved.accepts(dtype):
+            issues.append(
+                Issue(
+                    category="schema_mismatch",
+                    severity="critical",
+                    column=col,
+                    description=f"Column '{name}' is now {dtype} ({dtype_family(dtype)}), the schema has {saved.dtype} ({saved.semantic_type})",
+                    impact_score="high",
+                    quick_fix="Options:\n- Inspect new values: A few malformed entries can turn a numeric column into text.\n- Coerce types: Convert the column back before training.\n- Re-export the schema: If the type change is intended.",
+                )
+            )
+            continue
+        if dtype_family(dtype) != dtype_family(saved.dtype) and dtype_family(dtype) != "datetime":
+            issues.append(
+                Issue(
+                    category="schema_mismatch",
+                    severity="warning",
+                    column=col,
+                    description=f"Column '{name}' is now {dtype}, the schema has {saved.dtype}",
+                    impact_score="low",
+                    quick_fix="Options:\n- Check for missing values: Integer columns become float when values go missing.\n- Re-export the schema: If the change is intended.",
+                )
+            )
+
+        if saved.levels is not None and analyzer.column_types.get(col) == "Categorical":
+            new = saved.new_levels(cache.value_counts(col).index)
+            if new:
+                shown = ", ".join(repr(level) for level in new[:_SHOWN_LEVELS])
+                more = f" and {len(new) - _SHOWN_LEVELS} more" if len(new) > _SHOWN_LEVELS else ""
+                issues.append(
+                    Issue(
+                        category="schema_mismatch",
+                        severity="warning",
+                        column=col,
+                        description=f"Column '{name}' has {len(new)} level(s) not in the schema: {shown}{more}",
+                        impact_score="medium",
+                        quick_fix="Options:\n- Map new levels: Fold them into known categories or an 'other' level.\n- Check encoders: Fitted one-hot or ordinal encoders will not know these values.\n- Re-export the schema: If the new levels are expected.",
+                    )
+                )
+
+        if saved.datetime_format is not None and dtype_family(dtype) == "text":
+            non_missing = cache.non_missing_count(col)
+            parsed = len(cache.datetime_values(col))
+            if non_missing and parsed / non_missing < analyzer.config.datetime.parse_threshold:
+                issues.append(
+                    Issue(
+                        category="schema_mismatch",
+                        severity="warning",
+                        column=col,
+                        description=(
+                            f"Column '{name}': only {parsed / non_missing:.1%} of values parse with the "
+                            f"schema's datetime format '{saved.datetime_format}'"
+                        ),
+                        impact_score="medium",
+                        quick_fix="Options:\n- Check the feed: The date format may have changed upstream.\n- Re-export the schema: If the new format is intended.",
+                    )
+                )
+    return issues
@@ -6,6 +6,7 @@ variance homogeneity (Levene's test across target-column groups).
 import numpy as np
 from scipy.stats import levene, normaltest, shapiro
 
+from ..utils.column_cache import get_column_cache, split_by_level
 from .core import Issue
 
 
@@ -30,14 +31,15 @@ def _check_normality(analyzer) -> list[Issue]:
     Non-normality matters for linear models, t-tests, and certain imputation strategies.
     """
     _cfg = analyzer.config.statistical_tests
+    cache = get_column_cache(analyzer)
     issues = []
 
-    for col in analyzer.df.select_dtypes(include="number").columns:
-        series = analyzer.df[col].dropna()
+    for col in cache.columns_of("number"):
+        series = cache.non_null(col)
         n = len(series)
         if n < _cfg.normality_min_n:
             continue
-        if series.nunique() <= 1:
+        if cache.n_unique(col) <= 1:
             continue
 
         test_name, stat, p_val = _run_normality_test(series, _cfg.shapiro_max_n)
@@ -84,20 +86,19 @@ def _check_variance_homogeneity(analyzer) -> list[Issue]:
     if analyzer.target_col is None:
         return issues
 
-    target = analyzer.df[analyzer.target_col].dropna()
-    groups_labels = target.unique()
+    cache = get_column_cache(analyzer)
+    labels, codes = cache.level_codes(analyzer.target_col)
 
-    for col in analyzer.df.select_dtypes(include="number").columns:
+    for col in cache.columns_of("number"):
         if col == analyzer.target_col:
             continue
 
-        series = analyzer.df[col]
+        values = analyzer.df[col].to_numpy()
+        present = ~cache.isna(col).to_numpy()
 
         # Build per-group arrays, filtering out groups that are too small
         groups = []
-        for label in groups_labels:
-            mask = analyzer.df[analyzer.target_col] == label
-            grp = series[mask].dropna().values
+        for grp in split_by_level(values, codes, len(labels), present):
             if len(grp) >= _cfg.levene_min_group_size:
                 groups.append(grp)
 
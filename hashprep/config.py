@@ -55,6 +55,14 @@ class ColumnThresholds:
     high_cardinality_count: int = 100
     high_cardinality_ratio_critical: float = 0.9
     duplicate_ratio_critical: float = 0.1
+    # Share of rows on which two columns must agree to be near-duplicates, over rows where either column has a
+    # value and not both hold their shared most common value
+    near_duplicate_ratio: float = 0.95
+    # MinHash signature length used to find near-duplicate column candidates, and rows per LSH band
+    minhash_size: int = 128
+    minhash_band_rows: int = 8
+    # Columns sharing an LSH bucket are each paired with at most this many earlier members of it
+    minhash_bucket_size: int = 20
 
 
 @dataclass(frozen=True)
@@ -163,6 +171,8 @@ class DateTimeThresholds:
 
     # Ratio of parseable values to classify an object column as DateTime
     parse_threshold: float = 0.8
+    # Leading non-missing values used to pick a column's format and test the ratio above
+    format_sample_rows: int = 200
     # Any future-dated values trigger a warning (ratio > 0 → warn, ratio > this → critical)
     future_date_critical_ratio: float = 0.05
     # A gap is anomalous if it exceeds this multiple of the median gap
@@ -197,6 +207,94 @@ class SamplingDefaults:
 
     max_rows: int = 100_000
     memory_threshold_mb: float = 500.0
+    # Rows read at a time when sampling straight from a file
+    file_chunk_rows: int = 100_000
+    # Adaptive sizing: grow a sample from adaptive_min_rows by adaptive_growth per stage, up to
+    # adaptive_max_rows, until every tracked standard error is within tolerance
+    adaptive_min_rows: int = 10_000
+    adaptive_max_rows: int = 1_000_000
+    adaptive_growth: float = 2.0
+    # Absolute standard error allowed for missing rates, category frequencies, correlations and
+    # means and quantiles (relative to the column's spread)
+    adaptive_tolerance: float = 0.02
+    # Relative standard error allowed for the frequency of categories at least rare_frequency common
+    adaptive_rare_tolerance: float = 0.25
+    rare_frequency: float = 0.0005
+
+
+@dataclass(frozen=True)
+class StreamingDefaults:
+    """Limits for chunked (streaming) analysis of datasets larger than memory."""
+
+    # Stop tracking exact value frequencies for a column beyond this many distinct values
+    max_tracked_values: int = 10_000
+    # Stop exact duplicate-row tracking beyond this many distinct row hashes (8 bytes each)
+    max_tracked_row_hashes: int = 50_000_000
+
+
+@dataclass(frozen=True)
+class SketchDefaults:
+    """Accuracy/memory trade-offs for the approximate (sketch) summaries."""
+
+    # KLL compactor size; rank error is roughly 1.7 / quantile_k
+    quantile_k: int = 200
+    # HyperLogLog uses 2**hll_precision one-byte registers; relative error ~ 1.04 / sqrt(2**hll_precision)
+    hll_precision: int = 14
+    # Heavy hitters monitored per column by the space-saving summary
+    top_values_capacity: int = 100
+    # Rows fed to the sketches at a time when sketching an in-memory DataFrame
+    chunk_rows: int = 100_000
+
+
+@dataclass(frozen=True)
+class IncrementalDefaults:
+    """Change detection when re-analysing an appended dataset from saved state."""
+
+    # A column counts as changed when a ratio (missing, distinct, top-value share...) moves by more
+    # than this, or its mean or standard deviation moves by more than this many previous standard deviations
+    change_tolerance: float = 0.01
+
+
+@dataclass(frozen=True)
+class AnytimeDefaults:
+    """Progressive sample sizes for time-budgeted analysis (``analyze(time_budget_s=...)``)."""
+
+    # Rows analysed in the first round, which always runs to completion
+    initial_rows: int = 5_000
+    # Each further round analyses this many times as many rows as the previous one
+    growth_factor: float = 4.0
+
+
+@dataclass(frozen=True)
+class WideTableDefaults:
+    """Pair screening that replaces all-pairs work on tables with many numeric columns."""
+
+    # Screening switches on above this many numeric columns (0 disables it)
+    column_threshold: int = 200
+    # Strongest partners kept for every column
+    top_k: int = 10
+    # Most candidate pairs kept in total, for summaries and for the correlation check
+    max_pairs: int = 10_000
+    # Rows the screen estimates correlations from
+    screen_rows: int = 5_000
+    # Columns scored against all others at once; memory is block_size x columns scores
+    block_size: int = 256
+    # The correlation check also tests pairs scoring within this margin below its lowest warning threshold
+    screen_margin: float = 0.1
+    # Columns shown in correlation heatmaps, taken from the strongest pairs
+    heatmap_columns: int = 30
+
+
+@dataclass(frozen=True)
+class MemoryDefaults:
+    """Deep memory accounting and opt-in dtype downcasting (``optimize_memory=True``)."""
+
+    # Object columns longer than this are measured from a random sample of this many values
+    sample_rows: int = 10_000
+    # Downcast float64 columns to float32 when every value round-trips exactly
+    downcast_floats: bool = True
+    # Store Text columns as Arrow-backed strings (needs pyarrow; skipped without it)
+    arrow_strings: bool = True
 
 
 @dataclass(frozen=True)
@@ -207,6 +305,8 @@ class SummaryDefaults:
     top_n_values: int = 10
     extreme_values_count: int = 10
     top_n_words: int = 10
+    # Text values joined, decoded to code points and split into words at a time (see utils.text_profile)
+    text_chunk_rows: int = 100_000
 
 
 @dataclass(frozen=True)
@@ -226,6 +326,12 @@ class HashPrepConfig:
     datetime: DateTimeThresholds = field(default_factory=DateTimeThresholds)
     type_inference: TypeInferenceConfig = field(default_factory=TypeInferenceConfig)
     sampling: SamplingDefaults = field(default_factory=SamplingDefaults)
+    streaming: StreamingDefaults = field(default_factory=StreamingDefaults)
+    sketches: SketchDefaults = field(default_factory=SketchDefaults)
+    incremental: IncrementalDefaults = field(default_factory=IncrementalDefaults)
+    anytime: AnytimeDefaults = field(default_factory=AnytimeDefaults)
+    wide_table: WideTableDefaults = field(default_factory=WideTableDefaults)
+    memory: MemoryDefaults = field(default_factory=MemoryDefaults)
     summaries: SummaryDefaults = field(default_factory=SummaryDefaults)
 
 
@@ -1,11 +1,23 @@
+import copy
+import hashlib
+import math
+import os
+import threading
 import time
+import tracemalloc
 import warnings
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import CancelledError
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 from scipy.stats import ConstantInputWarning
 
-from ..checks import run_checks
+import hashprep
+
+from ..checks import FULL_DATA_CHECKS, Issue, check_tasks, iter_tasks, run_tasks
+from ..checks.scheduler import BACKENDS
 from ..config import DEFAULT_CONFIG, HashPrepConfig
 from ..summaries import (
     add_reproduction_info,
@@ -19,9 +31,22 @@ from ..summaries import (
     summarize_variables,
 )
 from ..summaries.mutual_info import summarize_mutual_information
+from ..summaries.sections import FULL_DATA_SECTIONS, SECTIONS, resolve_sections
+from ..summaries.sketches import ColumnSketch, apply_sketches, sketch_columns
+from ..summaries.streaming import StreamingProfile
+from ..utils.async_executor import run_blocking
+from ..utils.column_cache import ColumnProfileCache
+from ..utils.dtypes import DtypeOptimization, apply_dtypes, optimize_dtypes
+from ..utils.memory import MemoryUsage
+from ..utils.parallel import resolve_n_jobs
+from ..utils.profiling import Timing, measure
+from ..utils.result_cache import ResultCache, cache_key
 from ..utils.sampling import DatasetSampler, SamplingConfig
+from ..utils.schema import Schema
 from ..utils.type_inference import infer_types
+from .incremental import DATASET_KEY, AnalysisState, changed_columns, compute_fingerprints, run_checks_incrementally
 from .visualizations import (
+    PLOT_LOCK,
     plot_bar,
     plot_heatmap,
     plot_histogram,
@@ -42,6 +67,7 @@ class DatasetAnalyzer:
         "class_imbalance",
         "high_cardinality",
         "duplicates",
+        "duplicate_columns",
         "mixed_data_types",
         "outliers",
         "feature_correlation",
@@ -64,6 +90,7 @@ class DatasetAnalyzer:
         "normality",
         "variance_homogeneity",
         "low_mutual_information",
+        "schema_mismatch",
     ]
 
     def __init__(
@@ -76,6 +103,15 @@ class DatasetAnalyzer:
         sampling_config: SamplingConfig | None = None,
         auto_sample: bool = True,
         config: HashPrepConfig | None = None,
+        n_jobs: int = 1,
+        parallel_backend: str = "thread",
+        sketches: bool = False,
+        cache: str | os.PathLike | ResultCache | None = None,
+        profile_memory: bool = False,
+        sections: str | Iterable[str] = "all",
+        tiered: bool = True,
+        schema: Schema | None = None,
+        optimize_memory: bool = False,
     ):
         if not isinstance(df, pd.DataFrame):
             raise TypeError(f"Expected pandas DataFrame, got {type(df).__name__}")
@@ -85,15 +121,51 @@ class DatasetAnalyzer:
             raise ValueError(f"Target column '{target_col}' not found in DataFrame")
         if comparison_df is not None and not isinstance(comparison_df, pd.DataFrame):
             raise TypeError(f"comparison_df must be a pandas DataFrame, got {type(comparison_df).__name__}")
+        resolve_n_jobs(n_jobs)
+        resolve_sections(sections, [])
+        if parallel_backend not in BACKENDS:
+            raise ValueError(f"parallel_backend must be one of {BACKENDS}, got {parallel_backend!r}")
 
         self.config = config if config is not None else DEFAULT_CONFIG
         self.comparison_df = comparison_df
         self.target_col = target_col
         self.selected_checks = selected_checks
         self.include_plots = include_plots
+        # Summary sections to compute: "all", "auto" (what checks, plots and state read) or a list
+        self.sections = sections if isinstance(sections, str) else list(sections)
+        # On a sampled frame, run the cheap checks and sections on every row (see FULL_DATA_CHECKS)
+        self.tiered = tiered
+        # Saved schema of a recurring feed: its types replace inference and the schema_mismatch check compares against it
+        self.schema = schema
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
+        self.cache = ResultCache(cache) if isinstance(cache, (str, os.PathLike)) else cache
+        # Peak memory per step needs tracemalloc, which slows allocation-heavy code down noticeably
+        self.profile_memory = profile_memory
+        self.timings: list[Timing] = []
         self.issues: list = []
+        self.check_issues: dict = {}
         self.summaries: dict = {}
 
+        self.stream_profile: StreamingProfile | None = None
+        self.column_sketches: dict[str, ColumnSketch] | None = None
+        self.previous_state: AnalysisState | None = None
+        self._fingerprints: dict | None = None
+        # Set by analyze_async when its awaiting task is cancelled
+        self._cancel_event: threading.Event | None = None
+        # Set when a budgeted round after the first reaches the end of the time budget
+        self._deadline_event: threading.Event | None = None
+        # Seconds spent before analyze() (sampling, sketches, type inference), which a time budget cannot cover
+        self._setup_seconds: dict[str, float] = {}
+        # Column cache over df_full, built on first use by the full-data tier
+        self._full_cache: ColumnProfileCache | None = None
+        # Hash of every row of the file read by from_file, of which df_full is only the sample
+        self._file_hash: str | None = None
+        self._budgeted = False
+        # Set by optimize_memory: the dtype conversions and the bytes they saved
+        self.memory_optimization: DtypeOptimization | None = None
+
+        step_start = time.perf_counter()
         self.sampler: DatasetSampler | None = None
         if auto_sample:
             self.sampler = DatasetSampler(sampling_config)
@@ -107,64 +179,739 @@ class DatasetAnalyzer:
             self.df = df
             self.df_full = df
 
-        self.column_types = infer_types(self.df)
+        if self.sampler is not None:
+            self._setup_seconds["sampling"] = time.perf_counter() - step_start
+
+        # Sketches only pay off when the analysis would otherwise see a sample
+        if sketches and self.df is not self.df_full:
+            step_start = time.perf_counter()
+            self.column_sketches = sketch_columns(self.df_full, self.config)
+            self._setup_seconds["sketches"] = time.perf_counter() - step_start
+
+        # The sampler already measured an unsampled frame's memory; the summaries reuse it
+        measured = self.sampler.memory_usage if self.sampler is not None and self.df is df else None
+        datetime_formats = schema.datetime_formats(self.df) if schema is not None else None
+        step_start = time.perf_counter()
+        self.column_cache = self._new_cache(self.df, memory=measured, datetime_formats=datetime_formats)
+        self.column_types = self._infer_types()
+        self._setup_seconds["type_inference"] = time.perf_counter() - step_start
+        if optimize_memory:
+            step_start = time.perf_counter()
+            self._optimize_memory(measured)
+            self._setup_seconds["dtype_optimization"] = time.perf_counter() - step_start
+
+    @classmethod
+    def from_chunks(
+        cls,
+        chunks: Iterable[pd.DataFrame],
+        sampling_config: SamplingConfig | None = None,
+        config: HashPrepConfig | None = None,
+        **kwargs,
+    ) -> "DatasetAnalyzer":
+        """Build an analyzer from an iterable of DataFrame chunks without holding the full dataset.
+
+        Each chunk is folded into a StreamingProfile (exact counts, moments, extremes and
+        duplicate hashes) and a uniform reservoir sample of ``sampling_config.max_rows`` rows.
+        Summaries and checks run on the sample; ``analyze()`` then replaces additive
+        figures with their full-data values. With ``sketches=True`` every chunk is also
+        folded into per-column sketches for full-data quantiles, histograms, distinct
+        counts and top values.
+        """
+        sampling_config = sampling_config or SamplingConfig()
+        use_sketches = kwargs.pop("sketches", False)
+        start = time.perf_counter()
+        profile = StreamingProfile(
+            config=config, sample_rows=sampling_config.max_rows, random_state=sampling_config.random_state
+        )
+        column_sketches: dict[str, ColumnSketch] = {}
+        for chunk in chunks:
+            profile.update(chunk)
+            if use_sketches:
+                for col in profile.columns:
+                    column_sketches.setdefault(col, ColumnSketch(config)).update(chunk[col])
+        if profile.columns is None:
+            raise ValueError("No chunks to analyze")
+        seconds = time.perf_counter() - start
+        analyzer = cls._from_profile(profile, column_sketches or None, sampling_config, config=config, **kwargs)
+        analyzer._setup_seconds["streaming"] = seconds
+        return analyzer
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        sampling_config: SamplingConfig | None = None,
+        config: HashPrepConfig | None = None,
+        chunksize: int | None = None,
+        **kwargs,
+    ) -> "DatasetAnalyzer":
+        """Build an analyzer from a CSV or Parquet file, sampling it while it is read.
+
+        The file is streamed in chunks through ``DatasetSampler.sample_file``, so only the
+        sample configured by ``sampling_config`` (any ``sample_method``) is ever held in
+        memory. With ``sketches=True`` every chunk is also folded into per-column sketches
+        for full-data quantiles, histograms, distinct counts and top values. A ``schema``
+        also sets the dtypes the file is read with (see ``Schema.read_options``).
+        """
+        sampler = DatasetSampler(sampling_config)
+        use_sketches = kwargs.pop("sketches", False)
+        column_sketches: dict[str, ColumnSketch] = {}
+        # The result cache must key on the whole file, not on the sample taken from it
+        hasher = hashlib.md5() if kwargs.get("cache") is not None else None
+
+        def on_chunk(chunk: pd.DataFrame) -> None:
+            if hasher is not None:
+                hasher.update(pd.util.hash_pandas_object(chunk, index=False).to_numpy().tobytes())
+            if use_sketches:
+                for col in chunk.columns:
+                    column_sketches.setdefault(col, ColumnSketch(config)).update(chunk[col])
 
-    def analyze(self) -> dict:
-        """Run all summaries and checks, return summary."""
+        schema = kwargs.get("schema")
+        start = time.perf_counter()
+        df = sampler.sample_file(
+            path,
+            chunksize=chunksize,
+            on_chunk=on_chunk if use_sketches or hasher is not None else None,
+            read_options=schema.read_options() if schema is not None else None,
+        )
+        seconds = time.perf_counter() - start
+        analyzer = cls(df, sampling_config=sampler.config, auto_sample=False, config=config, **kwargs)
+        analyzer.sampler = sampler
+        analyzer._setup_seconds["sampling"] = seconds
+        if hasher is not None:
+            analyzer._file_hash = hasher.hexdigest()
+        if column_sketches and sampler.was_sampled:
+            analyzer.column_sketches = column_sketches
+        return analyzer
+
+    @classmethod
+    def update(
+        cls,
+        new_rows: pd.DataFrame | Iterable[pd.DataFrame],
+        previous_state: AnalysisState,
+        sampling_config: SamplingConfig | None = None,
+        **kwargs,
+    ) -> "DatasetAnalyzer":
+        """Fold rows appended since ``previous_state`` (see ``state()``) into it and return an analyzer.
+
+        ``new_rows`` is a DataFrame or an iterable of DataFrame chunks; the previous rows are
+        not needed. ``previous_state`` is updated in place. Target, selected checks and config
+        default to the previous run's. ``analyze()`` re-summarises and re-checks only what
+        materially changed and reuses the previous results for everything else.
+        """
+        profile, sketches = previous_state.profile, previous_state.sketches
+        for chunk in [new_rows] if isinstance(new_rows, pd.DataFrame) else new_rows:
+            profile.update(chunk)
+            if sketches is not None:
+                for col in profile.columns:
+                    sketches[col].update(chunk[col])
+
+        kwargs.setdefault("target_col", previous_state.target_col)
+        kwargs.setdefault("selected_checks", previous_state.selected_checks)
+        kwargs.setdefault("config", previous_state.config)
+        sampling_config = sampling_config or SamplingConfig(max_rows=profile.sample_rows)
+        analyzer = cls._from_profile(profile, sketches, sampling_config, **kwargs)
+        analyzer.previous_state = previous_state
+        return analyzer
+
+    @classmethod
+    def _from_profile(
+        cls,
+        profile: StreamingProfile,
+        column_sketches: dict[str, ColumnSketch] | None,
+        sampling_config: SamplingConfig,
+        **kwargs,
+    ) -> "DatasetAnalyzer":
+        analyzer = cls(profile.sample(), sampling_config=sampling_config, auto_sample=False, **kwargs)
+        analyzer.stream_profile = profile
+        analyzer.sampler = DatasetSampler(sampling_config)
+        analyzer.sampler.original_shape = (profile.rows, len(profile.columns))
+        analyzer.sampler.sample_fraction = len(analyzer.df) / profile.rows if profile.rows > 0 else 1.0
+        analyzer.sampler.was_sampled = len(analyzer.df) < profile.rows
+        if column_sketches and analyzer.sampler.was_sampled:
+            analyzer.column_sketches = column_sketches
+        return analyzer
+
+    def analyze(
+        self,
+        time_budget_s: float | None = None,
+        on_issue: Callable[[Issue], None] | None = None,
+        on_progress: Callable[[str, int, int], None] | None = None,
+    ) -> dict:
+        """Run all summaries and checks, return summary.
+
+        With ``time_budget_s``, analyse progressively larger nested samples (see
+        ``config.anytime``) and stop before a round that is not expected to finish within
+        the budget. A later round that still reaches the end of the budget is stopped at
+        its next summary step or check, and the result is that of the last completed
+        round. The first round always runs to completion; work done before ``analyze()``
+        (sampling, sketches, type inference) is outside the budget.
+
+        ``on_issue(issue)`` is called for every issue as soon as its check finishes, and
+        ``on_progress(check_name, done, total)`` after each check; with either callback the
+        cheapest checks run first.
+        """
+        if time_budget_s is not None and not time_budget_s > 0:
+            raise ValueError(f"time_budget_s must be positive, got {time_budget_s!r}")
+        if time_budget_s is not None and (on_issue is not None or on_progress is not None):
+            raise ValueError("on_issue and on_progress cannot be combined with time_budget_s")
         # Suppress scipy warnings about constant input arrays
         warnings.filterwarnings("ignore", category=ConstantInputWarning)
+        # Full-data passes scale with every row, which a time budget cannot promise
+        self._budgeted = time_budget_s is not None
+
+        key = self._cache_key() if self.cache is not None else None
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.summaries, self.check_issues = cached
+                self.issues = [issue for issues in self.check_issues.values() for issue in issues]
+                self.summaries["reproduction_info"]["result_cache"] = {"key": key, "hit": True}
+                self._replay(on_issue, on_progress)
+                return self._generate_summary()
+
+        start_tracing = self.profile_memory and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+        try:
+            if time_budget_s is None:
+                self._analyze(on_issue, on_progress)
+                complete = True
+            else:
+                complete = self._analyze_within(time_budget_s)
+        finally:
+            if start_tracing:
+                tracemalloc.stop()
+
+        # A budget-limited result covers less data than the key promises, so it is not cached
+        if key is not None and complete:
+            self.summaries["reproduction_info"]["result_cache"] = {"key": key, "hit": False}
+            self.cache.put(key, (self.summaries, self.check_issues))
+
+        return self._generate_summary()
+
+    def _analyze_within(self, time_budget_s: float) -> bool:
+        """Anytime analysis; returns whether the final round covered the whole analysis sample."""
+        start = time.perf_counter()
+        full_df, full_cache = self.df, self.column_cache
+        original_rows = self.sampler.original_shape[0] if self.sampler and self.sampler.original_shape else len(full_df)
+        random_state = self.sampler.config.random_state if self.sampler else SamplingConfig().random_state
+        # Rounds analyse nested prefixes of one permutation, kept in the original row order
+        order = np.random.default_rng(random_state).permutation(len(full_df))
+        if self.sampler is None:
+            self.sampler = DatasetSampler(SamplingConfig(max_rows=len(full_df)))
+            self.sampler.original_shape = (original_rows, full_df.shape[1])
+
+        rounds: list[dict] = []
+        interrupted = None
+        exponent = 1.0
+        for rows in self._anytime_sizes(len(full_df)):
+            if rounds:
+                last = rounds[-1]
+                expected = last["seconds"] * (rows / last["rows"]) ** exponent
+                if time.perf_counter() - start + expected > time_budget_s:
+                    break
+            kept = self._round_state()
+            self.df = full_df if rows == len(full_df) else full_df.iloc[np.sort(order[:rows])]
+            self.column_cache = full_cache if rows == len(full_df) else self._new_cache(self.df)
+            self.sampler.sample_fraction = rows / original_rows if original_rows > 0 else 1.0
+            self.sampler.was_sampled = rows < original_rows
+            self.summaries = {}
+
+            timer = None
+            if rounds:
+                # The prediction can be wrong; the deadline stops the round at its next checkpoint
+                self._deadline_event = threading.Event()
+                remaining = max(time_budget_s - (time.perf_counter() - start), 0.0)
+                timer = threading.Timer(remaining, self._deadline_event.set)
+                timer.daemon = True
+                timer.start()
+            round_start = time.perf_counter()
+            try:
+                self._analyze()
+            except _DeadlineReached:
+                interrupted = {"rows": rows, "seconds": round(time.perf_counter() - round_start, 3)}
+                self._restore_round_state(kept)
+                break
+            finally:
+                if timer is not None:
+                    timer.cancel()
+                    self._deadline_event = None
+            rounds.append({"rows": rows, "seconds": time.perf_counter() - round_start})
+            if len(rounds) > 1 and rounds[-2]["seconds"] > 0 and rounds[-1]["seconds"] > 0:
+                # Fit the observed cost growth (linear to quadratic in rows) to predict the next round
+                ratio = math.log(rounds[-1]["seconds"] / rounds[-2]["seconds"])
+                exponent = min(max(ratio / math.log(rounds[-1]["rows"] / rounds[-2]["rows"]), 1.0), 2.0)
+
+        complete = rounds[-1]["rows"] == len(full_df)
+        self.summaries["anytime_info"] = {
+            "budget_seconds": time_budget_s,
+            "elapsed_seconds": round(time.perf_counter() - start, 2),
+            "sample_rows": rounds[-1]["rows"],
+            "complete": complete,
+            "rounds": [{"rows": r["rows"], "seconds": round(r["seconds"], 3)} for r in rounds],
+            "interrupted_round": interrupted,
+            "outside_budget_seconds": {step: round(seconds, 3) for step, seconds in self._setup_seconds.items()},
+        }
+        return complete
+
+    def _round_state(self) -> tuple:
+        return (
+            self.df,
+            self.column_cache,
+            self.summaries,
+            self.check_issues,
+            self.issues,
+            self.timings,
+            self.sampler.sample_fraction,
+            self.sampler.was_sampled,
+        )
+
+    def _restore_round_state(self, state: tuple) -> None:
+        (
+            self.df,
+            self.column_cache,
+            self.summaries,
+            self.check_issues,
+            self.issues,
+            self.timings,
+            self.sampler.sample_fraction,
+            self.sampler.was_sampled,
+        ) = state
+
+    def _anytime_sizes(self, total: int) -> list[int]:
+        cfg = self.config.anytime
+        if cfg.initial_rows < 1 or cfg.growth_factor <= 1:
+            raise ValueError("anytime.initial_rows must be >= 1 and anytime.growth_factor > 1")
+        sizes, rows = [], cfg.initial_rows
+        while rows < total:
+            sizes.append(rows)
+            rows = int(rows * cfg.growth_factor)
+        return sizes + [total]
+
+    def _checkpoint(self) -> None:
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            raise CancelledError("Analysis cancelled")
+        if self._deadline_event is not None and self._deadline_event.is_set():
+            raise _DeadlineReached
+
+    def _measure(self, name: str, kind: str = "summary", df: pd.DataFrame | None = None):
+        self._checkpoint()
+        return measure(self.timings, name, kind, (self.df if df is None else df).shape)
+
+    async def analyze_async(self, **kwargs) -> dict:
+        """Awaitable ``analyze(**kwargs)`` that leaves the event loop free.
+
+        Runs on the process-wide bounded executor (see ``hashprep.utils.async_executor``).
+        Cancelling the awaiting task stops the analysis before its next summary step or
+        check; callbacks are invoked from the worker thread.
+        """
+        cancel_event = threading.Event()
+        return await run_blocking(self._analyze_cancellable, cancel_event, kwargs, cancel_event=cancel_event)
+
+    def _analyze_cancellable(self, cancel_event: threading.Event, kwargs: dict) -> dict:
+        self._cancel_event = cancel_event
+        try:
+            return self.analyze(**kwargs)
+        finally:
+            self._cancel_event = None
+
+    def __getstate__(self):
+        # Process workers get a copy without the (unpicklable) cancellation event; the column caches,
+        # warmed by the scheduler, travel with it
+        state = self.__dict__.copy()
+        state["_cancel_event"] = None
+        state["_deadline_event"] = None
+        return state
+
+    def _infer_types(self) -> dict[str, str]:
+        """Semantic column types: from the schema where it still fits the data, inferred otherwise."""
+        if self.schema is None:
+            return infer_types(self.df, column_cache=self.column_cache)
+        saved = self.schema.column_types(self.df)
+        rest = [col for col in self.df.columns if col not in saved]
+        inferred = infer_types(self.df[rest], column_cache=self.column_cache) if rest else {}
+        return {col: saved[col] if col in saved else inferred[col] for col in self.df.columns}
+
+    def _optimize_memory(self, measured: MemoryUsage | None) -> None:
+        """Downcast ``df_full`` (and the sample) to compact dtypes, keeping the inferred column types."""
+        full, report = optimize_dtypes(self.df_full, self.column_types, self.config.memory, memory=measured)
+        if self.df is self.df_full:
+            self.df = full
+        else:
+            # The sample takes its categories from its own values, so level counts never list unseen levels
+            plan = {
+                col: "category" if new == "category" else full[col].dtype
+                for col, (_, new) in report.conversions.items()
+            }
+            self.df = apply_dtypes(self.df, plan)
+        self.df_full = full
+        self.memory_optimization = report
+        formats = self.schema.datetime_formats(self.df) if self.schema is not None else None
+        self.column_cache = self._new_cache(self.df, datetime_formats=formats)
+
+    def _new_cache(self, df: pd.DataFrame, **kwargs) -> ColumnProfileCache:
+        """Column cache over ``df`` that selects columns by their original dtypes: those before
+        ``optimize_memory`` and those a schema's ``read_options`` replaced with ``category``.
+        """
+        source = self.schema.source_dtypes(df) if self.schema is not None else {}
+        if self.memory_optimization is not None:
+            source.update(self.memory_optimization.source_dtypes)
+        return ColumnProfileCache(df, source_dtypes=source or None, **kwargs)
+
+    def _is_tiered(self) -> bool:
+        # Needs every row in memory: from_file and from_chunks keep only the sample, so all of it runs there
+        return self.tiered and not self._budgeted and self.df is not self.df_full and self.stream_profile is None
+
+    def _full_view(self) -> "DatasetAnalyzer":
+        """This analyzer over ``df_full``, sharing config, types and summaries, with its own column cache."""
+        if self._full_cache is None:
+            formats = self.schema.datetime_formats(self.df_full) if self.schema is not None else None
+            self._full_cache = self._new_cache(self.df_full, datetime_formats=formats)
+        view = copy.copy(self)
+        view.df, view.column_cache = self.df_full, self._full_cache
+        return view
+
+    def _full_rows(self) -> int:
+        """Rows of the whole dataset, of which ``from_file`` and ``from_chunks`` keep only the sample."""
+        if self.stream_profile is not None:
+            return self.stream_profile.rows
+        if self.sampler is not None and self.sampler.original_shape:
+            return self.sampler.original_shape[0]
+        return len(self.df_full)
+
+    def _population(self, task: str) -> str:
+        """``"full"`` if ``task`` (a check task or summary section) saw every row, else ``"sample"``."""
+        if self.sampler is None or not self.sampler.was_sampled:
+            return "full"
+        if task == "duplicates" and self.stream_profile is not None and self.stream_profile.duplicate_rows is not None:
+            return "full"
+        if self._is_tiered() and (task in FULL_DATA_CHECKS or task in FULL_DATA_SECTIONS):
+            return "full"
+        return "sample"
+
+    def _route_tasks(self, tasks: list[tuple[str, Callable]]) -> list[tuple[str, Callable]]:
+        """Send full-data tier checks to ``df_full`` when tiering applies."""
+        if not self._is_tiered():
+            return tasks
+        return [(name, _OnFullData(fn) if name in FULL_DATA_CHECKS else fn) for name, fn in tasks]
+
+    def iter_issues(self) -> Iterator[Issue]:
+        """Run the selected checks, cheapest first, yielding issues as soon as each check finishes.
+
+        No summaries are computed. Once the generator is exhausted, ``check_issues`` and
+        ``issues`` hold every check's issues in the usual order; closing it early cancels
+        checks that have not started.
+        """
+        warnings.filterwarnings("ignore", category=ConstantInputWarning)
+        self.timings = []
+        tasks = self._route_tasks(check_tasks(self._checks_to_run()))
+        if self.previous_state is not None:
+            self.check_issues, _ = run_checks_incrementally(
+                self,
+                self.previous_state,
+                tasks,
+                self._changed_since_previous(),
+                n_jobs=self.n_jobs,
+                backend=self.parallel_backend,
+                timings=self.timings,
+            )
+            self.issues = [issue for issues in self.check_issues.values() for issue in issues]
+            yield from self.issues
+            return
+
+        grouped = {}
+        for name, issues in iter_tasks(
+            self, tasks, n_jobs=self.n_jobs, backend=self.parallel_backend, timings=self.timings
+        ):
+            grouped[name] = issues
+            yield from issues
+        self.check_issues = {name: grouped[name] for name, _ in tasks}
+        self.issues = [issue for issues in self.check_issues.values() for issue in issues]
+
+    def _checks_to_run(self) -> list[str]:
+        if self.selected_checks is None:
+            return list(self.ALL_CHECKS)
+        return [check for check in self.selected_checks if check in self.ALL_CHECKS]
+
+    def _stream_checks(self, tasks: list[tuple[str, Callable]], on_issue, on_progress) -> dict[str, list[Issue]]:
+        grouped = {}
+        for name, issues in iter_tasks(
+            self, tasks, n_jobs=self.n_jobs, backend=self.parallel_backend, timings=self.timings
+        ):
+            grouped[name] = issues
+            if on_issue is not None:
+                for issue in issues:
+                    on_issue(issue)
+            if on_progress is not None:
+                on_progress(name, len(grouped), len(tasks))
+            self._checkpoint()
+        return {name: grouped[name] for name, _ in tasks}
 
+    def _replay(self, on_issue, on_progress) -> None:
+        """Feed already computed check results (cached or incremental) to the callbacks."""
+        for done, (name, issues) in enumerate(self.check_issues.items(), 1):
+            if on_issue is not None:
+                for issue in issues:
+                    on_issue(issue)
+            if on_progress is not None:
+                on_progress(name, done, len(self.check_issues))
+
+    def _analyze(self, on_issue=None, on_progress=None) -> None:
         analysis_start = datetime.now()
         start_time = time.time()
+        self.timings = []
 
-        self.summaries.update(get_dataset_preview(self.df))
-        self.summaries.update(summarize_dataset_info(self.df))
+        checks_to_run = self._checks_to_run()
+        sections = self._resolved_sections(checks_to_run)
 
-        duplicate_info = get_duplicate_info(self.df)
+        if "preview" in sections:
+            with self._measure("dataset_preview"):
+                self.summaries.update(get_dataset_preview(self.df))
+        # Row counts, missing cells, memory and duplicates are cheap enough to cover every row
+        full = self._full_view() if self._is_tiered() else self
+        with self._measure("dataset_info", df=full.df):
+            self.summaries.update(summarize_dataset_info(full.df, column_cache=full.column_cache))
+            if self.memory_optimization is not None:
+                self.summaries["dataset_info"].update(self.memory_optimization.to_dict())
+        with self._measure("duplicates", df=full.df):
+            duplicate_info = get_duplicate_info(full.df)
         self.summaries["dataset_info"].update(duplicate_info)
 
-        self.summaries["variable_types"] = summarize_variable_types(self.df, column_types=self.column_types)
-        self.summaries["variable_type_counts"] = summarize_variable_type_counts(self.df, column_types=self.column_types)
-        self.summaries["reproduction_info"] = add_reproduction_info(self.df)
-        self.summaries["variables"] = summarize_variables(self.df, column_types=self.column_types)
-        self.summaries.update(summarize_interactions(self.df))
-        self.summaries.update(summarize_missing_values(self.df))
+        with self._measure("variable_types"):
+            self.summaries["variable_types"] = summarize_variable_types(self.df, column_types=self.column_types)
+            self.summaries["variable_type_counts"] = summarize_variable_type_counts(
+                self.df, column_types=self.column_types
+            )
+        with self._measure("reproduction_info"):
+            self.summaries["reproduction_info"] = add_reproduction_info(self.df)
+        changed = self._changed_since_previous() if self.previous_state is not None else None
+        if changed is not None:
+            with self._measure("variables", df=self.df[[col for col in self.df.columns if col in changed]]):
+                self.summaries["variables"] = self._summarize_changed_variables(changed)
+        elif "variables" in sections:
+            with self._measure("variables"):
+                self.summaries["variables"] = summarize_variables(
+                    self.df,
+                    column_types=self.column_types,
+                    column_cache=self.column_cache,
+                    n_jobs=self.n_jobs,
+                    sketches=self.column_sketches,
+                    config=self.config,
+                )
+        if "interactions" in sections:
+            with self._measure("interactions"):
+                self.summaries.update(
+                    summarize_interactions(self.df, column_cache=self.column_cache, config=self.config)
+                )
+        if "missing_values" in sections:
+            with self._measure("missing_values"):
+                self.summaries.update(summarize_missing_values(self.df, column_cache=self.column_cache))
 
-        if self.target_col is not None:
-            mi_result = summarize_mutual_information(self.df, self.target_col, self.column_types)
+        if self.target_col is not None and "mutual_information" in sections:
+            with self._measure("mutual_information"):
+                mi_result = summarize_mutual_information(
+                    self.df, self.target_col, self.column_types, column_cache=self.column_cache
+                )
             if mi_result:
                 self.summaries["mutual_information"] = mi_result
 
+        # Exact streamed figures take precedence over the sketch estimates applied above
+        if self.stream_profile is not None:
+            self.stream_profile.apply(self.summaries)
+            self.summaries["streaming_info"] = self.stream_profile.info()
+
         if self.sampler:
             self.summaries["sampling_info"] = self.sampler.get_sampling_info()
+        self.summaries["populations"] = {
+            "full_rows": self._full_rows(),
+            "sample_rows": len(self.df),
+            "sections": {name: self._population(name) for name in SECTIONS if name in sections},
+            "checks": {name: self._population(name) for name, _ in check_tasks(checks_to_run)},
+        }
 
         if self.include_plots:
-            self._generate_plots()
+            # pyplot keeps global state, so concurrent analyses take turns plotting
+            with self._measure("plots", kind="plots"), PLOT_LOCK:
+                self._generate_plots()
 
-        checks_to_run = (
-            self.ALL_CHECKS
-            if self.selected_checks is None
-            else [check for check in self.selected_checks if check in self.ALL_CHECKS]
-        )
-        self.issues = run_checks(self, checks_to_run)
+        tasks = self._route_tasks(check_tasks(checks_to_run))
+        # Checks run one by one through the stream when something needs to observe or stop them
+        if changed is None and (
+            on_issue is not None
+            or on_progress is not None
+            or self._cancel_event is not None
+            or self._deadline_event is not None
+        ):
+            self.check_issues = self._stream_checks(tasks, on_issue, on_progress)
+        elif changed is None:
+            self.check_issues = run_tasks(
+                self, tasks, n_jobs=self.n_jobs, backend=self.parallel_backend, timings=self.timings
+            )
+        else:
+            self.check_issues, rerun = run_checks_incrementally(
+                self,
+                self.previous_state,
+                tasks,
+                changed,
+                n_jobs=self.n_jobs,
+                backend=self.parallel_backend,
+                timings=self.timings,
+            )
+            self.summaries["incremental_info"] = {
+                "previous_rows": self.previous_state.rows,
+                "new_rows": self.stream_profile.rows - self.previous_state.rows,
+                "changed_columns": [col for col in self.df.columns if col in changed],
+                "dataset_changed": DATASET_KEY in changed,
+                "rerun_checks": rerun,
+                "reused_checks": [name for name, _ in tasks if name not in rerun],
+            }
+            self._replay(on_issue, on_progress)
+        self.issues = [issue for issues in self.check_issues.values() for issue in issues]
 
         analysis_end = datetime.now()
         duration_seconds = time.time() - start_time
         self.summaries["reproduction_info"]["analysis_started"] = analysis_start.isoformat()
         self.summaries["reproduction_info"]["analysis_finished"] = analysis_end.isoformat()
         self.summaries["reproduction_info"]["duration_seconds"] = round(duration_seconds, 2)
+        self.summaries["reproduction_info"]["column_cache"] = self.column_cache.cache_info()
+        self.summaries["reproduction_info"]["timings"] = [timing.to_dict() for timing in self.timings]
+        self.summaries["reproduction_info"]["sections"] = [name for name in SECTIONS if name in sections]
 
-        return self._generate_summary()
+    def _cache_key(self) -> str:
+        """Key over everything that determines ``analyze()``'s result; worker counts do not."""
+        if self.stream_profile is not None:
+            dataset_hash = self.stream_profile.dataset_hash
+        elif self._file_hash is not None:
+            dataset_hash = self._file_hash
+        else:
+            dataset_hash = hashlib.md5(pd.util.hash_pandas_object(self.df_full, index=True).values).hexdigest()
+        comparison_hash = (
+            hashlib.md5(pd.util.hash_pandas_object(self.comparison_df, index=True).values).hexdigest()
+            if self.comparison_df is not None
+            else None
+        )
+        return cache_key(
+            dataset_hash=dataset_hash,
+            columns=[str(col) for col in self.df_full.columns],
+            comparison_hash=comparison_hash,
+            config=self.config,
+            sampling=self.sampler.config if self.sampler else None,
+            selected_checks=self.selected_checks,
+            target_col=self.target_col,
+            include_plots=self.include_plots,
+            sections=sorted(self._resolved_sections(self.selected_checks or self.ALL_CHECKS)),
+            sketches=self.column_sketches is not None,
+            incremental=self.previous_state is not None,
+            # Both decide which checks and sections see every row of a sampled frame
+            tiered=self.tiered,
+            time_budget=self._budgeted,
+            schema=self.schema.to_dict() if self.schema is not None else None,
+            optimize_memory=self.memory_optimization is not None,
+            version=hashprep.__version__,
+        )
+
+    def _resolved_sections(self, checks: list[str]) -> set[str]:
+        return resolve_sections(self.sections, checks, self.include_plots, self.previous_state is not None)
+
+    def _state_sketches(self) -> dict[str, ColumnSketch] | None:
+        if self.column_sketches is not None:
+            return self.column_sketches
+        if self.previous_state is not None:
+            return self.previous_state.sketches
+        # Without a previous state, sketches can still be built whenever every row is in memory
+        if self.stream_profile is None or len(self.df) == self.stream_profile.rows:
+            return sketch_columns(self.df_full if self.stream_profile is None else self.df, self.config)
+        return None
+
+    def _current_fingerprints(self, profile: StreamingProfile, sketches) -> dict:
+        if self._fingerprints is None:
+            self._fingerprints = compute_fingerprints(profile, sketches, self.config.summaries.top_n_values)
+        return self._fingerprints
+
+    def _changed_since_previous(self) -> set[str]:
+        previous = self.previous_state
+        columns = set(self.df.columns)
+        if (
+            previous.config != self.config
+            or previous.target_col != self.target_col
+            or set(previous.variables) != columns
+        ):
+            return columns | {DATASET_KEY}
+        fingerprints = self._current_fingerprints(self.stream_profile, self._state_sketches())
+        changed = changed_columns(previous.fingerprints, fingerprints, self.config.incremental.change_tolerance)
+        return changed | {col for col in columns if self.column_types[col] != previous.column_types.get(col)}
+
+    def _summarize_changed_variables(self, changed: set[str]) -> dict:
+        """Summarize changed columns; reuse the previous summaries (refreshed from sketches) for the rest."""
+        columns = [col for col in self.df.columns if col in changed]
+        fresh = summarize_variables(
+            self.df[columns],
+            column_types=self.column_types,
+            column_cache=self.column_cache,
+            n_jobs=self.n_jobs,
+            sketches=self.column_sketches,
+            config=self.config,
+        )
+        reused = {col: copy.deepcopy(var) for col, var in self.previous_state.variables.items() if col not in changed}
+        if self.column_sketches:
+            apply_sketches(reused, self.column_sketches, self.config)
+        return {col: fresh[col] if col in fresh else reused[col] for col in self.df.columns}
+
+    def state(self) -> AnalysisState:
+        """Capture this analysis so ``DatasetAnalyzer.update`` can later fold in appended rows.
+
+        Call after ``analyze()``. For an in-memory DataFrame this makes one extra pass over
+        every row to build the mergeable profile and sketches.
+        """
+        if not self.summaries:
+            raise RuntimeError("Call analyze() before state()")
+        profile = self.stream_profile
+        if profile is None:
+            sampling_config = self.sampler.config if self.sampler else SamplingConfig(max_rows=len(self.df))
+            profile = StreamingProfile(
+                config=self.config, sample_rows=sampling_config.max_rows, random_state=sampling_config.random_state
+            )
+            step = self.config.sketches.chunk_rows
+            for start in range(0, len(self.df_full), step):
+                profile.update(self.df_full.iloc[start : start + step])
+        sketches = self._state_sketches()
+        if "variables" not in self.summaries:
+            # Skipped by ``sections``; later updates reuse these per-column summaries
+            self.summaries["variables"] = summarize_variables(
+                self.df,
+                column_types=self.column_types,
+                column_cache=self.column_cache,
+                n_jobs=self.n_jobs,
+                sketches=self.column_sketches,
+                config=self.config,
+            )
+        variables = {
+            col: {key: value for key, value in var.items() if key != "plots"}
+            for col, var in self.summaries["variables"].items()
+        }
+        return AnalysisState(
+            profile=profile,
+            sketches=sketches,
+            fingerprints=self._current_fingerprints(profile, sketches),
+            column_types=dict(self.column_types),
+            variables=copy.deepcopy(variables),
+            check_issues={name: list(issues) for name, issues in self.check_issues.items()},
+            config=self.config,
+            target_col=self.target_col,
+            selected_checks=self.selected_checks,
+            rows=profile.rows,
+        )
 
     def _generate_plots(self):
         for col, stats in self.summaries["variables"].items():
             plots = {}
             if stats["category"] == "Numeric":
                 if stats["histogram"]["counts"]:
-                    plots["histogram"] = plot_histogram(self.df[col].dropna(), f"Histogram of {col}")
+                    plots["histogram"] = plot_histogram(self.column_cache.non_null(col), f"Histogram of {col}")
             elif stats["category"] in ["Categorical", "Boolean"]:
                 if stats["categories"].get("common_values"):
-                    series = self.df[col].dropna().astype(str).value_counts().head(10)
+                    series = self.column_cache.str_values(col).value_counts().head(10)
                     plots["common_values_bar"] = plot_bar(series, f"Top Values of {col}", col, "Count")
             elif stats["category"] == "Text":
                 if stats["words"]:
@@ -176,6 +923,10 @@ class DatasetAnalyzer:
 
         if "pearson" in self.summaries.get("numeric_correlations", {}):
             numeric_df = self.df.select_dtypes(include="number")
+            if "wide_table" in self.summaries:
+                # A heatmap of thousands of columns is unreadable; show the columns of the strongest pairs
+                pair_columns = dict.fromkeys(c for pair in self.summaries["scatter_pairs"] for c in pair)
+                numeric_df = numeric_df[list(pair_columns)[: self.config.wide_table.heatmap_columns]]
             if not numeric_df.empty:
                 if "plots" not in self.summaries["numeric_correlations"]:
                     self.summaries["numeric_correlations"]["plots"] = {}
@@ -215,8 +966,11 @@ class DatasetAnalyzer:
                     "description": issue.description,
                     "impact_score": issue.impact_score,
                     "quick_fix": issue.quick_fix,
+                    # Whether the check saw every row or the sample
+                    "population": self._population(name),
                 }
-                for issue in self.issues
+                for name, issues in self.check_issues.items()
+                for issue in issues
             ],
             "summaries": self.summaries,
             "column_types": self.column_types,
@@ -226,3 +980,21 @@ class DatasetAnalyzer:
             summary["sampling_info"] = self.sampler.get_sampling_info()
 
         return summary
+
+
+class _OnFullData:
+    """Check wrapper that runs the check on the analyzer's full-data view; picklable for process pools."""
+
+    def __init__(self, fn: Callable):
+        self.fn = fn
+
+    def target(self, analyzer: DatasetAnalyzer) -> DatasetAnalyzer:
+        """The analyzer the check reads, so the scheduler warms the full-data column cache for it."""
+        return analyzer._full_view()
+
+    def __call__(self, analyzer: DatasetAnalyzer) -> list[Issue]:
+        return self.fn(self.target(analyzer))
+
+
+class _DeadlineReached(Exception):
+    """Raised at a checkpoint of a budgeted round that ran past the time budget."""
@@ -0,0 +1,187 @@
+"""Profile many files with one pool of long-lived worker processes.
+
+``scan_files`` splits the file list into small batches and runs them on a
+process pool that lives for the whole sweep, so pandas, scipy, scikit-learn and
+matplotlib are imported once per worker instead of once per file. Within a
+batch, a reader thread reads the next file while the current one is being
+analysed: with sampling on (the default) it samples the file as it streams
+through ``DatasetAnalyzer.from_file``, so only the sample is held in memory;
+with ``auto_sample=False`` it reads the whole file. Each file gets a JSON
+summary (the ``format="json"`` report) in the output directory, and
+``index.json`` lists every file's outcome in input order.
+A file that fails to read or analyse is recorded as an error rather than
+stopping the sweep.
+"""
+
+import glob
+import json
+import math
+import os
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+
+import hashprep
+
+from ..reports.json import JsonReport
+from ..utils.io import read_dataset
+from ..utils.parallel import resolve_n_jobs
+from .analyzer import DatasetAnalyzer
+
+INDEX_FILE = "index.json"
+DATA_SUFFIXES = (".csv", ".parquet", ".pq")
+# Files per worker task: small enough to balance uneven files, large enough to keep the reader thread ahead
+MAX_BATCH_SIZE = 16
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """One input file and where its JSON summary goes."""
+
+    position: int
+    path: str
+    output_file: str
+
+
+def expand_inputs(inputs: Iterable[str]) -> list[str]:
+    """Expand glob patterns and manifest files into a de-duplicated list of data files.
+
+    An existing file without a data suffix (``.csv``, ``.parquet``, ``.pq``) is a manifest:
+    one path or glob per line, relative to the manifest's directory, with blank lines and
+    ``#`` comments ignored.
+    """
+    paths: list[str] = []
+    for item in inputs:
+        if os.path.isfile(item) and not item.lower().endswith(DATA_SUFFIXES):
+            base = os.path.dirname(item)
+            with open(item) as f:
+                entries = [line.strip() for line in f]
+            entries = [os.path.join(base, e) for e in entries if e and not e.startswith("#")]
+            paths.extend(expand_inputs(entries))
+            continue
+        matches = sorted(glob.glob(item, recursive=True))
+        # A path that matches nothing is kept so that it is reported as a failed file
+        paths.extend(matches or [item])
+    return list(dict.fromkeys(paths))
+
+
+def output_names(paths: list[str]) -> list[str]:
+    """Name each file's summary after its stem, numbering repeats (``a.json``, ``a-2.json``)."""
+    used = {os.path.splitext(INDEX_FILE)[0]}
+    names = []
+    for path in paths:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        name, n = stem, 1
+        while name in used:
+            n += 1
+            name = f"{stem}-{n}"
+        used.add(name)
+        names.append(f"{name}.json")
+    return names
+
+
+def _load(path: str, analyzer_kwargs: dict) -> DatasetAnalyzer:
+    kwargs = dict(analyzer_kwargs, sections="auto")
+    if kwargs.pop("auto_sample", True):
+        return DatasetAnalyzer.from_file(path, **kwargs)
+    return DatasetAnalyzer(read_dataset(path), auto_sample=False, **kwargs)
+
+
+def _scan_one(job: BatchJob, load) -> dict:
+    entry = {"file": job.path, "output": job.output_file}
+    start = time.perf_counter()
+    try:
+        summary = load().analyze()
+        JsonReport().generate(summary, full=False, output_file=job.output_file)
+    except Exception as e:
+        entry.update(status="error", error=f"{type(e).__name__}: {e}", output=None)
+    else:
+        info = summary["summaries"]["dataset_info"]
+        sampling = summary.get("sampling_info", {})
+        entry.update(
+            status="ok",
+            rows=sampling["original_rows"] if sampling.get("was_sampled") else info["rows"],
+            columns=info["columns"],
+            critical_count=summary["critical_count"],
+            warning_count=summary["warning_count"],
+        )
+        if sampling.get("was_sampled"):
+            entry["sample_fraction"] = sampling["sample_fraction"]
+    entry["duration_seconds"] = round(time.perf_counter() - start, 4)
+    return entry
+
+
+def _scan_batch(jobs: list[BatchJob], analyzer_kwargs: dict) -> list[tuple[int, dict]]:
+    """Analyse ``jobs`` in order while a reader thread reads the file after the current one."""
+    results = []
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="hashprep-reader") as reader:
+        pending = reader.submit(_load, jobs[0].path, analyzer_kwargs) if jobs else None
+        for i, job in enumerate(jobs):
+            current = pending
+            pending = reader.submit(_load, jobs[i + 1].path, analyzer_kwargs) if i + 1 < len(jobs) else None
+            results.append((job.position, _scan_one(job, current.result)))
+    return results
+
+
+def _batches(jobs: list[BatchJob], workers: int) -> list[list[BatchJob]]:
+    # Aim for a few batches per worker so that a slow file does not leave the others idle
+    size = max(1, min(MAX_BATCH_SIZE, math.ceil(len(jobs) / (workers * 4))))
+    return [jobs[i : i + size] for i in range(0, len(jobs), size)]
+
+
+def scan_files(
+    paths: list[str],
+    output_dir: str,
+    n_jobs: int = 1,
+    analyzer_kwargs: dict | None = None,
+    on_result: Callable[[dict], None] | None = None,
+) -> dict:
+    """Analyse every file in ``paths``, write one JSON summary each plus ``index.json``, and return the index.
+
+    ``analyzer_kwargs`` are passed to every ``DatasetAnalyzer`` (each analysis itself runs
+    single-threaded; ``n_jobs`` is the number of files analysed at once); files are sampled
+    while they are read unless ``auto_sample`` is ``False``. ``on_result`` is
+    called in this process with each file's index entry as it finishes.
+    """
+    analyzer_kwargs = dict(analyzer_kwargs or {})
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [
+        BatchJob(position=i, path=path, output_file=os.path.join(output_dir, name))
+        for i, (path, name) in enumerate(zip(paths, output_names(paths)))
+    ]
+    workers = min(resolve_n_jobs(n_jobs), max(len(jobs), 1))
+    started = datetime.now()
+    entries: list[dict | None] = [None] * len(jobs)
+
+    def collect(results):
+        for position, entry in results:
+            entries[position] = entry
+            if on_result is not None:
+                on_result(entry)
+
+    if workers == 1:
+        for batch in _batches(jobs, 1):
+            collect(_scan_batch(batch, analyzer_kwargs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_scan_batch, batch, analyzer_kwargs) for batch in _batches(jobs, workers)]
+            for future in as_completed(futures):
+                collect(future.result())
+
+    ok = [e for e in entries if e["status"] == "ok"]
+    index = {
+        "generated": datetime.now().isoformat(),
+        "version": hashprep.__version__,
+        "duration_seconds": round((datetime.now() - started).total_seconds(), 4),
+        "files": len(entries),
+        "succeeded": len(ok),
+        "failed": len(entries) - len(ok),
+        "critical_issues": sum(e["critical_count"] for e in ok),
+        "warnings": sum(e["warning_count"] for e in ok),
+        "results": entries,
+    }
+    with open(os.path.join(output_dir, INDEX_FILE), "w") as f:
+        json.dump(index, f, indent=2)
+    return index
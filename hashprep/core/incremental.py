@@ -0,0 +1,174 @@
+"""
+Saved analysis state for re-analysing append-only datasets.
+
+AnalysisState keeps what is needed to fold new rows into an earlier
+analysis: the StreamingProfile (counts, moments, value frequencies,
+duplicate-row hashes and reservoir sample), the per-column sketches,
+per-column fingerprints, every check's issues and the variable summaries.
+An update costs one pass over the new rows plus work bounded by the
+reservoir size, however many rows were analysed before.
+
+A column counts as changed when its fingerprint moved by more than
+``incremental.change_tolerance``. Only changed columns are re-summarised and
+re-checked by column-local checks; whole-table checks re-run when any
+column (or a dataset-level figure, for dataset checks) changed. Checks whose
+descriptions report counts or ratios (``COUNTED_CHECKS``) re-run on every
+column whenever rows were appended, so their issues agree with the refreshed
+summaries. Every other check keeps its previous issues.
+
+State files are pickles: only load files written by a trusted source.
+"""
+
+import copy
+import math
+import pickle
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..checks import COLUMN_CHECKS, COUNTED_CHECKS, DATASET_CHECKS, Issue, run_tasks
+from ..config import HashPrepConfig
+from ..summaries.sketches import ColumnSketch
+from ..summaries.streaming import StreamingProfile
+
+STATE_VERSION = 1
+
+# Fingerprint key for whole-table figures
+DATASET_KEY = "__dataset__"
+
+
+@dataclass
+class AnalysisState:
+    """Everything ``DatasetAnalyzer.update`` needs to continue an analysis; see ``DatasetAnalyzer.state``."""
+
+    profile: StreamingProfile
+    sketches: dict[str, ColumnSketch] | None
+    fingerprints: dict[str, dict[str, float]]
+    column_types: dict[str, str]
+    variables: dict
+    check_issues: dict[str, list[Issue]]
+    config: HashPrepConfig
+    target_col: str | None
+    selected_checks: list[str] | None
+    rows: int
+    version: int = STATE_VERSION
+
+    def save(self, path: str | Path) -> None:
+        with open(path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "AnalysisState":
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if not isinstance(state, cls) or state.version != STATE_VERSION:
+            raise ValueError(f"'{path}' is not a HashPrep analysis state (version {STATE_VERSION})")
+        return state
+
+
+def compute_fingerprints(
+    profile: StreamingProfile, sketches: dict[str, ColumnSketch] | None, top_n: int
+) -> dict[str, dict[str, float]]:
+    """Per-column figures that are comparable between runs regardless of row count."""
+    fingerprints = profile.fingerprint()
+    for col, figures in fingerprints.items():
+        sketch = sketches.get(col) if sketches else None
+        if sketch is None or sketch.count == 0:
+            continue
+        figures["distinct_ratio"] = sketch.distinct_count() / sketch.count
+        for value, count in sketch.top_values.top(top_n):
+            figures[f"top:{value!r}"] = count / sketch.count
+
+    column_figures = list(fingerprints.values())
+    duplicates = profile.duplicate_rows
+    fingerprints[DATASET_KEY] = {
+        "empty": float(profile.rows == 0),
+        "missing_ratio": sum(f["missing_ratio"] for f in column_figures) / len(column_figures)
+        if column_figures
+        else 0.0,
+        "duplicate_ratio": duplicates / profile.rows if duplicates is not None and profile.rows > 0 else math.nan,
+    }
+    return fingerprints
+
+
+def _moved(before: dict[str, float], after: dict[str, float], tolerance: float) -> bool:
+    std = before.get("std", math.nan)
+    for key in before.keys() | after.keys():
+        # Top values may enter or leave the top n; any other key appearing or vanishing is a change
+        if not key.startswith("top:") and (key in before) != (key in after):
+            return True
+        old, new = before.get(key, 0.0), after.get(key, 0.0)
+        if math.isnan(old) and math.isnan(new):
+            continue
+        if key in ("mean", "std"):
+            scale = std if std > 0 else max(abs(old), 1.0)
+        else:
+            scale = 1.0
+        if not abs(new - old) <= tolerance * scale:
+            return True
+    return False
+
+
+def changed_columns(
+    before: dict[str, dict[str, float]], after: dict[str, dict[str, float]], tolerance: float
+) -> set[str]:
+    """Keys of ``after`` (columns and ``DATASET_KEY``) whose fingerprint moved by more than ``tolerance``."""
+    return {key for key, figures in after.items() if key not in before or _moved(before[key], figures, tolerance)}
+
+
+def _column_view(analyzer, columns: list[str]):
+    """Shallow analyzer copy restricted to ``columns``, for re-running column-local checks."""
+    view = copy.copy(analyzer)
+    view.df = analyzer.df[columns]
+    view.column_types = {col: analyzer.column_types[col] for col in columns}
+    view.column_cache = analyzer._new_cache(view.df)
+    return view
+
+
+def run_checks_incrementally(
+    analyzer,
+    state: AnalysisState,
+    tasks: list[tuple[str, Callable]],
+    changed: set[str],
+    n_jobs: int = 1,
+    backend: str = "thread",
+    timings: list | None = None,
+) -> tuple[dict[str, list[Issue]], list[str]]:
+    """Re-run only the checks whose inputs are in ``changed``; reuse ``state``'s issues for the rest.
+
+    Returns each task's issues and the names of the tasks that were (fully or partly) re-run.
+    """
+    order = {col: i for i, col in enumerate(analyzer.df.columns)}
+    changed_cols = [col for col in analyzer.df.columns if col in changed]
+    appended = analyzer._full_rows() != state.rows
+    full, partial = [], []
+    for name, check_fn in tasks:
+        # Drift and schema checks compare against inputs the state does not record
+        external = (name == "dataset_drift" and analyzer.comparison_df is not None) or (
+            name == "schema_mismatch" and analyzer.schema is not None
+        )
+        if name not in state.check_issues or external or (appended and name in COUNTED_CHECKS):
+            full.append((name, check_fn))
+        elif name in DATASET_CHECKS:
+            if DATASET_KEY in changed:
+                full.append((name, check_fn))
+        elif name in COLUMN_CHECKS:
+            if changed_cols:
+                partial.append((name, check_fn))
+        elif changed:
+            full.append((name, check_fn))
+
+    results = run_tasks(analyzer, full, n_jobs=n_jobs, backend=backend, timings=timings) if full else {}
+    if partial:
+        fresh = run_tasks(
+            _column_view(analyzer, changed_cols), partial, n_jobs=n_jobs, backend=backend, timings=timings
+        )
+        for name, issues in fresh.items():
+            kept = [
+                issue for issue in state.check_issues[name] if issue.column not in changed and issue.column in order
+            ]
+            results[name] = sorted(kept + issues, key=lambda issue: order.get(issue.column, len(order)))
+
+    rerun = {name for name, _ in full + partial}
+    grouped = {name: results.get(name, state.check_issues.get(name, [])) for name, _ in tasks}
+    return grouped, [name for name, _ in tasks if name in rerun]
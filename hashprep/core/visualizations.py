@@ -1,5 +1,6 @@
 import base64
 import io
+import threading
 
 import matplotlib.pyplot as plt
 import pandas as pd
@@ -9,6 +10,9 @@ import seaborn as sns
 plt.style.use("ggplot")
 sns.set_palette("husl")
 
+# pyplot keeps global figure state; hold this while drawing from more than one thread
+PLOT_LOCK = threading.Lock()
+
 
 def _fig_to_base64(fig) -> str:
     buf = io.BytesIO()
@@ -1,20 +1,25 @@
+import dataclasses
 import json
 import os
 
 import click
 import fuzzybunny
 import numpy as np
-import pandas as pd
 
 import hashprep
 from hashprep import DatasetAnalyzer
 from hashprep.checks.core import Issue
+from hashprep.core.batch import INDEX_FILE, expand_inputs, scan_files
+from hashprep.core.incremental import AnalysisState
 from hashprep.preparers.codegen import CodeGenerator
 from hashprep.preparers.pipeline_builder import PipelineBuilder
 from hashprep.preparers.suggestions import SuggestionProvider
 from hashprep.reports import generate_report
 from hashprep.utils.config_loader import load_config
+from hashprep.utils.io import iter_chunks, read_dataset
+from hashprep.utils.profiling import sort_by_cost
 from hashprep.utils.sampling import SamplingConfig
+from hashprep.utils.schema import Schema
 
 
 def json_numpy_handler(obj):
@@ -47,8 +52,33 @@ def version():
     click.echo(f"HashPrep Version: {hashprep.__version__}")
 
 
+def _echo_anytime(summary: dict) -> None:
+    info = summary["summaries"].get("anytime_info")
+    if info and not info["complete"]:
+        click.echo(
+            f"Time budget: stopped after {len(info['rounds'])} round(s); "
+            f"figures come from a {info['sample_rows']}-row sample"
+        )
+    if info and info.get("interrupted_round"):
+        click.echo(f"Time budget: the {info['interrupted_round']['rows']}-row round was stopped at the deadline")
+
+
+def _echo_timings(reproduction_info: dict) -> None:
+    timings = sort_by_cost(reproduction_info.get("timings", []))
+    if reproduction_info.get("result_cache", {}).get("hit"):
+        click.echo("Profile: served from the result cache; timings below are from the run that filled it")
+    click.echo(f"{'Step':<28} {'Kind':<8} {'Wall s':>9} {'CPU s':>9} {'Rows':>10} {'Cols':>6} {'Peak MiB':>9}")
+    for t in timings:
+        peak = "-" if t["memory_peak_bytes"] is None else f"{t['memory_peak_bytes'] / 1024**2:.1f}"
+        click.echo(
+            f"{t['name']:<28} {t['kind']:<8} {t['wall_seconds']:>9.3f} {t['cpu_seconds']:>9.3f} "
+            f"{t['rows']:>10} {t['columns']:>6} {peak:>9}"
+        )
+    click.echo(f"Total: {reproduction_info.get('duration_seconds', 0)} seconds\n")
+
+
 @cli.command()
-@click.argument("file_path", type=click.Path(exists=True))
+@click.argument("file_path", type=click.Path(exists=True, allow_dash=True))
 @click.option("--critical-only", is_flag=True, help="Show only critical issues")
 @click.option("--quiet", is_flag=True, help="Show minimal output")
 @click.option("--json", "json_out", is_flag=True, help="Output in JSON format")
@@ -68,9 +98,60 @@ def version():
     "--sample-size",
     type=int,
     default=None,
-    help="Max rows for sampling (default: 100000)",
+    help="Max rows for sampling (default: 100000); the file is sampled as it is read and every check runs on "
+    "the sample (tiered execution is only available from the Python API)",
+)
+@click.option("--no-sample", is_flag=True, help="Read the whole file and run every check on every row")
+@click.option(
+    "--chunksize",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Stream the file in chunks of this many rows (for files larger than memory)",
+)
+@click.option(
+    "--jobs", "n_jobs", type=int, default=1, help="Parallel workers for checks and summaries (-1 = all cores)"
+)
+@click.option(
+    "--sketches",
+    is_flag=True,
+    help="Estimate quantiles, distinct counts and top values over all rows with mergeable sketches",
+)
+@click.option(
+    "--time-budget",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Refine the analysis on growing samples, stopping before a round would exceed this many seconds",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Reuse results from this directory when the dataset and options are unchanged",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print wall time, CPU time and peak memory of every summary and check, most expensive first",
+)
+@click.option(
+    "--state",
+    "state_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Analysis state file: if it exists, FILE_PATH holds only rows appended since; it is rewritten afterwards",
+)
+@click.option(
+    "--schema",
+    "schema_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Schema from 'hashprep schema export': read with its dtypes, reuse its column types and report mismatches",
+)
+@click.option(
+    "--optimize-dtypes",
+    is_flag=True,
+    help="Downcast numeric columns and store repeated strings as categories before analysing",
 )
-@click.option("--no-sample", is_flag=True, help="Disable automatic sampling")
 @click.option(
     "--config",
     "config_path",
@@ -78,9 +159,35 @@ def version():
     default=None,
     help="Path to config file (.yaml, .toml, .json)",
 )
-def scan(file_path, critical_only, quiet, json_out, target, checks, comparison, sample_size, no_sample, config_path):
-    df = pd.read_csv(file_path)
-    comparison_df = pd.read_csv(comparison) if comparison else None
+def scan(
+    file_path,
+    critical_only,
+    quiet,
+    json_out,
+    target,
+    checks,
+    comparison,
+    sample_size,
+    no_sample,
+    chunksize,
+    n_jobs,
+    sketches,
+    time_budget,
+    cache_dir,
+    profile,
+    state_path,
+    schema_path,
+    optimize_dtypes,
+    config_path,
+):
+    if chunksize and no_sample:
+        raise click.UsageError("--chunksize analyzes a reservoir sample and cannot be combined with --no-sample")
+    schema = Schema.load(schema_path) if schema_path else None
+    read_options = schema.read_options() if schema is not None else None
+    # Sampled scans read the file through the sampler; only incremental state needs every row in memory
+    sample_from_file = not (no_sample or chunksize or state_path)
+    df = None if chunksize or sample_from_file else read_dataset(file_path, read_options)
+    comparison_df = read_dataset(comparison) if comparison else None
 
     selected_checks = checks.split(",") if checks else None
     valid_checks = DatasetAnalyzer.ALL_CHECKS
@@ -99,16 +206,89 @@ def scan(file_path, critical_only, quiet, json_out, target, checks, comparison,
         sampling_config = SamplingConfig(max_rows=sample_size)
 
     config = load_config(config_path) if config_path else None
-    analyzer = DatasetAnalyzer(
-        df,
-        target_col=target,
-        selected_checks=selected_checks,
-        comparison_df=comparison_df,
-        sampling_config=sampling_config,
-        auto_sample=not no_sample,
-        config=config,
-    )
-    summary = analyzer.analyze()
+    previous_state = AnalysisState.load(state_path) if state_path and os.path.exists(state_path) else None
+    if previous_state is not None:
+        # Options left unset keep the values the state was saved with
+        overrides = {"target_col": target, "selected_checks": selected_checks, "config": config}
+        analyzer = DatasetAnalyzer.update(
+            iter_chunks(file_path, chunksize, read_options) if chunksize else df,
+            previous_state,
+            sampling_config=sampling_config,
+            comparison_df=comparison_df,
+            n_jobs=n_jobs,
+            cache=cache_dir,
+            profile_memory=profile,
+            sections="auto",
+            schema=schema,
+            optimize_memory=optimize_dtypes,
+            **{key: value for key, value in overrides.items() if value is not None},
+        )
+    elif chunksize:
+        analyzer = DatasetAnalyzer.from_chunks(
+            iter_chunks(file_path, chunksize, read_options),
+            sampling_config=sampling_config,
+            config=config,
+            target_col=target,
+            selected_checks=selected_checks,
+            comparison_df=comparison_df,
+            n_jobs=n_jobs,
+            cache=cache_dir,
+            profile_memory=profile,
+            sections="auto",
+            sketches=sketches,
+            schema=schema,
+            optimize_memory=optimize_dtypes,
+        )
+    elif sample_from_file:
+        analyzer = DatasetAnalyzer.from_file(
+            file_path,
+            sampling_config=sampling_config,
+            config=config,
+            target_col=target,
+            selected_checks=selected_checks,
+            comparison_df=comparison_df,
+            n_jobs=n_jobs,
+            cache=cache_dir,
+            profile_memory=profile,
+            sections="auto",
+            sketches=sketches,
+            schema=schema,
+            optimize_memory=optimize_dtypes,
+        )
+    else:
+        analyzer = DatasetAnalyzer(
+            df,
+            target_col=target,
+            selected_checks=selected_checks,
+            comparison_df=comparison_df,
+            sampling_config=sampling_config,
+            auto_sample=not no_sample,
+            config=config,
+            n_jobs=n_jobs,
+            cache=cache_dir,
+            profile_memory=profile,
+            sections="auto",
+            sketches=sketches,
+            schema=schema,
+            optimize_memory=optimize_dtypes,
+        )
+    # With --optimize-dtypes the analyzer holds its own downcast copy; let the frame as read go
+    df = None
+    # Print critical issues as soon as their checks finish rather than after the whole analysis
+    stream = not (json_out or quiet) and time_budget is None
+    streamed = []
+
+    def echo_critical(issue):
+        if issue.severity == "critical":
+            streamed.append(issue)
+            click.echo(f"{len(streamed)}. {issue.description}" if critical_only else f"- {issue.description}")
+
+    if stream:
+        click.echo(f"Dataset Health Check: {file_path}")
+        click.echo("Critical Issues:")
+    summary = analyzer.analyze(time_budget_s=time_budget, on_issue=echo_critical if stream else None)
+    if state_path:
+        analyzer.state().save(state_path)
 
     issues = summary["issues"]
     critical = [i for i in issues if i["severity"] == "critical"]
@@ -123,14 +303,25 @@ def scan(file_path, critical_only, quiet, json_out, target, checks, comparison,
         }
         if "sampling_info" in summary:
             json_data["sampling_info"] = summary["sampling_info"]
+        if "anytime_info" in summary["summaries"]:
+            json_data["anytime_info"] = summary["summaries"]["anytime_info"]
+        if profile:
+            json_data["timings"] = sort_by_cost(summary["summaries"]["reproduction_info"].get("timings", []))
         click.echo(json.dumps(json_data, default=json_numpy_handler))
         return
 
+    if profile:
+        _echo_timings(summary["summaries"]["reproduction_info"])
+
     if quiet:
         click.echo(f"CRITICAL ISSUES: {len(critical)}, WARNINGS: {len(warnings)}")
         return
 
-    click.echo(f"Dataset Health Check: {file_path}")
+    if not stream:
+        click.echo(f"Dataset Health Check: {file_path}")
+        click.echo("Critical Issues:")
+        for i, issue in enumerate(critical, 1):
+            click.echo(f"{i}. {issue['description']}" if critical_only else f"- {issue['description']}")
     click.echo(
         f"Size: {summary['summaries']['dataset_info']['rows']} rows x {summary['summaries']['dataset_info']['columns']} columns"
     )
@@ -138,24 +329,122 @@ def scan(file_path, critical_only, quiet, json_out, target, checks, comparison,
     if "sampling_info" in summary and summary["sampling_info"].get("was_sampled"):
         info = summary["sampling_info"]
         click.echo(f"Sampled: {info['sample_fraction'] * 100:.1f}% of {info['original_rows']} rows")
+    _echo_anytime(summary)
 
     if critical_only:
-        click.echo("Critical Issues:")
-        for i, issue in enumerate(critical, 1):
-            click.echo(f"{i}. {issue['description']}")
         return
 
-    click.echo("Critical Issues:")
-    for issue in critical:
-        click.echo(f"- {issue['description']}")
     click.echo("Warnings:")
     for issue in warnings:
         click.echo(f"- {issue['description']}")
     click.echo("Next steps: Run 'hashprep details' or 'hashprep report' for more info.")
 
 
+@cli.command("scan-many")
+@click.argument("inputs", nargs=-1, required=True)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False),
+    default="hashprep_scan",
+    show_default=True,
+    help="Directory for the per-file JSON summaries and index.json",
+)
+@click.option("--jobs", "n_jobs", type=int, default=1, help="Files analysed at once (-1 = all cores)")
+@click.option("--target", default=None, help="Target column for relevant checks")
+@click.option(
+    "--checks",
+    default=None,
+    help=f"Comma-separated checks to run. Defaults to all: {','.join(DatasetAnalyzer.ALL_CHECKS)}",
+)
+@click.option(
+    "--sample-size",
+    type=int,
+    default=None,
+    help="Max rows sampled from each file (default: 100000) while it is read; every check runs on that sample",
+)
+@click.option("--no-sample", is_flag=True, help="Read each whole file and analyse every row")
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Reuse results from this directory when a file and the options are unchanged",
+)
+@click.option(
+    "--config",
+    "config_path",
+    type=click.Path(exists=True),
+    default=None,
+    help="Path to config file (.yaml, .toml, .json)",
+)
+def scan_many(inputs, output_dir, n_jobs, target, checks, sample_size, no_sample, cache_dir, config_path):
+    """Scan every file matched by INPUTS (glob patterns, paths or manifest files listing them)."""
+    paths = expand_inputs(inputs)
+
+    selected_checks = checks.split(",") if checks else None
+    valid_checks = DatasetAnalyzer.ALL_CHECKS
+    if selected_checks:
+        invalid_checks = [c for c in selected_checks if c not in valid_checks]
+        if invalid_checks:
+            click.echo(f"Warning: Invalid checks ignored: {', '.join(invalid_checks)}")
+            for invalid in invalid_checks:
+                suggestions = suggest_check_names(invalid, valid_checks)
+                if suggestions:
+                    click.echo(f"  Did you mean: {', '.join(suggestions)}?")
+            selected_checks = [c for c in selected_checks if c in valid_checks]
+
+    sampling_config = None
+    if not no_sample and sample_size:
+        sampling_config = SamplingConfig(max_rows=sample_size)
+
+    analyzer_kwargs = {
+        "target_col": target,
+        "selected_checks": selected_checks,
+        "sampling_config": sampling_config,
+        "auto_sample": not no_sample,
+        "config": load_config(config_path) if config_path else None,
+        "cache": cache_dir,
+    }
+
+    def echo_result(entry):
+        if entry["status"] == "ok":
+            click.echo(f"[ok] {entry['file']}: {entry['critical_count']} critical, {entry['warning_count']} warnings")
+        else:
+            click.echo(f"[error] {entry['file']}: {entry['error']}")
+
+    index = scan_files(paths, output_dir, n_jobs=n_jobs, analyzer_kwargs=analyzer_kwargs, on_result=echo_result)
+    click.echo(
+        f"Scanned {index['files']} files ({index['failed']} failed) in {index['duration_seconds']} seconds: "
+        f"{index['critical_issues']} critical, {index['warnings']} warnings"
+    )
+    click.echo(f"Index saved to: {os.path.join(output_dir, INDEX_FILE)}")
+    if index["failed"]:
+        raise SystemExit(1)
+
+
+@cli.group("schema")
+def schema_group():
+    """Save a dataset's schema for later runs (see --schema)."""
+
+
+@schema_group.command("export")
+@click.argument("file_path", type=click.Path(exists=True, allow_dash=True))
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    default="schema.json",
+    show_default=True,
+    help="Schema file to write",
+)
+def schema_export(file_path, output):
+    """Save FILE_PATH's column types, dtypes, category levels and datetime formats as JSON."""
+    schema = Schema.infer(read_dataset(file_path))
+    schema.save(output)
+    click.echo(f"Schema of {len(schema.columns)} columns saved to: {output}")
+
+
 @cli.command()
-@click.argument("file_path", type=click.Path(exists=True))
+@click.argument("file_path", type=click.Path(exists=True, allow_dash=True))
 @click.option("--target", default=None, help="Target column for relevant checks")
 @click.option(
     "--checks",
@@ -172,9 +461,42 @@ def scan(file_path, critical_only, quiet, json_out, target, checks, comparison,
     "--sample-size",
     type=int,
     default=None,
-    help="Max rows for sampling (default: 100000)",
+    help="Max rows for sampling (default: 100000); the file is sampled as it is read and every check runs on "
+    "the sample (tiered execution is only available from the Python API)",
+)
+@click.option("--no-sample", is_flag=True, help="Read the whole file and run every check on every row")
+@click.option(
+    "--jobs", "n_jobs", type=int, default=1, help="Parallel workers for checks and summaries (-1 = all cores)"
+)
+@click.option(
+    "--sketches",
+    is_flag=True,
+    help="Estimate quantiles, distinct counts and top values over all rows with mergeable sketches",
+)
+@click.option(
+    "--time-budget",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Refine the analysis on growing samples, stopping before a round would exceed this many seconds",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Reuse results from this directory when the dataset and options are unchanged",
+)
+@click.option(
+    "--schema",
+    "schema_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Schema from 'hashprep schema export': read with its dtypes, reuse its column types and report mismatches",
+)
+@click.option(
+    "--optimize-dtypes",
+    is_flag=True,
+    help="Downcast numeric columns and store repeated strings as categories before analysing",
 )
-@click.option("--no-sample", is_flag=True, help="Disable automatic sampling")
 @click.option(
     "--config",
     "config_path",
@@ -182,9 +504,25 @@ def scan(file_path, critical_only, quiet, json_out, target, checks, comparison,
     default=None,
     help="Path to config file (.yaml, .toml, .json)",
 )
-def details(file_path, target, checks, comparison, sample_size, no_sample, config_path):
-    df = pd.read_csv(file_path)
-    comparison_df = pd.read_csv(comparison) if comparison else None
+def details(
+    file_path,
+    target,
+    checks,
+    comparison,
+    sample_size,
+    no_sample,
+    n_jobs,
+    sketches,
+    time_budget,
+    cache_dir,
+    schema_path,
+    optimize_dtypes,
+    config_path,
+):
+    schema = Schema.load(schema_path) if schema_path else None
+    # Sampled runs read the file through the sampler and never hold every row
+    df = read_dataset(file_path, schema.read_options() if schema is not None else None) if no_sample else None
+    comparison_df = read_dataset(comparison) if comparison else None
 
     selected_checks = checks.split(",") if checks else None
     valid_checks = DatasetAnalyzer.ALL_CHECKS
@@ -203,16 +541,25 @@ def details(file_path, target, checks, comparison, sample_size, no_sample, confi
         sampling_config = SamplingConfig(max_rows=sample_size)
 
     config = load_config(config_path) if config_path else None
-    analyzer = DatasetAnalyzer(
-        df,
-        target_col=target,
-        selected_checks=selected_checks,
-        comparison_df=comparison_df,
-        sampling_config=sampling_config,
-        auto_sample=not no_sample,
-        config=config,
-    )
-    summary = analyzer.analyze()
+    analyzer_kwargs = {
+        "target_col": target,
+        "selected_checks": selected_checks,
+        "comparison_df": comparison_df,
+        "config": config,
+        "n_jobs": n_jobs,
+        "cache": cache_dir,
+        "sketches": sketches,
+        "schema": schema,
+        "optimize_memory": optimize_dtypes,
+        "sections": ["missing_values"],
+    }
+    if no_sample:
+        analyzer = DatasetAnalyzer(df, auto_sample=False, **analyzer_kwargs)
+    else:
+        analyzer = DatasetAnalyzer.from_file(file_path, sampling_config=sampling_config, **analyzer_kwargs)
+    # With --optimize-dtypes the analyzer holds its own downcast copy; let the frame as read go
+    df = None
+    summary = analyzer.analyze(time_budget_s=time_budget)
 
     issues = summary["issues"]
     critical = [i for i in issues if i["severity"] == "critical"]
@@ -225,6 +572,7 @@ def details(file_path, target, checks, comparison, sample_size, no_sample, confi
         click.echo(
             f"Note: Analysis performed on {info['sample_fraction'] * 100:.1f}% sample ({int(info['original_rows'] * info['sample_fraction'])} of {info['original_rows']} rows)"
         )
+    _echo_anytime(summary)
 
     click.echo("\nCritical Issues:")
     for i, issue in enumerate(critical, 1):
@@ -245,6 +593,8 @@ def details(file_path, target, checks, comparison, sample_size, no_sample, confi
     click.echo(f"- Rows: {info['rows']}")
     click.echo(f"- Columns: {info['columns']}")
     click.echo(f"- Memory: ~{info['memory_mb']} MB")
+    if "memory_saved_bytes" in info:
+        click.echo(f"- Saved by --optimize-dtypes: ~{info['memory_saved_bytes'] / 1024**2:.1f} MB")
     click.echo(f"- Missing: {info['missing_cells']} ({info['missing_percentage']} %)")
     click.echo("- Variable Types:")
     for col, typ in summary["summaries"]["variable_types"].items():
@@ -266,7 +616,7 @@ def details(file_path, target, checks, comparison, sample_size, no_sample, confi
 
 
 @cli.command()
-@click.argument("file_path", type=click.Path(exists=True))
+@click.argument("file_path", type=click.Path(exists=True, allow_dash=True))
 @click.option("--with-code", is_flag=True, help="Generate fixes.py and pipeline.py scripts")
 @click.option("--full/--no-full", default=True, help="Include full summaries in report (default: True)")
 @click.option("--format", default="md", help="Report format: md, json, html, pdf")
@@ -292,9 +642,42 @@ def details(file_path, target, checks, comparison, sample_size, no_sample, confi
     "--sample-size",
     type=int,
     default=None,
-    help="Max rows for sampling (default: 100000)",
+    help="Max rows for sampling (default: 100000); the file is sampled as it is read and every check runs on "
+    "the sample (tiered execution is only available from the Python API)",
+)
+@click.option("--no-sample", is_flag=True, help="Read the whole file and run every check on every row")
+@click.option(
+    "--jobs", "n_jobs", type=int, default=1, help="Parallel workers for checks and summaries (-1 = all cores)"
+)
+@click.option(
+    "--sketches",
+    is_flag=True,
+    help="Estimate quantiles, distinct counts and top values over all rows with mergeable sketches",
+)
+@click.option(
+    "--time-budget",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Refine the analysis on growing samples, stopping before a round would exceed this many seconds",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Reuse results from this directory when the dataset and options are unchanged",
+)
+@click.option(
+    "--schema",
+    "schema_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Schema from 'hashprep schema export': read with its dtypes, reuse its column types and report mismatches",
+)
+@click.option(
+    "--optimize-dtypes",
+    is_flag=True,
+    help="Downcast numeric columns and store repeated strings as categories before analysing",
 )
-@click.option("--no-sample", is_flag=True, help="Disable automatic sampling")
 @click.option(
     "--config",
     "config_path",
@@ -314,10 +697,18 @@ def report(
     comparison,
     sample_size,
     no_sample,
+    n_jobs,
+    sketches,
+    time_budget,
+    cache_dir,
+    schema_path,
+    optimize_dtypes,
     config_path,
 ):
-    df = pd.read_csv(file_path)
-    comparison_df = pd.read_csv(comparison) if comparison else None
+    schema = Schema.load(schema_path) if schema_path else None
+    # Sampled runs read the file through the sampler and never hold every row
+    df = read_dataset(file_path, schema.read_options() if schema is not None else None) if no_sample else None
+    comparison_df = read_dataset(comparison) if comparison else None
 
     selected_checks = checks.split(",") if checks else None
     valid_checks = DatasetAnalyzer.ALL_CHECKS
@@ -336,19 +727,30 @@ def report(
         sampling_config = SamplingConfig(max_rows=sample_size)
 
     config = load_config(config_path) if config_path else None
-    analyzer = DatasetAnalyzer(
-        df,
-        target_col=target,
-        selected_checks=selected_checks,
-        include_plots=visualizations,
-        comparison_df=comparison_df,
-        sampling_config=sampling_config,
-        auto_sample=not no_sample,
-        config=config,
-    )
-    summary = analyzer.analyze()
-
-    base_name = os.path.splitext(os.path.basename(file_path))[0] + "_hashprep_report"
+    analyzer_kwargs = {
+        "target_col": target,
+        "selected_checks": selected_checks,
+        # Plots only appear in the full report
+        "include_plots": visualizations and full,
+        "comparison_df": comparison_df,
+        "config": config,
+        "n_jobs": n_jobs,
+        "cache": cache_dir,
+        "sketches": sketches,
+        "schema": schema,
+        "optimize_memory": optimize_dtypes,
+        "sections": "all" if full else "auto",
+    }
+    if no_sample:
+        analyzer = DatasetAnalyzer(df, auto_sample=False, **analyzer_kwargs)
+    else:
+        analyzer = DatasetAnalyzer.from_file(file_path, sampling_config=sampling_config, **analyzer_kwargs)
+    # With --optimize-dtypes the analyzer holds its own downcast copy; let the frame as read go
+    df = None
+    summary = analyzer.analyze(time_budget_s=time_budget)
+
+    stem = "stdin" if file_path == "-" else os.path.splitext(os.path.basename(file_path))[0]
+    base_name = stem + "_hashprep_report"
     # Save to current working directory by default
     report_file = f"{base_name}.{format}"
 
@@ -365,9 +767,12 @@ def report(
     if "sampling_info" in summary and summary["sampling_info"].get("was_sampled"):
         info = summary["sampling_info"]
         click.echo(f"Note: Analysis performed on {info['sample_fraction'] * 100:.1f}% sample")
+    _echo_anytime(summary)
 
     if with_code:
-        issues = [Issue(**i) for i in summary["issues"]]
+        # Summary issues carry extra keys (e.g. "population") that Issue does not have
+        issue_fields = {field.name for field in dataclasses.fields(Issue)}
+        issues = [Issue(**{k: v for k, v in i.items() if k in issue_fields}) for i in summary["issues"]]
         column_types = summary.get("column_types", {})
 
         provider = SuggestionProvider(
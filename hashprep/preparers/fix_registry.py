@@ -31,6 +31,7 @@ class FixRegistry:
             "single_value_columns": self._suggest_drop,
             "high_cardinality": self._suggest_encoding,
             "duplicates": self._suggest_dedupe,
+            "duplicate_columns": self._suggest_drop,
             "outliers": self._suggest_outlier_fix,
             "skewness": self._suggest_transform,
             "mixed_types": self._suggest_drop,
@@ -1 +1,2 @@
 from .generators import generate_report as generate_report
+from .generators import generate_report_async as generate_report_async
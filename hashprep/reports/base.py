@@ -17,6 +17,7 @@ class BaseReport:
         "skewness": "Skewness",
         "high_cardinality": "High Cardinality",
         "duplicates": "Duplicates",
+        "duplicate_columns": "Duplicates",
         "data_leakage": "Leakage",
         "target_leakage_patterns": "Leakage",
         "class_imbalance": "Imbalance",
@@ -29,6 +30,7 @@ class BaseReport:
         "infinite_values": "Infinite",
         "constant_length": "Constant Length",
         "empty_dataset": "Empty Dataset",
+        "schema_mismatch": "Schema",
     }
 
     def _group_alerts_by_type(self, issues: list[dict]) -> dict[str, list[dict]]:
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from ..utils.async_executor import run_blocking
+
 
 class ReportGenerator(ABC):
     @abstractmethod
@@ -37,3 +39,8 @@ def generate_report(summary, format="md", full=False, output_file=None, theme="m
     if format in ["html", "pdf"]:
         return generators[format].generate(summary, full, output_file, theme=theme)
     return generators[format].generate(summary, full, output_file)
+
+
+async def generate_report_async(summary, format="md", full=False, output_file=None, theme="minimal"):
+    """Awaitable ``generate_report``, run on the shared bounded executor."""
+    return await run_blocking(generate_report, summary, format, full, output_file, theme)
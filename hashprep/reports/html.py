@@ -7,6 +7,7 @@ from jinja2 import Template
 
 import hashprep
 
+from ..utils.profiling import sort_by_cost
 from .base import BaseReport
 
 
@@ -15,9 +16,9 @@ class HtmlReport(BaseReport):
         template_str = self._get_template(theme)
         template = Template(template_str)
 
-        head_df = pd.DataFrame(summary["summaries"]["head"])
-        tail_df = pd.DataFrame(summary["summaries"]["tail"])
-        sample_df = pd.DataFrame(summary["summaries"]["sample"])
+        head_df = pd.DataFrame(summary["summaries"].get("head", []))
+        tail_df = pd.DataFrame(summary["summaries"].get("tail", []))
+        sample_df = pd.DataFrame(summary["summaries"].get("sample", []))
 
         dataset_info = summary["summaries"]["dataset_info"]
         reproduction_info = summary["summaries"].get("reproduction_info", {})
@@ -44,12 +45,14 @@ class HtmlReport(BaseReport):
             "variable_type_counts": variable_type_counts,
             # Alerts
             "alerts_by_type": alerts_by_type,
+            "sampled": summary.get("sampling_info", {}).get("was_sampled", False),
             "issues": summary["issues"],
             # Reproduction
             "analysis_started": reproduction_info.get("analysis_started", ""),
             "analysis_finished": reproduction_info.get("analysis_finished", ""),
             "duration_seconds": reproduction_info.get("duration_seconds", 0),
             "dataset_hash": reproduction_info.get("dataset_hash", ""),
+            "timings": sort_by_cost(reproduction_info.get("timings", [])),
             "version": hashprep.__version__,
             "config_json": json.dumps(self._generate_config(summary), indent=2),
             # Full report data
@@ -61,7 +64,7 @@ class HtmlReport(BaseReport):
             "numeric_correlations": summary["summaries"].get("numeric_correlations", {}),
             "categorical_correlations": summary["summaries"].get("categorical_correlations", {}),
             "mixed_correlations": summary["summaries"].get("mixed_correlations", {}),
-            "missing_values": summary["summaries"].get("missing_values", {}),
+            "missing_values": summary["summaries"].get("missing_values", {"count": {}, "percentage": {}}),
             "missing_patterns": summary["summaries"].get("missing_patterns", {}),
             "missing_plots": summary["summaries"].get("plots", {}),
             "yaml_dump": yaml.safe_dump,
@@ -246,7 +249,7 @@ class HtmlReport(BaseReport):
                                     </span>
                                     <div class="flex-1 min-w-0">
                                         <p class="text-sm text-gray-900">{{ alert.description }}</p>
-                                        <p class="text-xs text-gray-500 mt-1">{{ alert_type }}</p>
+                                        <p class="text-xs text-gray-500 mt-1">{{ alert_type }}{% if alert.population == 'sample' and sampled %} · sample{% endif %}</p>
                                     </div>
                                 </li>
                                 {% endfor %}
@@ -284,6 +287,27 @@ class HtmlReport(BaseReport):
                             <dd class="font-mono text-gray-900">hashprep v{{ version }}</dd>
                         </div>
                     </dl>
+                    {% if timings %}
+                    <details class="mt-4 pt-4 border-t border-gray-100 text-sm">
+                        <summary class="cursor-pointer text-gray-500">Timings ({{ timings|length }} steps, most expensive first)</summary>
+                        <table class="mt-2 min-w-full text-left font-mono">
+                            <thead class="text-gray-500">
+                                <tr><th>Step</th><th>Kind</th><th class="text-right">Wall s</th><th class="text-right">CPU s</th><th class="text-right">Rows</th><th class="text-right">Columns</th><th class="text-right">Peak MiB</th></tr>
+                            </thead>
+                            <tbody class="text-gray-900">
+                                {% for t in timings %}
+                                <tr>
+                                    <td>{{ t.name }}</td><td>{{ t.kind }}</td>
+                                    <td class="text-right">{{ "%.3f"|format(t.wall_seconds) }}</td>
+                                    <td class="text-right">{{ "%.3f"|format(t.cpu_seconds) }}</td>
+                                    <td class="text-right">{{ t.rows }}</td><td class="text-right">{{ t.columns }}</td>
+                                    <td class="text-right">{{ "%.1f"|format(t.memory_peak_bytes / 1048576) if t.memory_peak_bytes is not none else "-" }}</td>
+                                </tr>
+                                {% endfor %}
+                            </tbody>
+                        </table>
+                    </details>
+                    {% endif %}
                     {% if not pdf_mode %}
                     <div class="mt-4 pt-4 border-t border-gray-100">
                         <button onclick="downloadConfig()" class="text-sm text-blue-600 hover:text-blue-800 hover:underline">
@@ -440,6 +464,8 @@ class HtmlReport(BaseReport):
                                                 <tr><td class="py-1.5 text-gray-600">Total characters</td><td class="py-1.5 text-right font-medium font-mono">{{ stats.overview.characters_and_unicode.total_characters }}</td></tr>
                                                 <tr><td class="py-1.5 text-gray-600">Distinct characters</td><td class="py-1.5 text-right font-medium font-mono">{{ stats.overview.characters_and_unicode.distinct_characters }}</td></tr>
                                                 <tr><td class="py-1.5 text-gray-600">Distinct categories</td><td class="py-1.5 text-right font-medium font-mono">{{ stats.overview.characters_and_unicode.distinct_categories }}</td></tr>
+                                                <tr><td class="py-1.5 text-gray-600">Distinct scripts</td><td class="py-1.5 text-right font-medium font-mono">{{ stats.overview.characters_and_unicode.distinct_scripts }}</td></tr>
+                                                <tr><td class="py-1.5 text-gray-600">Distinct blocks</td><td class="py-1.5 text-right font-medium font-mono">{{ stats.overview.characters_and_unicode.distinct_blocks }}</td></tr>
                                             </tbody>
                                         </table>
                                         {% endif %}
@@ -811,7 +837,7 @@ class HtmlReport(BaseReport):
                             {% for alert in alerts %}
                             <li class="flex items-start space-x-2 {% if alert.severity == 'critical' %}bg-red-100{% else %}bg-orange-100{% endif %} p-2 border-2 border-black">
                                 <span class="font-black">{% if alert.severity == 'critical' %}!!{% else %}!{% endif %}</span>
-                                <span>{{ alert.description }}</span>
+                                <span>{{ alert.description }}{% if alert.population == 'sample' and sampled %} <em>(sample)</em>{% endif %}</span>
                             </li>
                             {% endfor %}
                         </ul>
@@ -830,6 +856,27 @@ class HtmlReport(BaseReport):
                         <div><dt class="uppercase font-bold">Duration</dt><dd class="font-mono">{{ duration_seconds }}s</dd></div>
                         <div><dt class="uppercase font-bold">Version</dt><dd class="font-mono">v{{ version }}</dd></div>
                     </dl>
+                    {% if timings %}
+                    <details class="mt-4 pt-4 border-t-2 border-black text-sm">
+                        <summary class="cursor-pointer uppercase font-bold">Timings ({{ timings|length }} steps, most expensive first)</summary>
+                        <table class="mt-2 min-w-full text-left font-mono">
+                            <thead class="uppercase">
+                                <tr><th>Step</th><th>Kind</th><th class="text-right">Wall s</th><th class="text-right">CPU s</th><th class="text-right">Rows</th><th class="text-right">Columns</th><th class="text-right">Peak MiB</th></tr>
+                            </thead>
+                            <tbody>
+                                {% for t in timings %}
+                                <tr>
+                                    <td>{{ t.name }}</td><td>{{ t.kind }}</td>
+                                    <td class="text-right">{{ "%.3f"|format(t.wall_seconds) }}</td>
+                                    <td class="text-right">{{ "%.3f"|format(t.cpu_seconds) }}</td>
+                                    <td class="text-right">{{ t.rows }}</td><td class="text-right">{{ t.columns }}</td>
+                                    <td class="text-right">{{ "%.1f"|format(t.memory_peak_bytes / 1048576) if t.memory_peak_bytes is not none else "-" }}</td>
+                                </tr>
+                                {% endfor %}
+                            </tbody>
+                        </table>
+                    </details>
+                    {% endif %}
                 </div>
             </section>
         </div>
@@ -961,6 +1008,8 @@ class HtmlReport(BaseReport):
                                         <tr class="border-b border-black"><td class="py-1">Total characters</td><td class="py-1 text-right font-mono font-bold">{{ stats.overview.characters_and_unicode.total_characters }}</td></tr>
                                         <tr class="border-b border-black"><td class="py-1">Distinct characters</td><td class="py-1 text-right font-mono font-bold">{{ stats.overview.characters_and_unicode.distinct_characters }}</td></tr>
                                         <tr><td class="py-1">Distinct categories</td><td class="py-1 text-right font-mono font-bold">{{ stats.overview.characters_and_unicode.distinct_categories }}</td></tr>
+                                        <tr><td class="py-1">Distinct scripts</td><td class="py-1 text-right font-mono font-bold">{{ stats.overview.characters_and_unicode.distinct_scripts }}</td></tr>
+                                        <tr><td class="py-1">Distinct blocks</td><td class="py-1 text-right font-mono font-bold">{{ stats.overview.characters_and_unicode.distinct_blocks }}</td></tr>
                                     </tbody>
                                 </table>
                                 {% endif %}
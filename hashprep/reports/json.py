@@ -5,6 +5,8 @@ import numpy as np
 
 import hashprep
 
+from ..utils.profiling import sort_by_cost
+
 
 def json_numpy_handler(obj):
     if hasattr(obj, "tolist"):
@@ -37,8 +39,11 @@ class JsonReport:
                     "memory_bytes": dataset_info.get("memory_bytes", 0),
                     "memory_kib": dataset_info.get("memory_kib", 0),
                     "average_record_size_bytes": dataset_info.get("average_record_size_bytes", 0),
+                    "memory_saved_bytes": dataset_info.get("memory_saved_bytes"),
+                    "optimized_dtypes": dataset_info.get("optimized_dtypes"),
                 },
                 "variable_types": summary["summaries"].get("variable_type_counts", {}),
+                "populations": summary["summaries"].get("populations"),
             },
             "alerts": {
                 "critical_count": summary["critical_count"],
@@ -52,6 +57,7 @@ class JsonReport:
                 "duration_seconds": reproduction_info.get("duration_seconds"),
                 "software_version": reproduction_info.get("software_version"),
                 "dataset_hash": reproduction_info.get("dataset_hash"),
+                "timings": sort_by_cost(reproduction_info.get("timings", [])),
             },
         }
 
@@ -30,7 +30,14 @@ class MarkdownReport(BaseReport):
         content += f"| Duplicate rows | {dataset_info.get('duplicate_rows', 0)} |\n"
         content += f"| Duplicate rows (%) | {dataset_info.get('duplicate_percentage', 0)}% |\n"
         content += f"| Total size in memory | {dataset_info.get('memory_kib', 0)} KiB |\n"
-        content += f"| Average record size | {dataset_info.get('average_record_size_bytes', 0)} B |\n\n"
+        content += f"| Average record size | {dataset_info.get('average_record_size_bytes', 0)} B |\n"
+        if "memory_saved_bytes" in dataset_info:
+            content += f"| Saved by dtype optimization | {dataset_info['memory_saved_bytes'] / 1024:.1f} KiB |\n"
+        sampled = summary.get("sampling_info", {}).get("was_sampled", False)
+        populations = summary["summaries"].get("populations")
+        if sampled and populations:
+            content += f"| Analysed sample | {populations['sample_rows']} of {populations['full_rows']} rows |\n"
+        content += "\n"
 
         content += "### Variable Types\n\n"
         content += "| Type | Count |\n|------|-------|\n"
@@ -49,7 +56,8 @@ class MarkdownReport(BaseReport):
                 content += f"### {alert_type}\n\n"
                 for alert in alerts:
                     severity_marker = "**" if alert["severity"] == "critical" else ""
-                    content += f"- {severity_marker}{alert['description']}{severity_marker}\n"
+                    population = " *(sample)*" if sampled and alert.get("population") == "sample" else ""
+                    content += f"- {severity_marker}{alert['description']}{severity_marker}{population}\n"
                 content += "\n"
 
         # Reproduction Section
@@ -73,7 +81,7 @@ class MarkdownReport(BaseReport):
 
             # Variable Analysis
             content += "## Variable Analysis\n\n"
-            for col, stats in summary["summaries"]["variables"].items():
+            for col, stats in summary["summaries"].get("variables", {}).items():
                 cat = stats.get("category", "Unknown")
                 badges = f"`{cat}`"
                 if stats.get("distinct_percentage", 0) >= 95:
@@ -148,7 +156,9 @@ class MarkdownReport(BaseReport):
                         content += "| Statistic | Value |\n|-----------|-------|\n"
                         content += f"| Total characters | {cu.get('total_characters', 0)} |\n"
                         content += f"| Distinct characters | {cu.get('distinct_characters', 0)} |\n"
-                        content += f"| Distinct categories | {cu.get('distinct_categories', 0)} |\n\n"
+                        content += f"| Distinct categories | {cu.get('distinct_categories', 0)} |\n"
+                        content += f"| Distinct scripts | {cu.get('distinct_scripts', 0)} |\n"
+                        content += f"| Distinct blocks | {cu.get('distinct_blocks', 0)} |\n\n"
 
                 if "common_values" in stats and stats["common_values"]:
                     content += "#### Common Values\n\n"
@@ -235,11 +245,11 @@ class MarkdownReport(BaseReport):
             # Dataset Preview
             content += "\n## Dataset Preview\n\n"
             content += "### Head (first 5 rows)\n\n"
-            content += pd.DataFrame(summary["summaries"]["head"]).to_markdown(index=False) + "\n\n"
+            content += pd.DataFrame(summary["summaries"].get("head", [])).to_markdown(index=False) + "\n\n"
             content += "### Random Sample (10 rows)\n\n"
-            content += pd.DataFrame(summary["summaries"]["sample"]).to_markdown(index=False) + "\n\n"
+            content += pd.DataFrame(summary["summaries"].get("sample", [])).to_markdown(index=False) + "\n\n"
             content += "### Tail (last 5 rows)\n\n"
-            content += pd.DataFrame(summary["summaries"]["tail"]).to_markdown(index=False) + "\n\n"
+            content += pd.DataFrame(summary["summaries"].get("tail", [])).to_markdown(index=False) + "\n\n"
 
         content += "\n---\nGenerated by HashPrep\n"
 
@@ -13,9 +13,9 @@ class PdfReport(BaseReport):
     def generate(self, summary, full=False, output_file=None, **kwargs):
         template = Template(self._get_template())
 
-        head_df = pd.DataFrame(summary["summaries"]["head"])
-        tail_df = pd.DataFrame(summary["summaries"]["tail"])
-        sample_df = pd.DataFrame(summary["summaries"]["sample"])
+        head_df = pd.DataFrame(summary["summaries"].get("head", []))
+        tail_df = pd.DataFrame(summary["summaries"].get("tail", []))
+        sample_df = pd.DataFrame(summary["summaries"].get("sample", []))
 
         dataset_info = summary["summaries"]["dataset_info"]
         reproduction_info = summary["summaries"].get("reproduction_info", {})
@@ -38,6 +38,7 @@ class PdfReport(BaseReport):
             "average_record_size": dataset_info.get("average_record_size_bytes", 0),
             "variable_type_counts": variable_type_counts,
             "alerts_by_type": alerts_by_type,
+            "sampled": summary.get("sampling_info", {}).get("was_sampled", False),
             "analysis_started": reproduction_info.get("analysis_started", ""),
             "analysis_finished": reproduction_info.get("analysis_finished", ""),
             "duration_seconds": reproduction_info.get("duration_seconds", 0),
@@ -49,7 +50,7 @@ class PdfReport(BaseReport):
             "variables": summary["summaries"].get("variables", {}),
             "numeric_correlations": summary["summaries"].get("numeric_correlations", {}),
             "categorical_correlations": summary["summaries"].get("categorical_correlations", {}),
-            "missing_values": summary["summaries"].get("missing_values", {}),
+            "missing_values": summary["summaries"].get("missing_values", {"count": {}, "percentage": {}}),
             "missing_plots": summary["summaries"].get("plots", {}),
         }
 
@@ -310,7 +311,7 @@ class PdfReport(BaseReport):
     <div class="alert-group-title">{{ alert_type }}</div>
     {% for alert in alerts %}
     <div class="alert-item {% if alert.severity == 'critical' %}alert-critical{% else %}alert-warning{% endif %}">
-        {{ alert.description }}
+        {{ alert.description }}{% if alert.population == 'sample' and sampled %} <em>(sample)</em>{% endif %}
     </div>
     {% endfor %}
 </div>
@@ -432,6 +433,8 @@ class PdfReport(BaseReport):
                 <tr><td>Total characters</td><td>{{ stats.overview.characters_and_unicode.total_characters }}</td></tr>
                 <tr><td>Distinct characters</td><td>{{ stats.overview.characters_and_unicode.distinct_characters }}</td></tr>
                 <tr><td>Distinct categories</td><td>{{ stats.overview.characters_and_unicode.distinct_categories }}</td></tr>
+                <tr><td>Distinct scripts</td><td>{{ stats.overview.characters_and_unicode.distinct_scripts }}</td></tr>
+                <tr><td>Distinct blocks</td><td>{{ stats.overview.characters_and_unicode.distinct_blocks }}</td></tr>
             </table>
             {% endif %}
         </div>
@@ -5,6 +5,8 @@ import pandas as pd
 
 import hashprep
 
+from ..utils.column_cache import ColumnProfileCache
+
 
 def get_dataset_preview(df):
     # replace NaN with None before conversion to dictionary
@@ -15,12 +17,14 @@ def get_dataset_preview(df):
     return {"head": head, "tail": tail, "sample": sample}
 
 
-def summarize_dataset_info(df: pd.DataFrame) -> dict:
+def summarize_dataset_info(df: pd.DataFrame, column_cache: ColumnProfileCache | None = None) -> dict:
+    cache = column_cache if column_cache is not None else ColumnProfileCache(df)
     rows = df.shape[0]
     cols = df.shape[1]
     total_cells = rows * cols
-    missing_cells = int(df.isnull().sum().sum())
-    total_memory_bytes = df.memory_usage(deep=True).sum()
+    missing_cells = sum(cache.missing_count(col) for col in df.columns)
+    memory = cache.memory_usage()
+    total_memory_bytes = memory.total
 
     return {
         "dataset_info": {
@@ -29,6 +33,8 @@ def summarize_dataset_info(df: pd.DataFrame) -> dict:
             "memory_bytes": int(total_memory_bytes),
             "memory_kib": float(round(total_memory_bytes / 1024, 1)),
             "memory_mb": float(round(total_memory_bytes / 1024**2, 1)),
+            # Relative error bound (95%) when object columns were measured from a sample
+            "memory_relative_error": float(round(memory.relative_error, 4)),
             "average_record_size_bytes": float(round(total_memory_bytes / rows, 1)) if rows > 0 else 0.0,
             "missing_cells": missing_cells,
             "total_cells": int(total_cells),
@@ -66,14 +72,18 @@ def summarize_variable_type_counts(df: pd.DataFrame, column_types: dict[str, str
     return type_counts
 
 
-def summarize_variable_types(df: pd.DataFrame, column_types: dict[str, str] | None = None) -> dict[str, str]:
+def summarize_variable_types(
+    df: pd.DataFrame,
+    column_types: dict[str, str] | None = None,
+    column_cache: ColumnProfileCache | None = None,
+) -> dict[str, str]:
     """
     Summarize column types using infer_types if column_types not provided.
     """
     if column_types is None:
         from ..utils.type_inference import infer_types
 
-        column_types = infer_types(df)
+        column_types = infer_types(df, column_cache=column_cache)
     return column_types
 
 
@@ -2,28 +2,47 @@ import numpy as np
 import pandas as pd
 from scipy.stats import chi2_contingency, f_oneway
 
+from ..config import DEFAULT_CONFIG, HashPrepConfig
+from ..utils.column_cache import ColumnProfileCache, split_by_level
 from ..utils.logging import get_logger
+from ..utils.pair_screening import is_wide, screen_numeric_pairs
 
 _log = get_logger("summaries.interactions")
 
 
-def summarize_interactions(df):
+def summarize_interactions(df, column_cache: ColumnProfileCache | None = None, config: HashPrepConfig | None = None):
+    cache = column_cache if column_cache is not None else ColumnProfileCache(df)
+    wide_cfg = (config or DEFAULT_CONFIG).wide_table
     interactions = {}
-    interactions["scatter_pairs"] = _scatter_plots_numeric(df)
-    interactions["numeric_correlations"] = _compute_correlation_matrices(df)
-    interactions["categorical_correlations"] = _compute_categorical_correlations(df)
-    interactions["mixed_correlations"] = _compute_mixed_correlations(df)
+    numeric_columns = cache.columns_of("number")
+    if is_wide(len(numeric_columns), wide_cfg):
+        # Screened candidate pairs stand in for all p² pairs; the matrices only hold those pairs
+        pairs = screen_numeric_pairs(df, numeric_columns, wide_cfg)
+        interactions["scatter_pairs"] = [(c1, c2) for c1, c2, _ in pairs]
+        interactions["numeric_correlations"] = _compute_pair_correlations(df, pairs)
+        interactions["wide_table"] = {
+            "numeric_columns": len(numeric_columns),
+            "screened_pairs": len(pairs),
+            "top_k": wide_cfg.top_k,
+            "max_pairs": wide_cfg.max_pairs,
+            "screen_rows": min(len(df), wide_cfg.screen_rows),
+        }
+    else:
+        interactions["scatter_pairs"] = _scatter_plots_numeric(df, cache)
+        interactions["numeric_correlations"] = _compute_correlation_matrices(df, cache)
+    interactions["categorical_correlations"] = _compute_categorical_correlations(df, cache)
+    interactions["mixed_correlations"] = _compute_mixed_correlations(df, cache, config or DEFAULT_CONFIG)
     return interactions
 
 
-def _scatter_plots_numeric(df):
-    numeric_columns = df.select_dtypes(include="number").columns.tolist()
+def _scatter_plots_numeric(df, cache: ColumnProfileCache):
+    numeric_columns = cache.columns_of("number")
     pairs = [(c1, c2) for i, c1 in enumerate(numeric_columns) for c2 in numeric_columns[i + 1 :]]
     return pairs
 
 
-def _compute_correlation_matrices(df):
-    numeric_df = df.select_dtypes(include="number")
+def _compute_correlation_matrices(df, cache: ColumnProfileCache):
+    numeric_df = df[cache.columns_of("number")]
     corrs = {}
     if not numeric_df.empty:
         corrs["pearson"] = numeric_df.corr(method="pearson").to_dict()
@@ -32,8 +51,33 @@ def _compute_correlation_matrices(df):
     return corrs
 
 
-def _compute_categorical_correlations(df):
-    categorical = df.select_dtypes(include="object").columns.tolist()
+def _compute_pair_correlations(df, pairs):
+    """Pearson and Spearman for each screened pair, as sparse ``{col: {col: r}}`` matrices.
+
+    Kendall's tau is left out: it costs O(n log n) per pair and adds little over Spearman here.
+    """
+    corrs = {"pearson": {}, "spearman": {}}
+    if not pairs:
+        return corrs
+    columns = list(dict.fromkeys(c for c1, c2, _ in pairs for c in (c1, c2)))
+    numeric_df = df[columns]
+    complete = numeric_df.notna().all().to_dict()
+    ranks = numeric_df.rank()
+    for c1, c2, _ in pairs:
+        pearson = numeric_df[c1].corr(numeric_df[c2])
+        if complete[c1] and complete[c2]:
+            # Without missing values Spearman is Pearson on whole-column ranks
+            spearman = ranks[c1].corr(ranks[c2])
+        else:
+            spearman = numeric_df[c1].corr(numeric_df[c2], method="spearman")
+        for method, value in (("pearson", pearson), ("spearman", spearman)):
+            corrs[method].setdefault(c1, {})[c2] = float(value)
+            corrs[method].setdefault(c2, {})[c1] = float(value)
+    return corrs
+
+
+def _compute_categorical_correlations(df, cache: ColumnProfileCache):
+    categorical = cache.columns_of("object")
     results = {}
     for i, c1 in enumerate(categorical):
         for c2 in categorical[i + 1 :]:
@@ -51,17 +95,19 @@ def _compute_categorical_correlations(df):
     return results
 
 
-def _compute_mixed_correlations(df):
-    cat_cols = df.select_dtypes(include=["object", "category"]).columns.tolist()
-    num_cols = df.select_dtypes(include=["int64", "float64"]).columns.tolist()
+def _compute_mixed_correlations(df, cache: ColumnProfileCache, config: HashPrepConfig):
+    # ANOVA over thousands of levels (IDs, free text) is neither meaningful nor cheap
+    max_levels = config.correlations.max_distinct_categories
+    cat_cols = [c for c in cache.columns_of(["object", "category"]) if cache.n_unique(c) <= max_levels]
+    num_cols = cache.columns_of(["int64", "float64"])
     mixed_corr = {}
     for cat in cat_cols:
+        levels, codes = cache.level_codes(cat)
         for num in num_cols:
-            groups = [
-                df.loc[df[cat] == level, num].dropna().to_numpy()
-                for level in df[cat].dropna().unique()
-                if len(df.loc[df[cat] == level, num].dropna()) > 1
-            ]
+            num_values = df[num].to_numpy()
+            present = ~cache.isna(num).to_numpy()
+            groups = split_by_level(num_values, codes, len(levels), present)
+            groups = [g for g in groups if len(g) > 1]
             if len(groups) < 2 or all(np.var(g, ddof=1) == 0 for g in groups):
                 continue
             try:
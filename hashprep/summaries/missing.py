@@ -1,7 +1,14 @@
-def summarize_missing_values(df):
-    missing_count = {col: int(val) for col, val in df.isnull().sum().to_dict().items()}
-    missing_percentage = {col: float(val) for col, val in (df.isnull().mean() * 100).round(2).to_dict().items()}
-    missing_patterns = {col: df[df[col].isna()].index.tolist() for col in df.columns if df[col].isna().any()}
+from ..utils.column_cache import ColumnProfileCache
+
+
+def summarize_missing_values(df, column_cache: ColumnProfileCache | None = None):
+    cache = column_cache if column_cache is not None else ColumnProfileCache(df)
+    rows = len(df)
+    missing_count = {col: cache.missing_count(col) for col in df.columns}
+    missing_percentage = {
+        col: float(round(count / rows * 100, 2)) if rows > 0 else float("nan") for col, count in missing_count.items()
+    }
+    missing_patterns = {col: df.index[cache.isna(col)].tolist() for col in df.columns if missing_count[col] > 0}
 
     missing_data = {}
     missing_data["missing_values"] = {"count": missing_count, "percentage": missing_percentage}
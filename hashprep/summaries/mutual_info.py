@@ -11,6 +11,7 @@ from sklearn.feature_selection import mutual_info_classif, mutual_info_regressio
 from sklearn.preprocessing import LabelEncoder
 
 from ..config import DEFAULT_CONFIG
+from ..utils.column_cache import ColumnProfileCache
 from ..utils.logging import get_logger
 
 _log = get_logger("summaries.mutual_info")
@@ -21,6 +22,7 @@ def summarize_mutual_information(
     df: pd.DataFrame,
     target_col: str,
     column_types: dict[str, str],
+    column_cache: ColumnProfileCache | None = None,
 ) -> dict:
     """
     Compute mutual information between every feature and the target column.
@@ -36,8 +38,9 @@ def summarize_mutual_information(
     if target_col not in df.columns:
         return {}
 
+    cache = column_cache if column_cache is not None else ColumnProfileCache(df)
     target_type = column_types.get(target_col, "Unsupported")
-    n = len(df.dropna(subset=[target_col]))
+    n = cache.non_missing_count(target_col)
     if n < _MI.min_samples_for_mi:
         return {}
 
@@ -60,7 +63,7 @@ def summarize_mutual_information(
         if typ == "Numeric":
             feature_cols.append(col)
             discrete_mask.append(False)
-        elif typ == "Categorical" and df[col].nunique() <= _MI.max_categories_for_mi:
+        elif typ == "Categorical" and cache.n_unique(col) <= _MI.max_categories_for_mi:
             feature_cols.append(col)
             discrete_mask.append(True)
 
@@ -74,7 +77,8 @@ def summarize_mutual_information(
     for col, is_discrete in zip(feature_cols, discrete_mask):
         if is_discrete:
             le = LabelEncoder()
-            filled = X[col].fillna("__missing__").astype(str)
+            # Filled after the str cast: a category column cannot take the "__missing__" fill value
+            filled = X[col].astype(str).where(X[col].notna(), "__missing__")
             X[col] = le.fit_transform(filled)
         else:
             X[col] = X[col].fillna(X[col].median())
@@ -82,7 +86,7 @@ def summarize_mutual_information(
     y_raw = sub[target_col]
     if task == "classification":
         le_y = LabelEncoder()
-        y = le_y.fit_transform(y_raw.fillna("__missing__").astype(str))
+        y = le_y.fit_transform(y_raw.astype(str).where(y_raw.notna(), "__missing__"))
     else:
         y = y_raw.values
 
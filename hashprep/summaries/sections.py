@@ -0,0 +1,68 @@
+"""Which summary sections each consumer reads, so analyses compute only those.
+
+``DatasetAnalyzer(sections=...)`` accepts ``"all"`` (the default: every
+section), ``"auto"`` (only what the selected checks, plots and incremental
+state read) or an iterable of section names; the core sections are always
+computed. Checks mostly work from the shared column cache and read no
+summary; ``CHECK_SECTIONS`` lists the ones that reuse a section instead of
+recomputing it.
+"""
+
+from collections.abc import Iterable
+
+# Every section, in the order ``analyze()`` computes them
+SECTIONS = (
+    "preview",
+    "dataset_info",
+    "duplicates",
+    "variable_types",
+    "reproduction_info",
+    "variables",
+    "interactions",
+    "missing_values",
+    "mutual_information",
+)
+
+# Cheap sections the CLI and every report read, so every analysis computes them
+CORE_SECTIONS = frozenset({"dataset_info", "duplicates", "variable_types", "reproduction_info"})
+
+# Sections that are cheap enough to compute on every row when the analysis is sampled
+FULL_DATA_SECTIONS = frozenset({"dataset_info", "duplicates"})
+
+# Sections a check reads from ``analyzer.summaries`` when present
+CHECK_SECTIONS: dict[str, set[str]] = {
+    "low_mutual_information": {"mutual_information"},
+}
+
+# Sections other consumers read
+PLOT_SECTIONS = frozenset({"variables", "interactions", "missing_values"})
+STATE_SECTIONS = frozenset({"variables"})
+
+
+def resolve_sections(
+    sections: str | Iterable[str],
+    checks: Iterable[str],
+    include_plots: bool = False,
+    incremental: bool = False,
+) -> set[str]:
+    """Expand ``sections`` into the set of section names to compute for ``checks``."""
+    if sections == "all":
+        return set(SECTIONS)
+    if sections == "auto":
+        requested = set()
+    elif isinstance(sections, str):
+        raise ValueError(f"sections must be 'all', 'auto' or an iterable of section names, got {sections!r}")
+    else:
+        requested = set(sections)
+        unknown = requested - set(SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown summary sections: {sorted(unknown)}. Valid sections: {list(SECTIONS)}")
+
+    resolved = requested | CORE_SECTIONS
+    for check in checks:
+        resolved |= CHECK_SECTIONS.get(check, set())
+    if include_plots:
+        resolved |= PLOT_SECTIONS
+    if incremental:
+        resolved |= STATE_SECTIONS
+    return resolved
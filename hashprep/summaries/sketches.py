@@ -0,0 +1,371 @@
+"""
+Mergeable, serialisable sketches for full-data approximate summaries.
+
+When analysis runs on a sample, exact quantiles, distinct counts and top
+values only describe that sample. The sketches here see every row in one
+bounded-memory pass and can be merged across chunks or processes:
+
+- KLLSketch: quantiles and histograms (Karnin, Lang & Liberty 2016)
+- HyperLogLog: distinct counts (Flajolet et al. 2007)
+- SpaceSaving: heavy hitters / top values (Metwally et al. 2005, merged as in Agarwal et al. 2012)
+
+Every sketch implements ``update``, ``merge``, ``to_dict`` and ``from_dict``;
+``to_dict`` output is JSON-serialisable for ordinary column values.
+"""
+
+import numpy as np
+import pandas as pd
+
+from ..config import DEFAULT_CONFIG, HashPrepConfig
+
+
+def _is_numeric(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+def _to_python(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def hash_values(values: pd.Series) -> np.ndarray:
+    """64-bit hashes of non-missing values; numerics hash as float64 so ``1`` and ``1.0`` agree."""
+    if _is_numeric(values):
+        values = values.astype("float64")
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+class KLLSketch:
+    """Quantile sketch of finite floats with rank error of roughly ``1.7 / k``."""
+
+    _DECAY = 2 / 3
+
+    def __init__(self, k: int = 200, seed: int = 0):
+        self.k = k
+        self.n = 0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+        self.levels: list[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(2, int(np.ceil(self.k * self._DECAY**depth)))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind so the total weight is preserved exactly
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                pairs = items[: len(items) - len(keep)]
+                promoted = pairs[self._rng.integers(2) :: 2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                # Adding a level shrinks every lower capacity, so rescan from the bottom
+                level = 0
+                continue
+            level += 1
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype="float64")
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            return
+        self.n += len(values)
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        if other.n == 0:
+            return
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self._compress()
+
+    def _weighted_items(self) -> tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2**h, dtype="int64") for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        return items[order], np.cumsum(weights[order])
+
+    def quantiles(self, qs) -> list[float]:
+        """Approximate quantiles for each ``q`` in ``qs``; 0 and 1 return the exact extremes."""
+        if self.n == 0:
+            return [float("nan")] * len(qs)
+        items, cumulative = self._weighted_items()
+        result = []
+        for q in qs:
+            if q <= 0:
+                result.append(self.minimum)
+            elif q >= 1:
+                result.append(self.maximum)
+            else:
+                idx = min(int(np.searchsorted(cumulative, q * self.n, side="left")), len(items) - 1)
+                result.append(float(items[idx]))
+        return result
+
+    def histogram(self, bin_edges: np.ndarray) -> list[int]:
+        """Approximate counts per bin, using ``np.histogram`` semantics (last bin closed)."""
+        if self.n == 0:
+            return [0] * (len(bin_edges) - 1)
+        items, cumulative = self._weighted_items()
+        # Weight of items strictly below each inner edge
+        below = np.searchsorted(items, bin_edges[1:-1], side="left")
+        ranks = np.concatenate([[0], np.where(below > 0, cumulative[np.maximum(below - 1, 0)], 0), [self.n]])
+        return [int(c) for c in np.diff(ranks)]
+
+    def to_dict(self) -> dict:
+        return {
+            "k": self.k,
+            "n": self.n,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "levels": [level.tolist() for level in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "KLLSketch":
+        sketch = cls(k=data["k"])
+        sketch.n = data["n"]
+        sketch.minimum = data["minimum"]
+        sketch.maximum = data["maximum"]
+        sketch.levels = [np.asarray(level, dtype="float64") for level in data["levels"]]
+        return sketch
+
+
+class HyperLogLog:
+    """Distinct-count sketch over 64-bit hashes with ``2**precision`` registers."""
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision must be between 4 and 18, got {precision!r}")
+        self.precision = precision
+        self.registers = np.zeros(2**precision, dtype="uint8")
+
+    def update(self, hashes: np.ndarray) -> None:
+        hashes = np.asarray(hashes, dtype="uint64")
+        if len(hashes) == 0:
+            return
+        p = self.precision
+        bucket = (hashes >> np.uint64(64 - p)).astype("int64")
+        rest = hashes & np.uint64((1 << (64 - p)) - 1)
+        # Bit length of the remaining 64-p bits, split in 32-bit halves so float64 stays exact
+        high = (rest >> np.uint64(32)).astype("float64")
+        low = (rest & np.uint64(0xFFFFFFFF)).astype("float64")
+        bit_length = np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+        rank = (64 - p - bit_length + 1).astype("uint8")
+        np.maximum.at(self.registers, bucket, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype("int64")))
+        zeros = int((self.registers == 0).sum())
+        if estimate <= 2.5 * m and zeros > 0:
+            # Linear counting is far more accurate for small cardinalities
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+    def to_dict(self) -> dict:
+        return {"precision": self.precision, "registers": self.registers.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HyperLogLog":
+        sketch = cls(precision=data["precision"])
+        sketch.registers = np.asarray(data["registers"], dtype="uint8")
+        return sketch
+
+
+class SpaceSaving:
+    """Top-``capacity`` heavy hitters with count upper bounds and per-item error.
+
+    Any value not monitored occurred at most ``floor`` times.
+    """
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype="int64")
+        self.errors = pd.Series(dtype="int64")
+        self.floor = 0
+
+    def update(self, value_counts: pd.Series) -> None:
+        """Fold exact value frequencies of one chunk (``Series.value_counts()`` output)."""
+        value_counts = value_counts.sort_values(ascending=False, kind="stable")
+        floor = int(value_counts.iloc[self.capacity]) if len(value_counts) > self.capacity else 0
+        top = value_counts.iloc[: self.capacity].astype("int64")
+        self._combine(top, pd.Series(0, index=top.index, dtype="int64"), floor)
+
+    def merge(self, other: "SpaceSaving") -> None:
+        self._combine(other.counts, other.errors, other.floor)
+
+    def _combine(self, counts: pd.Series, errors: pd.Series, floor: int) -> None:
+        if self.counts.empty or counts.empty:
+            index = counts.index if self.counts.empty else self.counts.index
+        else:
+            index = self.counts.index.append(counts.index).unique()
+        # A value missing from one summary may still have occurred up to that summary's floor times
+        combined = self.counts.reindex(index).fillna(self.floor) + counts.reindex(index).fillna(floor)
+        combined_errors = self.errors.reindex(index).fillna(self.floor) + errors.reindex(index).fillna(floor)
+        combined = combined.astype("int64").sort_values(ascending=False, kind="stable")
+        dropped = int(combined.iloc[self.capacity]) if len(combined) > self.capacity else 0
+        self.counts = combined.iloc[: self.capacity]
+        self.errors = combined_errors.astype("int64").reindex(self.counts.index)
+        self.floor = max(self.floor + floor, dropped)
+
+    def top(self, n: int) -> list[tuple]:
+        """The ``n`` most frequent values as ``(value, estimated_count)`` pairs."""
+        return [(_to_python(value), int(count)) for value, count in self.counts.iloc[:n].items()]
+
+    def to_dict(self) -> dict:
+        return {
+            "capacity": self.capacity,
+            "floor": self.floor,
+            "items": [[_to_python(value), int(count), int(self.errors[value])] for value, count in self.counts.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SpaceSaving":
+        sketch = cls(capacity=data["capacity"])
+        values = [item[0] for item in data["items"]]
+        index = pd.Index(values, dtype=object)
+        sketch.counts = pd.Series([item[1] for item in data["items"]], index=index, dtype="int64")
+        sketch.errors = pd.Series([item[2] for item in data["items"]], index=index, dtype="int64")
+        sketch.floor = data["floor"]
+        return sketch
+
+
+class ColumnSketch:
+    """All sketches for one column: exact counts, distinct count, top values and (numeric) quantiles."""
+
+    def __init__(self, config: HashPrepConfig | None = None):
+        cfg = (config if config is not None else DEFAULT_CONFIG).sketches
+        self.count = 0
+        self.missing = 0
+        self.distinct = HyperLogLog(cfg.hll_precision)
+        self.top_values = SpaceSaving(cfg.top_values_capacity)
+        self.quantiles: KLLSketch | None = KLLSketch(cfg.quantile_k)
+
+    def update(self, series: pd.Series) -> None:
+        missing = series.isna()
+        self.missing += int(missing.sum())
+        values = series[~missing]
+        if values.empty:
+            return
+        self.count += len(values)
+        self.distinct.update(hash_values(values))
+        self.top_values.update(values.value_counts())
+        if not _is_numeric(values):
+            self.quantiles = None
+        elif self.quantiles is not None:
+            self.quantiles.update(values.to_numpy(dtype="float64"))
+
+    def merge(self, other: "ColumnSketch") -> None:
+        self.count += other.count
+        self.missing += other.missing
+        self.distinct.merge(other.distinct)
+        self.top_values.merge(other.top_values)
+        if self.quantiles is None or other.quantiles is None:
+            self.quantiles = None
+        else:
+            self.quantiles.merge(other.quantiles)
+
+    def distinct_count(self) -> int:
+        # The HLL estimate can overshoot slightly; the true count never exceeds the non-missing count
+        return min(self.distinct.count(), self.count)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "missing": self.missing,
+            "distinct": self.distinct.to_dict(),
+            "top_values": self.top_values.to_dict(),
+            "quantiles": self.quantiles.to_dict() if self.quantiles is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ColumnSketch":
+        sketch = cls()
+        sketch.count = data["count"]
+        sketch.missing = data["missing"]
+        sketch.distinct = HyperLogLog.from_dict(data["distinct"])
+        sketch.top_values = SpaceSaving.from_dict(data["top_values"])
+        sketch.quantiles = KLLSketch.from_dict(data["quantiles"]) if data["quantiles"] is not None else None
+        return sketch
+
+
+def sketch_columns(df: pd.DataFrame, config: HashPrepConfig | None = None) -> dict[str, ColumnSketch]:
+    """Sketch every column of ``df`` in row chunks of ``config.sketches.chunk_rows``."""
+    config = config if config is not None else DEFAULT_CONFIG
+    sketches = {col: ColumnSketch(config) for col in df.columns}
+    step = config.sketches.chunk_rows
+    for start in range(0, len(df), step):
+        chunk = df.iloc[start : start + step]
+        for col, sketch in sketches.items():
+            sketch.update(chunk[col])
+    return sketches
+
+
+def get_column_sketch(analyzer, col: str) -> ColumnSketch | None:
+    """Return the full-data sketch for ``col`` if the analyzer built one (see ``sketches=True``)."""
+    sketches = getattr(analyzer, "column_sketches", None)
+    return sketches.get(col) if sketches else None
+
+
+def apply_sketches(variables: dict, sketches: dict[str, ColumnSketch], config: HashPrepConfig | None = None) -> None:
+    """Replace sample-based distinct counts, quantiles, histograms and top values with sketch estimates."""
+    summary_cfg = (config if config is not None else DEFAULT_CONFIG).summaries
+    top_n = summary_cfg.top_n_values
+    for col, var in variables.items():
+        sketch = sketches.get(col)
+        if sketch is None or sketch.count == 0:
+            continue
+        distinct = sketch.distinct_count()
+        var["distinct_count"] = distinct
+        var["distinct_percentage"] = float(distinct / sketch.count * 100)
+        top = sketch.top_values.top(top_n)
+
+        if var["category"] in ("Categorical", "Boolean") and var.get("categories"):
+            var["categories"]["common_values"] = {
+                str(v): {"count": c, "percentage": float(c / sketch.count * 100)} for v, c in top
+            }
+        if var["category"] != "Numeric" or sketch.quantiles is None or sketch.quantiles.n == 0:
+            continue
+
+        kll = sketch.quantiles
+        var["common_values"] = {
+            str(v): {"count": c, "percentage": float(c / sketch.count * 100)} for v, c in top if np.isfinite(float(v))
+        }
+        statistics = var.get("statistics", {})
+        if statistics.get("quantiles"):
+            minimum, p5, q1, median, q3, p95, maximum = kll.quantiles([0, 0.05, 0.25, 0.5, 0.75, 0.95, 1.0])
+            statistics["quantiles"].update(
+                {
+                    "minimum": minimum,
+                    "p5": p5,
+                    "q1": q1,
+                    "median": median,
+                    "q3": q3,
+                    "p95": p95,
+                    "maximum": maximum,
+                    "range": maximum - minimum,
+                    "iqr": q3 - q1,
+                }
+            )
+        bin_edges = np.histogram_bin_edges([], bins=summary_cfg.histogram_bins, range=(kll.minimum, kll.maximum))
+        var["histogram"] = {"bin_edges": [float(x) for x in bin_edges], "counts": kll.histogram(bin_edges)}
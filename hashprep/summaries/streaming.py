@@ -0,0 +1,459 @@
+"""
+Mergeable partial state for analysing datasets chunk by chunk.
+
+StreamingProfile folds each chunk into running totals that can be merged
+across chunks (or across processes): row and missing counts, finite-value
+moments, zero/negative/infinite counts, extremes, exact value frequencies
+(up to a cap), duplicate-row hashes and a uniform bottom-k reservoir sample
+of rows. Peak memory is bounded by one chunk plus the reservoir and the
+capped frequency tables, so files larger than RAM can be profiled.
+
+After the reservoir sample has been analysed like any in-memory DataFrame,
+``apply`` overwrites the additive figures in the summary with their
+full-data values.
+"""
+
+import hashlib
+from collections import Counter
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from ..config import DEFAULT_CONFIG, HashPrepConfig
+from ..utils.memory import memory_usage
+
+
+@dataclass
+class _Moments:
+    """Count, mean and central moment sums (M2..M4) of finite values; merged with Chan et al.'s formulas."""
+
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    m3: float = 0.0
+    m4: float = 0.0
+    total: float = 0.0
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> "_Moments":
+        n = len(values)
+        if n == 0:
+            return cls()
+        mean = float(values.mean())
+        dev = values - mean
+        dev2 = dev * dev
+        return cls(
+            n=n,
+            mean=mean,
+            m2=float(dev2.sum()),
+            m3=float((dev2 * dev).sum()),
+            m4=float((dev2 * dev2).sum()),
+            total=float(values.sum()),
+        )
+
+    def merge(self, other: "_Moments") -> None:
+        if other.n == 0:
+            return
+        if self.n == 0:
+            self.n, self.mean, self.m2, self.m3, self.m4, self.total = (
+                other.n,
+                other.mean,
+                other.m2,
+                other.m3,
+                other.m4,
+                other.total,
+            )
+            return
+        na, nb = self.n, other.n
+        n = na + nb
+        delta = other.mean - self.mean
+        m2 = self.m2 + other.m2 + delta**2 * na * nb / n
+        m3 = self.m3 + other.m3 + delta**3 * na * nb * (na - nb) / n**2 + 3 * delta * (na * other.m2 - nb * self.m2) / n
+        m4 = (
+            self.m4
+            + other.m4
+            + delta**4 * na * nb * (na * na - na * nb + nb * nb) / n**3
+            + 6 * delta**2 * (na * na * other.m2 + nb * nb * self.m2) / n**2
+            + 4 * delta * (na * other.m3 - nb * self.m3) / n
+        )
+        self.mean += delta * nb / n
+        self.n, self.m2, self.m3, self.m4 = n, m2, m3, m4
+        self.total += other.total
+
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else float("nan")
+
+    def skewness(self) -> float:
+        """Adjusted Fisher-Pearson skewness, as computed by ``pandas.Series.skew``."""
+        n = self.n
+        if n < 3:
+            return float("nan")
+        if self.m2 == 0:
+            return 0.0
+        return float(n * (n - 1) ** 0.5 / (n - 2) * self.m3 / self.m2**1.5)
+
+    def kurtosis(self) -> float:
+        """Excess kurtosis with bias correction, as computed by ``pandas.Series.kurtosis``."""
+        n = self.n
+        if n < 4:
+            return float("nan")
+        if self.m2 == 0:
+            return 0.0
+        adj = 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+        return float(n * (n + 1) * (n - 1) * self.m4 / ((n - 2) * (n - 3) * self.m2**2) - adj)
+
+
+class _UniqueHashes:
+    """Set of 64-bit row hashes kept as sorted, disjoint numpy levels (log-structured merge).
+
+    Adding a chunk costs O(c log n) lookups; levels of similar size are merged so the
+    total work over the stream stays O(n log n) while using 8 bytes per distinct row.
+    """
+
+    def __init__(self):
+        self.levels: list[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return sum(len(level) for level in self.levels)
+
+    def add(self, hashes: np.ndarray) -> None:
+        new = np.unique(hashes)
+        for level in self.levels:
+            if len(new) == 0:
+                return
+            pos = np.searchsorted(level, new).clip(max=len(level) - 1)
+            new = new[level[pos] != new]
+        if len(new) == 0:
+            return
+        self.levels.append(new)
+        while len(self.levels) > 1 and len(self.levels[-1]) >= len(self.levels[-2]):
+            newer, older = self.levels.pop(), self.levels.pop()
+            self.levels.append(np.sort(np.concatenate([older, newer])))
+
+    def merge(self, other: "_UniqueHashes") -> None:
+        for level in other.levels:
+            self.add(level)
+
+
+@dataclass
+class _ColumnState:
+    missing: int = 0
+    numeric: bool = True
+    moments: _Moments = field(default_factory=_Moments)
+    infinite: int = 0
+    zeros: int = 0
+    negative: int = 0
+    smallest: np.ndarray = field(default_factory=lambda: np.empty(0))
+    largest: np.ndarray = field(default_factory=lambda: np.empty(0))
+    values: Counter | None = field(default_factory=Counter)
+
+
+def _is_numeric(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+class StreamingProfile:
+    """Accumulates mergeable per-column state and a reservoir sample over DataFrame chunks."""
+
+    def __init__(self, config: HashPrepConfig | None = None, sample_rows: int | None = None, random_state=42):
+        self.config = config if config is not None else DEFAULT_CONFIG
+        self.sample_rows = sample_rows if sample_rows is not None else self.config.sampling.max_rows
+        self.columns: list[str] | None = None
+        self.rows = 0
+        self.chunks = 0
+        self.memory_bytes = 0
+        self._states: dict[str, _ColumnState] = {}
+        self._hashes: _UniqueHashes | None = _UniqueHashes()
+        self._md5 = hashlib.md5()
+        self._rng = np.random.default_rng(random_state)
+        self._reservoir: pd.DataFrame | None = None
+        self._reservoir_keys = np.empty(0)
+
+    def __getstate__(self):
+        # hashlib objects cannot be pickled; keep the digest and chain rows added later onto it
+        state = self.__dict__.copy()
+        state["_md5"] = bytes.fromhex(self.dataset_hash)
+        return state
+
+    def _hasher(self):
+        if isinstance(self._md5, bytes):
+            self._md5 = hashlib.md5(self._md5)
+        return self._md5
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Fold one chunk into the running state."""
+        if not isinstance(chunk, pd.DataFrame):
+            raise TypeError(f"Expected pandas DataFrame chunk, got {type(chunk).__name__}")
+        if self.columns is None:
+            if chunk.columns.duplicated().any():
+                raise ValueError(
+                    f"DataFrame has duplicate column names: {list(chunk.columns[chunk.columns.duplicated()])}"
+                )
+            self.columns = list(chunk.columns)
+            self._states = {col: _ColumnState() for col in self.columns}
+        elif set(chunk.columns) != set(self.columns):
+            raise ValueError(f"Chunk columns {list(chunk.columns)} do not match the first chunk's {self.columns}")
+        chunk = chunk[self.columns]
+
+        # Stream position becomes the row label, so sampled rows keep their order and a unique index
+        positions = np.arange(self.rows, self.rows + len(chunk))
+        self._hasher().update(pd.util.hash_pandas_object(chunk, index=True).to_numpy().tobytes())
+        self._update_duplicates(chunk)
+        self._update_reservoir(chunk, positions)
+        for col in self.columns:
+            self._update_column(self._states[col], chunk[col])
+
+        self.memory_bytes += memory_usage(chunk).total
+        self.rows += len(chunk)
+        self.chunks += 1
+
+    def _update_column(self, state: _ColumnState, series: pd.Series) -> None:
+        missing = series.isna()
+        state.missing += int(missing.sum())
+        values = series[~missing]
+        if values.empty:
+            return
+
+        if state.values is not None:
+            state.values.update(values.value_counts().to_dict())
+            if len(state.values) > self.config.streaming.max_tracked_values:
+                state.values = None
+
+        if not (state.numeric and _is_numeric(series)):
+            state.numeric = False
+            return
+        arr = values.to_numpy(dtype="float64")
+        finite = arr[np.isfinite(arr)]
+        state.infinite += len(arr) - len(finite)
+        state.zeros += int((arr == 0).sum())
+        state.negative += int((arr < 0).sum())
+        state.moments.merge(_Moments.from_values(finite))
+        k = self.config.summaries.extreme_values_count
+        state.smallest = np.sort(np.concatenate([state.smallest, finite]))[:k]
+        state.largest = np.sort(np.concatenate([state.largest, finite]))[-k:]
+
+    def _update_duplicates(self, chunk: pd.DataFrame) -> None:
+        if self._hashes is None:
+            return
+        # Hash numerics as float64 so a value hashes the same whether its chunk was read as int or float
+        normalized = chunk.apply(lambda s: s.astype("float64") if _is_numeric(s) else s)
+        self._hashes.add(pd.util.hash_pandas_object(normalized, index=False).to_numpy())
+        if len(self._hashes) > self.config.streaming.max_tracked_row_hashes:
+            self._hashes = None
+
+    def _update_reservoir(self, chunk: pd.DataFrame, positions: np.ndarray) -> None:
+        # Bottom-k sampling: every row gets a uniform key and the k smallest keys form the sample
+        keys = self._rng.random(len(chunk))
+        if len(self._reservoir_keys) >= self.sample_rows:
+            keep = keys < self._reservoir_keys.max()
+            chunk, keys, positions = chunk[keep], keys[keep], positions[keep]
+        chunk = chunk.set_axis(positions, axis=0)
+        self._add_to_reservoir(chunk, keys)
+
+    def _add_to_reservoir(self, rows: pd.DataFrame, keys: np.ndarray) -> None:
+        if len(rows) == 0:
+            return
+        combined = rows if self._reservoir is None else pd.concat([self._reservoir, rows])
+        combined_keys = np.concatenate([self._reservoir_keys, keys])
+        if len(combined_keys) > self.sample_rows:
+            chosen = np.argpartition(combined_keys, self.sample_rows - 1)[: self.sample_rows]
+            combined, combined_keys = combined.iloc[chosen], combined_keys[chosen]
+        self._reservoir, self._reservoir_keys = combined, combined_keys
+
+    def merge(self, other: "StreamingProfile") -> None:
+        """Merge another profile (e.g. built in a different process) into this one.
+
+        ``other``'s rows are treated as coming after this profile's rows.
+        """
+        if other.columns is None:
+            return
+        if self.columns is None:
+            self.columns = list(other.columns)
+            self._states = {col: _ColumnState() for col in self.columns}
+        elif set(other.columns) != set(self.columns):
+            raise ValueError(f"Cannot merge profiles with columns {other.columns} and {self.columns}")
+
+        for col in self.columns:
+            state, theirs = self._states[col], other._states[col]
+            state.missing += theirs.missing
+            if state.values is not None and theirs.values is not None:
+                state.values.update(theirs.values)
+                if len(state.values) > self.config.streaming.max_tracked_values:
+                    state.values = None
+            else:
+                state.values = None
+            state.numeric = state.numeric and theirs.numeric
+            state.infinite += theirs.infinite
+            state.zeros += theirs.zeros
+            state.negative += theirs.negative
+            state.moments.merge(theirs.moments)
+            k = self.config.summaries.extreme_values_count
+            state.smallest = np.sort(np.concatenate([state.smallest, theirs.smallest]))[:k]
+            state.largest = np.sort(np.concatenate([state.largest, theirs.largest]))[-k:]
+
+        if self._hashes is not None and other._hashes is not None:
+            self._hashes.merge(other._hashes)
+            if len(self._hashes) > self.config.streaming.max_tracked_row_hashes:
+                self._hashes = None
+        else:
+            self._hashes = None
+
+        if other._reservoir is not None:
+            self._add_to_reservoir(
+                other._reservoir.set_axis(other._reservoir.index + self.rows, axis=0), other._reservoir_keys
+            )
+        self._hasher().update(bytes.fromhex(other.dataset_hash))
+        self.memory_bytes += other.memory_bytes
+        self.rows += other.rows
+        self.chunks += other.chunks
+
+    @property
+    def dataset_hash(self) -> str:
+        """MD5 over per-row hashes; equals ``add_reproduction_info``'s hash for contiguous chunks.
+
+        Rows added after a merge or after unpickling are chained onto the earlier digest.
+        """
+        return self._md5.hex() if isinstance(self._md5, bytes) else self._md5.hexdigest()
+
+    @property
+    def duplicate_rows(self) -> int | None:
+        """Exact duplicate-row count, or None once the row-hash cap was exceeded."""
+        return None if self._hashes is None else self.rows - len(self._hashes)
+
+    def sample(self) -> pd.DataFrame:
+        """Return the reservoir sample in stream order, indexed by stream position."""
+        if self._reservoir is None:
+            return pd.DataFrame(columns=self.columns or [])
+        return self._reservoir.sort_index()
+
+    def info(self) -> dict:
+        return {
+            "chunks": self.chunks,
+            "rows": self.rows,
+            "sample_rows": len(self._reservoir_keys),
+            "exact_duplicates": self._hashes is not None,
+            "exact_value_counts": [col for col, state in self._states.items() if state.values is not None],
+        }
+
+    def fingerprint(self) -> dict[str, dict[str, float]]:
+        """Per-column ratios and moments for comparing two points in a stream."""
+        rows = self.rows
+        result = {}
+        for col, state in self._states.items():
+            non_missing = rows - state.missing
+            figures = {"missing_ratio": state.missing / rows if rows > 0 else 0.0}
+            if state.numeric and non_missing > 0:
+                figures.update(
+                    {
+                        "zeros_ratio": state.zeros / non_missing,
+                        "negative_ratio": state.negative / non_missing,
+                        "infinite_ratio": state.infinite / non_missing,
+                        "mean": state.moments.mean,
+                        "std": state.moments.variance() ** 0.5,
+                    }
+                )
+            result[col] = figures
+        return result
+
+    def apply(self, summaries: dict) -> None:
+        """Overwrite additive figures in an analysis summary with their full-data values."""
+        rows = self.rows
+        cols = len(self.columns or [])
+        missing_cells = sum(state.missing for state in self._states.values())
+        total_cells = rows * cols
+
+        info = summaries.get("dataset_info")
+        if info is not None:
+            info.update(
+                {
+                    "rows": rows,
+                    "columns": cols,
+                    "memory_bytes": self.memory_bytes,
+                    "memory_kib": float(round(self.memory_bytes / 1024, 1)),
+                    "memory_mb": float(round(self.memory_bytes / 1024**2, 1)),
+                    "average_record_size_bytes": float(round(self.memory_bytes / rows, 1)) if rows > 0 else 0.0,
+                    "missing_cells": missing_cells,
+                    "total_cells": total_cells,
+                    "missing_percentage": float(round(missing_cells / total_cells * 100, 1))
+                    if total_cells > 0
+                    else 0.0,
+                }
+            )
+            if self.duplicate_rows is not None:
+                info["duplicate_rows"] = self.duplicate_rows
+                info["duplicate_percentage"] = float(round(self.duplicate_rows / rows * 100, 1)) if rows > 0 else 0.0
+
+        missing_values = summaries.get("missing_values")
+        if missing_values is not None:
+            missing_values["count"] = {col: state.missing for col, state in self._states.items()}
+            missing_values["percentage"] = {
+                col: float(round(state.missing / rows * 100, 2)) if rows > 0 else 0.0
+                for col, state in self._states.items()
+            }
+
+        if "reproduction_info" in summaries:
+            summaries["reproduction_info"]["dataset_hash"] = self.dataset_hash
+
+        for col, var in summaries.get("variables", {}).items():
+            if col in self._states:
+                self._apply_variable(var, self._states[col], rows)
+
+    def _apply_variable(self, var: dict, state: _ColumnState, rows: int) -> None:
+        non_missing = rows - state.missing
+        var["missing_count"] = state.missing
+        var["missing_percentage"] = float(state.missing / rows * 100) if rows > 0 else 0.0
+        if state.values is not None:
+            var["distinct_count"] = len(state.values)
+            var["distinct_percentage"] = float(len(state.values) / non_missing * 100) if non_missing > 0 else 0.0
+
+        top_n = self.config.summaries.top_n_values
+        if var["category"] == "Categorical" and state.values is not None and "categories" in var:
+            top = Counter({str(k): v for k, v in state.values.items()}).most_common(top_n)
+            var["categories"]["common_values"] = {
+                k: {"count": int(c), "percentage": float(c / non_missing * 100)} for k, c in top
+            }
+
+        moments = state.moments
+        if var["category"] != "Numeric" or not state.numeric or moments.n == 0 or non_missing == 0:
+            return
+        std = moments.variance() ** 0.5
+        minimum, maximum = float(state.smallest[0]), float(state.largest[-1])
+        var.update(
+            {
+                "infinite_count": state.infinite,
+                "infinite_percentage": float(state.infinite / rows * 100),
+                "mean": moments.mean,
+                "minimum": minimum,
+                "maximum": maximum,
+                "zeros_count": state.zeros,
+                "zeros_percentage": state.zeros / non_missing * 100,
+                "negative_count": state.negative,
+                "negative_percentage": state.negative / non_missing * 100,
+                "extreme_values": {
+                    "minimum_10": [float(x) for x in state.smallest],
+                    "maximum_10": [float(x) for x in state.largest],
+                },
+            }
+        )
+        statistics = var.get("statistics", {})
+        if statistics.get("descriptive"):
+            statistics["descriptive"].update(
+                {
+                    "standard_deviation": float(std),
+                    "coefficient_of_variation": float(std / abs(moments.mean)) if moments.mean != 0 else None,
+                    "kurtosis": moments.kurtosis(),
+                    "mean": moments.mean,
+                    "skewness": moments.skewness(),
+                    "sum": moments.total,
+                    "variance": moments.variance(),
+                }
+            )
+        if statistics.get("quantiles"):
+            statistics["quantiles"].update({"minimum": minimum, "maximum": maximum, "range": maximum - minimum})
+        if state.values is not None:
+            finite_counts = Counter({k: v for k, v in state.values.items() if np.isfinite(k)})
+            var["common_values"] = {
+                str(v): {"count": int(c), "percentage": float(c / non_missing * 100)}
+                for v, c in finite_counts.most_common(top_n)
+            }
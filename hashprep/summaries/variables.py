@@ -1,12 +1,16 @@
-import re
-import unicodedata
-from collections import Counter, defaultdict
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 import pandas as pd
 from scipy.stats import median_abs_deviation, normaltest, shapiro
 
-from ..config import DEFAULT_CONFIG
+from ..config import DEFAULT_CONFIG, HashPrepConfig
+from ..utils import datetimes
+from ..utils.column_cache import ColumnProfileCache
+from ..utils.parallel import SharedColumn, is_shareable, release_blocks, resolve_n_jobs, share_column
+from ..utils.text_profile import profile_text
+from .sketches import apply_sketches
 
 _SUMMARY = DEFAULT_CONFIG.summaries
 _ST = DEFAULT_CONFIG.statistical_tests
@@ -47,48 +51,141 @@ def get_monotonicity(series: pd.Series) -> str:
         return "none"
 
 
-def summarize_variables(df, column_types=None):
+def summarize_variables(
+    df,
+    column_types=None,
+    column_cache: ColumnProfileCache | None = None,
+    n_jobs: int = 1,
+    sketches: dict | None = None,
+    config: HashPrepConfig | None = None,
+):
+    """Summarize every column of ``df``.
+
+    With ``n_jobs != 1`` columns are partitioned across a process pool. Numeric,
+    boolean and datetime columns reach the workers through shared memory rather
+    than pickling; the per-column results are merged back in column order.
+
+    ``sketches`` maps columns to full-data ``ColumnSketch`` objects (see
+    ``summaries.sketches``); their distinct counts, quantiles, histograms and
+    top values replace the figures computed on ``df``, with as many top values and
+    histogram bins as ``config.summaries`` asks for.
+    """
+    cache = column_cache if column_cache is not None else ColumnProfileCache(df)
     if column_types is None:
         from ..utils.type_inference import infer_types
 
-        column_types = infer_types(df)
-    inferred_types = column_types
-    variables = {}
-    for column in df.columns:
-        typ = inferred_types.get(column, "Unsupported")
-        non_missing_count = df[column].notna().sum()
-        distinct_count = df[column].nunique()
-        distinct_percentage = (distinct_count / non_missing_count * 100) if non_missing_count > 0 else 0
-        missing_count = int(df[column].isna().sum())
-        missing_percentage = (missing_count / len(df) * 100) if len(df) > 0 else 0
-        memory_size = df[column].memory_usage(deep=True)
-        summary = {
-            "category": typ,
-            "alerts": [],
-            "distinct_count": int(distinct_count),
-            "distinct_percentage": float(distinct_percentage),
-            "missing_count": missing_count,
-            "missing_percentage": float(missing_percentage),
-            "memory_size": memory_size,
+        column_types = infer_types(df, column_cache=cache)
+    workers = min(resolve_n_jobs(n_jobs), len(df.columns))
+    if workers > 1:
+        variables = _summarize_variables_parallel(df, column_types, workers, cache)
+    else:
+        variables = {
+            column: _summarize_column(df, column, column_types.get(column, "Unsupported"), cache)
+            for column in df.columns
         }
-        if typ == "Numeric":
-            summary.update(_summarize_numeric(df, column))
-        elif typ == "Text":
-            summary.update(_summarize_text(df, column))
-        elif typ == "Categorical":
-            summary.update(_summarize_categorical(df, column))
-        elif typ == "DateTime":
-            summary.update(_summarize_datetime(df, column))
-        elif typ == "Boolean":
-            summary.update(_summarize_boolean(df, column))
-        else:  # Unsupported
-            pass  # Basics already included
-        variables[column] = summary
+    if sketches:
+        apply_sketches(variables, sketches, config)
     return variables
 
 
-def _summarize_numeric(df, col):
-    series = df[col].dropna()
+def _summarize_column(df, column, typ, cache: ColumnProfileCache, memory_size: int | None = None) -> dict:
+    """Summarize one column. ``memory_size`` (column plus index) is measured from ``cache`` unless given."""
+    non_missing_count = cache.non_missing_count(column)
+    distinct_count = cache.n_unique(column)
+    distinct_percentage = (distinct_count / non_missing_count * 100) if non_missing_count > 0 else 0
+    missing_count = cache.missing_count(column)
+    missing_percentage = (missing_count / len(df) * 100) if len(df) > 0 else 0
+    if memory_size is None:
+        memory = cache.memory_usage()
+        memory_size = memory.columns[column] + memory.index
+    summary = {
+        "category": typ,
+        "alerts": [],
+        "distinct_count": int(distinct_count),
+        "distinct_percentage": float(distinct_percentage),
+        "missing_count": missing_count,
+        "missing_percentage": float(missing_percentage),
+        "memory_size": memory_size,
+    }
+    if typ == "Numeric":
+        summary.update(_summarize_numeric(df, column, column_cache=cache))
+    elif typ == "Text":
+        summary.update(_summarize_text(df, column, column_cache=cache))
+    elif typ == "Categorical":
+        summary.update(_summarize_categorical(df, column, column_cache=cache))
+    elif typ == "DateTime":
+        summary.update(_summarize_datetime(df, column, column_cache=cache))
+    elif typ == "Boolean":
+        summary.update(_summarize_boolean(df, column))
+    else:  # Unsupported
+        pass  # Basics already included
+    return summary
+
+
+def _summarize_variables_parallel(df, column_types, workers: int, cache: ColumnProfileCache) -> dict:
+    # Measured once here; workers only see single columns with a fresh index
+    memory = cache.memory_usage()
+    memory_sizes = {column: memory.columns[column] + memory.index for column in df.columns}
+    # Formats detected during type inference, so workers parse datetime strings with them directly
+    datetime_formats = {
+        column: cache.datetime_format(column) for column in df.columns if column_types.get(column) == "DateTime"
+    }
+    blocks = []
+    payloads = []
+    try:
+        for column in df.columns:
+            if is_shareable(df[column]):
+                shm, handle = share_column(df[column])
+                blocks.append(shm)
+                payloads.append((column, handle))
+            else:
+                payloads.append((column, df[column].reset_index(drop=True)))
+
+        # A few partitions per worker keeps the pool busy when column costs are uneven
+        n_parts = min(len(payloads), workers * 4)
+        partitions = [payloads[i::n_parts] for i in range(n_parts)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_summarize_partition, part, column_types, memory_sizes, datetime_formats)
+                for part in partitions
+            ]
+            merged = {}
+            for future in futures:
+                merged.update(future.result())
+    finally:
+        release_blocks(blocks)
+    return {column: merged[column] for column in df.columns}
+
+
+def _summarize_partition(payloads: list, column_types: dict, memory_sizes: dict, datetime_formats: dict) -> dict:
+    """Process-pool entry point: summarize the columns of one partition."""
+    results = {}
+    for column, payload in payloads:
+        typ = column_types.get(column, "Unsupported")
+        if isinstance(payload, SharedColumn):
+            shm, values = payload.attach()
+            try:
+                results[column] = _summarize_values(column, values, typ, memory_sizes[column], datetime_formats)
+            finally:
+                del values
+                # A view can outlive us in an in-flight traceback; the mapping goes away with it
+                with contextlib.suppress(BufferError):
+                    shm.close()
+        else:
+            results[column] = _summarize_values(column, payload, typ, memory_sizes[column], datetime_formats)
+    return results
+
+
+def _summarize_values(column, values, typ, memory_size: int, datetime_formats: dict) -> dict:
+    frame = pd.DataFrame({column: values}, copy=False)
+    formats = {column: datetime_formats[column]} if column in datetime_formats else None
+    cache = ColumnProfileCache(frame, datetime_formats=formats)
+    return _summarize_column(frame, column, typ, cache, memory_size=memory_size)
+
+
+def _summarize_numeric(df, col, column_cache: ColumnProfileCache | None = None):
+    cache = column_cache if column_cache is not None else ColumnProfileCache(df)
+    series = cache.non_null(col)
     if series.empty:
         return {
             "infinite_count": 0,
@@ -154,7 +251,7 @@ def _summarize_numeric(df, col):
     }
     # Normality test (Shapiro-Wilk for small n, D'Agostino-Pearson for large n)
     normality = None
-    if n >= _ST.normality_min_n and series.nunique() > 1:
+    if n >= _ST.normality_min_n and cache.n_unique(col) > 1:
         finite = series[np.isfinite(series)]
         if len(finite) >= _ST.normality_min_n:
             if len(finite) <= _ST.shapiro_max_n:
@@ -190,8 +287,9 @@ def _summarize_numeric(df, col):
     return stats
 
 
-def _summarize_text(df, col):
-    series = df[col].dropna().astype(str)
+def _summarize_text(df, col, column_cache: ColumnProfileCache | None = None):
+    cache = column_cache if column_cache is not None else ColumnProfileCache(df)
+    series = cache.str_values(col)
     if series.empty:
         return {
             "overview": {
@@ -205,8 +303,8 @@ def _summarize_text(df, col):
                     "total_characters": 0,
                     "distinct_characters": 0,
                     "distinct_categories": 0,
-                    "distinct_scripts": None,
-                    "distinct_blocks": None,
+                    "distinct_scripts": 0,
+                    "distinct_blocks": 0,
                 },
                 "sample": [],
             },
@@ -218,68 +316,42 @@ def _summarize_text(df, col):
                     "most_frequent_character_per_category": {},
                 },
                 "scripts": {
-                    "most_occurring_scripts": None,
-                    "most_frequent_character_per_script": None,
+                    "most_occurring_scripts": {},
+                    "most_frequent_character_per_script": {},
                 },
                 "blocks": {
-                    "most_occurring_blocks": None,
-                    "most_frequent_character_per_block": None,
+                    "most_occurring_blocks": {},
+                    "most_frequent_character_per_block": {},
                 },
             },
         }
-    lengths = series.str.len()
-    all_text = "".join(series)
-    total_chars = len(all_text)
-
-    # Single pass: collect char counts, category counts, and per-category char counts
-    char_counts = Counter()
-    cat_counts = Counter()
-    cat_to_char_count = defaultdict(Counter)
-    for c in all_text:
-        char_counts[c] += 1
-        cat = unicodedata.category(c)
-        cat_counts[cat] += 1
-        cat_to_char_count[cat][c] += 1
-
-    distinct_chars = len(char_counts)
-    distinct_categories = len(cat_counts)
-
-    most_freq_per_cat = {}
-    for cat, char_counter in cat_to_char_count.items():
-        top_char, count = char_counter.most_common(1)[0]
-        freq = (count / total_chars * 100) if total_chars > 0 else 0
-        most_freq_per_cat[cat] = {
-            "char": top_char,
-            "count": count,
-            "percentage": float(freq),
+    lengths = cache.str_lengths(col)
+    profile = profile_text(series, _SUMMARY.text_chunk_rows)
+    total_chars = profile.total_characters
+
+    def share(count: int) -> dict:
+        return {"count": int(count), "percentage": float(count / total_chars * 100) if total_chars > 0 else 0.0}
+
+    def top_per_group(groups) -> dict:
+        return {
+            group: {"char": char, **share(count)}
+            for group, (char, count) in profile.top_character_per_group(groups).items()
+        }
+
+    def most_occurring(groups) -> dict:
+        return {
+            group: share(count) for group, count in profile.group_counts(groups).head(_SUMMARY.top_n_values).items()
         }
 
-    # Word analysis
-    words = re.findall(r"\b\w+\b", all_text.lower())
-    word_len = len(words)
+    word_total = sum(profile.words.values())
     words_dict = {
         w: {
             "count": c,
-            "frequency": float(c / word_len * 100) if word_len > 0 else 0.0,
-        }
-        for w, c in Counter(words).most_common(10)
-    }
-
-    # Top characters and categories
-    char_dict = {
-        str(c): {
-            "count": v,
-            "percentage": float(v / total_chars * 100) if total_chars > 0 else 0.0,
+            "frequency": float(c / word_total * 100) if word_total > 0 else 0.0,
         }
-        for c, v in char_counts.most_common(10)
-    }
-    cat_dict = {
-        k: {
-            "count": v,
-            "percentage": float(v / total_chars * 100) if total_chars > 0 else 0.0,
-        }
-        for k, v in cat_counts.most_common(10)
+        for w, c in profile.words.most_common(_SUMMARY.top_n_words)
     }
+    char_dict = {char: share(count) for char, count in profile.top_characters(_SUMMARY.top_n_values)}
     sample = [str(s) for s in series.head(5).tolist()]
     stats = {
         "overview": {
@@ -291,10 +363,10 @@ def _summarize_text(df, col):
             },
             "characters_and_unicode": {
                 "total_characters": total_chars,
-                "distinct_characters": distinct_chars,
-                "distinct_categories": distinct_categories,
-                "distinct_scripts": None,
-                "distinct_blocks": None,
+                "distinct_characters": len(profile.code_points),
+                "distinct_categories": len(set(profile.categories)),
+                "distinct_scripts": len(set(profile.scripts)),
+                "distinct_blocks": len(set(profile.blocks)),
             },
             "sample": sample,
         },
@@ -302,24 +374,25 @@ def _summarize_text(df, col):
         "characters": {
             "most_occurring_characters": char_dict,
             "categories": {
-                "most_occurring_categories": cat_dict,
-                "most_frequent_character_per_category": most_freq_per_cat,
+                "most_occurring_categories": most_occurring(profile.categories),
+                "most_frequent_character_per_category": top_per_group(profile.categories),
             },
             "scripts": {
-                "most_occurring_scripts": None,
-                "most_frequent_character_per_script": None,
+                "most_occurring_scripts": most_occurring(profile.scripts),
+                "most_frequent_character_per_script": top_per_group(profile.scripts),
             },
             "blocks": {
-                "most_occurring_blocks": None,
-                "most_frequent_character_per_block": None,
+                "most_occurring_blocks": most_occurring(profile.blocks),
+                "most_frequent_character_per_block": top_per_group(profile.blocks),
             },
         },
     }
     return stats
 
 
-def _summarize_categorical(df, col):
-    series = df[col].dropna().astype(str)
+def _summarize_categorical(df, col, column_cache: ColumnProfileCache | None = None):
+    cache = column_cache if column_cache is not None else ColumnProfileCache(df)
+    series = cache.str_values(col)
     if series.empty:
         return {
             "overview": {
@@ -333,8 +406,8 @@ def _summarize_categorical(df, col):
                     "total_characters": 0,
                     "distinct_characters": 0,
                     "distinct_categories": 0,
-                    "distinct_scripts": None,
-                    "distinct_blocks": None,
+                    "distinct_scripts": 0,
+                    "distinct_blocks": 0,
                 },
                 "sample": [],
             },
@@ -347,16 +420,16 @@ def _summarize_categorical(df, col):
                     "most_frequent_character_per_category": {},
                 },
                 "scripts": {
-                    "most_occurring_scripts": None,
-                    "most_frequent_character_per_script": None,
+                    "most_occurring_scripts": {},
+                    "most_frequent_character_per_script": {},
                 },
                 "blocks": {
-                    "most_occurring_blocks": None,
-                    "most_frequent_character_per_block": None,
+                    "most_occurring_blocks": {},
+                    "most_frequent_character_per_block": {},
                 },
             },
         }
-    text_summary = _summarize_text(df, col)
+    text_summary = _summarize_text(df, col, column_cache=cache)
     n = len(series)
     vc = series.value_counts().head(10)
     common_values = {v: {"count": int(c), "percentage": float(c / n * 100)} for v, c in vc.items()}
@@ -373,15 +446,10 @@ def _summarize_categorical(df, col):
     return stats
 
 
-def _summarize_datetime(df, col):
-    if pd.api.types.is_datetime64_any_dtype(df[col]):
-        dt_series = df[col]
-        parse_fails = 0
-    else:
-        dt_series = pd.to_datetime(df[col], errors="coerce")
-        parse_fails = int((dt_series.isna() & df[col].notna()).sum())
-
-    valid_series = dt_series.dropna()
+def _summarize_datetime(df, col, column_cache: ColumnProfileCache | None = None):
+    cache = column_cache if column_cache is not None else ColumnProfileCache(df)
+    valid_series = cache.datetime_values(col)
+    parse_fails = cache.non_missing_count(col) - len(valid_series)
     invalid_percentage = (parse_fails / len(df) * 100) if len(df) > 0 else 0.0
 
     if valid_series.empty:
@@ -397,10 +465,11 @@ def _summarize_datetime(df, col):
             "future_count": None,
         }
 
-    min_dt = valid_series.min()
-    max_dt = valid_series.max()
+    # Sorted nanoseconds and their gaps are shared with the datetime checks
+    sorted_ns = cache.datetime_sorted_ns(col)
+    min_dt = datetimes.to_timestamp(sorted_ns[0], valid_series)
+    max_dt = datetimes.to_timestamp(sorted_ns[-1], valid_series)
     range_delta = max_dt - min_dt
-    now = pd.Timestamp.now()
 
     year_counts = {int(k): int(v) for k, v in valid_series.dt.year.value_counts().items()}
     month_counts = {int(k): int(v) for k, v in valid_series.dt.month.value_counts().items()}
@@ -412,16 +481,14 @@ def _summarize_datetime(df, col):
     hour_counts = {int(k): int(v) for k, v in valid_series.dt.hour.value_counts().items()} if has_time else None
 
     # Gap statistics (sorted diffs)
-    sorted_series = valid_series.sort_values()
-    diffs = sorted_series.diff().dropna()
+    gap_seconds = cache.datetime_gaps_ns(col) / 1e9
     gap_stats = None
-    if len(diffs) > 0:
-        diff_seconds = diffs.dt.total_seconds()
+    if len(gap_seconds) > 0:
         gap_stats = {
-            "median_gap_seconds": float(diff_seconds.median()),
-            "max_gap_seconds": float(diff_seconds.max()),
-            "min_gap_seconds": float(diff_seconds.min()),
-            "mean_gap_seconds": float(diff_seconds.mean()),
+            "median_gap_seconds": float(np.median(gap_seconds)),
+            "max_gap_seconds": float(gap_seconds.max()),
+            "min_gap_seconds": float(gap_seconds.min()),
+            "mean_gap_seconds": float(gap_seconds.mean()),
         }
 
     # Monotonicity
@@ -433,7 +500,7 @@ def _summarize_datetime(df, col):
         monotonicity = "non-monotonic"
 
     # Future dates
-    future_count = int((valid_series > now).sum())
+    future_count = len(sorted_ns) - int(np.searchsorted(sorted_ns, datetimes.now_ns(valid_series), side="right"))
 
     stats = {
         "minimum": str(min_dt),
@@ -0,0 +1,57 @@
+"""Bounded executor behind the asyncio entry points.
+
+``DatasetAnalyzer.analyze_async`` and ``generate_report_async`` run the
+blocking work on one process-wide thread pool, so the event loop stays free
+and at most ``max_concurrency`` analyses or reports run at a time; further
+requests wait in the pool's queue. Cancelling an awaiting task drops queued
+work immediately and asks running work to stop at its next checkpoint.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+DEFAULT_MAX_CONCURRENCY = min(4, os.cpu_count() or 1)
+
+_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+_max_concurrency = DEFAULT_MAX_CONCURRENCY
+
+
+def set_max_concurrency(n: int) -> None:
+    """Limit how many async analyses and reports run at once across the process."""
+    global _executor, _max_concurrency
+    if not isinstance(n, int) or n < 1:
+        raise ValueError(f"max concurrency must be a positive integer, got {n!r}")
+    with _lock:
+        old, _executor, _max_concurrency = _executor, None, n
+    if old is not None:
+        # Work already submitted finishes on the old pool
+        old.shutdown(wait=False)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_max_concurrency, thread_name_prefix="hashprep")
+        return _executor
+
+
+async def run_blocking(fn: Callable[..., Any], *args, cancel_event: threading.Event | None = None, **kwargs) -> Any:
+    """Await ``fn(*args, **kwargs)`` on the shared executor.
+
+    If the awaiting task is cancelled, ``cancel_event`` is set so that ``fn`` can stop early.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(get_executor(), functools.partial(fn, *args, **kwargs))
+    try:
+        return await future
+    except asyncio.CancelledError:
+        if cancel_event is not None:
+            cancel_event.set()
+        raise
@@ -0,0 +1,247 @@
+"""Per-column profile cache shared by summaries and checks.
+
+Most summaries and checks need the same handful of per-column primitives
+(missing mask, non-missing values, distinct count, value counts, string
+lengths, parsed datetimes). Recomputing them in every consumer means a wide table gets
+scanned dozens of times per analysis. ColumnProfileCache computes each
+primitive lazily, at most once per column, and counts hits and misses so
+the savings can be verified.
+
+Cached objects are shared between consumers and must be treated as read-only.
+The cache is safe to share between threads: bookkeeping is guarded by a lock,
+while the computation itself runs outside it so independent columns can be
+profiled concurrently (a racing duplicate computation is harmless).
+"""
+
+import hashlib
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from . import datetimes
+from .memory import MemoryUsage
+from .memory import memory_usage as _memory_usage
+
+
+class ColumnProfileCache:
+    """Lazily computed, memoised per-column primitives for a single DataFrame."""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        memory: MemoryUsage | None = None,
+        datetime_formats: dict[str, str | None] | None = None,
+        source_dtypes: dict[str, str] | None = None,
+    ):
+        self.df = df
+        # Dtypes of columns before downcasting (``utils.dtypes``); ``columns_of`` selects by these
+        self.source_dtypes = source_dtypes
+        self._store: dict[tuple[str, Any], Any] = {}
+        if memory is not None:
+            # Already measured (e.g. by the sampler deciding whether to sample this frame)
+            self._store[("memory_usage", None)] = memory
+        # Already detected (e.g. by the parent of a process-pool worker)
+        for col, fmt in (datetime_formats or {}).items():
+            self._store[("datetime_format", col)] = fmt
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _get(self, kind: str, key: Any, compute: Callable[[], Any]) -> Any:
+        entry = (kind, key)
+        with self._lock:
+            if entry in self._store:
+                self.hits += 1
+                return self._store[entry]
+            self.misses += 1
+        value = compute()
+        with self._lock:
+            return self._store.setdefault(entry, value)
+
+    def isna(self, col: str) -> pd.Series:
+        """Boolean missing-value mask for a column."""
+        return self._get("isna", col, lambda: self.df[col].isna())
+
+    def missing_count(self, col: str) -> int:
+        """Number of missing values in a column."""
+        return self._get("missing_count", col, lambda: int(self.isna(col).sum()))
+
+    def non_missing_count(self, col: str) -> int:
+        """Number of non-missing values in a column."""
+        return len(self.df) - self.missing_count(col)
+
+    def non_null(self, col: str) -> pd.Series:
+        """Column values with missing entries dropped (equivalent to ``df[col].dropna()``)."""
+        return self._get("non_null", col, lambda: self.df[col].dropna())
+
+    def n_unique(self, col: str) -> int:
+        """Distinct non-missing values (equivalent to ``df[col].nunique()``)."""
+        return self._get("n_unique", col, lambda: int(self.non_null(col).nunique()))
+
+    def value_counts(self, col: str) -> pd.Series:
+        """Value frequencies of non-missing entries, most frequent first."""
+        return self._get("value_counts", col, lambda: self.non_null(col).value_counts())
+
+    def str_values(self, col: str) -> pd.Series:
+        """Non-missing values cast to ``str``."""
+        return self._get("str_values", col, lambda: self.non_null(col).astype(str))
+
+    def str_lengths(self, col: str) -> pd.Series:
+        """Character length of each non-missing value (after casting to ``str``)."""
+        return self._get("str_lengths", col, lambda: self.str_values(col).str.len())
+
+    def datetime_format(self, col: str) -> str | None:
+        """Format that parses a column's values (see ``utils.datetimes.detect_format``)."""
+        return self._get("datetime_format", col, lambda: datetimes.detect_format(self.non_null(col)))
+
+    def datetimes(self, col: str) -> pd.Series:
+        """Column parsed as datetime64 with its detected format, aligned with the frame; failures are NaT."""
+        return self._get("datetimes", col, lambda: datetimes.parse(self.df[col], self.datetime_format(col)))
+
+    def datetime_values(self, col: str) -> pd.Series:
+        """Parsed datetimes of a column with missing and unparseable values dropped."""
+        return self._get("datetime_values", col, lambda: self.datetimes(col).dropna())
+
+    def datetime_ns(self, col: str) -> np.ndarray:
+        """``datetime_values`` as ``int64`` nanoseconds since the epoch, in row order."""
+        return self._get("datetime_ns", col, lambda: datetimes.to_ns(self.datetime_values(col)))
+
+    def datetime_sorted_ns(self, col: str) -> np.ndarray:
+        """``datetime_ns`` sorted ascending."""
+        return self._get("datetime_sorted_ns", col, lambda: np.sort(self.datetime_ns(col)))
+
+    def datetime_gaps_ns(self, col: str) -> np.ndarray:
+        """Gaps in nanoseconds between consecutive values of ``datetime_sorted_ns``."""
+        return self._get("datetime_gaps_ns", col, lambda: np.diff(self.datetime_sorted_ns(col)))
+
+    def content_hash(self, col: str) -> str:
+        """Digest of a column's dtype and values; columns with equal digests are ``equals()``."""
+        return self._get("content_hash", col, lambda: _content_hash(self.df[col]))
+
+    def row_hashes(self, col: str) -> np.ndarray:
+        """Per-row ``uint64`` hashes of a column's values that compare across dtypes; 0 marks missing.
+
+        Numbers (and strings that all parse as numbers) hash by float value, so ``5``, ``5.0``
+        and ``"5"`` match; other values hash by their ``str`` form.
+        """
+        return self._get("row_hashes", col, lambda: _row_hashes(self.df[col], self.isna(col).to_numpy()))
+
+    def row_hash_mode(self, col: str) -> tuple[int, int]:
+        """Most common non-missing value of ``row_hashes`` and its count (``(0, 0)`` when all missing)."""
+        return self._get("row_hash_mode", col, lambda: _hash_mode(self.row_hashes(col)))
+
+    def level_codes(self, col: str) -> tuple[pd.Index, np.ndarray]:
+        """Distinct non-missing values of a column and each row's code into them (``pd.factorize``).
+
+        Missing rows get code ``-1``. Used with ``split_by_level`` to split other columns by the
+        levels of a grouping column (typically the target) without a boolean mask per level.
+        """
+        return self._get("level_codes", col, lambda: _level_codes(self.df[col]))
+
+    def memory_usage(self) -> MemoryUsage:
+        """Deep memory usage of the frame per column, measured once (see ``utils.memory``)."""
+        return self._get("memory_usage", None, lambda: _memory_usage(self.df))
+
+    def columns_of(self, include: str | list[str]) -> list[str]:
+        """Column names matching ``df.select_dtypes(include=...)``, by ``source_dtypes`` where given."""
+        key = include if isinstance(include, str) else tuple(include)
+        return self._get("columns_of", key, lambda: self._dtype_frame().select_dtypes(include=include).columns.tolist())
+
+    def _dtype_frame(self) -> pd.DataFrame:
+        if not self.source_dtypes:
+            return self.df
+        # Empty columns carrying the original dtypes, so downcast columns are selected as before
+        return pd.DataFrame(
+            {col: pd.Series(dtype=self.source_dtypes.get(col, self.df[col].dtype)) for col in self.df.columns}
+        )
+
+    def cache_info(self) -> dict:
+        """Return hit/miss counters and the number of cached entries."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._store),
+            "hit_ratio": float(round(self.hits / total, 4)) if total > 0 else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Drop all cached primitives and reset the counters."""
+        with self._lock:
+            self._store.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _content_hash(series: pd.Series) -> str:
+    hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+    return hashlib.blake2b(str(series.dtype).encode() + hashes.tobytes(), digest_size=16).hexdigest()
+
+
+def _row_hashes(series: pd.Series, missing: np.ndarray) -> np.ndarray:
+    values = series[~missing]
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_numeric_dtype(values):
+        numbers = values.astype("float64")
+    else:
+        numbers = pd.to_numeric(values, errors="coerce")
+        if numbers.isna().any():
+            numbers = None
+    if numbers is not None:
+        keys = numbers.to_numpy(dtype="float64")
+        hashed = pd.util.hash_array(np.where(keys == 0, 0.0, keys))  # -0.0 and 0.0 are the same value
+    else:
+        hashed = pd.util.hash_array(values.astype(str).to_numpy(dtype=object))
+    out = np.zeros(len(series), dtype=np.uint64)
+    # hash_array maps 0.0 to 0, so move real values off the missing marker
+    out[~missing] = hashed ^ np.uint64(0x9E3779B97F4A7C15)
+    return out
+
+
+def _hash_mode(hashes: np.ndarray) -> tuple[int, int]:
+    values, counts = np.unique(hashes[hashes != 0], return_counts=True)
+    if not len(values):
+        return 0, 0
+    top = counts.argmax()
+    return int(values[top]), int(counts[top])
+
+
+def _level_codes(series: pd.Series) -> tuple[pd.Index, np.ndarray]:
+    codes, levels = pd.factorize(series, use_na_sentinel=True)
+    return pd.Index(levels), np.asarray(codes, dtype=np.int64)
+
+
+def split_by_level(values: np.ndarray, codes: np.ndarray, n_levels: int, present: np.ndarray) -> list[np.ndarray]:
+    """Split ``values`` into one array per level of ``codes`` (see ``level_codes``), in level order.
+
+    Rows that are not ``present`` or have a missing level (code ``-1``) are left out.
+    """
+    keep = present & (codes >= 0)
+    kept_codes = codes[keep]
+    order = np.argsort(kept_codes, kind="stable")
+    bounds = np.cumsum(np.bincount(kept_codes, minlength=n_levels))[:-1]
+    return np.split(values[keep][order], bounds)
+
+
+def get_column_cache(analyzer) -> ColumnProfileCache:
+    """Return the analyzer's column cache, creating one if missing or stale.
+
+    Checks are sometimes called with lightweight stand-ins for DatasetAnalyzer,
+    so the cache is attached on first use rather than assumed to exist.
+    """
+    cache = getattr(analyzer, "column_cache", None)
+    if cache is None or cache.df is not analyzer.df:
+        cache = ColumnProfileCache(analyzer.df)
+        analyzer.column_cache = cache
+    return cache
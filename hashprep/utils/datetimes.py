@@ -0,0 +1,76 @@
+"""Datetime format detection and parsing shared by inference, summaries and checks.
+
+``pd.to_datetime`` without ``format=`` guesses a format from the first value and
+falls back to parsing element by element through dateutil when none fits, and
+type inference, the datetime summary and every datetime check used to repeat that
+on the same column. ``detect_format`` settles a strict format once per column from
+a sample and ``parse`` reuses it; ColumnProfileCache keeps both, along with the
+parsed values as ``int64`` nanoseconds in row and sorted order and the sorted
+gaps, so a string column is parsed and sorted once per analysis.
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+from ..config import DEFAULT_CONFIG
+
+_DT_CFG = DEFAULT_CONFIG.datetime
+DEFAULT_SAMPLE_ROWS = _DT_CFG.format_sample_rows
+# pandas' own marker for per-element parsing, used when no single format fits
+MIXED = "mixed"
+# Sample values whose formats pandas is asked to guess; more rarely finds new candidates
+_GUESSES = 5
+
+
+def detect_format(values: pd.Series, sample_rows: int = DEFAULT_SAMPLE_ROWS) -> str | None:
+    """Return the format ``parse`` should use for ``values`` (non-missing entries).
+
+    None for datetime64 columns, which need no parsing. Otherwise candidate formats are
+    guessed from a few values spread over the first ``sample_rows`` values, plus ISO 8601
+    with optional parts; the one that parses the most of the sample wins. ``MIXED`` when
+    none parses ``datetime.parse_threshold`` of it.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return None
+    sample = values.iloc[:sample_rows]
+    strings = sample[[isinstance(v, str) for v in sample]]
+    if strings.empty:
+        return MIXED
+    positions = np.unique(np.linspace(0, len(strings) - 1, num=min(_GUESSES, len(strings))).astype(int))
+    with warnings.catch_warnings():
+        # Day-first guesses warn about dayfirst=False; the sample decides between them below
+        warnings.simplefilter("ignore", UserWarning)
+        candidates = [guess_datetime_format(strings.iloc[i]) for i in positions] + ["ISO8601"]
+    best, best_parsed = MIXED, 0
+    for fmt in dict.fromkeys(c for c in candidates if c):
+        parsed = int(pd.to_datetime(sample, errors="coerce", format=fmt).notna().sum())
+        if parsed > best_parsed:
+            best, best_parsed = fmt, parsed
+    return best if best_parsed >= _DT_CFG.parse_threshold * len(sample) else MIXED
+
+
+def parse(series: pd.Series, fmt: str | None) -> pd.Series:
+    """Parse ``series`` with a format from ``detect_format``; unparseable values become NaT."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    return pd.to_datetime(series, errors="coerce", format=fmt or MIXED)
+
+
+def to_ns(values: pd.Series) -> np.ndarray:
+    """Nanoseconds since the epoch (UTC for tz-aware values) of a NaT-free datetime Series."""
+    return values.to_numpy(dtype="datetime64[ns]").view("int64")
+
+
+def now_ns(values: pd.Series) -> int:
+    """The current time on the same nanosecond scale as ``to_ns(values)``."""
+    tz = values.dt.tz
+    return pd.Timestamp.now(tz="UTC").value if tz is not None else pd.Timestamp.now().value
+
+
+def to_timestamp(ns: int, values: pd.Series) -> pd.Timestamp:
+    """Timestamp for a nanosecond value from ``to_ns(values)``, in the timezone of ``values``."""
+    tz = values.dt.tz
+    return pd.Timestamp(int(ns), tz="UTC").tz_convert(tz) if tz is not None else pd.Timestamp(int(ns))
@@ -0,0 +1,137 @@
+"""Opt-in dtype downcasting (``DatasetAnalyzer(optimize_memory=True)``).
+
+``pd.read_csv`` hands every column over as ``int64``, ``float64`` or ``object``,
+so an eight-bit code takes eight bytes and a two-level string column keeps one
+Python object per row. ``optimize_dtypes`` shrinks a frame before it is
+profiled, without changing any value:
+
+- integer columns take the smallest signed integer dtype that holds both their values
+  and their spread ``max - min``, so differences of two values (ranges, bin widths)
+  cannot wrap around;
+- float columns become ``float32`` when every value survives the round trip;
+- string columns typed ``Categorical`` become ``category``;
+- other string columns become Arrow-backed strings when pyarrow is installed.
+
+Column types are decided beforehand and kept, so the analysis sees the same
+semantic types as without the optimisation.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from ..config import DEFAULT_CONFIG, MemoryDefaults
+from .memory import MemoryUsage, column_memory
+
+_INTEGERS = (np.int8, np.int16, np.int32)
+
+
+@dataclass(frozen=True)
+class DtypeOptimization:
+    """What ``optimize_dtypes`` changed: ``{column: (old dtype, new dtype)}`` and the memory of those columns."""
+
+    conversions: dict[str, tuple[str, str]]
+    bytes_before: int
+    bytes_after: int
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+    @property
+    def source_dtypes(self) -> dict[str, str]:
+        """Dtypes of the converted columns before conversion, for ``ColumnProfileCache(source_dtypes=...)``."""
+        return {col: old for col, (old, _) in self.conversions.items()}
+
+    def to_dict(self) -> dict:
+        return {
+            "memory_saved_bytes": int(self.bytes_saved),
+            "optimized_dtypes": {str(col): f"{old} -> {new}" for col, (old, new) in self.conversions.items()},
+        }
+
+
+def _arrow_strings() -> pd.StringDtype | None:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    return pd.StringDtype("pyarrow")
+
+
+def _smallest_integer(values: pd.Series):
+    if values.empty:
+        return None
+    low, high = int(values.min()), int(values.max())
+    for dtype in _INTEGERS:
+        if (
+            values.dtype.itemsize > np.dtype(dtype).itemsize
+            and np.iinfo(dtype).min <= low
+            and high <= np.iinfo(dtype).max
+            and high - low <= np.iinfo(dtype).max
+        ):
+            return dtype
+    return None
+
+
+def _fits_float32(values: pd.Series) -> bool:
+    array = values.to_numpy()
+    with np.errstate(over="ignore"):
+        return bool(np.array_equal(array.astype(np.float32).astype(np.float64), array, equal_nan=True))
+
+
+def plan_dtypes(
+    df: pd.DataFrame, column_types: dict[str, str], config: MemoryDefaults = DEFAULT_CONFIG.memory
+) -> dict[str, object]:
+    """New dtype for every column of ``df`` that can be stored more compactly (see module docstring)."""
+    plan: dict[str, object] = {}
+    arrow = _arrow_strings() if config.arrow_strings else None
+    for col in df.columns:
+        series = df[col]
+        dtype = series.dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            continue
+        if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+            target = _smallest_integer(series)
+            if target is not None:
+                plan[col] = np.dtype(target)
+        elif isinstance(dtype, np.dtype) and dtype == np.float64:
+            if config.downcast_floats and _fits_float32(series):
+                plan[col] = np.dtype(np.float32)
+        elif pd.api.types.is_object_dtype(dtype) and pd.api.types.infer_dtype(series, skipna=True) == "string":
+            # Mixed-type columns stay as they are: their element types are what mixed_data_types reports
+            typ = column_types.get(col)
+            if typ == "Categorical":
+                plan[col] = "category"
+            elif typ == "Text" and arrow is not None:
+                plan[col] = arrow
+    return plan
+
+
+def apply_dtypes(df: pd.DataFrame, plan: dict[str, object]) -> pd.DataFrame:
+    """A copy of ``df`` with the columns in ``plan`` converted; ``df`` itself is left alone.
+
+    Unconverted columns are copied too: a shallow copy would keep views of ``df``'s 2-D
+    blocks, and with them every converted column's old values, alive after ``df`` is dropped.
+    """
+    data = {i: (df[col].astype(plan[col]) if col in plan else df[col].copy()).array for i, col in enumerate(df.columns)}
+    out = pd.DataFrame(data, index=df.index, copy=False)
+    out.columns = df.columns
+    return out
+
+
+def optimize_dtypes(
+    df: pd.DataFrame,
+    column_types: dict[str, str],
+    config: MemoryDefaults = DEFAULT_CONFIG.memory,
+    memory: MemoryUsage | None = None,
+) -> tuple[pd.DataFrame, DtypeOptimization]:
+    """Return ``df`` with compact dtypes and what changed; ``memory`` (``memory_usage(df)``) saves re-measuring."""
+    plan = plan_dtypes(df, column_types, config)
+    out = apply_dtypes(df, plan)
+    before = sum(
+        memory.columns[col] if memory is not None else column_memory(df[col], config.sample_rows) for col in plan
+    )
+    after = sum(column_memory(out[col], config.sample_rows) for col in plan)
+    conversions = {col: (str(df[col].dtype), str(out[col].dtype)) for col in plan}
+    return out, DtypeOptimization(conversions=conversions, bytes_before=int(before), bytes_after=int(after))
@@ -0,0 +1,70 @@
+"""Read datasets from CSV or Parquet files (or stdin), whole or in chunks."""
+
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pandas as pd
+
+STDIN = "-"
+
+
+def _is_parquet(path: str) -> bool:
+    return Path(path).suffix.lower() in (".parquet", ".pq")
+
+
+def read_dataset(path: str, read_options: dict | None = None) -> pd.DataFrame:
+    """Read a whole CSV or Parquet file into memory. ``"-"`` reads CSV from stdin.
+
+    ``read_options`` (e.g. ``Schema.read_options()``) are passed to ``pd.read_csv``; Parquet
+    files carry their own dtypes.
+    """
+    if path == STDIN:
+        return pd.read_csv(sys.stdin, **(read_options or {}))
+    if _is_parquet(path):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, **(read_options or {}))
+
+
+def count_rows(path: str) -> int | None:
+    """Row count of a Parquet file from its metadata, or None when it cannot be known without parsing."""
+    if path == STDIN or not _is_parquet(path):
+        return None
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+    return pq.ParquetFile(path).metadata.num_rows
+
+
+def iter_chunks(path: str, chunksize: int, read_options: dict | None = None) -> Iterator[pd.DataFrame]:
+    """Yield a CSV or Parquet file (or CSV on stdin for ``"-"``) as DataFrames of at most ``chunksize`` rows.
+
+    ``read_options`` are passed to ``pd.read_csv`` as in ``read_dataset``. Parquet files are read
+    batch by batch with pyarrow; without it they are read whole and sliced, so memory is not bounded.
+    """
+    if chunksize <= 0:
+        raise ValueError(f"chunksize must be a positive integer, got {chunksize!r}")
+    if path != STDIN and _is_parquet(path):
+        yield from _iter_parquet(path, chunksize)
+        return
+    with pd.read_csv(sys.stdin if path == STDIN else path, chunksize=chunksize, **(read_options or {})) as reader:
+        yield from reader
+
+
+def _iter_parquet(path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        # Without pyarrow only whole-file reads are available (e.g. through fastparquet): slice them
+        df = pd.read_parquet(path)
+        for start in range(0, len(df), chunksize):
+            yield df.iloc[start : start + chunksize].set_axis(pd.RangeIndex(start, min(start + chunksize, len(df))))
+        return
+    offset = 0
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+        chunk = batch.to_pandas()
+        # Continue the row index across batches, as read_csv(chunksize=...) does
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        offset += len(chunk)
+        yield chunk
@@ -0,0 +1,91 @@
+"""Deep memory accounting without walking every Python object.
+
+``DataFrame.memory_usage(deep=True)`` calls ``sys.getsizeof`` on every value of
+every object column, which dominates start-up time on text-heavy tables, and
+the sampler, the dataset summary and each variable summary used to call it
+again. ``memory_usage`` measures a frame once: numeric, datetime, categorical
+and Arrow-backed columns are exact and cost nothing, while object columns longer
+than ``sample_rows`` are estimated from the average object size of a random
+sample of rows, with a stated error bound. ColumnProfileCache keeps the result
+so every consumer shares it.
+"""
+
+import sys
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from ..config import DEFAULT_CONFIG
+
+_MEMORY = DEFAULT_CONFIG.memory
+DEFAULT_SAMPLE_ROWS = _MEMORY.sample_rows
+# Normal quantile for the two-sided confidence level of the stated error
+_Z = 1.96
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    """Deep memory usage of a DataFrame, in bytes.
+
+    ``relative_error`` bounds the relative error of ``total`` at 95% confidence; it is
+    0.0 when every object column was measured exactly.
+    """
+
+    columns: dict[str, int]
+    index: int
+    relative_error: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return self.index + sum(self.columns.values())
+
+    @property
+    def exact(self) -> bool:
+        return self.relative_error == 0.0
+
+
+def memory_usage(df: pd.DataFrame, sample_rows: int = DEFAULT_SAMPLE_ROWS, random_state: int = 0) -> MemoryUsage:
+    """Deep memory usage of ``df`` per column and for its index (see module docstring)."""
+    columns, margin = {}, 0.0
+    for col in df.columns:
+        columns[col], se = _deep_bytes(df[col], sample_rows, random_state)
+        margin += _Z * se
+    index, se = _deep_bytes(df.index, sample_rows, random_state)
+    margin += _Z * se
+    total = index + sum(columns.values())
+    return MemoryUsage(columns=columns, index=index, relative_error=float(margin / total) if total else 0.0)
+
+
+def column_memory(series: pd.Series, sample_rows: int = DEFAULT_SAMPLE_ROWS, random_state: int = 0) -> int:
+    """Deep memory usage of a column's values, excluding its index."""
+    return _deep_bytes(series, sample_rows, random_state)[0]
+
+
+def _object_values(values: pd.Series | pd.Index) -> np.ndarray | None:
+    # Python objects sit behind object arrays and python-backed string arrays; everything else is flat
+    if values.dtype == object or getattr(values.dtype, "storage", None) == "python":
+        return values.to_numpy(dtype=object)
+    return None
+
+
+def _deep_bytes(values: pd.Series | pd.Index, sample_rows: int, random_state: int) -> tuple[int, float]:
+    """Return ``(bytes, standard error)`` for one column or index."""
+    objects = _object_values(values)
+    if objects is None:
+        usage = (
+            values.memory_usage(index=False, deep=True)
+            if isinstance(values, pd.Series)
+            else values.memory_usage(deep=True)
+        )
+        return int(usage), 0.0
+    shallow = int(objects.nbytes)
+    n = len(objects)
+    if n <= sample_rows:
+        return shallow + sum(map(sys.getsizeof, objects)), 0.0
+    # Every column draws the same rows for a given length, so results do not depend on the other columns
+    rows = np.random.default_rng(random_state).choice(n, size=sample_rows, replace=False)
+    sizes = np.fromiter(map(sys.getsizeof, objects[rows]), dtype=np.float64, count=sample_rows)
+    finite_population = np.sqrt(1 - sample_rows / n)
+    se = n * sizes.std(ddof=1) / np.sqrt(sample_rows) * finite_population
+    return shallow + int(round(n * sizes.mean())), float(se)
@@ -0,0 +1,89 @@
+"""Cheap screening of numeric column pairs for wide tables.
+
+With p numeric columns, correlation matrices, scatter pairs and the pairwise
+correlation check all grow as p²: 5,000 features make 12.5M pairs. Above
+``config.wide_table.column_threshold`` numeric columns, those consumers switch
+to the candidate pairs returned by ``screen_numeric_pairs``. It estimates
+Pearson and Spearman correlations for every pair from a row subsample, using
+one matrix product per block of columns, keeps each column's strongest
+partners plus any pair scoring above a floor, and caps the total. Only the
+surviving pairs get exact statistics.
+"""
+
+import numpy as np
+import pandas as pd
+
+from ..config import WideTableDefaults
+
+
+def is_wide(n_numeric: int, cfg: WideTableDefaults) -> bool:
+    """Return True if a table with ``n_numeric`` numeric columns should use pair screening."""
+    return cfg.column_threshold > 0 and n_numeric > cfg.column_threshold
+
+
+def _unit_columns(values: np.ndarray) -> np.ndarray:
+    # Centre and scale each column to unit norm so that Z.T @ Z is the correlation matrix;
+    # missing values sit at the mean and so contribute nothing
+    centred = values - np.nanmean(values, axis=0)
+    centred = np.nan_to_num(centred, nan=0.0).astype(np.float32)
+    norms = np.linalg.norm(centred, axis=0)
+    norms[norms == 0] = np.inf
+    return centred / norms
+
+
+def screen_numeric_pairs(
+    df: pd.DataFrame,
+    columns: list[str],
+    cfg: WideTableDefaults,
+    min_score: float | None = None,
+    random_state: int | None = 0,
+) -> list[tuple[str, str, float]]:
+    """Return candidate ``(col1, col2, score)`` pairs, strongest first.
+
+    ``score`` is the larger of the estimated absolute Pearson and Spearman correlations.
+    A pair is kept if it is among the ``cfg.top_k`` strongest for either column, or if its
+    score is at least ``min_score``; at most ``cfg.max_pairs`` pairs are returned.
+    """
+    p = len(columns)
+    if p < 2:
+        return []
+    sample = df[columns]
+    if len(sample) > cfg.screen_rows:
+        sample = sample.sample(n=cfg.screen_rows, random_state=random_state)
+    with np.errstate(invalid="ignore"):
+        bases = [
+            _unit_columns(sample.to_numpy(dtype=np.float64, na_value=np.nan)),
+            _unit_columns(sample.rank().to_numpy(dtype=np.float64, na_value=np.nan)),
+        ]
+
+    k = min(cfg.top_k, p - 1)
+    keep_i, keep_j, keep_score = [], [], []
+    for start in range(0, p, cfg.block_size):
+        stop = min(start + cfg.block_size, p)
+        scores = np.abs(bases[0][:, start:stop].T @ bases[0])
+        np.maximum(scores, np.abs(bases[1][:, start:stop].T @ bases[1]), out=scores)
+        rows = np.arange(stop - start)
+        scores[rows, rows + start] = -1.0  # a column is not its own partner
+
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        mask = np.zeros_like(scores, dtype=bool)
+        mask[rows[:, None], top] = True
+        if min_score is not None:
+            mask |= scores >= min_score
+        i, j = np.nonzero(mask)
+        keep_i.append(i + start)
+        keep_j.append(j)
+        keep_score.append(scores[i, j])
+        if sum(len(s) for s in keep_score) > 4 * cfg.max_pairs:
+            # Every pair appears at most twice, so the best 2 * max_pairs entries hold the best max_pairs pairs
+            i, j, score = np.concatenate(keep_i), np.concatenate(keep_j), np.concatenate(keep_score)
+            best = np.argpartition(-score, 2 * cfg.max_pairs - 1)[: 2 * cfg.max_pairs]
+            keep_i, keep_j, keep_score = [i[best]], [j[best]], [score[best]]
+
+    i, j, score = np.concatenate(keep_i), np.concatenate(keep_j), np.concatenate(keep_score)
+    # Each pair can be found from both ends; order it (low, high) and keep one copy
+    lo, hi = np.minimum(i, j), np.maximum(i, j)
+    _, first = np.unique(lo * p + hi, return_index=True)
+    lo, hi, score = lo[first], hi[first], score[first]
+    order = np.argsort(-score, kind="stable")[: cfg.max_pairs]
+    return [(columns[lo[n]], columns[hi[n]], float(score[n])) for n in order]
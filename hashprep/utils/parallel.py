@@ -0,0 +1,70 @@
+"""Helpers for running HashPrep work on thread and process pools.
+
+Numeric columns are handed to process workers through
+``multiprocessing.shared_memory``: the parent copies each column's values into
+a named shared block once and workers map that block directly, instead of
+receiving a pickled copy of the DataFrame.
+"""
+
+import os
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+# numpy dtype kinds that can be shared as a flat buffer: bool, int, uint, float, datetime64
+_SHAREABLE_KINDS = "biufM"
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """Translate ``n_jobs`` (``-1`` = all cores) into a positive worker count."""
+    if not isinstance(n_jobs, int) or n_jobs == 0 or n_jobs < -1:
+        raise ValueError(f"n_jobs must be a positive integer or -1, got {n_jobs!r}")
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    return n_jobs
+
+
+@dataclass(frozen=True)
+class SharedColumn:
+    """Picklable handle to a column's values stored in a shared memory block."""
+
+    shm_name: str
+    dtype: str
+    length: int
+
+    def attach(self) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+        """Map the block and return it with a read-only array view over it.
+
+        The caller must drop every reference to the array before closing the block.
+        """
+        shm = shared_memory.SharedMemory(name=self.shm_name)
+        values = np.ndarray((self.length,), dtype=np.dtype(self.dtype), buffer=shm.buf)
+        values.flags.writeable = False
+        return shm, values
+
+
+def is_shareable(series: pd.Series) -> bool:
+    """Return True if a column is backed by a plain numpy array that can live in shared memory."""
+    return isinstance(series.dtype, np.dtype) and series.dtype.kind in _SHAREABLE_KINDS
+
+
+def share_column(series: pd.Series) -> tuple[shared_memory.SharedMemory, SharedColumn]:
+    """Copy a column's values into a new shared memory block.
+
+    Returns the owning block (the caller must ``close()`` and ``unlink()`` it) and
+    the handle to send to workers.
+    """
+    values = series.to_numpy()
+    # Zero-sized blocks are not allowed; a single spare byte keeps empty columns shareable
+    shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)[:] = values
+    return shm, SharedColumn(shm_name=shm.name, dtype=values.dtype.str, length=len(values))
+
+
+def release_blocks(blocks: list[shared_memory.SharedMemory]) -> None:
+    """Close and unlink shared memory blocks created by ``share_column``."""
+    for shm in blocks:
+        shm.close()
+        shm.unlink()
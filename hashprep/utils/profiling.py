@@ -0,0 +1,61 @@
+"""Lightweight timing and memory instrumentation for summaries and checks.
+
+Every measured step records wall time, the CPU time of the thread that ran
+it, and the rows and columns it was given. When ``tracemalloc`` is tracing
+(``DatasetAnalyzer(profile_memory=True)``), steps that run one at a time also
+record their peak traced allocation above the level they started at; steps
+that share the process with concurrently running threads report ``None``
+because tracemalloc's peak cannot be attributed to one of them.
+"""
+
+import time
+import tracemalloc
+from collections.abc import Callable
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class Timing:
+    name: str
+    kind: str  # "summary", "check" or "plots"
+    wall_seconds: float
+    cpu_seconds: float
+    rows: int
+    columns: int
+    memory_peak_bytes: int | None = None
+
+    def to_dict(self) -> dict:
+        record = asdict(self)
+        record["wall_seconds"] = round(self.wall_seconds, 4)
+        record["cpu_seconds"] = round(self.cpu_seconds, 4)
+        return record
+
+
+@contextmanager
+def measure(records: list[Timing], name: str, kind: str, shape: tuple[int, int], memory: bool = True):
+    """Append a Timing for the enclosed block to ``records``; ``memory=False`` skips tracemalloc."""
+    trace = memory and tracemalloc.is_tracing()
+    if trace:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield
+    finally:
+        wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+        peak = max(tracemalloc.get_traced_memory()[1] - baseline, 0) if trace else None
+        records.append(Timing(name, kind, wall, cpu, int(shape[0]), int(shape[1]), peak))
+
+
+def timed_check(name: str, check_fn: Callable, analyzer, memory: bool = True) -> tuple[list, Timing]:
+    """Run ``check_fn(analyzer)`` and return its issues with the check's Timing."""
+    records: list[Timing] = []
+    with measure(records, name, "check", analyzer.df.shape, memory=memory):
+        issues = check_fn(analyzer)
+    return issues, records[0]
+
+
+def sort_by_cost(timings: list[dict]) -> list[dict]:
+    """Timing records (as stored in ``reproduction_info["timings"]``), most expensive first."""
+    return sorted(timings, key=lambda t: (t["wall_seconds"], t["cpu_seconds"]), reverse=True)
@@ -1,13 +1,25 @@
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 
 from ..config import DEFAULT_CONFIG
+from .io import count_rows, iter_chunks
+from .memory import MemoryUsage, memory_usage
 
 _SAMPLING = DEFAULT_CONFIG.sampling
 DEFAULT_MAX_ROWS = _SAMPLING.max_rows
 DEFAULT_MEMORY_THRESHOLD_MB = _SAMPLING.memory_threshold_mb
+DEFAULT_FILE_CHUNK_ROWS = _SAMPLING.file_chunk_rows
+
+# Quantiles whose standard errors adaptive sampling tracks, and the step used to estimate their density
+_TRACKED_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+_DENSITY_STEP = 0.01
+# Per stage, correlations are tracked for the first numeric columns and frequencies for the top levels
+_MAX_CORRELATION_COLUMNS = 20
+_MAX_TRACKED_LEVELS = 50
 
 
 @dataclass
@@ -17,9 +29,21 @@ class SamplingConfig:
     max_rows: int = DEFAULT_MAX_ROWS
     sample_method: Literal["random", "stratified", "systematic", "head"] = "random"
     random_state: int | None = 42
-    stratify_column: str | None = None
+    # One column or several; strata are their value combinations (missing values included)
+    stratify_column: str | list[str] | None = None
+    # Stratified samples keep at least this many rows of every stratum (all rows of smaller ones),
+    # even if that makes them larger than max_rows
+    min_per_stratum: int = 1
     memory_threshold_mb: float = DEFAULT_MEMORY_THRESHOLD_MB
     enabled: bool = True
+    # Grow the sample in stages until the tracked statistics converge instead of using max_rows
+    adaptive: bool = False
+    adaptive_min_rows: int = _SAMPLING.adaptive_min_rows
+    adaptive_max_rows: int = _SAMPLING.adaptive_max_rows
+    adaptive_growth: float = _SAMPLING.adaptive_growth
+    tolerance: float = _SAMPLING.adaptive_tolerance
+    rare_tolerance: float = _SAMPLING.adaptive_rare_tolerance
+    rare_frequency: float = _SAMPLING.rare_frequency
 
 
 class DatasetSampler:
@@ -30,17 +54,20 @@ class DatasetSampler:
         self.original_shape: tuple[int, int] | None = None
         self.sample_fraction: float | None = None
         self.was_sampled: bool = False
+        self.adaptive_info: dict | None = None
+        self.memory_usage: MemoryUsage | None = None
 
     def should_sample(self, df: pd.DataFrame) -> bool:
         """Determine if dataset needs sampling based on size/memory."""
         if not self.config.enabled:
             return False
 
-        row_threshold_exceeded = len(df) > self.config.max_rows
-        memory_mb = df.memory_usage(deep=True).sum() / (1024**2)
-        memory_threshold_exceeded = memory_mb > self.config.memory_threshold_mb
-
-        return row_threshold_exceeded or memory_threshold_exceeded
+        min_rows = self.config.adaptive_min_rows if self.config.adaptive else self.config.max_rows
+        if len(df) > min_rows:
+            return True
+        # Kept so that an unsampled frame is not measured again by the summaries
+        self.memory_usage = memory_usage(df)
+        return self.memory_usage.total / (1024**2) > self.config.memory_threshold_mb
 
     def sample(self, df: pd.DataFrame) -> pd.DataFrame:
         """Sample the dataset according to configuration."""
@@ -51,20 +78,29 @@ class DatasetSampler:
             self.sample_fraction = 1.0
             return df
 
-        target_rows = min(self.config.max_rows, len(df))
+        if self.config.adaptive:
+            target_rows, staged = self._adaptive_rows(df)
+            if target_rows >= len(df):
+                self.was_sampled = False
+                self.sample_fraction = 1.0
+                return df
+        else:
+            target_rows, staged = min(self.config.max_rows, len(df)), None
         self.sample_fraction = target_rows / len(df)
         self.was_sampled = True
+        if staged is not None and self.config.sample_method == "random":
+            # The last stage is already a uniform sample of the chosen size
+            return staged
+        return self._draw(df, target_rows)
 
+    def _draw(self, df: pd.DataFrame, target_rows: int) -> pd.DataFrame:
         method = self.config.sample_method
 
         if method == "random":
             return df.sample(n=target_rows, random_state=self.config.random_state)
 
         if method == "stratified":
-            stratify_col = self.config.stratify_column
-            if stratify_col and stratify_col in df.columns:
-                return self._stratified_sample(df, target_rows)
-            return df.sample(n=target_rows, random_state=self.config.random_state)
+            return self._stratified_sample(df, target_rows)
 
         if method == "systematic":
             step = max(1, len(df) // target_rows)
@@ -75,39 +111,125 @@ class DatasetSampler:
 
         return df.sample(n=target_rows, random_state=self.config.random_state)
 
-    def _stratified_sample(self, df: pd.DataFrame, target_rows: int) -> pd.DataFrame:
-        """Stratified sampling preserving class distribution."""
-        col = self.config.stratify_column
-        if col is None or col not in df.columns:
-            return df.sample(n=target_rows, random_state=self.config.random_state)
+    def _adaptive_rows(self, df: pd.DataFrame) -> tuple[int, pd.DataFrame]:
+        """Choose a sample size by growing nested random samples until their statistics converge.
+
+        Each stage is a prefix of one random permutation, ``adaptive_growth`` times larger than
+        the last, from ``adaptive_min_rows`` up to ``adaptive_max_rows``. Returns the chosen size
+        and the last stage, and records the stages in ``adaptive_info``.
+        """
+        cfg = self.config
+        order = np.random.default_rng(cfg.random_state).permutation(len(df))
+        cap = min(len(df), cfg.adaptive_max_rows)
+        rows = min(cfg.adaptive_min_rows, cap)
+        stages = []
+        while True:
+            stage = df.iloc[order[:rows]]
+            errors = standard_errors(stage, cfg.rare_frequency)
+            converged = _within_tolerance(errors, cfg)
+            stages.append({"rows": rows, "errors": errors, "converged": converged})
+            if converged or rows >= cap:
+                break
+            rows = min(cap, max(rows + 1, int(rows * cfg.adaptive_growth)))
+        self.adaptive_info = {
+            "rows": rows,
+            "converged": converged,
+            "tolerance": cfg.tolerance,
+            "rare_tolerance": cfg.rare_tolerance,
+            "errors": errors,
+            "stages": stages,
+        }
+        return rows, stage
 
-        groups = df.groupby(col, group_keys=False)
-        proportions = df[col].value_counts(normalize=True)
+    @classmethod
+    def from_file(
+        cls, path: str, config: SamplingConfig | None = None, **kwargs
+    ) -> tuple["DatasetSampler", pd.DataFrame]:
+        """Return a sampler and the sample it drew from ``path`` (see ``sample_file``)."""
+        sampler = cls(config)
+        return sampler, sampler.sample_file(path, **kwargs)
 
-        samples = []
-        remaining = target_rows
+    def sample_file(
+        self,
+        path: str,
+        chunksize: int | None = None,
+        on_chunk: Callable[[pd.DataFrame], None] | None = None,
+        read_options: dict | None = None,
+    ) -> pd.DataFrame:
+        """Sample a CSV or Parquet file (``"-"`` reads CSV from stdin) while streaming it in chunks.
 
-        for name, group in groups:
-            n_samples = max(1, int(proportions[name] * target_rows))
-            n_samples = min(n_samples, len(group), remaining)
-            if n_samples > 0:
-                samples.append(group.sample(n=n_samples, random_state=self.config.random_state))
-                remaining -= n_samples
-            if remaining <= 0:
-                break
+        Only the sample and one chunk are held in memory. ``random`` keeps a uniform
+        reservoir; ``stratified`` also keeps each stratum's first ``min_per_stratum`` reservoir
+        candidates and allocates the reservoir across strata in proportion to their counts in
+        the whole file; ``systematic`` keeps every step-th row, doubling the step
+        whenever the kept rows outgrow ``max_rows`` unless the row count is known up front
+        (Parquet); ``head`` keeps the first ``max_rows`` rows and only stops reading early
+        when the row count is known. Sampled rows keep their
+        file position as index, in file order. ``on_chunk`` is called with every chunk read,
+        e.g. to fold it into full-data sketches. ``read_options`` go to ``pd.read_csv``.
+        """
+        chunksize = chunksize or DEFAULT_FILE_CHUNK_ROWS
+        # Adaptive sizing picks its sample from a first sample of up to adaptive_max_rows rows
+        keep_config = (
+            replace(self.config, max_rows=self.config.adaptive_max_rows) if self.config.adaptive else self.config
+        )
+        max_rows = keep_config.max_rows if self.config.enabled else None
+        method = self.config.sample_method
+        total_rows = count_rows(path) if method in ("systematic", "head") else None
+        keeper = _FileSample(keep_config, total_rows if method == "systematic" else None)
 
-        if not samples:
-            return df.sample(n=target_rows, random_state=self.config.random_state)
+        rows = 0
+        columns = None
+        for chunk in iter_chunks(path, chunksize, read_options):
+            if on_chunk is not None:
+                on_chunk(chunk)
+            columns = chunk.columns
+            chunk = chunk.set_axis(pd.RangeIndex(rows, rows + len(chunk)), axis=0)
+            rows += len(chunk)
+            if max_rows is None:
+                keeper.keep_all(chunk)
+            else:
+                keeper.add(chunk)
+                if method == "head" and total_rows is not None and rows >= max_rows and on_chunk is None:
+                    # The row count came from file metadata; the rest of the file is not needed
+                    rows = total_rows
+                    break
+        if columns is None:
+            raise ValueError(f"No rows to sample in {path}")
 
-        result = pd.concat(samples)
+        if max_rows is None or rows <= max_rows:
+            # Every row was kept; decide exactly as for an in-memory DataFrame
+            return self.sample(keeper.frame(columns))
+        sample = keeper.result(columns, max_rows)
+        if self.config.adaptive:
+            target_rows, staged = self._adaptive_rows(sample)
+            if target_rows < len(sample):
+                sample = staged if method == "random" else self._draw(sample, target_rows)
+                sample = sample.sort_index()
+        self.original_shape = (rows, len(columns))
+        self.sample_fraction = len(sample) / rows
+        self.was_sampled = True
+        return sample
 
-        if len(result) < target_rows and len(result) < len(df):
-            additional_needed = min(target_rows - len(result), len(df) - len(result))
-            remaining_indices = df.index.difference(result.index)
-            additional = df.loc[remaining_indices].sample(n=additional_needed, random_state=self.config.random_state)
-            result = pd.concat([result, additional])
+    def _stratified_sample(self, df: pd.DataFrame, target_rows: int) -> pd.DataFrame:
+        """Stratified sampling preserving the distribution of ``stratify_column`` values.
 
-        return result.sample(frac=1, random_state=self.config.random_state)
+        Each stratum gets its proportional share of ``target_rows`` (rounded down, at least
+        ``min_per_stratum``), taken as the rows with the smallest random keys; rows with the
+        smallest remaining keys fill up to ``target_rows``. Everything is computed on group
+        codes, so the cost does not depend on the number of strata.
+        """
+        columns = _stratify_columns(self.config, df.columns)
+        if columns is None:
+            return df.sample(n=target_rows, random_state=self.config.random_state)
+
+        codes = df.groupby(columns, sort=False, dropna=False).ngroup().to_numpy()
+        counts = np.bincount(codes)
+        keys = np.random.default_rng(self.config.random_state).random(len(df))
+        quotas = _stratum_quotas(counts, len(df), target_rows, self.config.min_per_stratum)
+        chosen = _stratified_positions(codes, keys, quotas, target_rows)
+        # Ordering by key returns the rows shuffled
+        return df.iloc[chosen[np.argsort(keys[chosen])]]
 
     def get_sampling_info(self) -> dict:
         """Return metadata about sampling performed."""
@@ -118,4 +240,232 @@ class DatasetSampler:
             "sample_fraction": self.sample_fraction,
             "sample_method": self.config.sample_method,
             "max_rows": self.config.max_rows,
+            **({"adaptive": self.adaptive_info} if self.adaptive_info is not None else {}),
         }
+
+
+def standard_errors(df: pd.DataFrame, rare_frequency: float = _SAMPLING.rare_frequency) -> dict[str, float]:
+    """Largest estimated standard error of each family of statistics computed on ``df``.
+
+    ``missing_rate``, ``category_frequency`` (top levels of categorical, boolean and
+    low-cardinality numeric columns) and ``correlation`` (Pearson, among the first numeric
+    columns) are absolute. ``mean`` is relative to ``|mean| + std`` and ``quantile`` to the
+    distance between the 5th and 95th percentiles, with the density at each quantile estimated
+    from its neighbours. ``rare_category_frequency`` is relative to the frequency itself, for
+    levels at least ``rare_frequency`` common. Families with nothing to measure are left out.
+    """
+    errors: dict[str, float] = {}
+    n = len(df)
+    if n < 2 or df.shape[1] == 0:
+        return errors
+
+    missing = df.isna().mean().to_numpy()
+    errors["missing_rate"] = float(np.sqrt(missing * (1 - missing) / n).max())
+
+    numeric = df.select_dtypes("number")
+    if numeric.shape[1]:
+        values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        counts = (~np.isnan(values)).sum(axis=0)
+        usable = counts > 1
+        if usable.any():
+            values, counts = values[:, usable], counts[usable]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mean = np.nanmean(values, axis=0)
+                std = np.nanstd(values, axis=0, ddof=1)
+                mean_se = std / np.sqrt(counts) / (np.abs(mean) + std)
+                probs = sorted({p + d for p in _TRACKED_QUANTILES for d in (-_DENSITY_STEP, 0.0, _DENSITY_STEP)})
+                quantiles = dict(zip(probs, np.nanquantile(values, probs, axis=0)))
+                spread = quantiles[0.95] - quantiles[0.05]
+                spread = np.where(spread > 0, spread, std)
+                quantile_se = [
+                    np.sqrt(p * (1 - p) / counts)
+                    * (quantiles[p + _DENSITY_STEP] - quantiles[p - _DENSITY_STEP])
+                    / (2 * _DENSITY_STEP)
+                    / spread
+                    for p in _TRACKED_QUANTILES
+                ]
+            errors["mean"] = _max_finite(mean_se)
+            errors["quantile"] = _max_finite(np.concatenate(quantile_se))
+
+        varying = numeric.loc[:, numeric.std() > 0].iloc[:, :_MAX_CORRELATION_COLUMNS]
+        if varying.shape[1] > 1:
+            r = varying.corr().to_numpy()
+            pairs = np.triu_indices_from(r, k=1)
+            errors["correlation"] = _max_finite((1 - r[pairs] ** 2) / np.sqrt(n - 1))
+
+    frequency_se, rare_se = [], []
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            if series.nunique() > _MAX_TRACKED_LEVELS:
+                continue
+        freq = series.value_counts(normalize=True).head(_MAX_TRACKED_LEVELS).to_numpy()
+        present = series.notna().sum()
+        if len(freq) < 2 or present < 2:
+            continue
+        frequency_se.append(np.sqrt(freq * (1 - freq) / present))
+        tracked = freq[freq >= rare_frequency]
+        rare_se.append(np.sqrt((1 - tracked) / (present * tracked)))
+    if frequency_se:
+        errors["category_frequency"] = _max_finite(np.concatenate(frequency_se))
+        errors["rare_category_frequency"] = _max_finite(np.concatenate(rare_se))
+    return errors
+
+
+def _max_finite(values: np.ndarray) -> float:
+    values = values[np.isfinite(values)]
+    return float(values.max()) if len(values) else 0.0
+
+
+def _stratify_columns(config: SamplingConfig, available) -> list[str] | None:
+    columns = config.stratify_column
+    columns = [columns] if isinstance(columns, str) else list(columns or [])
+    return columns if columns and all(col in available for col in columns) else None
+
+
+def _stratum_quotas(counts: np.ndarray, total: int, target_rows: int, min_per_stratum: int) -> np.ndarray:
+    # Proportional share of target_rows, at least min_per_stratum, at most the stratum's size
+    share = np.floor(counts * (target_rows / total)).astype(np.int64)
+    return np.minimum(np.maximum(share, min_per_stratum), counts)
+
+
+def _rank_within(codes: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """Rank of every row's key within its stratum (0 for the smallest)."""
+    order = np.lexsort((keys, codes))
+    sorted_codes = codes[order]
+    positions = np.arange(len(order))
+    starts = np.r_[True, sorted_codes[1:] != sorted_codes[:-1]] if len(order) else np.empty(0, dtype=bool)
+    first = np.maximum.accumulate(np.where(starts, positions, 0))
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = positions - first
+    return rank
+
+
+def _stratified_positions(codes: np.ndarray, keys: np.ndarray, quotas: np.ndarray, target_rows: int) -> np.ndarray:
+    """Positions of the ``quotas[code]`` smallest-key rows per stratum, topped up by key to ``target_rows``."""
+    taken = _rank_within(codes, keys) < quotas[codes]
+    chosen = np.flatnonzero(taken)
+    deficit = target_rows - len(chosen)
+    if deficit > 0:
+        rest = np.flatnonzero(~taken)
+        if deficit < len(rest):
+            rest = rest[np.argpartition(keys[rest], deficit - 1)[:deficit]]
+        chosen = np.concatenate([chosen, rest])
+    return chosen
+
+
+def _stratum_hashes(df: pd.DataFrame, columns: list[str]) -> np.ndarray:
+    # Stable across chunks, unlike group codes
+    return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+
+def _within_tolerance(errors: dict[str, float], config: SamplingConfig) -> bool:
+    return all(
+        error <= (config.rare_tolerance if family == "rare_category_frequency" else config.tolerance)
+        for family, error in errors.items()
+    )
+
+
+class _FileSample:
+    """Rows kept while streaming a file: ``max_rows`` plus one chunk, and for stratified
+    sampling up to ``min_per_stratum`` rows per stratum."""
+
+    def __init__(self, config: SamplingConfig, total_rows: int | None):
+        self.config = config
+        self.rng = np.random.default_rng(config.random_state)
+        self.parts: list[pd.DataFrame] = []
+        self.keys = np.empty(0)
+        self.kept = 0
+        # Systematic sampling: keep rows whose position is a multiple of ``step``
+        self.step = max(1, total_rows // config.max_rows) if total_rows else 1
+        self.step_known = bool(total_rows)
+        # Stratified sampling: exact stratum counts (by stratum hash) and each stratum's
+        # min_per_stratum smallest-key rows
+        self.strata: list[str] | None = None
+        self.stratum_counts: pd.Series | None = None
+        self.front: pd.DataFrame | None = None
+        self.front_keys = np.empty(0)
+        self.front_hashes = np.empty(0, dtype=np.uint64)
+
+    def keep_all(self, chunk: pd.DataFrame) -> None:
+        self.parts.append(chunk)
+        self.kept += len(chunk)
+
+    def frame(self, columns) -> pd.DataFrame:
+        return pd.concat(self.parts) if self.parts else pd.DataFrame(columns=columns)
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        method = self.config.sample_method
+        if method == "head":
+            self.keep_all(chunk.iloc[: max(0, self.config.max_rows - self.kept)])
+        elif method == "systematic":
+            self._add_systematic(chunk)
+        else:
+            keys = self.rng.random(len(chunk))
+            if method == "stratified":
+                self.strata = _stratify_columns(self.config, chunk.columns)
+                if self.strata is not None:
+                    self._track_strata(chunk, keys)
+            self._add_bottom_k(chunk, keys)
+
+    def _add_bottom_k(self, chunk: pd.DataFrame, keys: np.ndarray) -> None:
+        # Bottom-k reservoir: every row gets a uniform key and the max_rows smallest keys are the sample
+        max_rows = self.config.max_rows
+        if len(self.keys) >= max_rows:
+            keep = keys < self.keys.max()
+            chunk, keys = chunk[keep], keys[keep]
+        combined = pd.concat(self.parts + [chunk]) if self.parts else chunk
+        combined_keys = np.concatenate([self.keys, keys])
+        if len(combined_keys) > max_rows:
+            chosen = np.argpartition(combined_keys, max_rows - 1)[:max_rows]
+            combined, combined_keys = combined.iloc[chosen], combined_keys[chosen]
+        self.parts, self.keys = [combined], combined_keys
+
+    def _track_strata(self, chunk: pd.DataFrame, keys: np.ndarray) -> None:
+        hashes = _stratum_hashes(chunk, self.strata)
+        counts = pd.Series(hashes).value_counts()
+        self.stratum_counts = counts if self.stratum_counts is None else self.stratum_counts.add(counts, fill_value=0)
+
+        # Keep the chunk's front rows, then merge them with the fronts kept so far
+        front = _rank_within(pd.factorize(hashes)[0], keys) < self.config.min_per_stratum
+        chunk, keys, hashes = chunk[front], keys[front], hashes[front]
+        if self.front is not None:
+            chunk = pd.concat([self.front, chunk])
+            keys = np.concatenate([self.front_keys, keys])
+            hashes = np.concatenate([self.front_hashes, hashes])
+            front = _rank_within(pd.factorize(hashes)[0], keys) < self.config.min_per_stratum
+            chunk, keys, hashes = chunk[front], keys[front], hashes[front]
+        self.front, self.front_keys, self.front_hashes = chunk, keys, hashes
+
+    def _add_systematic(self, chunk: pd.DataFrame) -> None:
+        self.keep_all(chunk[chunk.index % self.step == 0])
+        if self.step_known:
+            return
+        while self.kept > self.config.max_rows:
+            self.step *= 2
+            kept = pd.concat(self.parts)
+            self.parts = [kept[kept.index % self.step == 0]]
+            self.kept = len(self.parts[0])
+
+    def result(self, columns, max_rows: int) -> pd.DataFrame:
+        method = self.config.sample_method
+        if method == "systematic":
+            return self.frame(columns).head(max_rows)
+        if method == "head":
+            return self.frame(columns)
+        sample = self.frame(columns)
+        if method == "stratified" and self.stratum_counts is not None:
+            sample = self._allocate(sample, max_rows)
+        return sample.sort_index()
+
+    def _allocate(self, reservoir: pd.DataFrame, target_rows: int) -> pd.DataFrame:
+        # Same allocation as DatasetSampler._stratified_sample with whole-file stratum counts,
+        # drawn from the reservoir plus the stratum fronts
+        pool = pd.concat([reservoir, self.front])
+        keys = np.concatenate([self.keys, self.front_keys])
+        unique = ~pool.index.duplicated()
+        pool, keys = pool[unique], keys[unique]
+        codes, strata = pd.factorize(_stratum_hashes(pool, self.strata))
+        counts = self.stratum_counts.reindex(strata).to_numpy(dtype=np.int64)
+        quotas = _stratum_quotas(counts, int(self.stratum_counts.sum()), target_rows, self.config.min_per_stratum)
+        return pool.iloc[_stratified_positions(codes, keys, quotas, target_rows)]
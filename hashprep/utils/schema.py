@@ -0,0 +1,208 @@
+"""Saved dataset schemas for feeds that arrive with the same layout every run.
+
+Every run of a recurring load pays for pandas' CSV dtype sniffing and for
+``infer_types``. ``Schema.infer`` records what one run learned: semantic types,
+pandas dtypes, category levels and datetime formats. ``save``/``load`` persist it
+as JSON. Later runs read the file with ``read_options()`` (categories as
+``category``, text and datetime strings as ``object``, so pandas skips sniffing)
+and pass the schema to ``DatasetAnalyzer(schema=...)``. The analyzer then takes
+column types and datetime formats from the schema instead of inferring them, and
+the ``schema_mismatch`` check reports where the new data departs from it.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .column_cache import ColumnProfileCache
+from .datetimes import MIXED
+from .type_inference import infer_types
+
+SCHEMA_VERSION = 1
+# Numeric families whose semantic types survive a change between them (e.g. ints gaining NaNs)
+_NUMERIC = {"integer", "float"}
+
+
+def dtype_family(dtype) -> str:
+    """Coarse dtype family: ``"boolean"``, ``"integer"``, ``"float"``, ``"datetime"`` or ``"text"``."""
+    if isinstance(dtype, str):
+        try:
+            dtype = pd.api.types.pandas_dtype(dtype)
+        except TypeError:
+            return "text"
+    if pd.api.types.is_bool_dtype(dtype):
+        return "boolean"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "integer"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "float"
+    return "text"
+
+
+def level_name(value) -> str:
+    """A category level as a schema stores it; whole-number floats print as ints (``1.0`` -> ``"1"``)."""
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _numeric_level(level: str) -> str:
+    try:
+        return level_name(float(level))
+    except ValueError:
+        return level
+
+
+@dataclass(frozen=True)
+class ColumnSchema:
+    """What a schema records about one column."""
+
+    semantic_type: str
+    dtype: str
+    # Distinct values (as strings) of Categorical columns
+    levels: tuple[str, ...] | None = None
+    # Format of DateTime columns stored as strings (see ``utils.datetimes``)
+    datetime_format: str | None = None
+
+    def accepts(self, dtype) -> bool:
+        """Whether a column read with ``dtype`` can keep this column's semantic type."""
+        saved, current = dtype_family(self.dtype), dtype_family(dtype)
+        if saved == current or {saved, current} <= _NUMERIC:
+            return True
+        # String dates may arrive already parsed (e.g. from Parquet) and vice versa
+        return self.semantic_type == "DateTime" and {saved, current} <= {"text", "datetime"}
+
+    def new_levels(self, values) -> list[str]:
+        """Those of ``values`` (as level names) that are not among the saved levels.
+
+        Numeric levels compare as numbers, so an integer column that turned float by
+        gaining a missing value keeps its levels.
+        """
+        known = set(self.levels or ())
+        if dtype_family(self.dtype) in _NUMERIC:
+            known = {_numeric_level(level) for level in known}
+        return [name for name in map(level_name, values) if name not in known]
+
+
+@dataclass(frozen=True)
+class Schema:
+    """Per-column schema of a dataset; see the module docstring."""
+
+    columns: dict[str, ColumnSchema]
+    version: int = SCHEMA_VERSION
+
+    @classmethod
+    def infer(
+        cls,
+        df: pd.DataFrame,
+        column_types: dict[str, str] | None = None,
+        column_cache: ColumnProfileCache | None = None,
+    ) -> "Schema":
+        """Schema of ``df``; ``column_types`` and ``column_cache`` are reused when given."""
+        cache = column_cache if column_cache is not None else ColumnProfileCache(df)
+        types = column_types if column_types is not None else infer_types(df, column_cache=cache)
+        columns = {}
+        for col in df.columns:
+            typ = types.get(col, "Unsupported")
+            dtype = df[col].dtype
+            levels = None
+            if typ == "Categorical":
+                levels = tuple(sorted({level_name(value) for value in cache.value_counts(col).index}))
+            datetime_format = None
+            if typ == "DateTime" and dtype_family(dtype) == "text":
+                datetime_format = cache.datetime_format(col)
+            columns[str(col)] = ColumnSchema(typ, str(dtype), levels, datetime_format)
+        return cls(columns)
+
+    @classmethod
+    def from_analyzer(cls, analyzer) -> "Schema":
+        """Schema from an analyzer's inferred types; levels come from every row when they are in memory."""
+        if analyzer.df is analyzer.df_full:
+            return cls.infer(analyzer.df, analyzer.column_types, analyzer.column_cache)
+        return cls.infer(analyzer.df_full, analyzer.column_types)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": self.version,
+            "columns": {
+                col: {
+                    "semantic_type": c.semantic_type,
+                    "dtype": c.dtype,
+                    "levels": list(c.levels) if c.levels is not None else None,
+                    "datetime_format": c.datetime_format,
+                }
+                for col, c in self.columns.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Schema":
+        if data.get("version") != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported schema version {data.get('version')!r} (expected {SCHEMA_VERSION})")
+        columns = {
+            col: ColumnSchema(
+                semantic_type=c["semantic_type"],
+                dtype=c["dtype"],
+                levels=tuple(c["levels"]) if c.get("levels") is not None else None,
+                datetime_format=c.get("datetime_format"),
+            )
+            for col, c in data["columns"].items()
+        }
+        return cls(columns)
+
+    def save(self, path: str | Path) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Schema":
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    def read_options(self) -> dict:
+        """``pd.read_csv`` keyword arguments that fix the dtypes of the schema's string columns.
+
+        Numeric and boolean columns are left to pandas, so a file whose values no longer
+        fit still loads and the mismatch is reported by the ``schema_mismatch`` check.
+        """
+        dtypes = {}
+        for col, c in self.columns.items():
+            if dtype_family(c.dtype) != "text":
+                continue
+            dtypes[col] = "category" if c.semantic_type == "Categorical" else "object"
+        return {"dtype": dtypes}
+
+    def source_dtypes(self, df: pd.DataFrame) -> dict[str, str]:
+        """Saved dtypes of ``df``'s columns that ``read_options`` turned into ``category``, for
+        ``ColumnProfileCache(source_dtypes=...)``: checks then select them as they would the original strings.
+        """
+        return {
+            col: self.columns[str(col)].dtype
+            for col in df.columns
+            if str(col) in self.columns
+            and isinstance(df[col].dtype, pd.CategoricalDtype)
+            and self.columns[str(col)].dtype != "category"
+        }
+
+    def column_types(self, df: pd.DataFrame) -> dict[str, str]:
+        """Saved semantic types of ``df``'s columns whose dtype still fits them (see ``ColumnSchema.accepts``)."""
+        return {
+            col: self.columns[str(col)].semantic_type
+            for col in df.columns
+            if str(col) in self.columns and self.columns[str(col)].accepts(df[col].dtype)
+        }
+
+    def datetime_formats(self, df: pd.DataFrame) -> dict[str, str]:
+        """Saved formats of ``df``'s DateTime columns that are still strings, for ``ColumnProfileCache``."""
+        return {
+            col: self.columns[str(col)].datetime_format
+            for col in df.columns
+            if str(col) in self.columns
+            and self.columns[str(col)].datetime_format not in (None, MIXED)
+            and dtype_family(df[col].dtype) == "text"
+        }
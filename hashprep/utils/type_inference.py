@@ -1,6 +1,8 @@
 import pandas as pd
 
 from ..config import DEFAULT_CONFIG
+from . import datetimes
+from .column_cache import ColumnProfileCache
 
 _TYPE_CFG = DEFAULT_CONFIG.type_inference
 _DT_CFG = DEFAULT_CONFIG.datetime
@@ -12,62 +14,70 @@ CONFIG = {
 }
 
 
-def _looks_like_datetime(series: pd.Series) -> bool:
-    """Return True if an object/string column parses as datetime above the threshold."""
-    sample = series.dropna().head(200)
-    if len(sample) == 0:
-        return False
-    parsed = pd.to_datetime(sample, errors="coerce")
-    parse_ratio = parsed.notna().mean()
-    return float(parse_ratio) >= _DT_CFG.parse_threshold
+def _parse_ratio(sample: pd.Series, fmt: str | None) -> float:
+    """Share of ``sample`` (non-missing values) that parses as datetime with ``fmt``."""
+    if sample.empty:
+        return 0.0
+    return float(datetimes.parse(sample, fmt).notna().mean())
 
 
-def infer_types(df: pd.DataFrame) -> dict[str, str]:
+def infer_types(df: pd.DataFrame, column_cache: ColumnProfileCache | None = None) -> dict[str, str]:
     """
     Infer semantic types per ydata logic.
     Returns: {col: 'Numeric' | 'Categorical' | 'Text' | 'DateTime' | 'Boolean' | 'Unsupported'}
+
+    Columns are classified from frame-wide statistics (dtypes, non-missing counts) plus the
+    cached per-column distinct counts, which the summaries reuse. A string column is tested
+    for datetimes on its first ``datetime.format_sample_rows`` values with the format
+    detected by ``column_cache``, so later datetime consumers parse the column once with
+    that format (see ``utils.datetimes``).
     """
+    cache = column_cache if column_cache is not None else ColumnProfileCache(df)
+    dtypes = df.dtypes
+    counts = df.count()
+    bool_keys = list(CONFIG["bool_mappings"])
     types = {}
     for col in df.columns:
-        series = df[col].dropna()
-        if series.empty:
+        dtype = dtypes[col]
+        count = int(counts[col])
+        if count == 0:
             types[col] = "Unsupported"
-            continue
 
         # DateTime: native datetime64 dtype
-        if pd.api.types.is_datetime64_any_dtype(series):
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
             types[col] = "DateTime"
 
         # Numeric inference (ydata's Numeric.contains_op + numeric_is_category)
-        elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
-            n_unique = series.nunique()
+        elif pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            n_unique = cache.n_unique(col)
             if 1 <= n_unique <= CONFIG["num_low_cat_threshold"]:
                 types[col] = "Categorical"  # Low-card numeric → Categorical (e.g., SibSp, Parch)
             else:
                 types[col] = "Numeric"  # High-card numeric (e.g., Age, Fare)
 
         # Boolean dtype
-        elif pd.api.types.is_bool_dtype(series):
+        elif pd.api.types.is_bool_dtype(dtype):
             types[col] = "Categorical"
 
         # String/Text inference (ydata's Text.contains_op + string_is_category)
-        elif pd.api.types.is_string_dtype(series) or pd.api.types.is_object_dtype(series):
-            n_unique = series.nunique()
-            unique_pct = n_unique / len(series)
-            is_bool = all(str(s).lower() in CONFIG["bool_mappings"] for s in series[:5])
-            if is_bool:
+        elif pd.api.types.is_string_dtype(dtype) or pd.api.types.is_object_dtype(dtype):
+            sample = cache.non_null(col).head(_DT_CFG.format_sample_rows)
+            if sample.head(5).astype(str).str.lower().isin(bool_keys).all():
                 types[col] = "Categorical"
-            elif _looks_like_datetime(series):
+            elif _parse_ratio(sample, cache.datetime_format(col)) >= _DT_CFG.parse_threshold:
                 types[col] = "DateTime"  # String dates → DateTime (checked before cardinality)
-            elif (
-                1 <= n_unique <= CONFIG["cat_cardinality_threshold"] and unique_pct < CONFIG["cat_percentage_threshold"]
-            ):
-                types[col] = "Categorical"  # Low-card string → Categorical (e.g., Sex, Embarked)
             else:
-                types[col] = "Text"  # High-card/unique → Text (e.g., Name, Cabin, Ticket)
+                n_unique = cache.n_unique(col)
+                if (
+                    1 <= n_unique <= CONFIG["cat_cardinality_threshold"]
+                    and n_unique / count < CONFIG["cat_percentage_threshold"]
+                ):
+                    types[col] = "Categorical"  # Low-card string → Categorical (e.g., Sex, Embarked)
+                else:
+                    types[col] = "Text"  # High-card/unique → Text (e.g., Name, Cabin, Ticket)
 
         # Categorical dtype
-        elif pd.api.types.is_categorical_dtype(series):
+        elif isinstance(dtype, pd.CategoricalDtype):
             types[col] = "Categorical"
 
         else:
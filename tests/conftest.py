@@ -0,0 +1,36 @@
+"""Fixtures shared by the analyzer tests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Optional columns of the make_frame frame, drawn after the base columns
+_EXTRA_COLUMNS = {
+    "other": lambda rng, n: rng.normal(size=n),
+    "mostly_missing": lambda rng, n: np.where(rng.random(n) < 0.9, np.nan, 1.0),
+    "zeros": lambda rng, n: np.where(rng.random(n) < 0.7, 0.0, rng.normal(size=n)),
+}
+
+
+@pytest.fixture
+def make_frame():
+    """Build a seeded ``n``-row frame of ``value`` (normal), ``city`` (three levels) and a binary ``label``.
+
+    ``extra`` names columns to add: ``other`` (normal), ``mostly_missing`` (90% NaN) and
+    ``zeros`` (70% zeros).
+    """
+
+    def make(n: int, *extra: str) -> pd.DataFrame:
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "value": rng.normal(size=n),
+                "city": rng.choice(["a", "b", "c"], size=n),
+                "label": rng.integers(0, 2, size=n),
+            }
+        )
+        for name in extra:
+            df[name] = _EXTRA_COLUMNS[name](rng, n)
+        return df
+
+    return make
@@ -0,0 +1,85 @@
+"""Tests for time-budgeted (anytime) analysis."""
+
+import time
+
+import pytest
+
+from hashprep import DatasetAnalyzer, HashPrepConfig
+from hashprep.config import AnytimeDefaults
+from hashprep.core import analyzer as analyzer_module
+
+CONFIG = HashPrepConfig(anytime=AnytimeDefaults(initial_rows=200, growth_factor=4.0))
+
+
+@pytest.fixture
+def df(make_frame):
+    return make_frame(5_000, "zeros")
+
+
+def _issue_keys(summary):
+    return sorted((i["category"], i["column"], i["severity"]) for i in summary["issues"])
+
+
+class TestAnytime:
+    def test_generous_budget_refines_to_full_sample(self, df):
+        analyzer = DatasetAnalyzer(df, target_col="label", config=CONFIG, auto_sample=False)
+        summary = analyzer.analyze(time_budget_s=600)
+        info = summary["summaries"]["anytime_info"]
+
+        assert info["complete"] is True
+        assert [r["rows"] for r in info["rounds"]] == [200, 800, 3_200, 5_000]
+        assert summary["summaries"]["dataset_info"]["rows"] == len(df)
+        assert _issue_keys(summary) == _issue_keys(DatasetAnalyzer(df, target_col="label").analyze())
+
+    def test_tight_budget_keeps_first_round(self, df):
+        summary = DatasetAnalyzer(df, config=CONFIG).analyze(time_budget_s=1e-9)
+        info = summary["summaries"]["anytime_info"]
+
+        assert info["complete"] is False
+        assert info["sample_rows"] == 200
+        assert summary["summaries"]["dataset_info"]["rows"] == 200
+        assert summary["sampling_info"]["was_sampled"] is True
+        assert summary["sampling_info"]["sample_fraction"] == pytest.approx(200 / len(df))
+
+    def test_overrunning_round_falls_back_to_previous(self, df, monkeypatch):
+        summarize = analyzer_module.summarize_variables
+
+        def slow_after_first_round(frame, **kwargs):
+            if len(frame) > 200:
+                time.sleep(2.5)
+            return summarize(frame, **kwargs)
+
+        monkeypatch.setattr(analyzer_module, "summarize_variables", slow_after_first_round)
+        analyzer = DatasetAnalyzer(df, config=CONFIG)
+        summary = analyzer.analyze(time_budget_s=1.5)
+        info = summary["summaries"]["anytime_info"]
+
+        assert info["complete"] is False
+        assert info["sample_rows"] == 200 and len(analyzer.df) == 200
+        assert info["interrupted_round"]["rows"] == 800
+        assert summary["summaries"]["dataset_info"]["rows"] == 200
+        assert summary["summaries"]["variables"]["value"]["statistics"]["descriptive"]
+        assert analyzer._deadline_event is None
+
+    def test_setup_reported_outside_budget(self, df):
+        info = DatasetAnalyzer(df, config=CONFIG).analyze(time_budget_s=600)["summaries"]["anytime_info"]
+        assert set(info["outside_budget_seconds"]) == {"sampling", "type_inference"}
+        assert info["interrupted_round"] is None
+
+    def test_rounds_keep_row_order(self, df):
+        analyzer = DatasetAnalyzer(df, config=CONFIG)
+        analyzer.analyze(time_budget_s=1e-9)
+
+        assert analyzer.df.index.is_monotonic_increasing
+
+    def test_incomplete_result_is_not_cached(self, df, tmp_path):
+        DatasetAnalyzer(df, config=CONFIG, cache=tmp_path).analyze(time_budget_s=1e-9)
+        assert not list(tmp_path.glob("*.pkl"))
+
+        DatasetAnalyzer(df, config=CONFIG, cache=tmp_path).analyze(time_budget_s=600)
+        assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+    @pytest.mark.parametrize("budget", [0, -1])
+    def test_rejects_non_positive_budget(self, df, budget):
+        with pytest.raises(ValueError, match="time_budget_s"):
+            DatasetAnalyzer(df).analyze(time_budget_s=budget)
@@ -0,0 +1,105 @@
+"""Tests for the asyncio entry points."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from hashprep import DatasetAnalyzer
+from hashprep.reports import generate_report_async
+from hashprep.utils import async_executor
+
+
+@pytest.fixture
+def df(make_frame):
+    return make_frame(500, "mostly_missing")
+
+
+def _keys(summary):
+    return [(i["category"], i["column"], i["severity"]) for i in summary["issues"]]
+
+
+class TestAnalyzeAsync:
+    def test_matches_analyze(self, df):
+        expected = DatasetAnalyzer(df, target_col="label").analyze()
+        summary = asyncio.run(DatasetAnalyzer(df, target_col="label").analyze_async())
+
+        assert _keys(summary) == _keys(expected)
+        assert summary["summaries"]["dataset_info"] == expected["summaries"]["dataset_info"]
+
+    def test_concurrent_analyses(self, df):
+        async def main():
+            return await asyncio.gather(*(DatasetAnalyzer(df.iloc[: 100 * (i + 1)]).analyze_async() for i in range(3)))
+
+        summaries = asyncio.run(main())
+        assert [s["summaries"]["dataset_info"]["rows"] for s in summaries] == [100, 200, 300]
+
+    def test_forwards_callbacks(self, df):
+        progress = []
+        asyncio.run(DatasetAnalyzer(df).analyze_async(on_progress=lambda name, done, total: progress.append(done)))
+        assert progress and progress == list(range(1, len(progress) + 1))
+
+    def test_cancellation_stops_analysis(self, df):
+        analyzer = DatasetAnalyzer(df, target_col="label")
+        started, release = threading.Event(), threading.Event()
+        progress = []
+
+        def on_progress(name, done, total):
+            progress.append(done)
+            started.set()
+            release.wait(5)
+
+        async def main():
+            task = asyncio.create_task(analyzer.analyze_async(on_progress=on_progress))
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        release.set()
+        deadline = time.monotonic() + 5
+        while analyzer._cancel_event is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert analyzer._cancel_event is None
+        assert progress == [1]
+        assert analyzer.summaries.get("issues") is None
+
+
+class TestExecutor:
+    @pytest.mark.parametrize("n", [0, -1, 1.5, "2"])
+    def test_rejects_invalid_concurrency(self, n):
+        with pytest.raises(ValueError, match="positive integer"):
+            async_executor.set_max_concurrency(n)
+
+    def test_concurrency_limit(self):
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+        async def main():
+            await asyncio.gather(*(async_executor.run_blocking(work) for _ in range(6)))
+
+        async_executor.set_max_concurrency(2)
+        try:
+            asyncio.run(main())
+        finally:
+            async_executor.set_max_concurrency(async_executor.DEFAULT_MAX_CONCURRENCY)
+        assert peak[0] <= 2
+
+
+class TestGenerateReportAsync:
+    def test_matches_sync_report(self, df):
+        from hashprep.reports import generate_report
+
+        summary = DatasetAnalyzer(df).analyze()
+        assert asyncio.run(generate_report_async(summary, format="md")) == generate_report(summary, format="md")
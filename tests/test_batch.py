@@ -0,0 +1,99 @@
+"""Tests for profiling many files in one run."""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hashprep.core.batch import INDEX_FILE, expand_inputs, output_names, scan_files
+from hashprep.utils.sampling import SamplingConfig
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    rng = np.random.default_rng(0)
+    for i, n in enumerate([50, 80, 120]):
+        pd.DataFrame(
+            {
+                "value": rng.normal(size=n),
+                "mostly_missing": np.where(rng.random(n) < 0.9, np.nan, 1.0),
+                "city": rng.choice(["a", "b"], size=n),
+            }
+        ).to_csv(tmp_path / f"part_{i}.csv", index=False)
+    return tmp_path
+
+
+class TestExpandInputs:
+    def test_glob(self, data_dir):
+        paths = expand_inputs([str(data_dir / "*.csv")])
+        assert [os.path.basename(p) for p in paths] == ["part_0.csv", "part_1.csv", "part_2.csv"]
+
+    def test_manifest(self, data_dir):
+        manifest = data_dir / "files.txt"
+        manifest.write_text("# nightly\npart_2.csv\n\npart_0.csv\npart_2.csv\n")
+        paths = expand_inputs([str(manifest)])
+        assert paths == [str(data_dir / "part_2.csv"), str(data_dir / "part_0.csv")]
+
+    def test_unmatched_path_is_kept(self, data_dir):
+        assert expand_inputs([str(data_dir / "missing.csv")]) == [str(data_dir / "missing.csv")]
+
+
+def test_output_names_are_unique():
+    assert output_names(["a/x.csv", "b/x.csv", "c/index.csv", "y.parquet"]) == [
+        "x.json",
+        "x-2.json",
+        "index-2.json",
+        "y.json",
+    ]
+
+
+class TestScanFiles:
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    def test_writes_summaries_and_index(self, data_dir, tmp_path, n_jobs):
+        paths = expand_inputs([str(data_dir / "*.csv")])
+        out = tmp_path / f"out_{n_jobs}"
+        seen = []
+        index = scan_files(paths, str(out), n_jobs=n_jobs, on_result=seen.append)
+
+        assert index["files"] == index["succeeded"] == 3
+        assert [e["file"] for e in index["results"]] == paths
+        assert [e["rows"] for e in index["results"]] == [50, 80, 120]
+        assert sorted(e["file"] for e in seen) == sorted(paths)
+        assert json.loads((out / INDEX_FILE).read_text())["results"] == index["results"]
+        report = json.loads((out / "part_1.json").read_text())
+        assert report["dataset_overview"]["statistics"]["observations"] == 80
+        assert index["critical_issues"] == sum(e["critical_count"] for e in index["results"])
+
+    def test_failures_are_recorded(self, data_dir, tmp_path):
+        paths = [str(data_dir / "part_0.csv"), str(data_dir / "missing.csv")]
+        index = scan_files(paths, str(tmp_path / "out"))
+
+        assert index["failed"] == 1
+        ok, failed = index["results"]
+        assert ok["status"] == "ok"
+        assert failed["status"] == "error" and "FileNotFoundError" in failed["error"]
+        assert failed["output"] is None
+
+    def test_analyzer_kwargs(self, data_dir, tmp_path):
+        index = scan_files(
+            [str(data_dir / "part_2.csv")],
+            str(tmp_path / "out"),
+            analyzer_kwargs={"selected_checks": ["high_missing_values"]},
+        )
+        report = json.loads((tmp_path / "out" / "part_2.json").read_text())
+        assert {issue["category"] for issue in report["alerts"]["issues"]} <= {"missing_values"}
+        assert index["results"][0]["status"] == "ok"
+
+    def test_files_sampled_while_read(self, data_dir, tmp_path):
+        paths = [str(data_dir / "part_0.csv"), str(data_dir / "part_2.csv")]
+        index = scan_files(
+            paths, str(tmp_path / "out"), analyzer_kwargs={"sampling_config": SamplingConfig(max_rows=60)}
+        )
+        small, large = index["results"]
+        assert small["rows"] == 50 and "sample_fraction" not in small
+        assert large["rows"] == 120 and large["sample_fraction"] == pytest.approx(0.5)
+
+        whole = scan_files(paths, str(tmp_path / "whole"), analyzer_kwargs={"auto_sample": False})
+        assert all("sample_fraction" not in e for e in whole["results"])
@@ -93,6 +93,74 @@ class TestCLIScan:
         if "sample" in result.stdout.lower():
             assert "56.1%" in result.stdout  # 500/891
 
+    def test_scan_time_budget(self, titanic_csv):
+        """Test scan with a time budget."""
+        result = run_cli(["scan", titanic_csv, "--time-budget", "30", "--json"])
+
+        assert result.returncode == 0
+        data = json.loads(result.stdout)
+        assert data["anytime_info"]["rounds"]
+
+    def test_scan_profile(self, titanic_csv):
+        """Test scan with per-step timings."""
+        result = run_cli(["scan", titanic_csv, "--profile", "--quiet"])
+
+        assert result.returncode == 0
+        assert "Wall s" in result.stdout
+        assert "outliers" in result.stdout
+
+
+class TestCLIScanMany:
+    """Test 'hashprep scan-many' command."""
+
+    def test_scan_many_manifest(self, titanic_csv, temp_output_dir):
+        """Test scanning files listed in a manifest, including one that is missing."""
+        manifest = os.path.join(temp_output_dir, "files.txt")
+        with open(manifest, "w") as f:
+            f.write(f"{titanic_csv}\nmissing.csv\n")
+        out = os.path.join(temp_output_dir, "out")
+        result = run_cli(["scan-many", manifest, "--output-dir", out, "--jobs", "2"])
+
+        assert result.returncode == 1
+        assert "[ok]" in result.stdout and "[error]" in result.stdout
+        with open(os.path.join(out, "index.json")) as f:
+            index = json.load(f)
+        assert index["succeeded"] == 1 and index["failed"] == 1
+        assert os.path.exists(os.path.join(out, "train.json"))
+
+
+class TestCLISchema:
+    """Test 'hashprep schema export' and --schema."""
+
+    def test_export_then_scan_with_schema(self, titanic_csv, temp_output_dir):
+        """A feed that still matches its schema has no schema issues; a changed one reports them."""
+        schema_file = os.path.join(temp_output_dir, "schema.json")
+        result = run_cli(["schema", "export", titanic_csv, "-o", schema_file])
+        assert result.returncode == 0
+        with open(schema_file) as f:
+            assert json.load(f)["columns"]["Sex"]["levels"] == ["female", "male"]
+
+        result = run_cli(["scan", titanic_csv, "--schema", schema_file, "--checks", "schema_mismatch"])
+        assert result.returncode == 0
+        assert "schema" not in result.stdout.split("Critical Issues:")[1]
+
+        changed = os.path.join(temp_output_dir, "changed.csv")
+        with open(titanic_csv) as src, open(changed, "w") as dst:
+            dst.write(src.read().replace(",male,", ",unknown,"))
+        result = run_cli(["scan", changed, "--schema", schema_file, "--checks", "schema_mismatch", "--no-sample"])
+        assert result.returncode == 0
+        assert "Column 'Sex' has 1 level(s) not in the schema: 'unknown'" in result.stdout
+
+
+class TestCLIOptimizeDtypes:
+    """Test --optimize-dtypes."""
+
+    def test_details_reports_savings(self, titanic_csv):
+        result = run_cli(["details", titanic_csv, "--no-sample", "--optimize-dtypes"])
+        assert result.returncode == 0
+        assert "Saved by --optimize-dtypes" in result.stdout
+        assert "Sex: Categorical" in result.stdout
+
 
 class TestCLIDetails:
     """Test 'hashprep details' command."""
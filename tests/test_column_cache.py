@@ -0,0 +1,106 @@
+"""Tests for the shared per-column profile cache."""
+
+import numpy as np
+import pandas as pd
+
+from hashprep import DatasetAnalyzer
+from hashprep.summaries.interactions import summarize_interactions
+from hashprep.utils.column_cache import ColumnProfileCache, get_column_cache, split_by_level
+
+
+def _df():
+    return pd.DataFrame(
+        {
+            "num": [1.0, 2.0, np.nan, 2.0, 5.0],
+            "cat": ["a", "b", "a", None, "a"],
+        }
+    )
+
+
+class TestColumnProfileCache:
+    def test_primitives_match_pandas(self):
+        df = _df()
+        cache = ColumnProfileCache(df)
+
+        assert cache.missing_count("num") == 1
+        assert cache.non_missing_count("cat") == 4
+        assert cache.n_unique("num") == df["num"].nunique()
+        pd.testing.assert_series_equal(cache.non_null("cat"), df["cat"].dropna())
+        pd.testing.assert_series_equal(cache.value_counts("cat"), df["cat"].value_counts())
+        assert cache.str_lengths("cat").tolist() == [1, 1, 1, 1]
+        assert cache.columns_of("number") == ["num"]
+
+    def test_primitives_computed_once(self):
+        cache = ColumnProfileCache(_df())
+
+        first = cache.non_null("num")
+        second = cache.non_null("num")
+
+        assert first is second
+        assert cache.cache_info()["misses"] == 1
+        assert cache.cache_info()["hits"] == 1
+
+    def test_derived_primitives_reuse_base_entries(self):
+        cache = ColumnProfileCache(_df())
+
+        cache.non_null("num")
+        cache.n_unique("num")
+
+        info = cache.cache_info()
+        assert info["misses"] == 2
+        assert info["hits"] == 1
+
+    def test_clear_resets_counters(self):
+        cache = ColumnProfileCache(_df())
+        cache.missing_count("num")
+        cache.clear()
+
+        assert cache.cache_info() == {"hits": 0, "misses": 0, "entries": 0, "hit_ratio": 0.0}
+
+    def test_level_codes_split_values_by_level(self):
+        df = _df()
+        cache = ColumnProfileCache(df)
+
+        levels, codes = cache.level_codes("cat")
+        groups = split_by_level(df["num"].to_numpy(), codes, len(levels), df["num"].notna().to_numpy())
+
+        assert levels.tolist() == ["a", "b"]
+        assert codes.tolist() == [0, 1, 0, -1, 0]
+        assert [g.tolist() for g in groups] == [[1.0, 5.0], [2.0]]
+
+    def test_mixed_correlations_skip_high_cardinality_columns(self):
+        df = pd.DataFrame({"id": [f"r{i}" for i in range(60)], "grp": ["x", "y"] * 30, "v": np.arange(60.0)})
+        cache = ColumnProfileCache(df)
+
+        mixed = summarize_interactions(df, column_cache=cache)["mixed_correlations"]
+
+        assert set(mixed) == {"grp__v"}
+        assert ("level_codes", "id") not in cache._store
+
+    def test_get_column_cache_attaches_to_stand_in(self):
+        class _Stub:
+            def __init__(self, df):
+                self.df = df
+
+        stub = _Stub(_df())
+        cache = get_column_cache(stub)
+        assert get_column_cache(stub) is cache
+
+        stub.df = _df()
+        assert get_column_cache(stub) is not cache
+
+
+class TestAnalyzerColumnCache:
+    def test_cache_stats_reported(self):
+        analyzer = DatasetAnalyzer(_df(), auto_sample=False)
+        summary = analyzer.analyze()
+
+        info = summary["summaries"]["reproduction_info"]["column_cache"]
+        assert info["misses"] > 0
+        assert info["hits"] > 0
+
+    def test_checks_share_analyzer_cache(self):
+        analyzer = DatasetAnalyzer(_df(), auto_sample=False)
+        analyzer.analyze()
+
+        assert get_column_cache(analyzer) is analyzer.column_cache
@@ -9,7 +9,9 @@ from hashprep.checks.datetime_checks import (
     _check_datetime_gaps,
     _check_datetime_monotonicity,
 )
-from hashprep.summaries.variables import _summarize_datetime
+from hashprep.summaries.variables import _summarize_datetime, summarize_variables
+from hashprep.utils import datetimes
+from hashprep.utils.column_cache import ColumnProfileCache
 from hashprep.utils.type_inference import infer_types
 
 # ---------------------------------------------------------------------------
@@ -58,6 +60,78 @@ class TestDateTimeTypeInference:
         assert types["empty"] == "Unsupported"
 
 
+class TestDatetimeParsing:
+    def test_format_detected_once_and_reused(self, monkeypatch):
+        df = pd.DataFrame({"when": [f"03/{d:02d}/2021 10:30" for d in range(1, 29)] * 10})
+        parsed_lengths = []
+        parse = datetimes.parse
+        monkeypatch.setattr(datetimes, "parse", lambda s, fmt: parsed_lengths.append(len(s)) or parse(s, fmt))
+
+        cache = ColumnProfileCache(df)
+        assert infer_types(df, column_cache=cache)["when"] == "DateTime"
+        assert cache.datetime_format("when") == "%m/%d/%Y %H:%M"
+        analyzer = _FakeAnalyzer(df, {"when": "DateTime"})
+        analyzer.column_cache = cache
+        _summarize_datetime(df, "when", column_cache=cache)
+        _check_datetime_monotonicity(analyzer)
+        _check_datetime_gaps(analyzer)
+
+        # The 200-row inference sample, then one full-column parse shared by everything else
+        assert parsed_lengths == [200, len(df)]
+
+    def test_format_chosen_by_sample_majority(self):
+        values = pd.Series(["2021-01-05T10:00:00"] + [f"{d:02d}/01/2021" for d in range(1, 29)])
+        fmt = datetimes.detect_format(values)
+        assert fmt == "%d/%m/%Y"
+        assert datetimes.parse(values, fmt).iloc[1:].dt.day.tolist()[:3] == [1, 2, 3]
+
+    def test_mixed_formats_fall_back_to_per_element(self):
+        values = pd.Series(["2021-01-05 noon", "Jan 6 2021", "7 January 2021", "not a date"])
+        assert datetimes.detect_format(values) == datetimes.MIXED
+        parsed = datetimes.parse(values.iloc[1:], datetimes.MIXED)
+        assert parsed.notna().tolist() == [True, True, False]
+
+    def test_sorted_views_shared(self):
+        times = pd.to_datetime(["2021-01-03", "2021-01-01", None, "2021-01-02", "2021-01-02"])
+        df = pd.DataFrame({"t": times})
+        cache = ColumnProfileCache(df)
+        day = 86_400 * 10**9
+        assert (
+            cache.datetime_sorted_ns("t") == cache.datetime_sorted_ns("t")[0] + np.array([0, day, day, 2 * day])
+        ).all()
+        assert cache.datetime_gaps_ns("t").tolist() == [day, 0, day]
+
+    def test_timezone_aware_column(self):
+        times = pd.date_range("2021-03-27", periods=20, freq="D", tz="Europe/Paris").append(
+            pd.DatetimeIndex([pd.Timestamp.now(tz="UTC") + pd.Timedelta(days=30)]).tz_convert("Europe/Paris")
+        )
+        df = pd.DataFrame({"t": times})
+        result = _summarize_datetime(df, "t")
+        assert result["minimum"] == "2021-03-27 00:00:00+01:00"
+        assert result["future_count"] == 1
+        issues = _check_datetime_future_dates(_FakeAnalyzer(df, {"t": "DateTime"}))
+        assert len(issues) == 1
+
+    def test_unparseable_values_counted_as_invalid(self):
+        df = pd.DataFrame({"d": ["2021-01-01", "2021-01-02", "garbage", None, "2021-01-04"]})
+        result = _summarize_datetime(df, "d")
+        assert result["invalid_count"] == 1
+
+    def test_process_workers_reuse_detected_format(self):
+        df = pd.DataFrame(
+            {
+                "day": [f"2021-02-{d:02d}" for d in range(1, 29)] * 5,
+                "num": np.arange(140, dtype=float),
+            }
+        )
+        cache = ColumnProfileCache(df)
+        types = infer_types(df, column_cache=cache)
+        serial = summarize_variables(df, column_types=types, column_cache=cache)
+        parallel = summarize_variables(df, column_types=types, column_cache=ColumnProfileCache(df), n_jobs=2)
+        assert parallel["day"]["minimum"] == serial["day"]["minimum"]
+        assert parallel["day"]["range_days"] == serial["day"]["range_days"]
+
+
 # ---------------------------------------------------------------------------
 # _check_datetime_future_dates
 # ---------------------------------------------------------------------------
@@ -0,0 +1,125 @@
+"""Tests for opt-in dtype downcasting (DatasetAnalyzer(optimize_memory=True))."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hashprep import DatasetAnalyzer
+from hashprep.config import MemoryDefaults
+from hashprep.utils.dtypes import apply_dtypes, optimize_dtypes, plan_dtypes
+from hashprep.utils.sampling import SamplingConfig
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 2_000
+    return pd.DataFrame(
+        {
+            "small": rng.integers(0, 100, size=n),
+            "wide": rng.integers(0, 2**40, size=n),
+            "counts": np.where(rng.random(n) < 0.1, np.nan, rng.integers(0, 50, size=n)),
+            "price": rng.gamma(2.0, 10.0, size=n),
+            "flag": rng.random(n) < 0.5,
+            "segment": rng.choice(["north", "south", "east", "west"], size=n),
+            "note": [f"note {i}" for i in range(n)],
+            "label": rng.integers(0, 2, size=n),
+        }
+    )
+
+
+def _issues(summary):
+    return sorted((i["category"], str(i["column"]), i["description"]) for i in summary["issues"])
+
+
+class TestPlanDtypes:
+    def test_plan(self, frame):
+        frame = frame.assign(mixed=[str(i) if i % 2 else i for i in range(len(frame))])
+        types = {"segment": "Categorical", "note": "Text", "mixed": "Categorical"}
+        plan = plan_dtypes(frame, types, MemoryDefaults(arrow_strings=False))
+
+        assert plan == {
+            "small": np.int8,
+            "counts": np.float32,
+            "segment": "category",
+            "label": np.int8,
+        }
+
+    def test_spread_must_fit(self):
+        df = pd.DataFrame({"full": [-128, 127], "half": [-60, 60], "up": [0, 200]})
+        assert plan_dtypes(df, {}) == {"full": np.int16, "half": np.int8, "up": np.int16}
+
+    def test_lossy_floats_kept(self):
+        df = pd.DataFrame({"x": [0.1, 0.2, np.nan], "y": [1.0, np.inf, 1e300]})
+        assert plan_dtypes(df, {}) == {}
+
+    def test_float_downcasting_can_be_disabled(self, frame):
+        assert "counts" not in plan_dtypes(frame, {}, MemoryDefaults(downcast_floats=False))
+
+    def test_apply_dtypes_copies(self, frame):
+        out = apply_dtypes(frame, {"small": np.int8})
+        assert out["small"].dtype == np.int8 and frame["small"].dtype == np.int64
+        assert list(out.columns) == list(frame.columns)
+        assert out.index.equals(frame.index)
+        # Unconverted columns must not keep frame's blocks alive
+        assert not np.shares_memory(out["price"].to_numpy(), frame["price"].to_numpy())
+
+    def test_bytes_saved(self, frame):
+        out, report = optimize_dtypes(frame, {"segment": "Categorical"})
+        assert report.bytes_saved > 0
+        assert report.to_dict()["optimized_dtypes"]["small"] == "int64 -> int8"
+        pd.testing.assert_frame_equal(out.astype(frame.dtypes), frame)
+
+
+class TestAnalyzerOptimizeMemory:
+    def test_same_types_and_issues(self, frame):
+        plain = DatasetAnalyzer(frame, target_col="label")
+        optimized = DatasetAnalyzer(frame, target_col="label", optimize_memory=True)
+
+        assert optimized.df["segment"].dtype == "category"
+        assert optimized.column_types == plain.column_types
+        assert _issues(optimized.analyze()) == _issues(plain.analyze())
+
+    def test_full_range_int8_values(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({"code": rng.integers(-128, 128, size=2_000), "label": rng.integers(0, 2, size=2_000)})
+        plain = DatasetAnalyzer(df, target_col="label").analyze()
+        optimized = DatasetAnalyzer(df, target_col="label", optimize_memory=True).analyze()
+
+        assert "uniform_distribution" in {i["category"] for i in plain["issues"]}
+        assert _issues(optimized) == _issues(plain)
+        optimized_code, plain_code = (
+            {k: v for k, v in summary["summaries"]["variables"]["code"].items() if k != "memory_size"}
+            for summary in (optimized, plain)
+        )
+        assert optimized_code == plain_code
+
+    def test_dataset_info_reports_savings(self, frame):
+        info = DatasetAnalyzer(frame, optimize_memory=True).analyze()["summaries"]["dataset_info"]
+        assert info["memory_saved_bytes"] > 0
+        assert info["optimized_dtypes"]["segment"] == "object -> category"
+
+        assert "memory_saved_bytes" not in DatasetAnalyzer(frame).analyze()["summaries"]["dataset_info"]
+
+    def test_checks_still_select_downcast_columns(self, frame):
+        analyzer = DatasetAnalyzer(frame, optimize_memory=True)
+        assert analyzer.column_cache.columns_of(["int64", "float64"]) == ["small", "wide", "counts", "price", "label"]
+        assert "segment" in analyzer.column_cache.columns_of("object")
+
+    def test_sample_has_only_its_own_levels(self):
+        levels = ["common"] * 999 + ["rare"]
+        df = pd.DataFrame({"level": levels * 20, "value": np.arange(20_000)})
+        analyzer = DatasetAnalyzer(
+            df,
+            sampling_config=SamplingConfig(max_rows=500, sample_method="head", adaptive=False),
+            optimize_memory=True,
+        )
+
+        assert list(analyzer.df_full["level"].cat.categories) == ["common", "rare"]
+        assert list(analyzer.df["level"].cat.categories) == ["common"]
+        assert analyzer.df_full["value"].dtype == analyzer.df["value"].dtype == np.int16
+
+    def test_categorical_target_with_missing_values(self, frame):
+        frame = frame.assign(segment=frame["segment"].where(frame.index % 10 > 0))
+        summary = DatasetAnalyzer(frame, target_col="segment", optimize_memory=True).analyze()
+        assert summary["summaries"]["mutual_information"]
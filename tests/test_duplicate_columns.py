@@ -0,0 +1,148 @@
+"""Tests for duplicate and near-duplicate column detection."""
+
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hashprep import DatasetAnalyzer
+from hashprep.checks import run_checks
+from hashprep.config import DEFAULT_CONFIG
+from hashprep.reports.markdown import MarkdownReport
+from hashprep.utils.column_cache import ColumnProfileCache
+
+
+@pytest.fixture
+def joined_df():
+    rng = np.random.default_rng(0)
+    n = 2_000
+    user_id = rng.permutation(n) + 1000
+    noisy = user_id.copy()
+    noisy[rng.choice(n, size=40, replace=False)] = -1  # 98% agreement
+    df = pd.DataFrame(
+        {
+            "user_id": user_id,
+            "amount": rng.gamma(2.0, 10.0, size=n),
+            "segment": rng.choice(["a", "b", "c"], size=n),
+            "flag": rng.integers(0, 2, size=n),
+            "user_id_x": user_id,
+            "user_id_str": user_id.astype(str),
+            "segment_copy": None,
+            "log_amount": None,
+            "neg_amount": None,
+            "user_id_noisy": noisy,
+            "other_flag": rng.integers(0, 2, size=n),
+        }
+    )
+    df["segment_copy"] = df["segment"]
+    df["log_amount"] = np.log1p(df["amount"])
+    df["neg_amount"] = -3 * df["amount"]
+    df.loc[rng.random(n) < 0.05, ["amount", "log_amount", "neg_amount"]] = np.nan
+    return df
+
+
+def _by_column(issues):
+    return {issue.column: issue.description for issue in issues}
+
+
+class TestColumnHashes:
+    def test_content_hash_matches_equals(self):
+        df = pd.DataFrame({"a": [1, 2, None], "b": [1.0, 2.0, np.nan], "c": [1, 2, 3], "d": [1, 2, 3]})
+        cache = ColumnProfileCache(df)
+        assert cache.content_hash("a") == cache.content_hash("b")
+        assert cache.content_hash("c") == cache.content_hash("d")
+        assert cache.content_hash("a") != cache.content_hash("c")
+
+    def test_row_hashes_compare_across_dtypes(self):
+        df = pd.DataFrame(
+            {
+                "int": [0, 5, None],
+                "str": ["0", "5", None],
+                "bool": [False, True, None],
+                "text": ["x", "5", None],
+            }
+        )
+        cache = ColumnProfileCache(df)
+        assert (cache.row_hashes("int") == cache.row_hashes("str")).all()
+        assert cache.row_hashes("int")[2] == 0 and cache.row_hashes("int")[0] != 0
+        assert cache.row_hashes("bool")[0] == cache.row_hashes("int")[0]
+        assert cache.row_hashes("text")[1] != cache.row_hashes("int")[1]
+
+
+class TestDuplicateColumns:
+    def test_kinds(self, joined_df):
+        analyzer = DatasetAnalyzer(joined_df)
+        found = _by_column(run_checks(analyzer, ["duplicate_columns"]))
+
+        assert found["user_id_x"] == "Column 'user_id_x' is an exact copy of 'user_id'"
+        assert found["segment_copy"] == "Column 'segment_copy' is an exact copy of 'segment'"
+        assert "same values as 'user_id'" in found["user_id_str"]
+        assert found["log_amount"].startswith("Column 'log_amount' is an increasing transform of 'amount'")
+        assert found["neg_amount"].startswith("Column 'neg_amount' is a decreasing transform of 'amount'")
+        assert found["user_id_noisy"] == "Column 'user_id_noisy' matches 'user_id' on 98.0% of rows"
+        assert set(found) == {"user_id_x", "segment_copy", "user_id_str", "log_amount", "neg_amount", "user_id_noisy"}
+
+    def test_unrelated_columns_not_flagged(self):
+        rng = np.random.default_rng(1)
+        df = pd.DataFrame({f"b{i}": rng.integers(0, 2, size=500) for i in range(40)})
+        df["const"] = 1
+        df["const2"] = 1
+        assert run_checks(DatasetAnalyzer(df), ["duplicate_columns"]) == []
+
+    def test_sparse_flags_not_flagged(self):
+        rng = np.random.default_rng(0)
+        n = 20_000
+        is_fraud = (rng.random(n) < 0.01).astype(int)
+        df = pd.DataFrame(
+            {
+                "is_fraud": is_fraud,
+                "is_chargeback": (rng.random(n) < 0.01).astype(int),
+                "refund_amount": np.where(rng.random(n) < 0.02, rng.gamma(2.0, 10.0, size=n).round(2), 0.0),
+            }
+        )
+        assert run_checks(DatasetAnalyzer(df), ["duplicate_columns"]) == []
+
+        noisy = is_fraud.copy()
+        noisy[rng.choice(np.flatnonzero(is_fraud), size=5, replace=False)] = 0
+        found = _by_column(run_checks(DatasetAnalyzer(df.assign(fraud_label=noisy)), ["duplicate_columns"]))
+        assert found == {
+            "fraud_label": "Column 'fraud_label' matches 'is_fraud' on 97.5% of rows where either is not 0"
+        }
+
+    def test_many_sparse_flags(self):
+        rng = np.random.default_rng(2)
+        n = 10_000
+        df = pd.DataFrame({f"flag_{i}": (rng.random(n) < 0.01).astype(int) for i in range(60)})
+        assert run_checks(DatasetAnalyzer(df), ["duplicate_columns"]) == []
+
+        copies = {}
+        for i in range(5):
+            copy = df["flag_0"].to_numpy().copy()
+            copy[rng.choice(np.flatnonzero(copy), size=2, replace=False)] = 0
+            copies[f"flag_0_v{i}"] = copy
+        found = _by_column(run_checks(DatasetAnalyzer(df.assign(**copies)), ["duplicate_columns"]))
+        assert set(found) == set(copies)
+        assert all("'flag_0'" in description for description in found.values())
+
+    def test_target_copy_left_to_leakage_check(self, joined_df):
+        analyzer = DatasetAnalyzer(joined_df, target_col="user_id_x")
+        issues = run_checks(analyzer, ["duplicate_columns", "data_leakage"])
+        assert [(i.category, i.column) for i in issues if i.column in ("user_id", "user_id_x")] == [
+            ("data_leakage", "user_id")
+        ]
+
+    def test_near_duplicate_ratio_config(self, joined_df):
+        config = replace(DEFAULT_CONFIG, columns=replace(DEFAULT_CONFIG.columns, near_duplicate_ratio=0.99))
+        found = _by_column(run_checks(DatasetAnalyzer(joined_df, config=config), ["duplicate_columns"]))
+        assert "user_id_noisy" not in found
+
+    def test_alerts_grouped_with_duplicates(self, joined_df):
+        issues = DatasetAnalyzer(joined_df, selected_checks=["duplicate_columns"]).analyze()["issues"]
+        assert set(MarkdownReport()._group_alerts_by_type(issues)) == {"Duplicates"}
+
+    def test_parallel_matches_serial(self, joined_df):
+        checks = ["duplicate_columns", "data_leakage", "single_value_columns"]
+        serial = run_checks(DatasetAnalyzer(joined_df), checks)
+        parallel = run_checks(DatasetAnalyzer(joined_df), checks, n_jobs=2)
+        assert [i.description for i in parallel] == [i.description for i in serial]
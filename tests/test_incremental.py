@@ -0,0 +1,161 @@
+"""Tests for incremental re-analysis of appended rows."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hashprep import DatasetAnalyzer
+from hashprep.checks import COUNTED_CHECKS
+from hashprep.core.incremental import DATASET_KEY, AnalysisState, changed_columns
+from hashprep.utils.sampling import SamplingConfig
+
+
+def _make_df(n=24_000):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "value": rng.normal(10, 2, size=n),
+            "city": rng.choice(["a", "b", "c"], size=n, p=[0.5, 0.3, 0.2]),
+            "label": rng.choice([0, 1], size=n, p=[0.7, 0.3]),
+        }
+    )
+    df.loc[df.sample(frac=0.05, random_state=1).index, "value"] = np.nan
+    return df
+
+
+def _issue_keys(issues):
+    return sorted((i["category"], i["column"], i["severity"]) for i in issues)
+
+
+@pytest.fixture
+def df():
+    return _make_df()
+
+
+@pytest.fixture
+def state(df):
+    analyzer = DatasetAnalyzer(df.iloc[:8_000], target_col="label", sampling_config=SamplingConfig(max_rows=2_000))
+    analyzer.analyze()
+    return analyzer.state()
+
+
+class TestAnalysisState:
+    def test_round_trip(self, state, tmp_path):
+        path = tmp_path / "state.pkl"
+        state.save(path)
+        restored = AnalysisState.load(path)
+
+        assert restored.rows == 8_000
+        assert restored.target_col == "label"
+        assert restored.profile.dataset_hash == state.profile.dataset_hash
+        assert set(restored.check_issues) == set(state.check_issues)
+
+    def test_load_rejects_other_pickles(self, tmp_path):
+        path = tmp_path / "other.pkl"
+        pd.to_pickle({"not": "a state"}, path)
+        with pytest.raises(ValueError, match="analysis state"):
+            AnalysisState.load(path)
+
+    def test_state_requires_analysis(self, df):
+        with pytest.raises(RuntimeError, match="analyze"):
+            DatasetAnalyzer(df).state()
+
+
+class TestChangedColumns:
+    @pytest.mark.parametrize(
+        "after, changed",
+        [
+            ({"missing_ratio": 0.105, "mean": 5.01, "std": 2.01}, set()),
+            ({"missing_ratio": 0.13, "mean": 5.0, "std": 2.0}, {"x"}),
+            ({"missing_ratio": 0.10, "mean": 6.0, "std": 2.0}, {"x"}),
+            ({"missing_ratio": 0.10, "mean": 5.0}, {"x"}),
+        ],
+    )
+    def test_tolerance(self, after, changed):
+        before = {"x": {"missing_ratio": 0.10, "mean": 5.0, "std": 2.0}}
+        assert changed_columns(before, {"x": after}, 0.01) == changed
+
+    def test_new_column_counts_as_changed(self):
+        assert changed_columns({}, {"y": {"missing_ratio": 0.0}}, 0.01) == {"y"}
+
+
+class TestUpdate:
+    def test_full_data_counts(self, df, state):
+        summary = DatasetAnalyzer.update(df.iloc[8_000:], state).analyze()
+        summaries = summary["summaries"]
+
+        assert summaries["dataset_info"]["rows"] == len(df)
+        assert summaries["missing_values"]["count"]["value"] == int(df["value"].isna().sum())
+        assert summaries["variables"]["value"]["mean"] == pytest.approx(df["value"].mean())
+        assert summaries["incremental_info"]["previous_rows"] == 8_000
+        assert summaries["incremental_info"]["new_rows"] == 16_000
+
+    def test_unchanged_data_reuses_uncounted_checks(self, df, state):
+        previous_issues = [vars(issue) for issues in state.check_issues.values() for issue in issues]
+        analyzer = DatasetAnalyzer.update(df.iloc[8_000:9_000], state)
+        info = analyzer.analyze()["summaries"]["incremental_info"]
+
+        assert info["changed_columns"] == []
+        assert set(info["rerun_checks"]) <= COUNTED_CHECKS
+        assert "low_mutual_information" in info["reused_checks"]
+        assert _issue_keys([vars(issue) for issue in analyzer.issues]) == _issue_keys(previous_issues)
+
+    def test_reused_issues_agree_with_summaries(self, df, state):
+        previous = next(issue for issue in state.check_issues["duplicates"])
+        summary = DatasetAnalyzer.update(df.iloc[8_000:9_000], state).analyze()
+        duplicates = next(issue for issue in summary["issues"] if issue["category"] == "duplicates")
+        rows = summary["summaries"]["dataset_info"]["duplicate_rows"]
+
+        assert summary["summaries"]["incremental_info"]["changed_columns"] == []
+        assert duplicates["description"].startswith(f"Dataset contains {rows} duplicate rows")
+        assert duplicates["description"] != previous.description
+
+    def test_changed_column_is_rechecked(self, df, state):
+        appended = df.iloc[8_000:10_000].copy()
+        appended["value"] = np.nan
+        summary = DatasetAnalyzer.update(appended, state).analyze()
+        info = summary["summaries"]["incremental_info"]
+
+        assert info["changed_columns"] == ["value"]
+        assert "high_missing_values" in info["rerun_checks"]
+        assert summary["summaries"]["missing_values"]["count"]["value"] == int(
+            df["value"].iloc[:8_000].isna().sum() + len(appended)
+        )
+
+    def test_issues_follow_changed_column(self, df, state):
+        assert ("unique_values", "value", "warning") in _issue_keys(
+            [vars(issue) for issues in state.check_issues.values() for issue in issues]
+        )
+        appended = df.iloc[8_000:].copy()
+        appended["value"] = 0.0
+        issues = _issue_keys(DatasetAnalyzer.update(appended, state).analyze()["issues"])
+
+        assert ("high_zero_counts", "value", "warning") in issues
+        assert ("unique_values", "value", "warning") not in issues
+        assert ("constant_length", "city", "warning") in issues
+
+    def test_new_rows_as_chunks(self, df, state):
+        chunks = (df.iloc[start : start + 4_000] for start in range(8_000, len(df), 4_000))
+        summary = DatasetAnalyzer.update(chunks, state).analyze()
+
+        assert summary["summaries"]["dataset_info"]["rows"] == len(df)
+        # One chunk for the initial in-memory frame, then the four appended ones
+        assert summary["summaries"]["streaming_info"]["chunks"] == 5
+
+    def test_changed_settings_rerun_everything(self, df, state):
+        info = DatasetAnalyzer.update(df.iloc[8_000:], state, target_col=None).analyze()["summaries"][
+            "incremental_info"
+        ]
+
+        assert info["dataset_changed"] is True
+        assert info["reused_checks"] == []
+
+    def test_chained_updates(self, df, state):
+        first = DatasetAnalyzer.update(df.iloc[8_000:16_000], state)
+        first.analyze()
+        second = DatasetAnalyzer.update(df.iloc[16_000:], first.state())
+        summaries = second.analyze()["summaries"]
+
+        assert summaries["dataset_info"]["rows"] == len(df)
+        assert summaries["incremental_info"]["previous_rows"] == 16_000
+        assert DATASET_KEY not in summaries["incremental_info"]["changed_columns"]
@@ -0,0 +1,68 @@
+"""Tests for streaming issues as checks finish."""
+
+import pytest
+
+from hashprep import DatasetAnalyzer
+from hashprep.checks import CHECK_COSTS, check_tasks
+
+
+@pytest.fixture
+def df(make_frame):
+    return make_frame(1_000, "mostly_missing", "zeros")
+
+
+def _keys(issues):
+    return sorted((i.category, i.column, i.severity, i.description) for i in issues)
+
+
+class TestIterIssues:
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    def test_matches_analyze(self, df, n_jobs):
+        expected = DatasetAnalyzer(df, target_col="label").analyze()
+        analyzer = DatasetAnalyzer(df, target_col="label", n_jobs=n_jobs)
+        streamed = list(analyzer.iter_issues())
+
+        assert _keys(streamed) == sorted(
+            (i["category"], i["column"], i["severity"], i["description"]) for i in expected["issues"]
+        )
+        assert [issue.category for issue in analyzer.issues] == [i["category"] for i in expected["issues"]]
+        assert analyzer.summaries == {}
+
+    def test_close_early(self, df):
+        analyzer = DatasetAnalyzer(df, n_jobs=2)
+        issues = analyzer.iter_issues()
+        first = next(issues)
+        issues.close()
+
+        assert first.severity in ("critical", "warning")
+
+
+class TestCallbacks:
+    def test_cheap_checks_run_first(self, df):
+        progress = []
+        DatasetAnalyzer(df, target_col="label").analyze(on_progress=lambda *args: progress.append(args))
+
+        names = [name for name, _, _ in progress]
+        costs = [CHECK_COSTS.get(name, 1) for name in names]
+        assert costs == sorted(costs)
+        assert sorted(names) == sorted(name for name, _ in check_tasks(DatasetAnalyzer.ALL_CHECKS))
+        assert [done for _, done, _ in progress] == list(range(1, len(names) + 1))
+
+    def test_on_issue_sees_every_issue(self, df):
+        seen = []
+        summary = DatasetAnalyzer(df, target_col="label", n_jobs=2).analyze(on_issue=seen.append)
+
+        assert len(seen) == summary["total_issues"]
+        assert {i.category for i in seen} == {i["category"] for i in summary["issues"]}
+
+    def test_replayed_on_cache_hit(self, df, tmp_path):
+        DatasetAnalyzer(df, cache=tmp_path).analyze()
+        seen = []
+        summary = DatasetAnalyzer(df, cache=tmp_path).analyze(on_issue=seen.append)
+
+        assert summary["summaries"]["reproduction_info"]["result_cache"]["hit"] is True
+        assert len(seen) == summary["total_issues"]
+
+    def test_rejects_time_budget(self, df):
+        with pytest.raises(ValueError, match="time_budget_s"):
+            DatasetAnalyzer(df).analyze(time_budget_s=10, on_issue=print)
@@ -0,0 +1,81 @@
+"""Tests for shared deep memory accounting."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hashprep import DatasetAnalyzer
+from hashprep.summaries import summarize_dataset_info, summarize_variables
+from hashprep.utils.column_cache import ColumnProfileCache
+from hashprep.utils.memory import column_memory, memory_usage
+from hashprep.utils.sampling import DatasetSampler, SamplingConfig
+
+
+@pytest.fixture
+def text_df():
+    rng = np.random.default_rng(0)
+    n = 200_000
+    words = np.array(["a", "short text", "x" * 300, "ünïcode résumé"], dtype=object)
+    df = pd.DataFrame(
+        {
+            "text": words[rng.integers(0, len(words), n)],
+            "id": [f"user_{i}" for i in range(n)],
+            "value": rng.normal(size=n),
+            "level": pd.Categorical(rng.choice(["low", "high"], n)),
+        }
+    )
+    df.loc[::9, "text"] = None
+    return df
+
+
+class TestMemoryUsage:
+    def test_small_frames_are_exact(self):
+        df = pd.DataFrame(
+            {"s": ["a", "bb", None] * 100, "n": range(300), "p": pd.array(["x", None, "zz"] * 100, dtype="string")},
+            index=[f"r{i}" for i in range(300)],
+        )
+        usage = memory_usage(df)
+        expected = df.memory_usage(deep=True)
+        assert usage.exact and usage.relative_error == 0.0
+        assert usage.columns == {col: int(expected[col]) for col in df.columns}
+        assert usage.total == int(expected.sum())
+
+    def test_estimate_within_stated_error(self, text_df):
+        usage = memory_usage(text_df, sample_rows=5_000)
+        exact = int(text_df.memory_usage(deep=True).sum())
+        assert not usage.exact and 0 < usage.relative_error < 0.05
+        assert abs(usage.total - exact) / exact <= usage.relative_error
+        assert usage.columns["value"] == text_df["value"].memory_usage(index=False, deep=True)
+
+    def test_column_estimate_does_not_depend_on_frame(self, text_df):
+        usage = memory_usage(text_df, sample_rows=5_000)
+        column = text_df["text"].reset_index(drop=True)
+        assert column_memory(column, sample_rows=5_000) == usage.columns["text"]
+
+
+class TestSharedMeasurement:
+    def test_summaries_share_one_measurement(self, text_df):
+        cache = ColumnProfileCache(text_df)
+        info = summarize_dataset_info(text_df, column_cache=cache)["dataset_info"]
+        variables = summarize_variables(text_df, column_cache=cache)
+        usage = cache.memory_usage()
+
+        assert info["memory_bytes"] == usage.total
+        assert info["memory_relative_error"] == round(usage.relative_error, 4)
+        assert variables["text"]["memory_size"] == usage.columns["text"] + usage.index
+        assert cache.memory_usage() is usage
+
+    def test_sampler_measurement_reused_by_analyzer(self):
+        df = pd.DataFrame({"s": ["abc", "de"] * 500})
+        analyzer = DatasetAnalyzer(df, sampling_config=SamplingConfig(max_rows=5_000))
+        assert analyzer.column_cache.memory_usage() is analyzer.sampler.memory_usage
+
+    def test_row_threshold_skips_measurement(self, text_df):
+        sampler = DatasetSampler(SamplingConfig(max_rows=1_000))
+        assert sampler.should_sample(text_df)
+        assert sampler.memory_usage is None
+
+    def test_memory_threshold(self, text_df):
+        sampler = DatasetSampler(SamplingConfig(max_rows=1_000_000, memory_threshold_mb=1))
+        assert sampler.should_sample(text_df)
+        assert sampler.memory_usage.total > 1024**2
@@ -0,0 +1,61 @@
+"""Tests for per-summary and per-check timing instrumentation."""
+
+import pytest
+
+from hashprep import DatasetAnalyzer
+from hashprep.checks import check_tasks
+from hashprep.utils.profiling import measure, sort_by_cost
+
+
+@pytest.fixture
+def df(make_frame):
+    return make_frame(2_000)
+
+
+def _timings(summary):
+    return summary["summaries"]["reproduction_info"]["timings"]
+
+
+class TestMeasure:
+    def test_records_block(self):
+        records = []
+        with measure(records, "step", "summary", (10, 2)):
+            sum(range(10_000))
+
+        (timing,) = records
+        assert timing.name == "step"
+        assert (timing.rows, timing.columns) == (10, 2)
+        assert timing.wall_seconds >= 0 and timing.cpu_seconds >= 0
+        assert timing.memory_peak_bytes is None
+
+    def test_sort_by_cost(self):
+        timings = [{"wall_seconds": w, "cpu_seconds": 0.0} for w in (0.1, 0.5, 0.2)]
+        assert [t["wall_seconds"] for t in sort_by_cost(timings)] == [0.5, 0.2, 0.1]
+
+
+class TestAnalyzerTimings:
+    def test_every_check_and_summary_is_timed(self, df):
+        summary = DatasetAnalyzer(df, target_col="label").analyze()
+        timings = _timings(summary)
+        checks = [t["name"] for t in timings if t["kind"] == "check"]
+        summaries = {t["name"] for t in timings if t["kind"] == "summary"}
+
+        assert checks == [name for name, _ in check_tasks(DatasetAnalyzer.ALL_CHECKS)]
+        assert {"variables", "interactions", "missing_values", "mutual_information"} <= summaries
+        assert all((t["rows"], t["columns"]) == df.shape for t in timings)
+        assert all(t["memory_peak_bytes"] is None for t in timings)
+
+    def test_profile_memory(self, df):
+        timings = _timings(DatasetAnalyzer(df, selected_checks=["outliers"], profile_memory=True).analyze())
+
+        assert all(t["memory_peak_bytes"] is not None for t in timings)
+        assert max(t["memory_peak_bytes"] for t in timings) > 0
+
+    @pytest.mark.parametrize("backend", ["thread", "process"])
+    def test_parallel_checks_are_timed(self, df, backend):
+        checks = ["outliers", "high_cardinality", "duplicates"]
+        analyzer = DatasetAnalyzer(df, selected_checks=checks, n_jobs=2, parallel_backend=backend)
+        timings = _timings(analyzer.analyze())
+
+        assert [t["name"] for t in timings if t["kind"] == "check" and t["name"] in checks] == checks
+        assert "warm_column_cache" in {t["name"] for t in timings}
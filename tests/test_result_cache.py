@@ -0,0 +1,134 @@
+"""Tests for the on-disk analysis result cache."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hashprep import DatasetAnalyzer, HashPrepConfig
+from hashprep.config import ColumnThresholds
+from hashprep.utils.result_cache import ResultCache, cache_key
+from hashprep.utils.sampling import SamplingConfig
+
+
+@pytest.fixture
+def df(make_frame):
+    return make_frame(300)
+
+
+def _cache_info(summary):
+    return summary["summaries"]["reproduction_info"]["result_cache"]
+
+
+class TestResultCache:
+    def test_round_trip_and_miss(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        assert cache.get("missing") is None
+
+        cache.put("k", {"a": [1, 2]})
+        assert cache.get("k") == {"a": [1, 2]}
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ResultCache(tmp_path, max_bytes=3_500)
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.put(key, b"x" * 1_000)
+            os.utime(tmp_path / f"{key}.pkl", (i, i))
+
+        cache.get("a")  # touching "a" makes "b" the least recently used
+        cache.put("d", b"x" * 1_000)
+
+        assert cache.get("b") is None
+        assert all(cache.get(key) is not None for key in ["a", "c", "d"])
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        (tmp_path / "bad.pkl").write_bytes(b"not a pickle")
+
+        assert cache.get("bad") is None
+        assert not (tmp_path / "bad.pkl").exists()
+
+    def test_key_covers_dataclass_fields(self):
+        assert cache_key(config=HashPrepConfig()) == cache_key(config=HashPrepConfig())
+        assert cache_key(config=HashPrepConfig()) != cache_key(
+            config=HashPrepConfig(columns=ColumnThresholds(high_cardinality_count=5))
+        )
+
+
+class TestAnalyzerCache:
+    def test_second_run_is_a_hit(self, df, tmp_path):
+        first = DatasetAnalyzer(df, target_col="label", cache=tmp_path).analyze()
+        analyzer = DatasetAnalyzer(df.copy(), target_col="label", cache=tmp_path)
+        second = analyzer.analyze()
+
+        assert _cache_info(first)["hit"] is False
+        assert _cache_info(second)["hit"] is True
+        assert second["issues"] == first["issues"]
+        assert second["summaries"]["variables"] == first["summaries"]["variables"]
+        assert analyzer.issues and analyzer.check_issues
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"target_col": "city"},
+            {"selected_checks": ["outliers"]},
+            {"config": HashPrepConfig(columns=ColumnThresholds(high_cardinality_count=5))},
+            {"include_plots": True},
+        ],
+    )
+    def test_options_change_the_key(self, df, tmp_path, change):
+        DatasetAnalyzer(df, target_col="label", cache=tmp_path).analyze()
+        summary = DatasetAnalyzer(df, **{"target_col": "label", **change}, cache=tmp_path).analyze()
+
+        assert _cache_info(summary)["hit"] is False
+
+    def test_data_change_is_a_miss(self, df, tmp_path):
+        DatasetAnalyzer(df, cache=tmp_path).analyze()
+        changed = df.copy()
+        changed.loc[0, "value"] = 100.0
+
+        assert _cache_info(DatasetAnalyzer(changed, cache=tmp_path).analyze())["hit"] is False
+
+    def test_file_change_outside_the_sample_is_a_miss(self, tmp_path):
+        path = tmp_path / "data.csv"
+        pd.DataFrame({"x": np.random.default_rng(0).normal(size=20_000)}).to_csv(path, index=False)
+
+        def scan():
+            return DatasetAnalyzer.from_file(
+                str(path), sampling_config=SamplingConfig(max_rows=1_000), sketches=True, cache=tmp_path / "cache"
+            ).analyze()
+
+        scan()
+        with open(path, "a") as f:
+            f.write("1000000.0\n")
+        summary = scan()
+
+        assert _cache_info(summary)["hit"] is False
+        assert summary["summaries"]["variables"]["x"]["statistics"]["quantiles"]["maximum"] == 1e6
+        assert _cache_info(scan())["hit"] is True
+
+    def test_tiering_changes_the_key(self, tmp_path):
+        big = pd.DataFrame({"value": np.random.default_rng(0).normal(size=20_000)})
+        sampling = SamplingConfig(max_rows=1_000)
+        DatasetAnalyzer(big, sampling_config=sampling, cache=tmp_path).analyze()
+        summary = DatasetAnalyzer(big, sampling_config=sampling, tiered=False, cache=tmp_path).analyze()
+
+        assert _cache_info(summary)["hit"] is False
+        assert summary["summaries"]["dataset_info"]["rows"] == 1_000
+
+    def test_budgeted_run_is_not_reused_by_plain_run(self, tmp_path):
+        big = pd.DataFrame({"value": np.random.default_rng(0).normal(size=20_000)})
+        sampling = SamplingConfig(max_rows=1_000)
+        budgeted = DatasetAnalyzer(big, sampling_config=sampling, cache=tmp_path).analyze(time_budget_s=600)
+        plain = DatasetAnalyzer(big, sampling_config=sampling, cache=tmp_path).analyze()
+        again = DatasetAnalyzer(big, sampling_config=sampling, cache=tmp_path).analyze(time_budget_s=600)
+
+        assert budgeted["summaries"]["anytime_info"]["complete"]
+        assert _cache_info(plain)["hit"] is False
+        assert plain["summaries"]["dataset_info"]["rows"] == 20_000
+        assert "anytime_info" not in plain["summaries"]
+        assert _cache_info(again)["hit"] is True
+
+    def test_without_cache(self, df):
+        summary = DatasetAnalyzer(df).analyze()
+        assert "result_cache" not in summary["summaries"]["reproduction_info"]
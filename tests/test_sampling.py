@@ -1,8 +1,11 @@
 """Tests for dataset sampling module."""
 
+import numpy as np
 import pandas as pd
+import pytest
 
-from hashprep.utils.sampling import DatasetSampler, SamplingConfig
+from hashprep import DatasetAnalyzer
+from hashprep.utils.sampling import DatasetSampler, SamplingConfig, standard_errors
 
 
 class TestSampler:
@@ -70,6 +73,38 @@ class TestSampler:
         sampled_prop = result["label"].value_counts(normalize=True)["A"]
         assert abs(original_prop - sampled_prop) < 0.15
 
+    def test_stratified_sampling_on_several_columns(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "region": rng.choice(["north", "south", None], p=[0.7, 0.29, 0.01], size=50_000),
+                "segment": rng.choice(["retail", "business"], p=[0.9, 0.1], size=50_000),
+            }
+        )
+        config = SamplingConfig(max_rows=1_000, sample_method="stratified", stratify_column=["region", "segment"])
+        result = DatasetSampler(config).sample(df)
+
+        assert len(result) == 1_000 and result.index.is_unique
+        expected = df.fillna("none").value_counts(normalize=True) * 1_000
+        observed = result.fillna("none").value_counts()
+        assert set(observed.index) == set(expected.index)
+        assert ((observed - expected.astype(int)).reindex(expected.index) >= 0).all()
+
+    def test_stratified_min_per_stratum(self):
+        df = pd.DataFrame({"user": np.repeat(np.arange(5_000), 4), "x": np.arange(20_000)})
+        config = SamplingConfig(max_rows=1_000, sample_method="stratified", stratify_column="user", min_per_stratum=2)
+        result = DatasetSampler(config).sample(df)
+
+        # Two rows of every user, even though that exceeds max_rows
+        assert len(result) == 10_000
+        assert (result["user"].value_counts() == 2).all()
+        assert result["user"].nunique() == 5_000
+
+    def test_stratified_sampling_is_reproducible(self):
+        df = pd.DataFrame({"label": ["A"] * 900 + ["B"] * 100, "x": range(1_000)})
+        config = SamplingConfig(max_rows=100, sample_method="stratified", stratify_column="label")
+        assert DatasetSampler(config).sample(df).index.equals(DatasetSampler(config).sample(df).index)
+
     def test_sampling_info_metadata(self):
         df = pd.DataFrame({"col": range(10000)})
         config = SamplingConfig(max_rows=1000)
@@ -107,3 +142,159 @@ class TestSampler:
         sampler = DatasetSampler(config)
 
         assert not sampler.should_sample(df)
+
+
+class TestSampleFile:
+    @staticmethod
+    def _write(tmp_path, n=20_000):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(
+            {
+                "x": np.arange(n),
+                "label": rng.choice(["a", "b", "c", "rare"], p=[0.6, 0.3, 0.0995, 0.0005], size=n),
+            }
+        )
+        path = tmp_path / "data.csv"
+        df.to_csv(path, index=False)
+        return df, str(path)
+
+    def _sample(self, path, chunksize=1_500, **config):
+        sampler = DatasetSampler(SamplingConfig(max_rows=1_000, stratify_column="label", **config))
+        return sampler, sampler.sample_file(path, chunksize=chunksize)
+
+    def test_rows_keep_file_positions(self, tmp_path):
+        df, path = self._write(tmp_path)
+        for method in ("random", "stratified", "systematic", "head"):
+            sampler, sample = self._sample(path, sample_method=method)
+            assert sample.index.is_monotonic_increasing and sample.index.is_unique
+            assert (sample["x"] == sample.index).all()
+            assert (sample["label"] == df.loc[sample.index, "label"]).all()
+            assert sampler.was_sampled
+            assert sampler.original_shape == (20_000, 2)
+            assert sampler.sample_fraction == len(sample) / 20_000
+
+    def test_random_is_uniform_and_reproducible(self, tmp_path):
+        _, path = self._write(tmp_path)
+        _, sample = self._sample(path)
+        assert len(sample) == 1_000
+        assert 8_000 < sample["x"].mean() < 12_000
+        _, again = self._sample(path, chunksize=7_000)
+        assert sample.index.equals(again.index)
+
+    def test_stratified_keeps_every_level(self, tmp_path):
+        df, path = self._write(tmp_path)
+        _, sample = self._sample(path, sample_method="stratified")
+        counts = sample["label"].value_counts()
+        assert len(sample) == 1_000
+        assert set(counts.index) == set(df["label"])
+        assert abs(counts["a"] / 1_000 - (df["label"] == "a").mean()) < 0.05
+
+    def test_stratified_min_per_stratum(self, tmp_path):
+        df, path = self._write(tmp_path)
+        _, sample = self._sample(path, sample_method="stratified", min_per_stratum=5)
+        assert (sample["label"].value_counts() >= 5).all()
+        assert (sample["label"] == "rare").sum() == min(5, (df["label"] == "rare").sum())
+
+    def test_systematic_and_head(self, tmp_path):
+        _, path = self._write(tmp_path)
+        _, sample = self._sample(path, sample_method="systematic")
+        steps = np.diff(sample.index)
+        assert 500 <= len(sample) <= 1_000 and (steps == steps[0]).all()
+        _, sample = self._sample(path, sample_method="head")
+        assert list(sample.index) == list(range(1_000))
+
+    def test_small_file_matches_in_memory_sampling(self, tmp_path):
+        df, path = self._write(tmp_path, n=800)
+        sampler, sample = self._sample(path)
+        assert not sampler.was_sampled
+        pd.testing.assert_frame_equal(sample, df)
+
+    def test_disabled_reads_everything(self, tmp_path):
+        df, path = self._write(tmp_path)
+        sampler, sample = DatasetSampler.from_file(path, SamplingConfig(max_rows=10, enabled=False), chunksize=3_000)
+        assert not sampler.was_sampled
+        pd.testing.assert_frame_equal(sample, df)
+
+    def test_analyzer_from_file(self, tmp_path):
+        _, path = self._write(tmp_path)
+        analyzer = DatasetAnalyzer.from_file(
+            path, sampling_config=SamplingConfig(max_rows=1_000), chunksize=3_000, sketches=True
+        )
+        summary = analyzer.analyze()
+        assert summary["sampling_info"]["original_rows"] == 20_000
+        assert len(analyzer.df) == 1_000
+        assert analyzer.column_sketches["x"].count == 20_000
+        assert sum(summary["summaries"]["variables"]["x"]["histogram"]["counts"]) == 20_000
+
+
+class TestAdaptiveSampling:
+    @staticmethod
+    def _frame(n=200_000, **columns):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({"x": rng.normal(size=n), "c": rng.choice(["a", "b"], size=n)})
+        return df.assign(**{name: make(rng, n) for name, make in columns.items()})
+
+    def _sample(self, df, **config):
+        sampler = DatasetSampler(SamplingConfig(adaptive=True, **config))
+        return sampler, sampler.sample(df)
+
+    def test_simple_table_stops_at_first_stage(self):
+        sampler, sample = self._sample(self._frame())
+        info = sampler.get_sampling_info()
+        assert len(sample) == 10_000
+        assert info["adaptive"]["converged"] and info["adaptive"]["rows"] == 10_000
+        assert info["sample_fraction"] == 0.05
+        assert all(error <= 0.02 for error in info["adaptive"]["errors"].values())
+
+    def test_rare_category_grows_sample(self):
+        df = self._frame(c=lambda rng, n: rng.choice(["a", "b", "rare"], p=[0.6, 0.399, 0.001], size=n))
+        sampler, sample = self._sample(df)
+        stages = sampler.adaptive_info["stages"]
+        assert len(stages) > 1 and stages[-1]["converged"]
+        assert stages[0]["errors"]["rare_category_frequency"] > 0.25 >= stages[-1]["errors"]["rare_category_frequency"]
+        assert len(sample) == stages[-1]["rows"] and (sample["c"] == "rare").sum() >= 16
+
+    def test_heavy_tails_grow_sample(self):
+        df = self._frame(x=lambda rng, n: rng.lognormal(sigma=2, size=n))
+        sampler, _ = self._sample(df)
+        stages = sampler.adaptive_info["stages"]
+        assert len(stages) > 1 and stages[-1]["converged"]
+        assert stages[0]["errors"]["quantile"] > 0.02 >= stages[-1]["errors"]["quantile"]
+
+    def test_cap_reports_unconverged(self):
+        df = self._frame(c=lambda rng, n: rng.choice(["a", "b", "rare"], p=[0.6, 0.399, 0.001], size=n))
+        sampler, sample = self._sample(df, adaptive_min_rows=1_000, adaptive_max_rows=4_000)
+        assert len(sample) == 4_000
+        assert not sampler.adaptive_info["converged"]
+
+    def test_small_table_not_sampled(self):
+        sampler, sample = self._sample(self._frame(n=5_000))
+        assert len(sample) == 5_000 and not sampler.was_sampled
+        assert "adaptive" not in sampler.get_sampling_info()
+
+    def test_stratified_uses_chosen_size(self):
+        df = self._frame(c=lambda rng, n: rng.choice(["a", "b", "rare"], p=[0.6, 0.399, 0.001], size=n))
+        sampler, sample = self._sample(df, sample_method="stratified", stratify_column="c")
+        rows = sampler.adaptive_info["rows"]
+        assert rows > 10_000 and len(sample) == rows
+        assert (sample["c"] == "rare").sum() == int((df["c"] == "rare").mean() * rows)
+
+    def test_from_file(self, tmp_path):
+        df = self._frame(n=50_000, c=lambda rng, n: rng.choice(["a", "b", "rare"], p=[0.6, 0.399, 0.001], size=n))
+        path = tmp_path / "data.csv"
+        df.to_csv(path, index=False)
+        sampler, sample = DatasetSampler.from_file(
+            str(path), SamplingConfig(adaptive=True, adaptive_max_rows=30_000), chunksize=7_000
+        )
+        assert len(sample) == 20_000 and sample.index.is_monotonic_increasing
+        assert sampler.original_shape == (50_000, 2)
+        assert sampler.sample_fraction == 0.4
+
+    def test_standard_errors(self):
+        df = pd.DataFrame({"x": [1.0, 2.0, None, 4.0] * 250, "flag": [True, False] * 500})
+        errors = standard_errors(df)
+        assert errors["missing_rate"] == pytest.approx(np.sqrt(0.25 * 0.75 / 1_000))
+        # x has three levels among 750 present values, so it outweighs the boolean
+        assert errors["category_frequency"] == pytest.approx(np.sqrt(2 / 9 / 750))
+        assert set(errors) == {"missing_rate", "mean", "quantile", "category_frequency", "rare_category_frequency"}
+        assert standard_errors(df.iloc[:1]) == {}
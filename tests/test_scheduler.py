@@ -0,0 +1,69 @@
+"""Tests for the dependency-aware parallel check scheduler."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hashprep import DatasetAnalyzer
+from hashprep.checks import CHECK_REQUIREMENTS, CHECKS, run_checks
+from hashprep.checks.scheduler import RESOURCES
+from hashprep.utils.parallel import resolve_n_jobs
+
+
+@pytest.fixture
+def mixed_df():
+    rng = np.random.default_rng(0)
+    n = 300
+    return pd.DataFrame(
+        {
+            "a": rng.normal(size=n),
+            "b": rng.exponential(size=n),
+            "c": np.where(rng.random(n) < 0.5, np.nan, rng.normal(size=n)),
+            "cat": rng.choice(["x", "y", "z"], size=n),
+            "text": [f"row {i} text" for i in range(n)],
+            "target": rng.integers(0, 2, size=n),
+        }
+    )
+
+
+def _issue_tuples(issues):
+    return [(i.category, i.column, i.description) for i in issues]
+
+
+class TestCheckRequirements:
+    def test_every_check_declares_requirements(self):
+        assert set(CHECKS) <= set(CHECK_REQUIREMENTS)
+
+    def test_requirements_reference_known_resources(self):
+        for name, requirements in CHECK_REQUIREMENTS.items():
+            assert requirements <= set(RESOURCES), name
+
+
+class TestScheduler:
+    @pytest.mark.parametrize("backend", ["thread", "process"])
+    def test_parallel_matches_serial_order(self, mixed_df, backend):
+        serial = DatasetAnalyzer(mixed_df, target_col="target", auto_sample=False)
+        parallel = DatasetAnalyzer(mixed_df, target_col="target", auto_sample=False, n_jobs=4, parallel_backend=backend)
+
+        serial_issues = run_checks(serial, DatasetAnalyzer.ALL_CHECKS)
+        parallel_issues = run_checks(parallel, DatasetAnalyzer.ALL_CHECKS, n_jobs=4, backend=backend)
+
+        assert _issue_tuples(parallel_issues) == _issue_tuples(serial_issues)
+
+    def test_analyze_with_n_jobs(self, mixed_df):
+        serial = DatasetAnalyzer(mixed_df, target_col="target", auto_sample=False).analyze()
+        parallel = DatasetAnalyzer(mixed_df, target_col="target", auto_sample=False, n_jobs=-1).analyze()
+
+        assert parallel["issues"] == serial["issues"]
+
+    def test_invalid_n_jobs(self, mixed_df):
+        with pytest.raises(ValueError, match="n_jobs"):
+            DatasetAnalyzer(mixed_df, n_jobs=0)
+
+    def test_invalid_backend(self, mixed_df):
+        with pytest.raises(ValueError, match="parallel_backend"):
+            DatasetAnalyzer(mixed_df, parallel_backend="gpu")
+
+    def test_resolve_all_cores(self):
+        assert resolve_n_jobs(-1) >= 1
+        assert resolve_n_jobs(3) == 3
@@ -0,0 +1,150 @@
+"""Tests for saved schemas: export, reading with schema dtypes, reused types and mismatch issues."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hashprep import DatasetAnalyzer
+from hashprep.checks import run_checks
+from hashprep.utils import type_inference
+from hashprep.utils.io import read_dataset
+from hashprep.utils.schema import ColumnSchema, Schema
+from hashprep.utils.type_inference import infer_types
+
+
+@pytest.fixture
+def feed():
+    rng = np.random.default_rng(0)
+    n = 500
+    return pd.DataFrame(
+        {
+            "id": np.arange(n),
+            "amount": rng.gamma(2.0, 10.0, size=n),
+            "segment": rng.choice(["a", "b", "c"], size=n),
+            "day": [f"03/{d:02d}/2021" for d in rng.integers(1, 29, size=n)],
+            "note": [f"free text {i}" for i in range(n)],
+        }
+    )
+
+
+def _descriptions(analyzer):
+    return [issue.description for issue in run_checks(analyzer, ["schema_mismatch"])]
+
+
+class TestSchema:
+    def test_infer_records_types_levels_and_formats(self, feed):
+        schema = Schema.infer(feed)
+
+        assert schema.columns["segment"] == ColumnSchema("Categorical", "object", ("a", "b", "c"), None)
+        assert schema.columns["day"].semantic_type == "DateTime"
+        assert schema.columns["day"].datetime_format == "%m/%d/%Y"
+        assert schema.columns["id"] == ColumnSchema("Numeric", "int64")
+
+    def test_save_load_round_trip(self, feed, tmp_path):
+        schema = Schema.infer(feed)
+        schema.save(tmp_path / "schema.json")
+        assert Schema.load(tmp_path / "schema.json") == schema
+
+    def test_unknown_version_rejected(self):
+        with pytest.raises(ValueError, match="schema version"):
+            Schema.from_dict({"version": 99, "columns": {}})
+
+    def test_read_options_fix_string_columns(self, feed, tmp_path):
+        path = tmp_path / "feed.csv"
+        feed.to_csv(path, index=False)
+        df = read_dataset(str(path), Schema.infer(feed).read_options())
+
+        assert isinstance(df["segment"].dtype, pd.CategoricalDtype)
+        assert df["note"].dtype == object and df["day"].dtype == object
+        assert df["id"].dtype == np.int64
+
+    def test_analyzer_skips_inference(self, feed, tmp_path, monkeypatch):
+        schema = Schema.infer(feed)
+        path = tmp_path / "feed.csv"
+        feed.to_csv(path, index=False)
+        df = read_dataset(str(path), schema.read_options())
+        calls = []
+        monkeypatch.setattr("hashprep.core.analyzer.infer_types", lambda df, **kw: calls.append(list(df.columns)) or {})
+
+        analyzer = DatasetAnalyzer(df, schema=schema)
+        assert calls == []
+        assert analyzer.column_types == infer_types(feed)
+        assert analyzer.column_cache.datetime_format("day") == "%m/%d/%Y"
+        assert _descriptions(analyzer) == []
+
+    def test_changed_dtype_falls_back_to_inference(self, feed):
+        schema = Schema.infer(feed)
+        changed = feed.assign(amount=["n/a"] + feed["amount"].astype(str).tolist()[1:])
+        analyzer = DatasetAnalyzer(changed, schema=schema)
+
+        assert analyzer.column_types["amount"] == type_inference.infer_types(changed[["amount"]])["amount"]
+        assert "Column 'amount' is now object (text), the schema has float64 (Numeric)" in _descriptions(analyzer)
+
+    def test_mismatches_reported(self, feed):
+        schema = Schema.infer(feed)
+        changed = feed.drop(columns=["note"]).assign(extra=1.0)
+        changed["id"] = changed["id"].astype(float)
+        changed.loc[0, "segment"] = "d"
+        changed["day"] = changed["day"].str.replace("/", "-")
+
+        found = _descriptions(DatasetAnalyzer(changed, schema=schema))
+        assert found == [
+            "Column 'note' from the schema is missing",
+            "Column 'id' is now float64, the schema has int64",
+            "Column 'segment' has 1 level(s) not in the schema: 'd'",
+            "Column 'day': only 0.0% of values parse with the schema's datetime format '%m/%d/%Y'",
+            "Column 'extra' is not in the schema",
+        ]
+
+    def test_int_levels_survive_missing_values(self, feed):
+        rated = feed.assign(rating=np.resize([1, 2, 3], len(feed)))
+        schema = Schema.infer(rated)
+        assert schema.columns["rating"].levels == ("1", "2", "3")
+
+        rated.loc[0, "rating"] = np.nan
+        rated.loc[1, "rating"] = 4
+        assert _descriptions(DatasetAnalyzer(rated, schema=schema)) == [
+            "Column 'rating' is now float64, the schema has int64",
+            "Column 'rating' has 1 level(s) not in the schema: '4'",
+        ]
+
+    def test_parsed_datetimes_accepted(self, feed):
+        schema = Schema.infer(feed)
+        parsed = feed.assign(day=pd.to_datetime(feed["day"], format="%m/%d/%Y"))
+        analyzer = DatasetAnalyzer(parsed, schema=schema)
+        assert analyzer.column_types["day"] == "DateTime"
+        assert _descriptions(analyzer) == []
+
+    def test_no_schema_no_issues(self, feed):
+        assert _descriptions(DatasetAnalyzer(feed)) == []
+
+    def test_same_issues_as_without_schema(self, feed, tmp_path):
+        rng = np.random.default_rng(1)
+        label = rng.integers(0, 2, size=len(feed))
+        feed = feed.assign(
+            label=np.where(label == 1, "yes", "no"),
+            outcome=np.where(label == 1, "won", "lost"),
+            code=rng.choice(["AB1", "CD2", "EF3"], size=len(feed)),
+        )
+        path = tmp_path / "feed.csv"
+        feed.to_csv(path, index=False)
+        schema = Schema.infer(feed)
+
+        plain = DatasetAnalyzer(read_dataset(str(path)), target_col="label").analyze()
+        with_schema = DatasetAnalyzer(
+            read_dataset(str(path), schema.read_options()), target_col="label", schema=schema
+        ).analyze()
+
+        def keys(summary):
+            return sorted((i["category"], str(i["column"]), i["description"]) for i in summary["issues"])
+
+        assert {"target_leakage", "constant_length"} <= {i["category"] for i in plain["issues"]}
+        assert keys(with_schema) == keys(plain)
+
+    def test_from_file_reads_with_schema(self, feed, tmp_path):
+        path = tmp_path / "feed.csv"
+        feed.to_csv(path, index=False)
+        schema = Schema.infer(feed)
+        analyzer = DatasetAnalyzer.from_file(str(path), schema=schema)
+        assert analyzer.schema is schema
+        assert isinstance(analyzer.df["segment"].dtype, pd.CategoricalDtype)
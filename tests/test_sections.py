@@ -0,0 +1,76 @@
+"""Tests for computing only the summary sections that are consumed."""
+
+import numpy as np
+import pytest
+
+from hashprep import DatasetAnalyzer
+from hashprep.reports.html import HtmlReport
+from hashprep.reports.json import JsonReport
+from hashprep.reports.markdown import MarkdownReport
+from hashprep.summaries.sections import CORE_SECTIONS, SECTIONS, resolve_sections
+
+
+@pytest.fixture
+def df(make_frame):
+    return make_frame(500, "other")
+
+
+def _summary_steps(summary):
+    return {t["name"] for t in summary["summaries"]["reproduction_info"]["timings"] if t["kind"] == "summary"}
+
+
+class TestResolveSections:
+    def test_all(self):
+        assert resolve_sections("all", []) == set(SECTIONS)
+
+    def test_auto_follows_consumers(self):
+        assert resolve_sections("auto", ["duplicates"]) == set(CORE_SECTIONS)
+        assert "mutual_information" in resolve_sections("auto", ["low_mutual_information"])
+        assert "interactions" in resolve_sections("auto", [], include_plots=True)
+        assert "variables" in resolve_sections("auto", [], incremental=True)
+
+    def test_explicit_sections_keep_core(self):
+        assert resolve_sections(["missing_values"], []) == set(CORE_SECTIONS) | {"missing_values"}
+
+    @pytest.mark.parametrize("sections", ["some", ["variables", "nope"]])
+    def test_rejects_unknown(self, sections):
+        with pytest.raises(ValueError):
+            resolve_sections(sections, [])
+
+
+class TestAnalyzerSections:
+    def test_default_computes_everything(self, df):
+        summaries = DatasetAnalyzer(df, target_col="label", selected_checks=["duplicates"]).analyze()["summaries"]
+        assert {"variables", "numeric_correlations", "missing_values", "mutual_information", "head"} <= set(summaries)
+
+    def test_auto_skips_unused_sections(self, df):
+        summary = DatasetAnalyzer(df, target_col="label", selected_checks=["duplicates"], sections="auto").analyze()
+        summaries = summary["summaries"]
+
+        assert not {"variables", "numeric_correlations", "missing_values", "mutual_information", "head"} & set(
+            summaries
+        )
+        assert summaries["dataset_info"]["rows"] == len(df)
+        assert summaries["reproduction_info"]["sections"] == [s for s in SECTIONS if s in CORE_SECTIONS]
+        assert _summary_steps(summary) == {"dataset_info", "duplicates", "variable_types", "reproduction_info"}
+
+    def test_checks_unaffected(self, df):
+        df = df.assign(value=np.where(np.arange(len(df)) < 400, 0.0, df["value"]))
+        full = DatasetAnalyzer(df, target_col="label").analyze()
+        auto = DatasetAnalyzer(df, target_col="label", sections="auto").analyze()
+
+        assert auto["issues"] == full["issues"]
+        assert "mutual_information" in auto["summaries"]
+
+    def test_reports_render_without_optional_sections(self, df):
+        summary = DatasetAnalyzer(df, selected_checks=["outliers"], sections="auto").analyze()
+
+        assert "Dataset Statistics" in MarkdownReport().generate(summary, full=True)
+        assert JsonReport().generate(summary, full=True)
+        assert HtmlReport().generate(summary, full=True)
+
+    def test_state_fills_in_variables(self, df):
+        analyzer = DatasetAnalyzer(df, sections="auto")
+        analyzer.analyze()
+
+        assert set(analyzer.state().variables) == set(df.columns)
@@ -0,0 +1,170 @@
+"""Tests for mergeable sketch-based summaries."""
+
+import json
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hashprep import DatasetAnalyzer
+from hashprep.config import DEFAULT_CONFIG
+from hashprep.summaries.sketches import ColumnSketch, HyperLogLog, KLLSketch, SpaceSaving, hash_values
+from hashprep.utils.sampling import SamplingConfig
+
+
+def _make_df(n=20_000):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "value": rng.lognormal(size=n),
+            "city": rng.choice(["a", "b", "c", "d", "e"], size=n, p=[0.4, 0.3, 0.15, 0.1, 0.05]),
+            "user": [f"u{i}" for i in range(n)],
+        }
+    )
+    df.loc[df.sample(frac=0.1, random_state=1).index, "value"] = np.nan
+    return df
+
+
+def _chunks(df, size):
+    return (df.iloc[start : start + size] for start in range(0, len(df), size))
+
+
+@pytest.fixture
+def df():
+    return _make_df()
+
+
+class TestKLLSketch:
+    def test_quantiles_within_rank_error(self):
+        values = np.random.default_rng(1).normal(size=50_000)
+        sketch = KLLSketch(k=200)
+        sketch.update(values)
+
+        for q, estimate in zip([0.05, 0.25, 0.5, 0.75, 0.95], sketch.quantiles([0.05, 0.25, 0.5, 0.75, 0.95])):
+            assert abs((values <= estimate).mean() - q) < 0.02
+        assert sketch.quantiles([0, 1]) == [values.min(), values.max()]
+
+    def test_merge_preserves_weight(self):
+        values = np.random.default_rng(2).uniform(size=10_000)
+        merged = KLLSketch(k=100)
+        for part in np.array_split(values, 9):
+            sketch = KLLSketch(k=100)
+            sketch.update(part)
+            merged.merge(sketch)
+
+        edges = np.linspace(0, 1, 5)
+        counts = merged.histogram(edges)
+        assert merged.n == len(values)
+        assert sum(counts) == len(values)
+        for estimate, exact in zip(counts, np.histogram(values, edges)[0]):
+            assert abs(estimate - exact) < 0.05 * len(values)
+
+
+class TestHyperLogLog:
+    def test_count_and_merge(self):
+        values = pd.Series(np.arange(100_000))
+        left, right = HyperLogLog(12), HyperLogLog(12)
+        left.update(hash_values(values[:60_000]))
+        right.update(hash_values(values[40_000:]))
+        left.merge(right)
+
+        assert left.count() == pytest.approx(100_000, rel=0.05)
+
+    def test_small_cardinality_is_exact(self):
+        sketch = HyperLogLog()
+        sketch.update(hash_values(pd.Series(["x", "y", "z"] * 100)))
+        assert sketch.count() == 3
+
+    def test_int_and_float_hash_alike(self):
+        assert (hash_values(pd.Series([1, 2, 3])) == hash_values(pd.Series([1.0, 2.0, 3.0]))).all()
+
+    def test_precision_mismatch_rejected(self):
+        with pytest.raises(ValueError, match="precision"):
+            HyperLogLog(10).merge(HyperLogLog(12))
+
+
+class TestSpaceSaving:
+    def test_heavy_hitters_across_chunks(self, df):
+        sketch = SpaceSaving(capacity=3)
+        for chunk in _chunks(df, 1_000):
+            sketch.update(chunk["city"].value_counts())
+
+        exact = df["city"].value_counts()
+        assert [value for value, _ in sketch.top(2)] == list(exact.index[:2])
+        for value, count in sketch.top(3):
+            assert count >= exact[value]
+
+
+class TestColumnSketch:
+    def test_round_trip_through_json(self, df):
+        sketch = ColumnSketch()
+        sketch.update(df["value"])
+        restored = ColumnSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+        assert restored.count == sketch.count
+        assert restored.missing == sketch.missing
+        assert restored.distinct_count() == sketch.distinct_count()
+        assert restored.quantiles.quantiles([0.5]) == sketch.quantiles.quantiles([0.5])
+        assert restored.top_values.top(3) == sketch.top_values.top(3)
+
+    def test_non_numeric_drops_quantiles(self, df):
+        sketch = ColumnSketch()
+        sketch.update(df["city"])
+        assert sketch.quantiles is None
+        assert sketch.distinct_count() == 5
+
+
+class TestAnalyzerSketches:
+    def test_full_data_estimates_replace_sample_figures(self, df):
+        summary = DatasetAnalyzer(df, sampling_config=SamplingConfig(max_rows=500), sketches=True).analyze()
+        variables = summary["summaries"]["variables"]
+        values = df["value"].dropna()
+
+        assert variables["user"]["distinct_count"] == pytest.approx(len(df), rel=0.02)
+        median = variables["value"]["statistics"]["quantiles"]["median"]
+        assert abs((values <= median).mean() - 0.5) < 0.02
+        assert sum(variables["value"]["histogram"]["counts"]) == len(values)
+        city = variables["city"]["categories"]["common_values"]
+        assert list(city)[:2] == ["a", "b"]
+        assert sum(v["count"] for v in city.values()) == len(df)
+
+    def test_summary_settings_apply_to_sketch_figures(self, df):
+        config = replace(DEFAULT_CONFIG, summaries=replace(DEFAULT_CONFIG.summaries, top_n_values=3, histogram_bins=4))
+        sampling = SamplingConfig(max_rows=500)
+        analyzer = DatasetAnalyzer(df.iloc[:10_000], sampling_config=sampling, sketches=True, config=config)
+        analyzer.analyze()
+        first = analyzer.summaries["variables"]
+        update = DatasetAnalyzer.update(df.iloc[10_000:], analyzer.state(), sampling_config=sampling)
+        later = update.analyze()["summaries"]["variables"]
+
+        for variables in (first, later):
+            assert len(variables["city"]["categories"]["common_values"]) == 3
+            assert len(variables["value"]["histogram"]["counts"]) == 4
+
+    def test_high_cardinality_uses_full_data_ratio(self, df):
+        analyzer = DatasetAnalyzer(
+            df,
+            selected_checks=["high_cardinality"],
+            sampling_config=SamplingConfig(max_rows=500),
+            sketches=True,
+        )
+        issues = analyzer.analyze()["issues"]
+
+        assert [i["column"] for i in issues] == ["user"]
+        assert str(analyzer.column_sketches["user"].distinct_count()) in issues[0]["description"]
+
+    def test_not_built_without_sampling(self, df):
+        analyzer = DatasetAnalyzer(df, auto_sample=False, sketches=True)
+        assert analyzer.column_sketches is None
+
+    def test_from_chunks(self, df):
+        analyzer = DatasetAnalyzer.from_chunks(
+            _chunks(df, 3_000), sampling_config=SamplingConfig(max_rows=500), sketches=True
+        )
+        summaries = analyzer.analyze()["summaries"]
+
+        assert analyzer.column_sketches["value"].count == df["value"].count()
+        assert summaries["variables"]["user"]["distinct_count"] == pytest.approx(len(df), rel=0.02)
+        median = summaries["variables"]["value"]["statistics"]["quantiles"]["median"]
+        assert abs((df["value"].dropna() <= median).mean() - 0.5) < 0.02
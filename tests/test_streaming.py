@@ -0,0 +1,184 @@
+"""Tests for chunked (streaming) analysis."""
+
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hashprep import DatasetAnalyzer
+from hashprep.summaries.streaming import StreamingProfile, _Moments
+from hashprep.utils.io import iter_chunks, read_dataset
+from hashprep.utils.sampling import SamplingConfig
+
+
+def _make_df(n=2_000):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "value": rng.lognormal(size=n),
+            "count": rng.integers(-5, 50, size=n),
+            "city": rng.choice(["a", "b", "c", "d"], size=n),
+            "flag": rng.choice([True, False], size=n),
+        }
+    )
+    df.loc[df.sample(frac=0.1, random_state=1).index, "value"] = np.nan
+    df.loc[df.sample(frac=0.05, random_state=2).index, "city"] = None
+    # A block of exact duplicate rows that spans chunk boundaries
+    df.iloc[500:560] = df.iloc[0:60].to_numpy()
+    return df
+
+
+def _chunks(df, size):
+    return (df.iloc[start : start + size] for start in range(0, len(df), size))
+
+
+@pytest.fixture
+def df():
+    return _make_df()
+
+
+class TestMoments:
+    def test_merge_matches_single_pass(self):
+        values = np.random.default_rng(3).normal(size=1_000)
+        merged = _Moments()
+        for part in np.array_split(values, 7):
+            merged.merge(_Moments.from_values(part))
+        series = pd.Series(values)
+
+        assert merged.n == 1_000
+        assert merged.mean == pytest.approx(series.mean())
+        assert merged.variance() == pytest.approx(series.var())
+        assert merged.skewness() == pytest.approx(series.skew())
+        assert merged.kurtosis() == pytest.approx(series.kurtosis())
+
+
+class TestStreamingProfile:
+    def test_counts_match_full_frame(self, df):
+        profile = StreamingProfile(sample_rows=100)
+        for chunk in _chunks(df, 300):
+            profile.update(chunk)
+
+        assert profile.rows == len(df)
+        assert profile.chunks == 7
+        assert profile.duplicate_rows == int(df.duplicated().sum())
+        assert len(profile.sample()) == 100
+        assert profile.sample().index.is_monotonic_increasing
+
+    def test_dataset_hash_matches_in_memory_hash(self, df):
+        streamed = DatasetAnalyzer.from_chunks(_chunks(df, 300), sampling_config=SamplingConfig(max_rows=100))
+        full = DatasetAnalyzer(df, auto_sample=False)
+
+        streamed_hash = streamed.analyze()["summaries"]["reproduction_info"]["dataset_hash"]
+        assert streamed_hash == full.analyze()["summaries"]["reproduction_info"]["dataset_hash"]
+
+    def test_merge_equals_sequential_update(self, df):
+        sequential = StreamingProfile(sample_rows=50)
+        for chunk in _chunks(df, 400):
+            sequential.update(chunk)
+
+        left, right = StreamingProfile(sample_rows=50), StreamingProfile(sample_rows=50)
+        left.update(df.iloc[:1000])
+        right.update(df.iloc[1000:])
+        left.merge(right)
+
+        assert left.rows == sequential.rows
+        assert left.duplicate_rows == sequential.duplicate_rows
+        assert len(left.sample()) == 50
+
+    def test_mismatched_columns_rejected(self, df):
+        profile = StreamingProfile()
+        profile.update(df.iloc[:10])
+        with pytest.raises(ValueError, match="do not match"):
+            profile.update(df.iloc[10:20].drop(columns="flag"))
+
+    def test_value_tracking_stops_at_cap(self, df):
+        from hashprep.config import HashPrepConfig, StreamingDefaults
+
+        config = HashPrepConfig(streaming=StreamingDefaults(max_tracked_values=10))
+        profile = StreamingProfile(config=config)
+        profile.update(df)
+
+        assert profile.info()["exact_value_counts"] == ["city", "flag"]
+
+
+class TestFromChunks:
+    def test_full_data_figures(self, df):
+        analyzer = DatasetAnalyzer.from_chunks(_chunks(df, 300), sampling_config=SamplingConfig(max_rows=200))
+        summary = analyzer.analyze()
+        summaries = summary["summaries"]
+        reference = DatasetAnalyzer(df, auto_sample=False).analyze()["summaries"]
+
+        assert len(analyzer.df) == 200
+        assert summaries["dataset_info"]["rows"] == len(df)
+        assert summaries["dataset_info"]["missing_cells"] == reference["dataset_info"]["missing_cells"]
+        assert summaries["dataset_info"]["duplicate_rows"] == reference["dataset_info"]["duplicate_rows"]
+        assert summaries["missing_values"]["count"] == reference["missing_values"]["count"]
+
+        streamed, exact = summaries["variables"]["value"], reference["variables"]["value"]
+        for key in ("missing_count", "distinct_count", "mean", "minimum", "maximum", "zeros_count"):
+            assert streamed[key] == pytest.approx(exact[key])
+        for key in ("standard_deviation", "variance", "skewness", "kurtosis", "sum"):
+            assert streamed["statistics"]["descriptive"][key] == pytest.approx(exact["statistics"]["descriptive"][key])
+        assert streamed["extreme_values"] == exact["extreme_values"]
+        # Ties may be ordered differently, so compare the frequencies rather than the keys
+        assert [v["count"] for v in summaries["variables"]["count"]["common_values"].values()] == [
+            v["count"] for v in reference["variables"]["count"]["common_values"].values()
+        ]
+        assert (
+            summaries["variables"]["city"]["categories"]["common_values"]
+            == reference["variables"]["city"]["categories"]["common_values"]
+        )
+
+        assert summary["sampling_info"]["was_sampled"] is True
+        assert summary["sampling_info"]["original_rows"] == len(df)
+        assert summaries["streaming_info"]["chunks"] == 7
+
+    def test_duplicates_check_uses_exact_count(self):
+        rng = np.random.default_rng(0)
+        half = pd.DataFrame({"x": rng.normal(size=10_000), "y": rng.integers(0, 1_000, size=10_000)})
+        doubled = pd.concat([half, half], ignore_index=True)
+        analyzer = DatasetAnalyzer.from_chunks(
+            _chunks(doubled, 3_000), sampling_config=SamplingConfig(max_rows=1_000), selected_checks=["duplicates"]
+        )
+        summary = analyzer.analyze()
+        expected = DatasetAnalyzer(doubled, auto_sample=False, selected_checks=["duplicates"]).analyze()
+
+        assert summary["summaries"]["dataset_info"]["duplicate_rows"] == 10_000
+        assert summary["issues"] == expected["issues"]
+        assert summary["issues"][0]["severity"] == "critical"
+        assert summary["summaries"]["populations"]["checks"]["duplicates"] == "full"
+
+    def test_small_stream_keeps_every_row(self, df):
+        analyzer = DatasetAnalyzer.from_chunks(_chunks(df, 500))
+
+        assert len(analyzer.df) == len(df)
+        assert analyzer.sampler.was_sampled is False
+
+    def test_empty_stream_rejected(self):
+        with pytest.raises(ValueError, match="No chunks"):
+            DatasetAnalyzer.from_chunks(iter([]))
+
+
+class TestIO:
+    def test_iter_chunks_csv(self, df, tmp_path):
+        path = tmp_path / "data.csv"
+        df.to_csv(path, index=False)
+
+        chunks = list(iter_chunks(str(path), 700))
+        assert [len(c) for c in chunks] == [700, 700, 600]
+        assert chunks[1].index[0] == 700
+        assert len(read_dataset(str(path))) == len(df)
+
+    def test_iter_chunks_parquet_without_pyarrow(self, df, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+        monkeypatch.setattr("hashprep.utils.io.pd.read_parquet", lambda path: df.set_index(df.index + 10))
+
+        chunks = list(iter_chunks("data.parquet", 700))
+        assert [len(c) for c in chunks] == [700, 700, 600]
+        assert chunks[1].index[0] == 700
+        pd.testing.assert_frame_equal(pd.concat(chunks), df)
+
+    def test_iter_chunks_rejects_bad_size(self, tmp_path):
+        with pytest.raises(ValueError, match="chunksize"):
+            list(iter_chunks(str(tmp_path / "x.csv"), 0))
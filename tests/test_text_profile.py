@@ -0,0 +1,89 @@
+"""Tests for the code-point text profile and the text summary built on it."""
+
+import unicodedata
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+from hashprep.summaries.variables import _summarize_categorical, _summarize_text
+from hashprep.utils.text_profile import profile_text
+
+
+@pytest.fixture
+def texts():
+    return pd.Series(["Hello world", "Привет мир", "你好 世界", "naïve café!", "", "hello again"])
+
+
+class TestTextProfile:
+    def test_counts_match_naive_loop(self, texts):
+        profile = profile_text(texts)
+        expected = Counter("".join(texts))
+
+        assert dict(zip(map(chr, profile.code_points), profile.counts.tolist())) == expected
+        assert profile.total_characters == sum(expected.values())
+        assert list(profile.categories) == [unicodedata.category(chr(cp)) for cp in profile.code_points]
+
+    def test_scripts_and_blocks(self, texts):
+        profile = profile_text(texts)
+        scripts = dict(zip(map(chr, profile.code_points), profile.scripts))
+        blocks = dict(zip(map(chr, profile.code_points), profile.blocks))
+
+        assert (scripts["H"], scripts["П"], scripts["你"], scripts[" "]) == ("Latin", "Cyrillic", "Han", "Common")
+        assert blocks["H"] == "Basic Latin"
+        assert blocks["ï"] == "Latin-1 Supplement"
+        assert blocks["П"] == "Cyrillic"
+        assert blocks["你"] == "CJK Unified Ideographs"
+
+    def test_chunking_does_not_change_result(self, texts):
+        whole = profile_text(texts)
+        chunked = profile_text(texts, chunk_rows=2)
+
+        assert chunked.code_points.tolist() == whole.code_points.tolist()
+        assert chunked.counts.tolist() == whole.counts.tolist()
+        assert chunked.words == whole.words
+
+    def test_words_do_not_span_values(self):
+        profile = profile_text(pd.Series(["ab", "cd"]))
+        assert profile.words == Counter({"ab": 1, "cd": 1})
+
+    def test_lone_surrogate_counted(self):
+        profile = profile_text(pd.Series(["a\udcff"]))
+        assert profile.total_characters == 2
+        assert list(profile.categories) == ["Ll", "Cs"]
+
+    def test_top_character_per_group(self):
+        profile = profile_text(pd.Series(["aab", "ББ1"]))
+
+        assert profile.top_character_per_group(profile.scripts) == {
+            "Latin": ("a", 2),
+            "Cyrillic": ("Б", 2),
+            "Common": ("1", 1),
+        }
+        assert profile.group_counts(profile.scripts).to_dict() == {"Latin": 3, "Cyrillic": 2, "Common": 1}
+
+
+class TestSummarizeText:
+    def test_scripts_and_blocks_filled(self, texts):
+        df = pd.DataFrame({"t": texts})
+        stats = _summarize_text(df, "t")
+        cu = stats["overview"]["characters_and_unicode"]
+        scripts = stats["characters"]["scripts"]
+
+        assert cu["total_characters"] == len("".join(texts))
+        assert cu["distinct_scripts"] == 4
+        assert cu["distinct_blocks"] == 4
+        assert list(scripts["most_occurring_scripts"])[0] == "Latin"
+        assert scripts["most_frequent_character_per_script"]["Han"]["char"] in "你好世界"
+        assert stats["words"]["hello"]["count"] == 2
+
+    def test_empty_column(self):
+        stats = _summarize_text(pd.DataFrame({"t": pd.Series([None, None], dtype=object)}), "t")
+        assert stats["overview"]["characters_and_unicode"]["distinct_scripts"] == 0
+        assert stats["characters"]["blocks"]["most_occurring_blocks"] == {}
+
+    def test_empty_categorical_matches_empty_text(self):
+        df = pd.DataFrame({"t": pd.Series([None, None], dtype=object)})
+        text, categorical = _summarize_text(df, "t"), _summarize_categorical(df, "t")
+        assert categorical["overview"] == text["overview"]
+        assert categorical["characters"] == text["characters"]
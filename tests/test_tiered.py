@@ -0,0 +1,115 @@
+"""Tests for tiered execution: cheap checks on every row, expensive checks on the sample."""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hashprep import DatasetAnalyzer
+from hashprep.checks import FULL_DATA_CHECKS, check_tasks, run_tasks
+from hashprep.reports.markdown import MarkdownReport
+from hashprep.utils.sampling import SamplingConfig
+
+
+@pytest.fixture
+def big_df():
+    rng = np.random.default_rng(0)
+    n = 20_000
+    df = pd.DataFrame(
+        {
+            "id": np.arange(n),
+            "amount": rng.gamma(2.0, 10.0, size=n),
+            "segment": rng.choice(["a", "b", "c"], size=n),
+            "rare_missing": rng.normal(size=n),
+        }
+    )
+    df.loc[:29, "rare_missing"] = np.nan
+    # A handful of duplicated rows a small sample would very likely miss
+    return pd.concat([df, df.iloc[:20]], ignore_index=True)
+
+
+def _analyze(df, **kwargs):
+    analyzer = DatasetAnalyzer(df, sampling_config=SamplingConfig(max_rows=1_000), **kwargs)
+    return analyzer, analyzer.analyze()
+
+
+class TestTieredExecution:
+    def test_full_tier_sees_every_row(self, big_df):
+        analyzer, summary = _analyze(big_df, selected_checks=["duplicates", "high_missing_values", "outliers"])
+        info = summary["summaries"]["dataset_info"]
+
+        assert len(analyzer.df) == 1_000
+        assert info["rows"] == len(big_df)
+        assert info["duplicate_rows"] == 20
+        assert info["missing_cells"] == 50  # the 20 duplicated rows repeat missing values
+        assert [i.category for i in analyzer.check_issues["duplicates"]] == ["duplicates"]
+
+    def test_populations_reported(self, big_df):
+        _, summary = _analyze(big_df, selected_checks=["duplicates", "outliers"])
+        populations = summary["summaries"]["populations"]
+
+        assert populations["full_rows"] == len(big_df)
+        assert populations["sample_rows"] == 1_000
+        assert populations["checks"] == {"duplicates": "full", "outliers": "sample"}
+        assert populations["sections"]["dataset_info"] == "full"
+        assert populations["sections"]["variables"] == "sample"
+        by_category = {issue["category"]: issue["population"] for issue in summary["issues"]}
+        assert by_category["duplicates"] == "full"
+
+    def test_untiered_runs_everything_on_sample(self, big_df):
+        analyzer, summary = _analyze(big_df, selected_checks=["duplicates"], tiered=False)
+
+        assert summary["summaries"]["dataset_info"]["rows"] == 1_000
+        assert set(summary["summaries"]["populations"]["checks"].values()) == {"sample"}
+        assert all(issue["population"] == "sample" for issue in summary["issues"])
+
+    def test_unsampled_frame_is_full(self):
+        df = pd.DataFrame({"a": [1, 1, 2], "b": ["x", "x", "y"]})
+        analyzer = DatasetAnalyzer(df)
+        summary = analyzer.analyze()
+        assert set(summary["summaries"]["populations"]["checks"].values()) == {"full"}
+        assert analyzer._full_cache is None
+
+    def test_process_backend_matches_serial(self, big_df):
+        checks = sorted(FULL_DATA_CHECKS | {"outliers", "skewness"})
+        serial, _ = _analyze(big_df, selected_checks=checks)
+        parallel, _ = _analyze(big_df, selected_checks=checks, n_jobs=2, parallel_backend="process")
+        assert [i.description for i in parallel.issues] == [i.description for i in serial.issues]
+
+    def test_full_tier_requirements_warmed_for_workers(self, big_df):
+        analyzer = DatasetAnalyzer(big_df, sampling_config=SamplingConfig(max_rows=1_000), n_jobs=2)
+        run_tasks(analyzer, analyzer._route_tasks(check_tasks(["high_missing_values", "outliers"])), n_jobs=2)
+
+        full_cache = pickle.loads(pickle.dumps(analyzer))._full_cache
+        assert full_cache is not None and full_cache.df.shape == big_df.shape
+        assert all(("missing_count", col) in full_cache._store for col in big_df.columns)
+        # outliers runs on the sample, so its numeric values are not computed over every row
+        assert not any(kind == "non_null" for kind, _ in full_cache._store)
+
+    def test_markdown_marks_sample_alerts(self, big_df):
+        _, summary = _analyze(big_df, selected_checks=["duplicates", "outliers"])
+        content = MarkdownReport().generate(summary)
+
+        assert f"| Analysed sample | 1000 of {len(big_df)} rows |" in content
+        duplicate_lines = [line for line in content.splitlines() if "duplicate rows" in line and line.startswith("- ")]
+        assert duplicate_lines and not any("*(sample)*" in line for line in duplicate_lines)
+
+    def test_time_budget_stays_on_sample(self, big_df):
+        analyzer = DatasetAnalyzer(big_df, sampling_config=SamplingConfig(max_rows=1_000))
+        summary = analyzer.analyze(time_budget_s=1e-9)
+
+        assert summary["summaries"]["dataset_info"]["rows"] == summary["summaries"]["anytime_info"]["sample_rows"]
+        assert set(summary["summaries"]["populations"]["checks"].values()) == {"sample"}
+
+    def test_from_file_runs_everything_on_sample(self, big_df, tmp_path):
+        path = tmp_path / "big.csv"
+        big_df.to_csv(path, index=False)
+        analyzer = DatasetAnalyzer.from_file(str(path), sampling_config=SamplingConfig(max_rows=1_000))
+        populations = analyzer.analyze()["summaries"]["populations"]
+
+        # Only the sample is in memory, so no check or section can see every row
+        assert populations["full_rows"] == len(big_df)
+        assert populations["sample_rows"] == 1_000
+        assert set(populations["checks"].values()) == {"sample"}
+        assert set(populations["sections"].values()) == {"sample"}
@@ -0,0 +1,100 @@
+"""Tests for wide-table pair screening."""
+
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hashprep import DatasetAnalyzer
+from hashprep.config import DEFAULT_CONFIG, WideTableDefaults
+from hashprep.summaries import summarize_interactions
+from hashprep.utils.pair_screening import is_wide, screen_numeric_pairs
+
+
+@pytest.fixture
+def wide_df():
+    rng = np.random.default_rng(0)
+    n, p = 1_000, 60
+    df = pd.DataFrame(rng.normal(size=(n, p)), columns=[f"f{i}" for i in range(p)])
+    df["f7"] = df["f3"] * 2 + rng.normal(scale=0.1, size=n)  # strong linear
+    df["f20"] = np.exp(df["f11"])  # monotonic, not linear
+    df["f40"] = df["f30"] + rng.normal(scale=0.9, size=n)  # moderate (~0.75)
+    df.loc[rng.random(n) < 0.1, "f30"] = np.nan
+    return df
+
+
+def _config(**overrides):
+    return replace(DEFAULT_CONFIG, wide_table=replace(DEFAULT_CONFIG.wide_table, **overrides))
+
+
+class TestScreening:
+    def test_is_wide(self):
+        cfg = WideTableDefaults(column_threshold=100)
+        assert not is_wide(100, cfg)
+        assert is_wide(101, cfg)
+        assert not is_wide(10_000, WideTableDefaults(column_threshold=0))
+
+    def test_finds_planted_pairs_first(self, wide_df):
+        pairs = screen_numeric_pairs(wide_df, list(wide_df.columns), WideTableDefaults(top_k=2, block_size=16))
+        top = {(c1, c2) for c1, c2, _ in pairs[:3]}
+        assert top == {("f3", "f7"), ("f11", "f20"), ("f30", "f40")}
+        assert pairs[0][2] > 0.95
+
+    def test_scores_match_exact_correlations(self, wide_df):
+        cols = ["f0", "f3", "f7", "f11", "f20"]
+        pairs = screen_numeric_pairs(wide_df, cols, WideTableDefaults(top_k=4))
+        exact = wide_df[cols].corr().abs().combine(wide_df[cols].corr(method="spearman").abs(), np.maximum)
+        assert len(pairs) == 10
+        for c1, c2, score in pairs:
+            assert score == pytest.approx(exact.loc[c1, c2], abs=1e-4)
+
+    def test_limits(self, wide_df):
+        cols = list(wide_df.columns)
+        per_column = screen_numeric_pairs(wide_df, cols, WideTableDefaults(top_k=1))
+        assert len(per_column) <= len(cols)
+        assert {c for pair in per_column for c in pair[:2]} == set(cols)
+
+        capped = screen_numeric_pairs(wide_df, cols, WideTableDefaults(top_k=5, max_pairs=7, block_size=8))
+        assert len(capped) == 7
+        assert [s for _, _, s in capped] == sorted((s for _, _, s in capped), reverse=True)
+
+    def test_min_score_keeps_pairs_beyond_top_k(self, wide_df):
+        df = wide_df.copy()
+        for i in range(5):
+            df[f"copy{i}"] = df["f3"] + i
+        cols = list(df.columns)
+        pairs = screen_numeric_pairs(df, cols, WideTableDefaults(top_k=1), min_score=0.9)
+        partners = {c2 if c1 == "f3" else c1 for c1, c2, _ in pairs if "f3" in (c1, c2)}
+        assert {"copy0", "copy1", "copy2", "copy3", "copy4", "f7"} <= partners
+
+
+class TestWideSummaries:
+    def test_sparse_correlations(self, wide_df):
+        summary = summarize_interactions(wide_df, config=_config(column_threshold=50, top_k=2))
+        info = summary["wide_table"]
+        assert info["numeric_columns"] == 60 and info["screened_pairs"] == len(summary["scatter_pairs"])
+        assert len(summary["scatter_pairs"]) < 60 * 59 // 2
+        pearson = summary["numeric_correlations"]["pearson"]
+        assert pearson["f3"]["f7"] == pytest.approx(wide_df["f3"].corr(wide_df["f7"]))
+        assert pearson["f7"]["f3"] == pearson["f3"]["f7"]
+        spearman = summary["numeric_correlations"]["spearman"]
+        assert spearman["f11"]["f20"] == pytest.approx(1.0)
+        assert spearman["f30"]["f40"] == pytest.approx(wide_df["f30"].corr(wide_df["f40"], method="spearman"))
+        assert "kendall" not in summary["numeric_correlations"]
+
+    def test_below_threshold_keeps_full_matrices(self, wide_df):
+        summary = summarize_interactions(wide_df[["f0", "f3", "f7"]], config=_config(column_threshold=50))
+        assert "wide_table" not in summary
+        assert summary["scatter_pairs"] == [("f0", "f3"), ("f0", "f7"), ("f3", "f7")]
+        assert set(summary["numeric_correlations"]) == {"pearson", "spearman", "kendall"}
+
+
+def test_correlation_check_matches_all_pairs(wide_df):
+    def flagged(config):
+        analyzer = DatasetAnalyzer(wide_df, selected_checks=["feature_correlation"], config=config, sections="auto")
+        return sorted((i["column"], i["description"]) for i in analyzer.analyze()["issues"])
+
+    wide = flagged(_config(column_threshold=50))
+    assert wide == flagged(_config(column_threshold=0))
+    assert {column for column, _ in wide} == {"f3,f7", "f11,f20", "f30,f40"}